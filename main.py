@@ -5,25 +5,65 @@ from utilities.logger.log_utils import Logger
 from utilities.logger.logail_handler import LogtailHandler
 
 from src.application import routers
+from src.application.compiled_routes import compiled_lambda_handlers
+from src.application.internal_routes import internal_lambda_handlers
+from src.application.request_context import with_request_context
+from src.application.route_table import RouteTable, build_unified_handler, collect_deployable_routes
+from src.application.consumers.account_change_consumer import handle_account_change_stream
 from src.config.custom_config import ENVIRONMENT
 
 TARGET = os.environ.get("TARGET", "lambda")
-
-resolver = HandlerResolver(routers, TARGET)
-app_or_functions = resolver.get_handler()
-
-Logger.setup(LogtailHandler(), ENVIRONMENT.log_level)
+# "split": one function per endpoint. "unified": every endpoint behind a single router function.
+DEPLOY_LAYOUT = os.environ.get("DEPLOY_LAYOUT", "split")
 
 if TARGET == "fastapi":
-    import uvicorn
-    uvicorn.run(app_or_functions, host="0.0.0.0", port=8080)
+    # serve() sets up logging and builds the app: here with one worker, in every spawned
+    # worker otherwise, so a supervising process never builds the routers and their
+    # dependencies. Spawned workers re-import this module as `__mp_main__`: only the script serves.
+    if __name__ == "__main__":
+        from src.application.asgi_server import serve
+        serve()
+else:
+    Logger.setup(LogtailHandler(), ENVIRONMENT.log_level)
+    app_or_functions = HandlerResolver(routers, TARGET).get_handler()
+
+if TARGET == "cloudfunction":
+    function_create_account = with_request_context(app_or_functions["create_account"])
+    function_get_account = with_request_context(app_or_functions["get_account"])
+    function_get_account_by_owner = with_request_context(app_or_functions["get_account_by_owner"])
+    function_update_status = with_request_context(app_or_functions["update_status"])
+    function_bulk_update_status = with_request_context(app_or_functions["bulk_update_status"])
+    function_record_transaction = with_request_context(app_or_functions["record_transaction"])
+    function_get_transactions = with_request_context(app_or_functions["get_transactions"])
+    function_get_transaction_summary = with_request_context(app_or_functions["get_transaction_summary"])
+    function_get_balance = with_request_context(app_or_functions["get_balance"])
+    function_export_statement = with_request_context(app_or_functions["export_statement"])
 
-elif TARGET == "cloudfunction":
-    function_create_account = app_or_functions["create_account"]
-    function_get_account = app_or_functions["get_account"]
-    function_update_status = app_or_functions["update_status"]
+    if DEPLOY_LAYOUT == "unified":
+        function_router = with_request_context(
+            build_unified_handler(RouteTable.from_routes(collect_deployable_routes(routers)), app_or_functions)
+        )
 
 elif TARGET == "lambda":
-    lambda_create_account = app_or_functions["create_account"]
-    lambda_get_account = app_or_functions["get_account"]
-    lambda_update_status = app_or_functions["update_status"]
\ No newline at end of file
+    # Precompiled routes parse the event straight into their schema, bypassing deployable's parsing.
+    if ENVIRONMENT.compiled_request_parsing:
+        app_or_functions = compiled_lambda_handlers(app_or_functions)
+
+    lambda_create_account = with_request_context(app_or_functions["create_account"])
+    lambda_get_account = with_request_context(app_or_functions["get_account"])
+    lambda_get_account_by_owner = with_request_context(app_or_functions["get_account_by_owner"])
+    lambda_update_status = with_request_context(app_or_functions["update_status"])
+    lambda_bulk_update_status = with_request_context(app_or_functions["bulk_update_status"])
+    lambda_record_transaction = with_request_context(app_or_functions["record_transaction"])
+    lambda_get_transactions = with_request_context(app_or_functions["get_transactions"])
+    lambda_get_transaction_summary = with_request_context(app_or_functions["get_transaction_summary"])
+    lambda_get_balance = with_request_context(app_or_functions["get_balance"])
+    lambda_export_statement = with_request_context(app_or_functions["export_statement"])
+    # Service-to-service routes: not deployable, encoded by content negotiation.
+    lambda_internal_lookup = with_request_context(internal_lambda_handlers()["internal_lookup"])
+    lambda_account_change_stream = handle_account_change_stream
+
+    if DEPLOY_LAYOUT == "unified":
+        lambda_router = with_request_context(
+            build_unified_handler(RouteTable.from_routes(collect_deployable_routes(routers)), app_or_functions)
+        )
\ No newline at end of file
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Move transactions older than the archive horizon from `account-transaction-table` to the archive.
+
+What it does:
+
+1. Selects the transactions with `timestamp` before `now - horizon` (`--horizon-days`,
+   default TRANSACTION_ARCHIVE_HORIZON_DAYS):
+   - `--account-id`: one account, through `account_id-timestamp-index`,
+   - `--all`: every account, through a parallel scan (`--segments`, `--max-rcu`).
+2. Every `--flush-rows` transactions, writes one compressed segment per account
+   and month (`TransactionArchive.write_segments`), commits them to the
+   min/max indexes, then deletes the archived transactions from the table.
+3. Prints the archived transactions and segments.
+
+Readers merge the archive with the table (TRANSACTION_ARCHIVE_ENABLED=true), so
+the move is transparent to statements. A run interrupted after a commit
+leaves some transactions in both tiers; readers return them once and the
+next run archives and deletes them again. Daily rollups stay in DynamoDB.
+
+Run one job at a time (the indexes are rewritten whole), with the same
+horizon as the readers.
+
+Usage:
+    python scripts/archive_transactions.py --all --segments 8 --max-rcu 500
+    python scripts/archive_transactions.py --account-id 01HYXY... --horizon-days 365 --dry-run
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.entity.timestamps import format_timestamp
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.exports.object_store import build_object_store
+from src.infra.repositories.dynamodb_items import serialize_value
+from src.infra.repositories.parallel_scan import ParallelScanner
+from src.infra.repositories.transaction_repository import TransactionRepository
+
+
+def old_transactions(args, transaction_repository: TransactionRepository, cutoff: str) -> Iterator[dict]:
+    """Transactions with a timestamp strictly before `cutoff`."""
+    if args.account_id:
+        for items, _ in transaction_repository.query_range_pages("0000", cutoff, account_id=args.account_id):
+            yield from (item for item in items if item["timestamp"] < cutoff)
+        return
+
+    scanner = ParallelScanner(
+        get_dynamodb_client(), transaction_repository.table_name, total_segments=args.segments,
+        max_read_units_per_second=args.max_rcu,
+        filter_expression="#timestamp < :cutoff",
+        expression_attribute_names={"#timestamp": "timestamp"},
+        expression_attribute_values={":cutoff": serialize_value(cutoff)},
+    )
+    yield from scanner.items()
+
+
+def flush(batch: list[dict], archive: TransactionArchive, transaction_repository: TransactionRepository, dry_run: bool) -> int:
+    """Archives a batch, then deletes it from the table. Returns the number of segments."""
+    if dry_run:
+        return len({(item["account_id"], item["timestamp"][:7]) for item in batch})
+
+    segments = archive.write_segments(batch)
+    archive.commit(segments)
+    transaction_repository.batch_delete([item["id"] for item in batch])
+    return len(segments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old transactions.")
+    selector = parser.add_mutually_exclusive_group(required=True)
+    selector.add_argument("--account-id")
+    selector.add_argument("--all", action="store_true")
+    parser.add_argument("--horizon-days", type=int, default=ENVIRONMENT.transaction_archive_horizon_days)
+    parser.add_argument("--flush-rows", type=int, default=50_000, help="Transactions archived per commit.")
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--max-rcu", type=float, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="Count what would be archived, change nothing.")
+    args = parser.parse_args()
+
+    if args.horizon_days < ENVIRONMENT.transaction_archive_horizon_days:
+        print(f"⚠️ Horizon {args.horizon_days}d is shorter than the readers' "
+              f"{ENVIRONMENT.transaction_archive_horizon_days}d: recent statements would miss archived rows.")
+        sys.exit(1)
+
+    cutoff = format_timestamp(datetime.now(timezone.utc) - timedelta(days=args.horizon_days))
+    transaction_repository = TransactionRepository(index_shards=ENVIRONMENT.transaction_account_index_shards)
+    archive = TransactionArchive(build_object_store(
+        ENVIRONMENT.transaction_archive_store,
+        path=ENVIRONMENT.transaction_archive_path,
+        bucket=ENVIRONMENT.transaction_archive_bucket,
+    ))
+
+    print(f"🗄️ Archiving transactions before {cutoff} ({args.account_id or 'all accounts'})...")
+    rows = segments = 0
+    batch: list[dict] = []
+    for item in old_transactions(args, transaction_repository, cutoff):
+        batch.append(item)
+        if len(batch) >= args.flush_rows:
+            segments += flush(batch, archive, transaction_repository, args.dry_run)
+            rows += len(batch)
+            print(f"  {rows:,} transactions, {segments:,} segments")
+            batch = []
+    if batch:
+        segments += flush(batch, archive, transaction_repository, args.dry_run)
+        rows += len(batch)
+
+    print(f"{'🔎 Would archive' if args.dry_run else '✅ Archived'} {rows:,} transactions in {segments:,} segments.")
+
+
+if __name__ == "__main__":
+    main()
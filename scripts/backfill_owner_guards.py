@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Backfill the owner guards of `account-owner-table` for existing accounts.
+
+Accounts created before owner uniqueness have no guard item, so nothing stops
+a second account for their owner and `GET /tenants/{tenantId}/owners/{ownerId}/account`
+does not find them. This tool writes the missing guards.
+
+What it does:
+
+1. Scans `account-table` with `AccountRepository.parallel_scan` over
+   `--segments` segments, projecting `id`, `tenant_id` and `owner_id`,
+   optionally capped at `--max-rcu`.
+2. Claims the guard of every account with `AccountRepository.claim_owner`
+   (`--writers` at a time). When an owner already has several accounts, the
+   oldest (smallest ULID) keeps the guard whatever the scan order, and the
+   others are reported as duplicates; they are not modified.
+3. Records the `LastEvaluatedKey` of every segment in `--checkpoint` after each
+   page. Running the tool again with the same checkpoint resumes where it stopped;
+   claims are idempotent, so a page claimed twice is harmless.
+4. Prints accounts scanned, guards claimed, duplicates and items/sec.
+
+Deploy the guarded `create_account` before running it: accounts created by the
+old code during the backfill would otherwise be missed.
+
+Usage:
+    python scripts/backfill_owner_guards.py --segments 8 --checkpoint backfill_owner_guards.json
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/backfill_owner_guards.py --dry-run
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infra.repositories.account_repository import AccountRepository
+from src.infra.repositories.parallel_scan import ScanCheckpoint
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill the owner guards of existing accounts.")
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--writers", type=int, default=16, help="Concurrent conditional puts.")
+    parser.add_argument("--max-rcu", type=float, default=None, help="Read capacity units per second.")
+    parser.add_argument("--checkpoint", default="backfill_owner_guards.json", help="Progress file. Empty to disable.")
+    parser.add_argument("--dry-run", action="store_true", help="Count accounts and duplicates without writing.")
+    args = parser.parse_args()
+
+    repository = AccountRepository()
+    checkpoint = ScanCheckpoint(args.checkpoint or None, args.segments)
+    scanner = repository.parallel_scan(
+        args.segments,
+        page_size=args.page_size,
+        checkpoint=checkpoint,
+        max_read_units_per_second=args.max_rcu,
+        projection=["id", "tenant_id", "owner_id"],
+    )
+    already_scanned = checkpoint.scanned
+
+    # Dry run: oldest account seen per owner, in this process only.
+    oldest: dict[tuple[str, str], str] = {}
+    lock = threading.Lock()
+
+    def claim(item: dict) -> str | None:
+        tenant_id, owner_id = item["tenant_id"], item["owner_id"]
+        if not args.dry_run:
+            return repository.claim_owner(item["id"], tenant_id, owner_id)
+        with lock:
+            other = oldest.setdefault((tenant_id, owner_id), item["id"])
+            if item["id"] < other:
+                oldest[(tenant_id, owner_id)] = item["id"]
+        return other if other != item["id"] else None
+
+    print(f"🔐 Backfilling owner guards of {repository.table_name} into {repository.owner_table_name}...")
+    started = time.perf_counter()
+    claimed, duplicates = 0, 0
+
+    with ThreadPoolExecutor(max_workers=args.writers) as writers:
+        for page in scanner.pages():
+            for item, other in zip(page.items, writers.map(claim, page.items)):
+                claimed += 1
+                if other is not None:
+                    duplicates += 1
+                    print(f"⚠️ Owner {item['owner_id']} of tenant {item['tenant_id']} has accounts {item['id']} and {other}")
+
+    elapsed = time.perf_counter() - started
+    this_run = checkpoint.scanned - already_scanned
+
+    verb = "to claim" if args.dry_run else "claimed"
+    print(f"✅ {checkpoint.scanned} accounts scanned, {claimed} guards {verb}, {duplicates} duplicates this run "
+          f"({scanner.consumed_capacity:,.0f} RCU).")
+    print(f"⏱️ {this_run} items in {elapsed:.1f}s this run ({this_run / elapsed if elapsed else 0:,.0f} items/sec).")
+
+
+if __name__ == "__main__":
+    main()
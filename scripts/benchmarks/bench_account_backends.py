@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark the account repository backends on the operations the routers use.
+
+What it does:
+
+1. Builds one repository per backend in `--backends`: the in-memory store,
+   MongoDB (`--mongodb-uri`, or mongomock when omitted), Firestore
+   (the emulator, skipped unless FIRESTORE_EMULATOR_HOST is set) and
+   DynamoDB (only when `--dynamodb` is given; uses the configured table).
+2. Times `create`, `find_by_id`, `transition_status`, `batch_get` of
+   `--batch-size` accounts and `query_ids_by_tenant` pages of 100.
+3. Prints the mean and p99 latency per operation and backend.
+
+In-process fakes only measure the repository's own overhead; point the
+benchmark at real servers (same region as the function) to compare backends.
+
+Usage:
+    python scripts/benchmarks/bench_account_backends.py --accounts 2000
+    docker run -d -p 27017:27017 mongo:7
+    gcloud emulators firestore start --host-port=localhost:8080 &
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python scripts/benchmarks/bench_account_backends.py \\
+        --backends mongodb,firestore --mongodb-uri mongodb://localhost:27017
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.entity.account import Account, AccountStatus
+from src.infra.repositories.firestore_account_repository import FirestoreAccountRepository
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+from src.infra.repositories.mongo_account_repository import MongoAccountRepository
+
+
+def build(backend: str, args):
+    collection = f"bench_accounts_{uuid.uuid4().hex[:8]}"
+    match backend:
+        case "memory":
+            return InMemoryAccountRepository()
+        case "mongodb":
+            if args.mongodb_uri:
+                repository = MongoAccountRepository.from_uri(args.mongodb_uri, collection=collection)
+            else:
+                import mongomock
+
+                repository = MongoAccountRepository(mongomock.MongoClient()["account"][collection])
+            repository.ensure_indexes()
+            return repository
+        case "firestore":
+            if not os.getenv("FIRESTORE_EMULATOR_HOST"):
+                return None
+            return FirestoreAccountRepository.from_project("account-bench", collection=collection)
+        case "dynamodb":
+            from src.infra.repositories.account_repository import AccountRepository
+
+            return AccountRepository()
+    raise ValueError(f"Unknown backend '{backend}'")
+
+
+def timed(samples: list[float], function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def report(backend: str, operation: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{backend:<10} {operation:<20} {statistics.fmean(samples) * 1e3:>9.3f} ms  p99 {p99 * 1e3:>9.3f} ms  n={len(samples)}")
+
+
+def bench(backend: str, repository, args) -> None:
+    tenant_id = f"bench_{uuid.uuid4().hex[:8]}"
+    accounts = [
+        Account(id=uuid.uuid4().hex, tenant_id=tenant_id, owner_id=f"owner_{index}", status=AccountStatus.ACTIVE,
+                created_at="2025-01-01T00:00:00.000Z", updated_at="2025-01-01T00:00:00.000Z")
+        for index in range(args.accounts)
+    ]
+    samples: dict[str, list[float]] = {name: [] for name in ("create", "find_by_id", "transition_status", "batch_get", "query_ids_by_tenant")}
+
+    for account in accounts:
+        timed(samples["create"], repository.create, account)
+    for account in accounts:
+        timed(samples["find_by_id"], repository.find_by_id, account.id)
+    for account in accounts:
+        timed(samples["transition_status"], repository.transition_status,
+              account.id, AccountStatus.SUSPENDED, "bench", "2025-01-02T00:00:00.000Z")
+    for start in range(0, len(accounts), args.batch_size):
+        timed(samples["batch_get"], repository.batch_get, [account.id for account in accounts[start:start + args.batch_size]])
+
+    cursor = None
+    while True:
+        _, cursor = timed(samples["query_ids_by_tenant"], repository.query_ids_by_tenant, tenant_id, cursor=cursor, limit=100)
+        if cursor is None:
+            break
+
+    for operation, values in samples.items():
+        report(backend, operation, values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Account repository backend benchmark.")
+    parser.add_argument("--backends", default="memory,mongodb,firestore")
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--mongodb-uri", help="Real MongoDB server (mongomock otherwise).")
+    parser.add_argument("--dynamodb", action="store_true", help="Also run against the configured DynamoDB table.")
+    args = parser.parse_args()
+
+    backends = args.backends.split(",") + (["dynamodb"] if args.dynamodb else [])
+    print(f"⏱️ {args.accounts:,} accounts per backend, batches of {args.batch_size}")
+    for backend in backends:
+        repository = build(backend, args)
+        if repository is None:
+            print(f"{backend:<10} skipped (FIRESTORE_EMULATOR_HOST is not set)")
+            continue
+        bench(backend, repository, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the overhead per-tenant admission control adds to every request.
+
+What it does:
+
+1. Times `InMemoryTokenBucketStore.take` for `--tenants` distinct tenants,
+   single-threaded and from `--threads` threads sharing the store.
+2. Times a no-op router function with and without `@admission.limit()`,
+   tenant taken from the authorizer context of the bound request context.
+3. Optionally (`--redis-url`), times `RedisTokenBucketStore.take` (one round trip).
+4. Prints the cost per call in microseconds.
+
+Usage:
+    python scripts/benchmarks/bench_admission_control.py --calls 1000000 --tenants 1000
+    docker run -d -p 6379:6379 redis:7
+    python scripts/benchmarks/bench_admission_control.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.application.admission_control import TenantAdmissionControl, TenantQuota
+from src.application.request_context import bind_request_context, reset_request_context
+from src.infra.rate_limit.token_bucket import InMemoryTokenBucketStore, RedisTokenBucketStore
+
+# High enough that nothing is throttled: the benchmark measures the admitted path.
+RATE = 1e9
+BURST = 1e9
+
+
+def report(label: str, calls: int, elapsed: float) -> None:
+    print(f"{label:<34} {elapsed / calls * 1e6:>8.3f} µs/call  {calls / elapsed:>12,.0f} calls/s")
+
+
+def bench_store(store, calls: int, tenants: list[str]) -> float:
+    started = time.perf_counter()
+    for index in range(calls):
+        store.take(tenants[index % len(tenants)], RATE, BURST)
+    return time.perf_counter() - started
+
+
+def bench_store_threads(store, calls: int, tenants: list[str], threads: int) -> float:
+    per_thread = calls // threads
+
+    def worker():
+        bench_store(store, per_thread, tenants)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def bench_router(handler, calls: int, tenants: list[str]) -> float:
+    contexts = [{"lambda": {"tenant_id": tenant}} for tenant in tenants]
+    started = time.perf_counter()
+    for index in range(calls):
+        token = bind_request_context(authorizer=contexts[index % len(contexts)])
+        try:
+            handler(None)
+        finally:
+            reset_request_context(token)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Admission control overhead benchmark.")
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--redis-url", help="Also time the shared Redis store.")
+    args = parser.parse_args()
+
+    tenants = [f"tenant-{index}" for index in range(args.tenants)]
+    print(f"⏱️ {args.calls:,} calls over {args.tenants:,} tenants")
+
+    report("memory store", args.calls, bench_store(InMemoryTokenBucketStore(), args.calls, tenants))
+    report(f"memory store, {args.threads} threads", args.calls,
+           bench_store_threads(InMemoryTokenBucketStore(), args.calls, tenants, args.threads))
+
+    admission = TenantAdmissionControl(InMemoryTokenBucketStore(), TenantQuota(rate=RATE, burst=BURST))
+
+    def route(schema):
+        return schema
+
+    baseline = bench_router(route, args.calls, tenants)
+    limited = bench_router(admission.limit()(route), args.calls, tenants)
+    report("router, no admission control", args.calls, baseline)
+    report("router, admission control", args.calls, limited)
+    print(f"{'added per request':<34} {(limited - baseline) / args.calls * 1e6:>8.3f} µs")
+
+    if args.redis_url:
+        calls = min(args.calls, 20_000)
+        report("redis store", calls, bench_store(RedisTokenBucketStore(args.redis_url), calls, tenants))
+
+
+if __name__ == "__main__":
+    main()
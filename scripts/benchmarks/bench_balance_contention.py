@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark balance counter and daily rollup contention on one hot merchant account, with and without sharding.
+
+What it does:
+
+1. Offers `--rate` transactions per second to a single account for
+   `--seconds` (simulated time). Like `TransactionService.record_transaction`,
+   each one is a transactional write adding to its balance counter (through
+   `BalanceCounterService`) and to its daily rollup (the key built by
+   `DailyRollupRepository.increment_operation`).
+2. Models the DynamoDB per-item limit: every counter and rollup item absorbs
+   `--item-wcu` write units per second with one second of burst, and a
+   transactional write costs 2 units on each item; it is throttled when
+   either item is. A throttled write is retried with exponential backoff
+   (50 ms doubling up to 1 s, `--max-attempts`), like the SDK retry mode;
+   writes exhausting their attempts fail.
+3. Runs four layouts:
+   - `unsharded`: a single counter and a single rollup item (baseline),
+   - `rollup unsharded`: adaptive counters, single rollup item, showing the
+     rollup alone caps the account,
+   - `adaptive`: promoted to `--shards` counters once the observed rate
+     crosses `--promote` writes/s, rollup in `--rollup-shards` items,
+   - `pre-sharded`: `--shards` counters from the first write, rollup in `--rollup-shards` items.
+4. Prints the throughput of accepted writes, the share of throttled
+   attempts, failed writes, the p99 write latency (including retries), when
+   the account was promoted, and whether the summed balance and rollup
+   match the accepted writes.
+
+DynamoDB-local does not throttle, so the per-item limit is modelled in
+process with the token buckets of `src/infra/rate_limit`.
+
+Usage:
+    python scripts/benchmarks/bench_balance_contention.py --rate 3000 --seconds 30 --shards 10 --rollup-shards 8
+"""
+
+import argparse
+import heapq
+import statistics
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.entity.account_balance import UNSHARDED, BalanceLayout
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.domain.services.balance_counter_service import BalanceCounterService
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.rate_limit.token_bucket import InMemoryTokenBucketStore
+from src.infra.repositories.balance_counter_repository import counter_key
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository
+
+ACCOUNT_ID = "bench-merchant"
+TRANSACT_WRITE_COST = 2
+
+
+class SimulatedClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ThrottlingCounters:
+    """
+    Balance counters whose partition keys each absorb `item_wcu` write units per second.
+    """
+
+    def __init__(self, clock: SimulatedClock, item_wcu: float):
+        self.item_wcu = item_wcu
+        self.partitions = InMemoryTokenBucketStore(clock=clock)
+        self.counters: dict[int, Decimal] = {}
+        self.layout = UNSHARDED
+        self.promoted_at: float | None = None
+        self.clock = clock
+
+    def increment_operation(self, account_id, shard, delta):
+        return account_id, shard, delta
+
+    def apply(self, operation) -> bool:
+        account_id, shard, delta = operation
+        admission = self.partitions.take(counter_key(account_id, shard), self.item_wcu, self.item_wcu, TRANSACT_WRITE_COST)
+        if admission.allowed:
+            self.counters[shard] = self.counters.get(shard, Decimal(0)) + delta
+        return admission.allowed
+
+    def get_layout(self, account_id):
+        return self.layout
+
+    def get_counters(self, account_id, shard_count):
+        return self.layout, {shard: value for shard, value in self.counters.items() if shard < shard_count}
+
+    def set_write_shards(self, account_id, write_shards):
+        if write_shards > 1 and self.promoted_at is None:
+            self.promoted_at = self.clock.now
+        self.layout = BalanceLayout(write_shards, max(write_shards, self.layout.read_shards))
+        return self.layout
+
+
+class ThrottlingRollups:
+    """
+    Daily rollup items, keyed like `DailyRollupRepository`, each absorbing `item_wcu` write units per second.
+    """
+
+    def __init__(self, clock: SimulatedClock, item_wcu: float, shard_count: int):
+        self.item_wcu = item_wcu
+        self.repository = DailyRollupRepository(shard_count=shard_count)
+        self.partitions = InMemoryTokenBucketStore(clock=clock)
+        self.credits: dict[str, Decimal] = {}
+
+    def item_key(self, entry: TransactionEntry) -> str:
+        return self.repository.increment_operation(entry)["Update"]["Key"]["rollup_key"]["S"]
+
+    def admit(self, item_key: str) -> bool:
+        return self.partitions.take(item_key, self.item_wcu, self.item_wcu, TRANSACT_WRITE_COST).allowed
+
+    def add(self, item_key: str, amount: Decimal) -> None:
+        self.credits[item_key] = self.credits.get(item_key, Decimal(0)) + amount
+
+
+def run(args, shards: int, promote: float, pre_sharded: bool, rollup_shards: int) -> dict:
+    clock = SimulatedClock()
+    repository = ThrottlingCounters(clock, args.item_wcu)
+    rollups = ThrottlingRollups(clock, args.item_wcu, rollup_shards)
+    if pre_sharded:
+        repository.set_write_shards(ACCOUNT_ID, shards)
+    service = BalanceCounterService(
+        repository,
+        hot_shard_count=shards,
+        promote_writes_per_second=promote,
+        demote_writes_per_second=promote / 5,
+        window_seconds=args.window,
+        layout_cache=TTLCache(ttl_seconds=args.layout_ttl, clock=clock),
+        balance_cache=TTLCache(ttl_seconds=1.0, clock=clock),
+        clock=clock,
+    )
+    ids = MonotonicUlidGenerator()
+
+    total = int(args.rate * args.seconds)
+    # (attempt at, arrival, attempt number, entry)
+    pending = [(index / args.rate, index / args.rate, 1, None) for index in range(total)]
+    heapq.heapify(pending)
+    accepted, throttled, failed, latencies, last_accepted_at = 0, 0, 0, [], 0.0
+    while pending:
+        at, arrived, attempt, entry = heapq.heappop(pending)
+        clock.now = at
+        if entry is None:
+            entry = TransactionEntry(
+                id=ids.new(), account_id=ACCOUNT_ID, timestamp="2025-06-11T10:00:00.000Z",
+                amount=10.0, type=TransactionType.CREDIT, product="PIX", reference="bench",
+            )
+        rollup_key = rollups.item_key(entry)
+        # Both items take the write units of the attempt; it only succeeds if neither is throttled.
+        rollup_admitted = rollups.admit(rollup_key)
+        operation = service.increment_operation(entry)
+        if rollup_admitted and repository.apply(operation):
+            rollups.add(rollup_key, entry.amount)
+            service.observe_write(ACCOUNT_ID)
+            accepted += 1
+            latencies.append(at - arrived)
+            last_accepted_at = at
+            continue
+        throttled += 1
+        if attempt >= args.max_attempts:
+            failed += 1
+            continue
+        heapq.heappush(pending, (at + min(1.0, 0.05 * 2 ** (attempt - 1)), arrived, attempt + 1, entry))
+
+    balance = service.get_balance(ACCOUNT_ID)
+    return {
+        "throughput": accepted / max(last_accepted_at, args.seconds),
+        "throttled": throttled / (accepted + throttled),
+        "failed": failed,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else 0.0,
+        "promoted_at": repository.promoted_at,
+        "balance_ok": round(balance.balance, 2) == round(accepted * 10.0, 2),
+        "rollup_ok": round(sum(rollups.credits.values()), 2) == round(accepted * 10.0, 2),
+        "shards": balance.shards,
+        "rollup_items": len(rollups.credits),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balance counter contention: unsharded vs sharded.")
+    parser.add_argument("--rate", type=float, default=3000, help="Offered transactions per second.")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--shards", type=int, default=10)
+    parser.add_argument("--rollup-shards", type=int, default=8, help="Write shards of the daily rollup.")
+    parser.add_argument("--promote", type=float, default=100, help="Promotion threshold, writes/s.")
+    parser.add_argument("--window", type=float, default=5, help="Rate observation window, seconds.")
+    parser.add_argument("--layout-ttl", type=float, default=5, help="Lifetime of the cached layout, seconds.")
+    parser.add_argument("--item-wcu", type=float, default=1000, help="Write units per second one item absorbs.")
+    parser.add_argument("--max-attempts", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"🔥 One account, {args.rate:,.0f} tx/s offered for {args.seconds:.0f}s, "
+          f"{args.item_wcu:,.0f} WCU/s per item (2 WCU per transactional write)")
+    for label, shards, pre_sharded, rollup_shards in (
+        ("unsharded", 1, False, 1),
+        ("rollup unsharded", args.shards, False, 1),
+        ("adaptive", args.shards, False, args.rollup_shards),
+        ("pre-sharded", args.shards, True, args.rollup_shards),
+    ):
+        result = run(args, shards, args.promote, pre_sharded, rollup_shards)
+        promoted = f"{result['promoted_at']:.1f}s" if result["promoted_at"] is not None else "-"
+        print(f"  {label:<16} {result['throughput']:>9,.0f} tx/s  throttled {result['throttled']:>6.1%}  "
+              f"failed {result['failed']:>7,}  p99 {result['p99_ms']:>8.1f} ms  promoted {promoted:>6}  "
+              f"shards {result['shards']:>3}  rollup items {result['rollup_items']:>3}  "
+              f"balance {'✅' if result['balance_ok'] else '❌'}  rollup {'✅' if result['rollup_ok'] else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
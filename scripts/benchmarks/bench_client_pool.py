@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared, tuned DynamoDB client against the boto3 defaults.
+
+What it does:
+
+1. Seeds `account-table` on dynamodb-local (created if missing) with test accounts.
+2. Runs `--concurrency` threads issuing GetItem for `--seconds`, once with a
+   default boto3 client (10 pooled connections, legacy retries, 60s timeouts)
+   and once with the shared client from `get_dynamodb_client()`.
+3. Optionally (`--url`), drives a running FastAPI server (TARGET=fastapi) with
+   the same concurrency, to observe end-to-end latency.
+4. Prints throughput, p50 and p99 latency per run.
+
+Usage:
+    docker compose up -d dynamodb-local
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/benchmarks/bench_client_pool.py --concurrency 64
+    python scripts/benchmarks/bench_client_pool.py --url http://localhost:8080 --concurrency 64
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import boto3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.ids.ulid_generator import ULID_GENERATOR
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+
+TABLE_NAME = "account-table"
+
+
+def ensure_table(client) -> None:
+    """Create the account table on dynamodb-local if it does not exist."""
+    if TABLE_NAME in client.list_tables()["TableNames"]:
+        return
+    client.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.get_waiter("table_exists").wait(TableName=TABLE_NAME)
+
+
+def seed(client, count: int) -> list[str]:
+    """Insert `count` accounts and return their IDs."""
+    ids = ULID_GENERATOR.allocate(count)
+    for account_id in ids:
+        client.put_item(TableName=TABLE_NAME, Item={
+            "id": {"S": account_id},
+            "tenant_id": {"S": "bench-tenant"},
+            "owner_id": {"S": f"owner-{account_id}"},
+            "status": {"S": "active"},
+        })
+    return ids
+
+
+def run_load(label: str, call, ids: list[str], concurrency: int, seconds: float) -> None:
+    """Run `call(account_id)` from `concurrency` threads and print latency percentiles."""
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def worker(offset: int):
+        nonlocal errors
+        local, local_errors, index = [], 0, offset
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                call(ids[index % len(ids)])
+            except Exception:
+                local_errors += 1
+            local.append(time.perf_counter() - started)
+            index += concurrency
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<16} {len(latencies) / seconds:>9,.0f} req/s  "
+        f"p50 {quantiles[49] * 1000:>7.2f} ms  p99 {quantiles[98] * 1000:>7.2f} ms  errors {errors}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DynamoDB client pooling benchmark.")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--accounts", type=int, default=500)
+    parser.add_argument("--url", help="Base URL of a running FastAPI server to load instead of DynamoDB.")
+    args = parser.parse_args()
+
+    tuned = get_dynamodb_client()
+    ensure_table(tuned)
+    ids = seed(tuned, args.accounts)
+
+    print(f"⏱️ {args.concurrency} threads, {args.seconds:.0f}s per run, pool={ENVIRONMENT.dynamodb_max_pool_connections}")
+
+    if args.url:
+        run_load(
+            "fastapi",
+            lambda account_id: urllib.request.urlopen(f"{args.url}/accounts/{account_id}", timeout=10).read(),
+            ids, args.concurrency, args.seconds,
+        )
+        return
+
+    default = boto3.client("dynamodb", endpoint_url=ENVIRONMENT.dynamodb_endpoint_url)
+    for label, client in (("boto3 default", default), ("shared tuned", tuned)):
+        run_load(
+            label,
+            lambda account_id, client=client: client.get_item(TableName=TABLE_NAME, Key={"id": {"S": account_id}}),
+            ids, args.concurrency, args.seconds,
+        )
+
+
+if __name__ == "__main__":
+    main()
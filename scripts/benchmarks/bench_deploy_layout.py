@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Compare cold-start frequency and latency of the split and unified Lambda layouts.
+
+What it does:
+
+1. Simulates mixed Poisson traffic over the account endpoints for `--hours`.
+2. Replays it against two container models:
+   - split: one container pool per function (current serverless.yml),
+   - unified: one pool shared by every route (`--layout unified`).
+   A container serves one request at a time and is reclaimed after
+   `--idle-timeout` seconds without traffic; a request that finds no idle
+   container pays `--cold-ms` on top of its service time.
+3. Measures the real per-request cost of the precompiled RouteTable lookup
+   used by the unified handler, and adds it to every unified request.
+4. Prints cold starts, cold-start ratio and p50/p99 latency, overall and per route.
+
+Usage:
+    python scripts/benchmarks/bench_deploy_layout.py --hours 6 --idle-timeout 420
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.application.route_table import RouteTable
+
+ROUTES = {
+    "get_account": (["GET"], "/accounts/{accountId}"),
+    "create_account": (["POST"], "/accounts/create"),
+    "update_status": (["PATCH"], "/accounts/update_status"),
+    "bulk_update_status": (["POST"], "/accounts/bulk_update_status"),
+}
+
+# Requests per second and median service time (ms) of each route.
+TRAFFIC = {
+    "get_account": (2.0, 12.0),
+    "create_account": (0.05, 25.0),
+    "update_status": (0.002, 30.0),
+    "bulk_update_status": (0.0002, 900.0),
+}
+
+
+def generate_requests(hours: float, seed: int) -> list[tuple[float, str, float]]:
+    """Return (arrival_time, route, service_seconds) sorted by arrival."""
+    rng = random.Random(seed)
+    horizon = hours * 3600
+    requests = []
+    for route, (rate, median_ms) in TRAFFIC.items():
+        now = rng.expovariate(rate)
+        while now < horizon:
+            requests.append((now, route, rng.lognormvariate(0, 0.5) * median_ms / 1000))
+            now += rng.expovariate(rate)
+    requests.sort()
+    return requests
+
+
+def simulate(requests, pool_of, idle_timeout: float, cold_seconds: float, dispatch_seconds: float):
+    """Replay requests against container pools. Return per-route latencies and cold starts."""
+    pools: dict[str, list[list[float]]] = {}  # pool -> containers as [busy_until, last_used]
+    latencies: dict[str, list[float]] = {route: [] for route in TRAFFIC}
+    cold_starts = 0
+
+    for arrival, route, service in requests:
+        containers = pools.setdefault(pool_of(route), [])
+        containers[:] = [c for c in containers if arrival - c[1] <= idle_timeout or c[0] > arrival]
+
+        idle = [c for c in containers if c[0] <= arrival]
+        latency = service + dispatch_seconds
+        if idle:
+            container = max(idle, key=lambda c: c[1])
+        else:
+            cold_starts += 1
+            latency += cold_seconds
+            container = [0.0, 0.0]
+            containers.append(container)
+
+        container[0] = container[1] = arrival + latency
+        latencies[route].append(latency)
+
+    return latencies, cold_starts
+
+
+def report(label: str, latencies: dict[str, list[float]], cold_starts: int) -> None:
+    everything = [value for values in latencies.values() for value in values]
+    quantiles = statistics.quantiles(everything, n=100)
+    print(f"\n{label}: {cold_starts} cold starts ({cold_starts / len(everything):.3%} of {len(everything):,} requests)")
+    print(f"  {'all':<20} p50 {quantiles[49] * 1000:>8.1f} ms  p99 {quantiles[98] * 1000:>8.1f} ms")
+    for route, values in latencies.items():
+        if len(values) < 2:
+            continue
+        route_quantiles = statistics.quantiles(values, n=100)
+        print(f"  {route:<20} p50 {route_quantiles[49] * 1000:>8.1f} ms  p99 {route_quantiles[98] * 1000:>8.1f} ms  n={len(values)}")
+
+
+def measure_dispatch(iterations: int = 200_000) -> float:
+    """Return the mean RouteTable resolution time, in seconds, for a realistic route mix."""
+    table = RouteTable.from_routes(ROUTES)
+    samples = [
+        ("GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8", "GET /accounts/{accountId}"),
+        ("GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8", None),
+        ("POST", "/accounts/create", None),
+        ("PATCH", "/accounts/update_status", "PATCH /accounts/update_status"),
+    ]
+    started = time.perf_counter()
+    for index in range(iterations):
+        method, path, route_key = samples[index & 3]
+        table.resolve(method, path, route_key)
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split vs unified deployment simulation.")
+    parser.add_argument("--hours", type=float, default=6.0)
+    parser.add_argument("--idle-timeout", type=float, default=420.0)
+    parser.add_argument("--cold-ms", type=float, default=900.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    dispatch = measure_dispatch()
+    print(f"⏱️ RouteTable.resolve: {dispatch * 1e6:.2f} µs/request")
+
+    requests = generate_requests(args.hours, args.seed)
+    cold = args.cold_ms / 1000
+
+    report("split", *simulate(requests, lambda route: route, args.idle_timeout, cold, 0.0))
+    report("unified", *simulate(requests, lambda route: "router", args.idle_timeout, cold, dispatch))
+
+
+if __name__ == "__main__":
+    main()
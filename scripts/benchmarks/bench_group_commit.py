@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark group commit: one DynamoDB request per write vs `GroupCommitWriter`.
+
+What it does:
+
+1. Starts `--concurrency` caller threads (like the FastAPI thread pool) that
+   each write `--writes` transactions shaped like `TransactionRepository.create_once`:
+   a conditional put of the transaction plus one rollup `ADD`.
+2. Runs every concurrency level twice:
+   - `direct`: each caller sends its own `TransactWriteItems`,
+   - `group`: callers go through `GroupCommitWriter` (`--delay-ms`, `--batch-items`, `--in-flight`).
+3. Prints writes/s, p50/p99 caller latency, requests sent and the average
+   batch size; the added p50 is the group p50 minus the direct one.
+
+Without `DYNAMODB_ENDPOINT_URL` the client is simulated: a request takes
+`--latency-ms` plus `--per-item-ms` per item (typical in-region numbers),
+with at most `--pool` requests at once like the client connection pool.
+With it, writes go to `account-transaction-table` / `account-rollup-table`
+on that endpoint (e.g. dynamodb-local), which must exist.
+
+Usage:
+    python scripts/benchmarks/bench_group_commit.py --concurrency 1 8 32 128 --writes 200
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/benchmarks/bench_group_commit.py
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.infra.repositories.dynamodb_items import serialize_value
+from src.infra.repositories.group_commit import GroupCommitWriter
+
+TRANSACTION_TABLE = "account-transaction-table"
+ROLLUP_TABLE = "account-rollup-table"
+
+
+class SimulatedClient:
+    """
+    Client whose requests take a fixed round trip plus a per-item cost, over a bounded connection pool.
+    """
+
+    def __init__(self, latency_ms: float, per_item_ms: float, pool: int):
+        self.latency = latency_ms / 1000
+        self.per_item = per_item_ms / 1000
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._pool = threading.BoundedSemaphore(pool)
+
+    def transact_write_items(self, TransactItems):
+        with self._lock:
+            self.requests += 1
+        with self._pool:
+            time.sleep(self.latency + self.per_item * len(TransactItems))
+        return {}
+
+
+class CountingClient:
+    """
+    Real client wrapper counting requests.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def transact_write_items(self, TransactItems):
+        with self._lock:
+            self.requests += 1
+        return self.client.transact_write_items(TransactItems=TransactItems)
+
+
+def operations(ids: MonotonicUlidGenerator, caller: int) -> list[dict]:
+    transaction_id = ids.new()
+    return [
+        {"Put": {
+            "TableName": TRANSACTION_TABLE,
+            "Item": {"id": serialize_value(transaction_id), "account_id": serialize_value(f"bench-{caller}")},
+            "ConditionExpression": "attribute_not_exists(id)",
+        }},
+        {"Update": {
+            "TableName": ROLLUP_TABLE,
+            "Key": {"account_id": serialize_value(f"bench-{caller}"), "rollup_key": serialize_value("2025-06-11#PIX")},
+            "UpdateExpression": "ADD credits :amount",
+            "ExpressionAttributeValues": {":amount": serialize_value(1)},
+        }},
+    ]
+
+
+def run(args, concurrency: int, grouped: bool) -> dict:
+    if os.environ.get("DYNAMODB_ENDPOINT_URL"):
+        from src.infra.clients.dynamodb_client import get_dynamodb_client
+
+        client = CountingClient(get_dynamodb_client())
+    else:
+        client = SimulatedClient(args.latency_ms, args.per_item_ms, args.pool)
+    writer = None
+    if grouped:
+        writer = GroupCommitWriter(
+            max_delay_ms=args.delay_ms, max_batch_items=args.batch_items,
+            max_in_flight=args.in_flight, client_factory=lambda: client,
+        )
+        writer.register_table(TRANSACTION_TABLE, ("id",))
+
+    ids = MonotonicUlidGenerator()
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def caller(index: int):
+        own = []
+        for _ in range(args.writes):
+            items = operations(ids, index)
+            started = time.perf_counter()
+            if writer is not None:
+                writer.transact(items).result()
+            else:
+                client.transact_write_items(TransactItems=items)
+            own.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=caller, args=(index,)) for index in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if writer is not None:
+        writer.close()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "writes_per_second": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "requests": client.requests,
+        "batch": len(latencies) / client.requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Direct vs group-commit writes at varying concurrency.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--writes", type=int, default=200, help="Writes per caller.")
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    parser.add_argument("--batch-items", type=int, default=100)
+    parser.add_argument("--in-flight", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=8.0, help="Simulated request round trip.")
+    parser.add_argument("--per-item-ms", type=float, default=0.2, help="Simulated cost per item of a request.")
+    parser.add_argument("--pool", type=int, default=50, help="Simulated connection pool (DYNAMODB_MAX_POOL_CONNECTIONS).")
+    args = parser.parse_args()
+
+    target = os.environ.get("DYNAMODB_ENDPOINT_URL") or f"simulated ({args.latency_ms} ms + {args.per_item_ms} ms/item)"
+    print(f"✍️ {args.writes} writes per caller against {target}")
+    for concurrency in args.concurrency:
+        direct = run(args, concurrency, grouped=False)
+        group = run(args, concurrency, grouped=True)
+        print(f"  concurrency {concurrency:>4}")
+        for label, result in (("direct", direct), ("group", group)):
+            print(f"    {label:<7} {result['writes_per_second']:>9,.0f} writes/s  p50 {result['p50_ms']:>7.1f} ms  "
+                  f"p99 {result['p99_ms']:>7.1f} ms  {result['requests']:>7,} requests  {result['batch']:>5.1f} writes/request")
+        print(f"    added p50 {group['p50_ms'] - direct['p50_ms']:+.1f} ms, "
+              f"throughput x{group['writes_per_second'] / direct['writes_per_second']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark internal lookups: public JSON endpoints vs batched `internal_lookup` frames (JSON, MessagePack).
+
+What it does:
+
+1. Builds `--lookups` lookups, `--statement-share` of them statement pages
+   of `--page-size` transactions and the rest balances, answered by
+   `TransactionUseCase` over an in-memory service (no DynamoDB), so only
+   encoding and envelope costs are measured.
+2. Serves them three ways:
+   - `public json`: one request per lookup, as `get_balance` /
+     `get_transactions` answer it (`SuccessResponse` via `to_lambda_http_response`);
+     the client decodes the envelope and takes `body`.
+   - `frame json`: `--batch` lookups per `internal_lookup` request, JSON both ways.
+   - `frame msgpack`: the same frames with `Content-Type` and `Accept` set to `application/msgpack`.
+3. Prints per lookup: bytes on the wire, i.e. request and response bodies
+   (binary counted raw, as API Gateway delivers them, not base64) plus
+   `--header-bytes` of HTTP headers per request, and the CPU time of client
+   encode, server decode/validate/encode and client decode (best of
+   `--rounds`). Connection, TLS and API Gateway costs, also paid per request,
+   are not included.
+
+Usage:
+    python scripts/benchmarks/bench_internal_lookups.py --lookups 20000 --batch 50 --page-size 20
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
+
+from src.application.internal_routes import InternalRoute, build_internal_handler
+from src.application.request_context import bind_request_context, reset_request_context
+from src.application.schemas.transaction_schema import GetBalanceSchema, ListTransactionsSchema, LookupBatchSchema
+from src.application.use_cases.transaction_use_case import TransactionUseCase
+from src.application.wire_codecs import JsonCodec, MessagePackCodec, _load_msgpack
+from src.domain.entity.account_balance import AccountBalance
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+
+START, END = "2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z"
+
+
+class InMemoryTransactionService:
+    """
+    Answers balances and statement pages from memory.
+    """
+
+    def __init__(self, page_size: int):
+        ids = MonotonicUlidGenerator()
+        self.page = [
+            TransactionEntry(
+                id=ids.new(), tenant_id="bench-tenant", account_id="bench-account",
+                timestamp=f"2025-06-11T10:{index // 60 % 60:02d}:{index % 60:02d}.000Z",
+                amount=12.5 + index, type=TransactionType.CREDIT if index % 3 else TransactionType.DEBIT,
+                product="PIX", reference=f"order-{index}", balance_snapshot=1000.0 + index,
+            )
+            for index in range(page_size)
+        ]
+
+    def get_balance(self, account_id):
+        return AccountBalance(account_id=account_id, balance=1234.56, shards=1)
+
+    def list_transactions(self, account_id, start, end, product, cursor, limit):
+        return self.page, "01JXN4CURSOR"
+
+
+def lookups(args) -> list[dict]:
+    every = max(1, round(1 / args.statement_share)) if args.statement_share > 0 else None
+    return [
+        {"op": "statement", "account_id": f"acc-{index}", "start": START, "end": END}
+        if every and index % every == 0 else
+        {"op": "balance", "account_id": f"acc-{index}"}
+        for index in range(args.lookups)
+    ]
+
+
+def run_public(use_case: TransactionUseCase, items: list[dict], header_bytes: int) -> tuple[int, float]:
+    wire, started = 0, time.process_time()
+    for lookup in items:
+        token = bind_request_context({"Accept": "application/json"})
+        if lookup["op"] == "balance":
+            path = f"/accounts/{lookup['account_id']}/balance"
+            schema = GetBalanceSchema.__pydantic_validator__.validate_python({"accountId": lookup["account_id"]})
+            response = to_lambda_http_response(use_case.get_balance(schema))
+        else:
+            path = f"/accounts/{lookup['account_id']}/transactions?start={START}&end={END}"
+            schema = ListTransactionsSchema.__pydantic_validator__.validate_python(
+                {"accountId": lookup["account_id"], "start": START, "end": END}
+            )
+            response = to_lambda_http_response(use_case.list_transactions(schema))
+        reset_request_context(token)
+        json.loads(response["body"])["body"]
+        wire += header_bytes + len(path) + len(response["body"].encode())
+    return wire, time.process_time() - started
+
+
+def run_frames(handler, codec, items: list[dict], batch: int, header_bytes: int) -> tuple[int, float]:
+    headers = {"Content-Type": codec.media_type, "Accept": codec.media_type}
+    encode = codec.packb if isinstance(codec, MessagePackCodec) else (lambda frame: json.dumps(frame).encode())
+    decode = codec.unpackb if isinstance(codec, MessagePackCodec) else json.loads
+
+    wire, started = 0, time.process_time()
+    for offset in range(0, len(items), batch):
+        body = encode({"lookups": items[offset:offset + batch]})
+        token = bind_request_context(headers)
+        try:
+            response = handler({"body": base64.b64encode(body).decode() if codec.binary else body.decode(), "isBase64Encoded": codec.binary})
+        finally:
+            reset_request_context(token)
+        payload = base64.b64decode(response["body"]) if response.get("isBase64Encoded") else response["body"].encode()
+        decode(payload)["results"]
+        wire += header_bytes + len(body) + len(payload)
+    return wire, time.process_time() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Public JSON lookups vs batched internal frames.")
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=50, help="Lookups per frame (at most 100).")
+    parser.add_argument("--page-size", type=int, default=20, help="Transactions per statement page.")
+    parser.add_argument("--statement-share", type=float, default=0.5)
+    parser.add_argument("--header-bytes", type=int, default=500, help="HTTP request + response headers per request.")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    use_case = TransactionUseCase(InMemoryTransactionService(args.page_size))
+    items = lookups(args)
+    codecs = [JsonCodec()]
+    msgpack = _load_msgpack()
+    if msgpack is not None:
+        codecs.append(MessagePackCodec(msgpack))
+    handler = build_internal_handler(InternalRoute("internal_lookup", use_case.lookup, LookupBatchSchema), codecs)
+
+    runs = {"public json": lambda: run_public(use_case, items, args.header_bytes)}
+    for codec in codecs:
+        label = "frame msgpack" if codec.binary else "frame json"
+        runs[label] = lambda codec=codec: run_frames(handler, codec, items, args.batch, args.header_bytes)
+    results = {label: min((run() for _ in range(args.rounds)), key=lambda result: result[1]) for label, run in runs.items()}
+
+    print(f"📦 {args.lookups:,} lookups ({args.statement_share:.0%} statement pages of {args.page_size}), "
+          f"frames of {args.batch}")
+    if msgpack is None:
+        print("  msgpack not installed: MessagePack frames skipped")
+    base_wire, base_cpu = results["public json"]
+    for label, (wire, cpu) in results.items():
+        print(f"  {label:<14} {wire / args.lookups:>8,.0f} bytes/lookup ({wire / base_wire:>5.0%})  "
+              f"{cpu / args.lookups * 1e6:>7.1f} µs CPU/lookup ({cpu / base_cpu:>5.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark account creation: single put vs `TransactWriteItems` with the owner guard.
+
+What it does:
+
+1. Prints the write capacity of one creation, from the DynamoDB pricing
+   rules for an account of `--item-kb`:
+   - `put`: the account put alone (the creation before owner uniqueness),
+     1 WCU per KB,
+   - `transact`: the account put and the guard put of `AccountRepository.create`,
+     2 WCU per KB of each item (a transactional write costs twice a standard one).
+2. With `DYNAMODB_ENDPOINT_URL`, creates `--creates` accounts each way from
+   `--concurrency` caller threads against `account-table` /
+   `account-owner-table` on that endpoint (e.g. dynamodb-local), which must
+   exist, and prints creations/s and p50/p99 latency; the overhead is the
+   `transact` p50/p99 minus the `put` one. A last run retries the owners
+   already created to time the rejection of a duplicate.
+
+Without `DYNAMODB_ENDPOINT_URL` only the capacity is printed: a simulated
+round trip would just restate its own parameters. dynamodb-local does not
+reproduce the coordination cost of transactions either; measure against a
+real table for the figures that matter.
+
+Usage:
+    python scripts/benchmarks/bench_owner_uniqueness.py --item-kb 1
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/benchmarks/bench_owner_uniqueness.py --creates 2000 --concurrency 1 16
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.infra.repositories.base_account_repository import owner_key
+from src.infra.repositories.dynamodb_items import serialize_value
+
+ACCOUNT_TABLE = "account-table"
+OWNER_TABLE = "account-owner-table"
+GUARD_KB = 0.1
+
+
+def account_put(account_id: str, owner_id: str, item_kb: float) -> dict:
+    return {
+        "TableName": ACCOUNT_TABLE,
+        "Item": {
+            "id": serialize_value(account_id),
+            "tenant_id": serialize_value("bench-tenant"),
+            "owner_id": serialize_value(owner_id),
+            "status": serialize_value("ACTIVE"),
+            "padding": serialize_value("x" * max(0, int(item_kb * 1024) - 200)),
+        },
+        "ConditionExpression": "attribute_not_exists(id)",
+    }
+
+
+def guard_put(account_id: str, owner_id: str) -> dict:
+    return {
+        "TableName": OWNER_TABLE,
+        "Item": {
+            "owner_key": serialize_value(owner_key("bench-tenant", owner_id)),
+            "account_id": serialize_value(account_id),
+            "tenant_id": serialize_value("bench-tenant"),
+            "owner_id": serialize_value(owner_id),
+        },
+        "ConditionExpression": "attribute_not_exists(owner_key)",
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+
+
+def run(client, args, mode: str, concurrency: int, owners: list[str]) -> dict:
+    ids = MonotonicUlidGenerator()
+    latencies: list[float] = []
+    rejected = 0
+    lock = threading.Lock()
+
+    def caller(index: int):
+        nonlocal rejected
+        own, own_rejected = [], 0
+        for owner_id in owners[index::concurrency]:
+            account_id = ids.new()
+            started = time.perf_counter()
+            if mode == "put":
+                client.put_item(**account_put(account_id, owner_id, args.item_kb))
+            else:
+                try:
+                    client.transact_write_items(TransactItems=[
+                        {"Put": account_put(account_id, owner_id, args.item_kb)},
+                        {"Put": guard_put(account_id, owner_id)},
+                    ])
+                except client.exceptions.TransactionCanceledException:
+                    own_rejected += 1
+            own.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(own)
+            rejected += own_rejected
+
+    threads = [threading.Thread(target=caller, args=(index,)) for index in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "creates_per_second": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "rejected": rejected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single put vs transactional put with owner guard.")
+    parser.add_argument("--creates", type=int, default=2000, help="Accounts created per run.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--item-kb", type=float, default=1.0, help="Size of an account item.")
+    args = parser.parse_args()
+
+    put_wcu = math.ceil(args.item_kb)
+    transact_wcu = 2 * (math.ceil(args.item_kb) + math.ceil(GUARD_KB))
+    print(f"🔐 Account creation, {args.item_kb:g} KB account + {GUARD_KB:g} KB guard")
+    print(f"  put       {put_wcu:>3} WCU/create")
+    print(f"  transact  {transact_wcu:>3} WCU/create (x{transact_wcu / put_wcu:.1f}); "
+          f"a rejected duplicate is also charged as a transactional write")
+
+    endpoint = os.environ.get("DYNAMODB_ENDPOINT_URL")
+    if not endpoint:
+        print("  DYNAMODB_ENDPOINT_URL not set: latency not measured")
+        return
+
+    from src.infra.clients.dynamodb_client import get_dynamodb_client
+
+    client = get_dynamodb_client()
+    print(f"⏱️ {args.creates} creations per run against {endpoint}")
+    for concurrency in args.concurrency:
+        prefix = f"bench-owner-{time.time_ns()}"
+        owners = [f"{prefix}-{index}" for index in range(args.creates)]
+        put = run(client, args, "put", concurrency, [f"{owner}-put" for owner in owners])
+        transact = run(client, args, "transact", concurrency, owners)
+        duplicate = run(client, args, "transact", concurrency, owners)
+        print(f"  concurrency {concurrency:>4}")
+        for label, result in (("put", put), ("transact", transact), ("duplicate", duplicate)):
+            print(f"    {label:<10} {result['creates_per_second']:>8,.0f} creates/s  p50 {result['p50_ms']:>7.1f} ms  "
+                  f"p99 {result['p99_ms']:>7.1f} ms  {result['rejected']:>6,} rejected")
+        print(f"    overhead p50 {transact['p50_ms'] - put['p50_ms']:+.1f} ms, "
+              f"p99 {transact['p99_ms'] - put['p99_ms']:+.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the read capacity of account reads: always strong vs eventual + session tokens.
+
+What it does:
+
+1. Replays the same mixed workload of `--operations` requests against
+   `AccountService` over an in-process repository that charges DynamoDB read
+   capacity for every `get_item`: 1 RCU per 4 KB for a strongly consistent
+   read, 0.5 RCU for an eventually consistent one (`--item-kb` per account).
+   - `--write-ratio` of the requests update the status of an account,
+   - `--follow-ratio` of the writes are read back right away by the same
+     caller, presenting the session token of the write,
+   - the other reads pick one of `--accounts` accounts at random.
+2. Runs the workload under three configurations:
+   - `strong`: `account_read_consistency=strong`, no account cache (baseline),
+   - `eventual+tokens`: eventual reads, strong only for session tokens, no cache,
+   - `eventual+tokens+cache`: same, with the write-through account cache.
+3. Prints the RCUs consumed by reads and the savings over the baseline.
+
+The capacity is modelled from the DynamoDB pricing rules rather than read
+from `ConsumedCapacity`; on a real table the same split shows up in the
+`ConsumedReadCapacityUnits` CloudWatch metric.
+
+Usage:
+    python scripts/benchmarks/bench_read_consistency.py --operations 100000 --write-ratio 0.1 --follow-ratio 0.3
+"""
+
+import argparse
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.application.schemas.acchount_schema import GetAccountSchema
+from src.application.use_cases.account_use_case import AccountUseCase
+from src.domain.deadlines.request_deadline import NO_DEADLINE
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.session_token import SessionToken
+from src.domain.services.account_service import AccountService
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+
+class MeteredAccountRepository(InMemoryAccountRepository):
+    """
+    In-memory repository charging read capacity like DynamoDB `get_item`.
+    """
+
+    def __init__(self, item_kb: float):
+        super().__init__()
+        self.units_per_read = math.ceil(item_kb / 4)
+        self.rcu = 0.0
+        self.strong_reads = 0
+        self.eventual_reads = 0
+
+    def find_by_id(self, account_id, deadline=NO_DEADLINE, consistent: bool = False):
+        if consistent:
+            self.strong_reads += 1
+            self.rcu += self.units_per_read
+        else:
+            self.eventual_reads += 1
+            self.rcu += self.units_per_read / 2
+        return super().find_by_id(account_id, deadline, consistent)
+
+
+class NoCache(TTLCache):
+    """
+    Account cache that never holds anything.
+    """
+
+    def __init__(self):
+        super().__init__(ttl_seconds=0)
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl_seconds=None):
+        return None
+
+
+def run(args, consistent_reads: bool, cache: bool) -> MeteredAccountRepository:
+    rng = random.Random(args.seed)
+    repository = MeteredAccountRepository(args.item_kb)
+    service = AccountService(
+        repository,
+        account_cache=TTLCache(ttl_seconds=args.cache_ttl) if cache else NoCache(),
+        consistent_reads=consistent_reads,
+    )
+    use_case = AccountUseCase(service)
+
+    account_ids = []
+    for index in range(args.accounts):
+        account = Account(id=f"bench-{index:06d}", tenant_id="bench-tenant", owner_id=f"owner-{index}", status=AccountStatus.ACTIVE)
+        repository.create(account)
+        account_ids.append(account.id)
+    repository.rcu = repository.strong_reads = repository.eventual_reads = 0
+
+    pending_token: str | None = None
+    for _ in range(args.operations):
+        if rng.random() < args.write_ratio:
+            account = repository.get_by_id(rng.choice(account_ids))
+            target = AccountStatus.SUSPENDED if account.status == AccountStatus.ACTIVE else AccountStatus.ACTIVE
+            updated = service.update_status(account.id, target, reason="bench")
+            if isinstance(updated, Account) and rng.random() < args.follow_ratio:
+                pending_token = SessionToken.of(updated).encode()
+            continue
+
+        if pending_token is not None:
+            account_id = SessionToken.parse(pending_token).account_id
+            use_case.get_account_conditional(GetAccountSchema(account_id=account_id), session_token=pending_token)
+            pending_token = None
+        else:
+            use_case.get_account_conditional(GetAccountSchema(account_id=rng.choice(account_ids)))
+
+    return repository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Account read capacity: strong vs eventual + session tokens.")
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--accounts", type=int, default=5_000)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--follow-ratio", type=float, default=0.3, help="Share of writes followed by a read with their token.")
+    parser.add_argument("--item-kb", type=float, default=1.0)
+    parser.add_argument("--cache-ttl", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"📊 {args.operations:,} operations, {args.write_ratio:.0%} writes, "
+          f"{args.follow_ratio:.0%} of writes read back with their token, {args.accounts:,} accounts")
+
+    baseline = None
+    for label, consistent_reads, cache in (
+        ("strong", True, False),
+        ("eventual+tokens", False, False),
+        ("eventual+tokens+cache", False, True),
+    ):
+        repository = run(args, consistent_reads, cache)
+        baseline = baseline if baseline is not None else repository.rcu
+        savings = 1 - repository.rcu / baseline if baseline else 0.0
+        print(f"  {label:<22} {repository.rcu:>12,.1f} RCU  "
+              f"strong {repository.strong_reads:>8,}  eventual {repository.eventual_reads:>8,}  savings {savings:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
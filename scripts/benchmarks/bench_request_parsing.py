@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark event parsing: generic decode-then-validate vs the precompiled route parsers.
+
+What it does:
+
+1. Builds API Gateway v2 events for create_account (JSON body),
+   get_account (path parameters) and update_status (JSON body), with the
+   headers and request context a real event carries.
+2. Parses each event `--events` times with:
+   - generic: what `deployable` does per request, `json.loads(body)` then
+     `schema_cls(**data)` (path: `schema_cls(**pathParameters)`),
+   - compiled: the parser `@precompiled` builds at import
+     (`validate_json` on the body, `validate_python` on the path parameters).
+3. Times the full compiled handler with a no-op router function inside
+   `with_request_context`, i.e. the overhead a request pays before the use case.
+4. Prints events/s and µs/event per route and path.
+
+Usage:
+    python scripts/benchmarks/bench_request_parsing.py --events 200000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.application.compiled_routes import CompiledRoute, build_compiled_handler, compile_parser
+from src.application.request_context import with_request_context
+from src.application.schemas.acchount_schema import AccountSchema, GetAccountSchema, UpdateStatusAccountSchema
+
+
+def http_event(method: str, path: str, body: dict | None = None, path_parameters: dict | None = None) -> dict:
+    return {
+        "version": "2.0",
+        "routeKey": f"{method} {path}",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {
+            "accept": "application/json",
+            "content-type": "application/json",
+            "host": "api.example.com",
+            "user-agent": "bench/1.0",
+            "x-tenant-id": "tenant_123",
+            "x-amzn-trace-id": "Root=1-5e1b4151-5ac6c58f5b8f7d7f2d3e4f5a",
+        },
+        "pathParameters": path_parameters or {},
+        "requestContext": {
+            "accountId": "123456789012",
+            "apiId": "api-id",
+            "domainName": "api.example.com",
+            "http": {"method": method, "path": path, "protocol": "HTTP/1.1", "sourceIp": "10.0.0.1"},
+            "requestId": "c6af9ac6-7b61-11e6-9a41-93e8deadbeef",
+            "stage": "$default",
+            "timeEpoch": 1_749_652_200_000,
+        },
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+ROUTES = {
+    "create_account": (AccountSchema, "json", http_event(
+        "POST", "/accounts/create", {"tenant_id": "tenant_123", "owner_id": "owner_456"},
+    )),
+    "get_account": (GetAccountSchema, "path", http_event(
+        "GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8", path_parameters={"accountId": "01JXN4DSSZPX14M9CK8BVV8TS8"},
+    )),
+    "update_status": (UpdateStatusAccountSchema, "json", http_event(
+        "PATCH", "/accounts/update_status",
+        {"account_id": "01JXN4DSSZPX14M9CK8BVV8TS8", "status": "suspended", "reason": "chargeback"},
+    )),
+}
+
+
+def generic_parser(schema_cls, source: str):
+    if source == "json":
+        return lambda event: schema_cls(**json.loads(event.get("body") or "{}"))
+    return lambda event: schema_cls(**(event.get("pathParameters") or {}))
+
+
+def bench(parse, event: dict, events: int) -> float:
+    started = time.perf_counter()
+    for _ in range(events):
+        parse(event)
+    return time.perf_counter() - started
+
+
+def report(label: str, events: int, elapsed: float) -> None:
+    print(f"  {label:<26} {elapsed / events * 1e6:>8.3f} µs/event  {events / elapsed:>12,.0f} events/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request parsing benchmark.")
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for name, (schema_cls, source, event) in ROUTES.items():
+        print(f"⏱️ {name} ({source})")
+        generic = bench(generic_parser(schema_cls, source), event, args.events)
+        compiled = bench(compile_parser(schema_cls, source), event, args.events)
+        report("generic decode + validate", args.events, generic)
+        report("compiled", args.events, compiled)
+        print(f"  {'speedup':<26} {generic / compiled:>8.2f}x")
+
+        handler = with_request_context(build_compiled_handler(
+            CompiledRoute(name, lambda schema: {"statusCode": 200}, compile_parser(schema_cls, source))
+        ))
+        report("compiled handler (no-op)", args.events, bench(handler, event, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Load test the FastAPI target: throughput as the number of server workers grows.
+
+What it does:
+
+1. Seeds `--accounts` accounts through the configured account repository
+   (use a shared backend such as dynamodb-local: the in-memory one is per worker).
+2. For every count in `--workers`, starts `main.py` with TARGET=fastapi and
+   SERVER_WORKERS=<count>, and waits until it accepts connections.
+3. Drives GET /accounts/{id} for `--seconds` from `--client-processes`
+   processes with `--connections` keep-alive HTTP/1.1 connections each.
+4. Stops the server with SIGTERM (graceful drain) and prints req/s,
+   p50/p99 latency, errors, and the speedup over the first worker count.
+
+Client and server share the host's cores; for clean numbers on large
+hosts, start the server elsewhere and pass `--url` (single run).
+
+Usage:
+    docker compose up -d dynamodb-local
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/benchmarks/bench_server_workers.py --workers 1,2,4,8
+    python scripts/benchmarks/bench_server_workers.py --url http://10.0.0.5:8080 --seconds 30
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def seed(count: int) -> list[str]:
+    """Store `count` accounts in the configured backend and return their IDs."""
+    from src.config.custom_config import ENVIRONMENT
+    from src.domain.entity.account import Account, AccountStatus
+    from src.infra.repositories.account_repository_factory import build_account_repository
+
+    repository = build_account_repository(
+        ENVIRONMENT.account_repository_backend,
+        mongodb_uri=ENVIRONMENT.mongodb_uri,
+        mongodb_database=ENVIRONMENT.mongodb_database,
+        firestore_project=ENVIRONMENT.firestore_project,
+        firestore_database=ENVIRONMENT.firestore_database,
+    )
+    accounts = [
+        Account(tenant_id="bench-tenant", owner_id=f"owner-{index}", status=AccountStatus.ACTIVE).generate_ulid()
+        for index in range(count)
+    ]
+    repository.batch_create(accounts)
+    return [account.id for account in accounts]
+
+
+def wait_until_listening(host: str, port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"Server did not listen on {host}:{port} within {timeout:.0f}s")
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "TARGET": "fastapi", "SERVER_WORKERS": str(workers), "SERVER_PORT": str(port)}
+    server = subprocess.Popen([sys.executable, "main.py"], cwd=PROJECT_ROOT, env=env)
+    wait_until_listening("127.0.0.1", port)
+    return server
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def client_process(url: str, ids: list[str], connections: int, seconds: float, offset: int) -> tuple[list[float], int]:
+    """Runs `connections` keep-alive connections for `seconds`; returns latencies and errors."""
+    target = urlparse(url)
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def connection_loop(index: int):
+        nonlocal errors
+        local, local_errors = [], 0
+        connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=10)
+        while time.perf_counter() < stop_at:
+            account_id = ids[index % len(ids)]
+            index += connections
+            started = time.perf_counter()
+            try:
+                connection.request("GET", f"/accounts/{account_id}", headers={"X-Tenant-Id": "bench-tenant"})
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=10)
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=connection_loop, args=(offset + index,)) for index in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def run_load(url: str, ids: list[str], processes: int, connections: int, seconds: float) -> tuple[float, float, float, int]:
+    """Returns (requests per second, p50 ms, p99 ms, errors)."""
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        results = pool.starmap(
+            client_process,
+            [(url, ids, connections, seconds, index * connections) for index in range(processes)],
+        )
+
+    latencies = [value for values, _ in results for value in values]
+    errors = sum(count for _, count in results)
+    quantiles = statistics.quantiles(latencies, n=100)
+    return len(latencies) / seconds, quantiles[49] * 1000, quantiles[98] * 1000, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FastAPI worker scaling load test.")
+    parser.add_argument("--workers", default=",".join(str(count) for count in (1, 2, 4, 8) if count <= (os.cpu_count() or 1)))
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 1) // 2))
+    parser.add_argument("--connections", type=int, default=32, help="Keep-alive connections per client process.")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--url", help="Load an already running server instead of starting one per worker count.")
+    args = parser.parse_args()
+
+    ids = seed(args.accounts)
+    print(
+        f"⏱️ {args.client_processes} client processes × {args.connections} connections, "
+        f"{args.seconds:.0f}s per run, {os.cpu_count()} cores"
+    )
+
+    if args.url:
+        rate, p50, p99, errors = run_load(args.url, ids, args.client_processes, args.connections, args.seconds)
+        print(f"{'external':<12} {rate:>9,.0f} req/s  p50 {p50:>7.2f} ms  p99 {p99:>7.2f} ms  errors {errors}")
+        return
+
+    baseline = None
+    for workers in (int(value) for value in args.workers.split(",")):
+        server = start_server(workers, args.port)
+        try:
+            rate, p50, p99, errors = run_load(
+                f"http://127.0.0.1:{args.port}", ids, args.client_processes, args.connections, args.seconds
+            )
+        finally:
+            stop_server(server)
+
+        baseline = baseline or rate
+        print(
+            f"{workers:>2} worker(s) {rate:>9,.0f} req/s  p50 {p50:>7.2f} ms  p99 {p99:>7.2f} ms  "
+            f"errors {errors}  speedup {rate / baseline:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming statement exports: rows/sec, output size and peak RSS.
+
+What it does:
+
+1. Generates `--rows` synthetic transactions as query pages of `--page-size`
+   items (the shape `TransactionRepository.query_range_pages` yields), without
+   keeping them around, so the generator itself uses constant memory.
+2. Streams the pages into a `StatementWriter` on a `LocalObjectStore`, exactly
+   like `TransactionService.export_statement`.
+3. Runs every format in its own subprocess, so each peak RSS is measured in
+   isolation, and prints rows/sec, bytes per row and peak RSS.
+
+`--buffered` collects every row before writing (the paging-into-memory
+approach) to show the memory the streaming path avoids.
+
+Usage:
+    python scripts/benchmarks/bench_statement_export.py --rows 10000000
+    python scripts/benchmarks/bench_statement_export.py --rows 1000000 --formats csv.gz --buffered
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.infra.exports.object_store import LocalObjectStore
+from src.infra.exports.statement_writer import STATEMENT_FORMATS, build_statement_writer, statement_format_available
+
+PRODUCTS = ("VOUCHER", "PIX", "CARD", "BOLETO")
+
+
+def synthetic_pages(rows: int, page_size: int):
+    """Yield query pages of synthetic transactions for one tenant."""
+    base_ms = 1_748_736_000_000  # 2025-06-01T00:00:00Z
+    balance = 0.0
+    for page_start in range(0, rows, page_size):
+        page = []
+        for index in range(page_start, min(page_start + page_size, rows)):
+            credit = index % 3 != 0
+            amount = round(10 + (index * 7919 % 50_000) / 100, 2)
+            balance += amount if credit else -amount
+            millis = base_ms + index * 250
+            seconds, ms = divmod(millis, 1000)
+            page.append({
+                "id": f"01JX{index:022d}",
+                "tenant_id": "tenant_123",
+                "account_id": f"acc-{index % 5000:05d}",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{ms:03d}Z",
+                "amount": amount,
+                "type": "CREDIT" if credit else "DEBIT",
+                "currency": "BRL",
+                "product": PRODUCTS[index % len(PRODUCTS)],
+                "reference": f"Pedido #{index}",
+                "balance_snapshot": round(balance, 2),
+                "metadata": {"parcelas": index % 12 + 1} if index % 10 == 0 else None,
+            })
+        yield page, None
+
+
+def run_one(export_format: str, rows: int, page_size: int, buffered: bool, directory: str) -> dict:
+    """Export once in this process and return the measurements."""
+    if not statement_format_available(export_format):
+        raise SystemExit(f"{export_format} needs pyarrow (pip install -r requirements.txt)")
+    store = LocalObjectStore(directory)
+    key = f"bench.{STATEMENT_FORMATS[export_format]}"
+
+    started = time.perf_counter()
+    pages = synthetic_pages(rows, page_size)
+    if buffered:
+        everything = [item for items, _ in pages for item in items]
+        pages = [(everything, None)]
+
+    with store.open_write(key) as stream:
+        writer = build_statement_writer(export_format, stream)
+        for items, _ in pages:
+            writer.write_rows(items)
+        writer.close()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "format": export_format,
+        "rows": writer.rows,
+        "seconds": elapsed,
+        "bytes": (Path(directory) / key).stat().st_size,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Statement export benchmark.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--formats", nargs="+", default=list(STATEMENT_FORMATS))
+    parser.add_argument("--buffered", action="store_true", help="Also run with every row collected in memory first.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        export_format, buffered, directory = json.loads(args.child)
+        print(json.dumps(run_one(export_format, args.rows, args.page_size, buffered, directory)))
+        return
+
+    print(f"📦 Exporting {args.rows:,} synthetic transactions (pages of {args.page_size})")
+    runs = [(export_format, False) for export_format in args.formats]
+    if args.buffered:
+        runs += [(export_format, True) for export_format in args.formats]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for export_format, buffered in runs:
+            child = json.dumps([export_format, buffered, directory])
+            output = subprocess.run(
+                [sys.executable, __file__, "--rows", str(args.rows), "--page-size", str(args.page_size), "--child", child],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            label = export_format
+            mode = "buffered" if buffered else "streaming"
+            print(
+                f"{label:<18} {mode:<10} {result['rows'] / result['seconds']:>12,.0f} rows/s  "
+                f"{result['bytes'] / result['rows']:>6.1f} B/row  peak RSS {result['peak_rss_mb']:>8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
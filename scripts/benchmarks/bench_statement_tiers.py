@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark long-range statements: all-hot table vs hot table + transaction archive.
+
+What it does:
+
+1. Creates `account-transaction-table` (with `account_id-timestamp-index`) on
+   the DynamoDB endpoint if it does not exist, and seeds two accounts with the
+   same `--months` of history, `--per-day` transactions a day:
+   - `bench-hot`: everything stays in the table (baseline),
+   - `bench-tiered`: transactions older than `--horizon-days` are archived
+     into a `LocalObjectStore` and deleted from the table, like
+     `scripts/archive_transactions.py`.
+2. Reads whole statements through `query_range_pages`, `--runs` times each:
+   - the full history (crosses the boundary: archive segments + hot table),
+   - the last 30 days (hot table only on both).
+3. Prints p50/p99 latency per range and tier, the items left in the table
+   and the archive size per transaction.
+
+Usage:
+    docker compose up -d dynamodb-local
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/benchmarks/bench_statement_tiers.py --months 24 --per-day 50
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.entity.timestamps import format_timestamp
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.exports.object_store import LocalObjectStore
+from src.infra.repositories.dynamodb_items import serialize_item
+from src.infra.repositories.tiered_transaction_repository import TieredTransactionRepository
+from src.infra.repositories.transaction_repository import ACCOUNT_TIMESTAMP_INDEX_NAME, TransactionRepository
+
+PRODUCTS = ("VOUCHER", "PIX", "CARD", "BOLETO")
+
+
+def ensure_table(client, table_name: str) -> None:
+    if table_name in client.list_tables()["TableNames"]:
+        return
+    client.create_table(
+        TableName=table_name,
+        BillingMode="PAY_PER_REQUEST",
+        AttributeDefinitions=[
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "account_id", "AttributeType": "S"},
+            {"AttributeName": "timestamp", "AttributeType": "S"},
+        ],
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        GlobalSecondaryIndexes=[{
+            "IndexName": ACCOUNT_TIMESTAMP_INDEX_NAME,
+            "KeySchema": [
+                {"AttributeName": "account_id", "KeyType": "HASH"},
+                {"AttributeName": "timestamp", "KeyType": "RANGE"},
+            ],
+            "Projection": {"ProjectionType": "ALL"},
+        }],
+    )
+    client.get_waiter("table_exists").wait(TableName=table_name)
+
+
+def history(account_id: str, now: datetime, months: int, per_day: int) -> list[dict]:
+    """Synthetic transactions of one account, oldest first."""
+    rows = []
+    for day in range(months * 30, 0, -1):
+        for index in range(per_day):
+            moment = now - timedelta(days=day, seconds=index * 86_400 // per_day)
+            rows.append({
+                "id": f"{account_id}-{day:05d}-{index:04d}",
+                "tenant_id": "bench-tenant",
+                "account_id": account_id,
+                "timestamp": format_timestamp(moment),
+                "amount": round(10 + (day * 31 + index) % 5000 / 100, 2),
+                "type": "CREDIT" if index % 3 else "DEBIT",
+                "currency": "BRL",
+                "product": PRODUCTS[index % len(PRODUCTS)],
+                "reference": f"Pedido #{day}-{index}",
+            })
+    return rows
+
+
+def seed(client, table_name: str, rows: list[dict]) -> None:
+    for start in range(0, len(rows), 25):
+        request = {table_name: [{"PutRequest": {"Item": serialize_item(row)}} for row in rows[start:start + 25]]}
+        while request:
+            request = client.batch_write_item(RequestItems=request).get("UnprocessedItems") or None
+
+
+def read_statement(repository, account_id: str, start: str, end: str) -> int:
+    return sum(len(items) for items, _ in repository.query_range_pages(start, end, account_id=account_id))
+
+
+def measure(repository, account_id: str, start: str, end: str, runs: int) -> tuple[float, float, int]:
+    """Returns (p50 ms, p99 ms, rows)."""
+    latencies, rows = [], 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = read_statement(repository, account_id, start, end)
+        latencies.append((time.perf_counter() - started) * 1000)
+    if len(latencies) == 1:
+        return latencies[0], latencies[0], rows
+    quantiles = statistics.quantiles(latencies, n=100)
+    return quantiles[49], quantiles[98], rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot vs tiered statement benchmark.")
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--per-day", type=int, default=50)
+    parser.add_argument("--horizon-days", type=int, default=180)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    client = get_dynamodb_client()
+    hot = TransactionRepository()
+    ensure_table(client, hot.table_name)
+
+    now = datetime.now(timezone.utc)
+    cutoff = format_timestamp(now - timedelta(days=args.horizon_days))
+    baseline_rows = history("bench-hot", now, args.months, args.per_day)
+    tiered_rows = history("bench-tiered", now, args.months, args.per_day)
+    print(f"🌱 Seeding {len(baseline_rows) + len(tiered_rows):,} transactions...")
+    seed(client, hot.table_name, baseline_rows + tiered_rows)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = LocalObjectStore(directory)
+        archive = TransactionArchive(store)
+        old = [row for row in tiered_rows if row["timestamp"] < cutoff]
+        segments = archive.write_segments(old)
+        archive.commit(segments)
+        hot.batch_delete([row["id"] for row in old])
+        archive_bytes = sum(path.stat().st_size for path in Path(directory).rglob("*.jsonl.gz"))
+        print(f"🗄️ Archived {len(old):,} transactions in {len(segments)} segments, "
+              f"{archive_bytes / max(len(old), 1):.1f} bytes/transaction; "
+              f"{len(tiered_rows) - len(old):,} stay in the table")
+
+        tiered = TieredTransactionRepository(hot, archive, horizon_days=args.horizon_days)
+        ranges = {
+            "full history": (baseline_rows[0]["timestamp"], format_timestamp(now)),
+            "last 30 days": (format_timestamp(now - timedelta(days=30)), format_timestamp(now)),
+        }
+        for label, (start, end) in ranges.items():
+            print(f"⏱️ {label}")
+            for tier, repository, account_id in (("all-hot", hot, "bench-hot"), ("tiered", tiered, "bench-tiered")):
+                p50, p99, rows = measure(repository, account_id, start, end, args.runs)
+                print(f"  {tier:<8} {rows:>9,} rows  p50 {p50:>9.1f} ms  p99 {p99:>9.1f} ms")
+
+    hot.batch_delete([row["id"] for row in baseline_rows] + [row["id"] for row in tiered_rows if row["timestamp"] >= cutoff])
+
+
+if __name__ == "__main__":
+    main()
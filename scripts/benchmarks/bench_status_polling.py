@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the status-polling workload of `GET /accounts/{accountId}`.
+
+What it does:
+
+Runs `--polls` polls of the same account through `AccountUseCase.get_account_conditional`
+backed by a stand-in repository that sleeps `--latency-ms` per DynamoDB call,
+in four modes:
+
+1. full: full account, no cache, no ETag reuse (previous behaviour).
+2. fields=status: projected read, no cache.
+3. fields=status + cache: projection served from the account cache.
+4. fields=status + cache + If-None-Match: the poller sends back the ETag and gets 304.
+
+For each mode it prints the mean latency per poll, the DynamoDB reads issued
+and the average response body size in bytes.
+
+Usage:
+    python scripts/benchmarks/bench_status_polling.py --polls 2000 --latency-ms 4
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.application.schemas.acchount_schema import GetAccountSchema
+from src.application.use_cases.account_use_case import AccountUseCase
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.infra.cache.ttl_cache import TTLCache
+
+ACCOUNT = Account(
+    id="01JXN4DSSZPX14M9CK8BVV8TS8",
+    tenant_id="tenant_123",
+    owner_id="lojista-ABC",
+    status=AccountStatus.SUSPENDED,
+    suspension_reason="inadimplência",
+    version=3,
+    created_at="2025-06-01T10:00:00Z",
+    updated_at="2025-06-11T14:30:00Z",
+)
+
+
+class StandInRepository:
+    """Serves one account with a fixed latency per call and counts the calls."""
+
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+        self.reads = 0
+
+    def get_by_id(self, account_id: str):
+        self.reads += 1
+        time.sleep(self.latency_seconds)
+        return ACCOUNT.model_copy()
+
+    def get_projected(self, account_id: str, fields: list[str]):
+        self.reads += 1
+        time.sleep(self.latency_seconds)
+        return ACCOUNT.model_dump(mode="json", include=set(fields))
+
+
+def run(label: str, polls: int, latency: float, fields: list[str] | None, cache_ttl: float, reuse_etag: bool) -> None:
+    repository = StandInRepository(latency)
+    use_case = AccountUseCase(AccountService(repository, account_cache=TTLCache(ttl_seconds=cache_ttl)))
+    etag, body_bytes = None, 0
+
+    started = time.perf_counter()
+    for _ in range(polls):
+        response, new_etag = use_case.get_account_conditional(
+            GetAccountSchema(account_id=ACCOUNT.id, fields=fields),
+            if_none_match=etag if reuse_etag else None,
+        )
+        etag = new_etag
+        if response.status_code == 200:
+            body = response.body.model_dump(mode="json") if isinstance(response.body, Account) else response.body
+            body_bytes += len(json.dumps(body).encode())
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{label:<36} {elapsed / polls * 1000:>7.3f} ms/poll  "
+        f"reads {repository.reads:>6}  body {body_bytes / polls:>6.1f} B/poll"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Status polling benchmark.")
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=4.0)
+    parser.add_argument("--cache-ttl", type=float, default=2.0)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+
+    run("full", args.polls, latency, None, 0, False)
+    run("fields=status", args.polls, latency, ["status"], 0, False)
+    run("fields=status + cache", args.polls, latency, ["status"], args.cache_ttl, False)
+    run("fields=status + cache + If-None-Match", args.polls, latency, ["status"], args.cache_ttl, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark ULID generation throughput and key distribution.
+
+What it does:
+
+1. Measures IDs/sec of the monotonic generator (`new()` and `allocate(n)`)
+   against a naive per-ID implementation (fresh entropy + per-character encoding).
+2. Prints key-distribution histograms for a bulk onboarding burst:
+   - ULIDs as hash-partitioned partition keys (the `account-table` layout),
+   - ULIDs on range-partitioned storage (what "time-ordered keys" hurts),
+   - ULID sort keys under a single hot partition key, without and with `KeySharding`.
+
+Usage:
+    python scripts/benchmarks/bench_ulid.py --ids 200000 --partitions 16 --shards 8
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.domain.ids.ulid_generator import CROCKFORD_ALPHABET, MonotonicUlidGenerator, decode_ulid_timestamp
+from src.infra.repositories.key_sharding import KeySharding
+
+
+def naive_ulid() -> str:
+    """Per-ID reference implementation: fresh entropy and per-character encoding."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    return "".join(CROCKFORD_ALPHABET[(value >> (5 * index)) & 31] for index in reversed(range(26)))
+
+
+def throughput(label: str, produce, total: int) -> None:
+    started = time.perf_counter()
+    produced = produce(total)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {produced / elapsed:>14,.0f} ids/sec")
+
+
+def hash_partition(key: str, partitions: int) -> int:
+    """Approximates DynamoDB's placement: a hash of the partition key."""
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big") % partitions
+
+
+def histogram(title: str, counts: Counter, buckets: int) -> None:
+    total = sum(counts.values())
+    peak = max(counts.values())
+    print(f"\n{title}")
+    for bucket in range(buckets):
+        share = counts.get(bucket, 0) / total
+        bar = "#" * round(40 * counts.get(bucket, 0) / peak)
+        print(f"  {bucket:>3} {share:>7.1%} {bar}")
+    print(f"  hottest bucket: {peak / total:.1%} of writes (ideal {1 / buckets:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ULID throughput and key distribution benchmark.")
+    parser.add_argument("--ids", type=int, default=200_000)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    generator = MonotonicUlidGenerator()
+
+    print("⏱️ Generator throughput")
+    throughput("naive per-id", lambda n: len([naive_ulid() for _ in range(n)]), args.ids)
+    throughput("monotonic new()", lambda n: len([generator.new() for _ in range(n)]), args.ids)
+    throughput(
+        f"monotonic allocate({args.batch})",
+        lambda n: sum(len(generator.allocate(args.batch)) for _ in range(n // args.batch)),
+        args.ids,
+    )
+
+    burst = generator.allocate(args.ids)
+
+    histogram(
+        "📊 ULID partition keys, hash-partitioned (account-table)",
+        Counter(hash_partition(key, args.partitions) for key in burst),
+        args.partitions,
+    )
+
+    # Range partitions split the keyspace of the last 24h evenly, like an ordered store would.
+    now_ms = time.time_ns() // 1_000_000
+    width = 86_400_000 // args.partitions
+    range_counts = Counter(
+        min((decode_ulid_timestamp(key) - (now_ms - 86_400_000)) // width, args.partitions - 1)
+        for key in burst
+    )
+    histogram("📊 ULID keys, range-partitioned by time (ordered store)", range_counts, args.partitions)
+
+    hot_account = generator.new()
+    histogram(
+        "📊 ULID sort keys under one hot partition key, unsharded",
+        Counter(hash_partition(KeySharding(1).partition_key(hot_account, key), args.shards) for key in burst),
+        args.shards,
+    )
+
+    sharding = KeySharding(args.shards)
+    histogram(
+        f"📊 ULID sort keys under one hot partition key, KeySharding({args.shards})",
+        Counter(sharding.shard_for(key) for key in burst),
+        args.shards,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Static dependency closure of every `@deployable` function, for incremental deploys.
+
+What it does:
+
+1. Finds the `@deployable` (or `@precompiled_deployable`) functions of `src/application/routers` by parsing
+   the modules (AST only: nothing is imported, so `start_account_dependencies()`
+   and the module-level wiring of the routers never run).
+2. Computes each function's closure:
+   - inside its router module, the function and only the module-level
+     statements it reaches (the services it uses, their imports, ...), plus
+     statements run for side effects (e.g. `start_account_dependencies()`);
+   - every project module reached through those imports, transitively,
+     with the package `__init__` files they execute;
+   - the shared entry points: `main.py` (and its closure) and `requirements.txt`.
+3. Hashes the closure (Python files by AST, so comments and formatting do not
+   count) and compares it with the manifest of the last deploy.
+
+The generators use it with `--incremental`; after a successful deploy,
+`record` stores the deployed hashes in the manifest.
+
+Usage:
+    python scripts/deploy_closure.py show --target lambda
+    python scripts/deploy_closure.py record --target lambda --plan deploy_plan.json
+    python scripts/deploy_closure.py record --target cloudfunction --functions get_account,update_status
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ROUTERS_PATH = Path("src/application/routers")
+ENTRY_MODULE = "main"
+DEPLOYABLE_DECORATORS = frozenset({"deployable", "precompiled_deployable"})
+SHARED_FILES = ("requirements.txt",)
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class DeployableFunction:
+    """A `@deployable` function found statically."""
+
+    name: str
+    module: str
+    path: Path
+    targets: list[str]
+    methods: list[str] = field(default_factory=list)
+    route: str | None = None
+    node: ast.FunctionDef | None = field(default=None, repr=False)
+
+
+def _target_name(node: ast.expr, constants: dict[str, ast.expr]) -> str | None:
+    """Normalizes `DeploymentTarget.LAMBDA`, `LAMBDA_TARGET` or `"lambda"` to "lambda"."""
+    if isinstance(node, ast.Name) and node.id in constants:
+        return _target_name(constants[node.id], constants)
+    if isinstance(node, ast.Attribute):
+        return node.attr.lower().replace("_", "")
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value.lower().replace("_", "")
+    return None
+
+
+def _deployable_call(function: ast.FunctionDef) -> ast.Call | None:
+    for decorator in function.decorator_list:
+        if isinstance(decorator, ast.Call):
+            called = decorator.func
+            name = called.id if isinstance(called, ast.Name) else getattr(called, "attr", None)
+            if name in DEPLOYABLE_DECORATORS:
+                return decorator
+    return None
+
+
+def _module_name(path: Path, root: Path) -> str:
+    return ".".join(path.relative_to(root).with_suffix("").parts)
+
+
+def find_deployable_functions(root: Path = PROJECT_ROOT) -> list[DeployableFunction]:
+    """
+    Returns every `@deployable` function of the routers package, without importing it.
+    """
+    functions = []
+    for path in sorted((root / ROUTERS_PATH).rglob("*.py")):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        constants = {
+            target.id: statement.value
+            for statement in tree.body if isinstance(statement, ast.Assign)
+            for target in statement.targets if isinstance(target, ast.Name)
+        }
+
+        for statement in tree.body:
+            if not isinstance(statement, ast.FunctionDef):
+                continue
+            call = _deployable_call(statement)
+            if call is None:
+                continue
+
+            target_nodes = call.args[0].elts if call.args and isinstance(call.args[0], (ast.List, ast.Tuple)) else []
+            keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+            if "targets" in keywords and isinstance(keywords["targets"], (ast.List, ast.Tuple)):
+                target_nodes = keywords["targets"].elts
+
+            methods = keywords.get("methods")
+            route = keywords.get("route")
+            functions.append(DeployableFunction(
+                name=statement.name,
+                module=_module_name(path, root),
+                path=path,
+                targets=[name for name in (_target_name(node, constants) for node in target_nodes) if name],
+                methods=[element.value for element in methods.elts] if isinstance(methods, (ast.List, ast.Tuple)) else [],
+                route=route.value if isinstance(route, ast.Constant) else None,
+                node=statement,
+            ))
+    return functions
+
+
+def _used_names(node: ast.AST) -> set[str]:
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _defined_names(statement: ast.stmt) -> set[str]:
+    match statement:
+        case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+            return {statement.name}
+        case ast.Import():
+            return {(alias.asname or alias.name).split(".")[0] for alias in statement.names}
+        case ast.ImportFrom():
+            return {alias.asname or alias.name for alias in statement.names}
+        case ast.Assign() | ast.AnnAssign() | ast.AugAssign():
+            targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+            return {name.id for target in targets for name in ast.walk(target) if isinstance(name, ast.Name)}
+    return set()
+
+
+class ClosureHasher:
+    """
+    Computes and caches module closures and their digests for one source tree.
+    """
+
+    def __init__(self, root: Path = PROJECT_ROOT) -> None:
+        self.root = root
+        self._trees: dict[Path, ast.Module] = {}
+        self._file_digests: dict[Path, str] = {}
+        self._module_closures: dict[str, frozenset[Path]] = {}
+
+    def tree(self, path: Path) -> ast.Module:
+        if path not in self._trees:
+            self._trees[path] = ast.parse(path.read_text(), filename=str(path))
+        return self._trees[path]
+
+    def file_digest(self, path: Path) -> str:
+        """Digest of a file: its AST for Python files, its bytes otherwise."""
+        if path not in self._file_digests:
+            content = ast.dump(self.tree(path)).encode() if path.suffix == ".py" else path.read_bytes()
+            self._file_digests[path] = hashlib.sha256(content).hexdigest()
+        return self._file_digests[path]
+
+    def module_path(self, module: str) -> Path | None:
+        """File of a project module (None for third-party and standard library modules)."""
+        base = self.root.joinpath(*module.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _package_inits(self, module: str) -> set[Path]:
+        """`__init__.py` files executed when importing `module`."""
+        parts = module.split(".")
+        inits = set()
+        for depth in range(1, len(parts)):
+            init = self.root.joinpath(*parts[:depth], "__init__.py")
+            if init.is_file():
+                inits.add(init)
+        return inits
+
+    def imported_modules(self, statements, module: str, is_package: bool) -> set[str]:
+        """Project modules imported by some statements of `module` (including nested, lazy imports)."""
+        imported = set()
+        package = module if is_package else module.rpartition(".")[0]
+        for statement in statements:
+            for node in ast.walk(statement):
+                if isinstance(node, ast.Import):
+                    imported.update(alias.name for alias in node.names)
+                elif isinstance(node, ast.ImportFrom):
+                    if node.level:
+                        base_parts = package.split(".")[: len(package.split(".")) - node.level + 1]
+                        base = ".".join(part for part in base_parts + [node.module or ""] if part)
+                    else:
+                        base = node.module or ""
+                    imported.add(base)
+                    # `from package import submodule` imports the submodule too.
+                    imported.update(f"{base}.{alias.name}" for alias in node.names)
+        return {name for name in imported if self.module_path(name) is not None}
+
+    def module_closure(self, module: str) -> frozenset[Path]:
+        """Files of `module` and of every project module it imports, transitively."""
+        if module in self._module_closures:
+            return self._module_closures[module]
+
+        files: set[Path] = set()
+        pending = [module]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            path = self.module_path(current)
+            if path is None:
+                continue
+            files.add(path)
+            files.update(self._package_inits(current))
+            pending.extend(_module_name(init.parent, self.root) for init in self._package_inits(current))
+            pending.extend(self.imported_modules(self.tree(path).body, current, path.name == "__init__.py"))
+
+        self._module_closures[module] = frozenset(files)
+        return self._module_closures[module]
+
+    def function_statements(self, function: DeployableFunction) -> list[ast.stmt]:
+        """
+        The module-level statements of the router module a function depends on, in source order.
+        """
+        body = self.tree(function.path).body
+        definitions: dict[str, list[ast.stmt]] = {}
+        always = []
+        for statement in body:
+            names = _defined_names(statement)
+            for name in names:
+                definitions.setdefault(name, []).append(statement)
+            is_docstring = isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant)
+            if not names and not is_docstring:
+                always.append(statement)
+
+        node = next(statement for statement in body if isinstance(statement, ast.FunctionDef) and statement.name == function.name)
+        included = {id(node): node}
+        pending = [node, *always]
+        for statement in always:
+            included[id(statement)] = statement
+
+        while pending:
+            for name in _used_names(pending.pop()):
+                for definition in definitions.get(name, ()):
+                    if id(definition) not in included:
+                        included[id(definition)] = definition
+                        pending.append(definition)
+
+        return [statement for statement in body if id(statement) in included]
+
+    def function_files(self, function: DeployableFunction) -> set[Path]:
+        """Project files (other than the router module) and shared inputs a function depends on."""
+        statements = self.function_statements(function)
+        files = set(self._package_inits(function.module))
+        for module in self.imported_modules(statements, function.module, False):
+            files.update(self.module_closure(module))
+        files.update(self.module_closure(ENTRY_MODULE))
+        files.update(self.root / name for name in SHARED_FILES if (self.root / name).is_file())
+        files.discard(function.path)
+        return files
+
+    def module_digest(self, module: str) -> str:
+        """Digest of the closure of a handler module, with the shared inputs (for functions outside `@deployable`)."""
+        files = set(self.module_closure(module)) | self.module_closure(ENTRY_MODULE)
+        files.update(self.root / name for name in SHARED_FILES if (self.root / name).is_file())
+        digest = hashlib.sha256()
+        for path in sorted(files):
+            digest.update(str(path.relative_to(self.root)).encode())
+            digest.update(self.file_digest(path).encode())
+        return digest.hexdigest()
+
+    def function_digest(self, function: DeployableFunction) -> str:
+        """Digest of a function's closure."""
+        digest = hashlib.sha256()
+        for statement in self.function_statements(function):
+            digest.update(ast.dump(statement).encode())
+        for path in sorted(self.function_files(function)):
+            digest.update(str(path.relative_to(self.root)).encode())
+            digest.update(self.file_digest(path).encode())
+        return digest.hexdigest()
+
+
+def closure_digests(target: str, root: Path = PROJECT_ROOT) -> dict[str, str]:
+    """`{function_name: closure digest}` of every function deployed to `target`."""
+    hasher = ClosureHasher(root)
+    return {
+        function.name: hasher.function_digest(function)
+        for function in find_deployable_functions(root)
+        if target in function.targets
+    }
+
+
+def module_digests(modules: dict[str, str], root: Path = PROJECT_ROOT) -> dict[str, str]:
+    """`{function_name: closure digest}` of functions not declared with `@deployable`, from `{function_name: handler module}`."""
+    hasher = ClosureHasher(root)
+    return {name: hasher.module_digest(module) for name, module in modules.items()}
+
+
+def file_digest(path: str | Path) -> str | None:
+    """Digest of a generated deploy configuration (e.g. serverless.yml), None if missing."""
+    path = Path(path)
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.is_file() else None
+
+
+def load_manifest(path: str | Path) -> dict:
+    """The manifest of the last deploy ({} when there is none)."""
+    path = Path(path)
+    if not path.is_file():
+        return {}
+    with open(path) as f:
+        manifest = json.load(f)
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def changed_functions(digests: dict[str, str], manifest: dict, target: str) -> list[str]:
+    """Functions whose closure differs from the last deployed one (or that were never deployed)."""
+    deployed = manifest.get("targets", {}).get(target, {}).get("functions", {})
+    return [name for name, digest in digests.items() if deployed.get(name) != digest]
+
+
+def record(manifest_path: str | Path, target: str, digests: dict[str, str], config_digest: str | None = None) -> dict:
+    """Stores the deployed digests of `target` in the manifest and returns it."""
+    manifest = load_manifest(manifest_path) or {"version": MANIFEST_VERSION, "targets": {}}
+    entry = manifest["targets"].setdefault(target, {"functions": {}})
+    entry["functions"].update(digests)
+    if config_digest is not None:
+        entry["config"] = config_digest
+
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dependency closures of @deployable functions.")
+    parser.add_argument("command", choices=["show", "record"])
+    parser.add_argument("--target", choices=["lambda", "cloudfunction"], default="lambda")
+    parser.add_argument("--manifest", default="deploy_manifest.json")
+    parser.add_argument("--functions", help="Only record these functions (comma separated). Defaults to all.")
+    parser.add_argument("--config", help="Generated deploy configuration to record (e.g. serverless.yml).")
+    parser.add_argument("--digests", help="Digests computed beforehand (JSON object) instead of hashing the tree.")
+    parser.add_argument("--plan", help="deploy_plan.json written by generate_lambda.py --incremental (digests and config).")
+    args = parser.parse_args()
+
+    config_digest = file_digest(args.config) if args.config else None
+    if args.plan:
+        with open(args.plan) as f:
+            plan = json.load(f)
+        digests, config_digest = plan["digests"], plan["config"]
+    elif args.digests:
+        digests = json.loads(args.digests)
+    else:
+        digests = closure_digests(args.target)
+    if args.command == "show":
+        changed = set(changed_functions(digests, load_manifest(args.manifest), args.target))
+        for name, digest in digests.items():
+            print(f"{'🔁' if name in changed else '✅'} {name:<28} {digest[:16]}")
+        return
+
+    if args.functions:
+        wanted = set(args.functions.split(","))
+        digests = {name: digest for name, digest in digests.items() if name in wanted}
+    record(args.manifest, args.target, digests, config_digest)
+    print(f"📝 Recorded {len(digests)} function(s) for '{args.target}' in {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,38 @@ Script for automatically generating a cloudbuild.yaml file for deploying Google
 
 What it does:
 
-1. Scans the project for functions decorated with `@deployable(targets=["cloudfunction"])`.
+1. Scans the project (parsing, not importing, the routers) for functions decorated with `@deployable(targets=["cloudfunction"])`.
 2. Generates Cloud Build steps for deploying each Cloud Function.
 3. Adds a step to update the `requirements.txt` with a private GitHub token for private dependency installation.
 4. Outputs the final result as `cloudbuild.yaml`.
 
+Layouts:
+- split (default): one Cloud Function per function.
+- unified: a single `account_router` Cloud Function dispatching every route.
+
 Requirements:
 - Project directory structure with Python modules under `src/application/routers`.
 - Functions must use the `@deployable` decorator to be detected.
+
+Incremental deploys:
+- With `--incremental`, only the functions whose dependency closure changed since the
+  manifest of the last deploy get a deploy step (unified: the router, if any route changed).
+- With `--manifest-uri gs://...`, the build records the deployed closures in that manifest
+  after the deploy steps succeed.
+
+Usage:
+    python scripts/generate_cloudbuild.py [--layout split|unified] [--incremental --manifest-uri gs://bucket/deploy_manifest.json]
 """
 
-import os
+import argparse
+import json
 import sys
-import inspect
-import importlib.util
 from pathlib import Path
 import yaml
 
-# Base path where use case routers are located
-USE_CASES_PATH = "src/application/routers"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.deploy_closure import changed_functions, closure_digests, find_deployable_functions, load_manifest
 
 # Base YAML step for Cloud Build deploy
 BASE_YAML_STEP = {
@@ -47,62 +60,108 @@ GENERATE_REQUIREMENTS_STEP = {
 }
 
 
-def import_module_from_path(module_name: str, path: Path):
+def find_cloudfunction_methods() -> list[str]:
     """
-    Dynamically import a Python module from a file path.
+    Find all Python functions decorated with `@deployable(targets=["cloudfunction"])`.
 
-    Args:
-        module_name (str): Desired module name for Python system modules.
-        path (Path): Absolute path to the Python file.
+    The routers are parsed, not imported, so their module-level wiring
+    (`start_account_dependencies()`, repository clients) never runs here.
 
     Returns:
-        module: The imported Python module.
+        list[str]: List of function names detected for deployment.
     """
-    spec = importlib.util.spec_from_file_location(module_name, path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+    return [function.name for function in find_deployable_functions() if "cloudfunction" in function.targets]
 
 
-def find_cloudfunction_methods() -> list[str]:
+def generate_record_steps(digests: dict[str, str], manifest_uri: str) -> list[dict]:
     """
-    Find all Python functions decorated with `@deployable(targets=["cloudfunction"])`.
+    Generate the steps storing the deployed closures once every deploy step succeeded.
 
-    Returns:
-        list[str]: List of function names detected for deployment.
-    """
-    cloud_functions = set()
+    The digests are computed when generating this file: the build rewrites
+    requirements.txt (private token) before deploying, so hashing again
+    inside the build would record a different closure.
 
-    for file in Path(USE_CASES_PATH).rglob("*.py"):
-        module_name = str(file).replace("/", ".").replace("\\", ".").replace(".py", "")
-        try:
-            module = import_module_from_path(module_name, file)
-        except Exception as e:
-            print(f"⚠️ Error importing module '{module_name}': {e}")
-            continue
-
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            targets = getattr(obj, "_deploy_targets", [])
-            if "cloudfunction" in targets:
-                cloud_functions.add(name)
+    Args:
+        digests (dict[str, str]): Closure digest of every function deployed by this build.
+        manifest_uri (str): gs:// URI of the manifest kept between builds.
 
-    return list(cloud_functions)
+    Returns:
+        list[dict]: Cloud Build steps fetching, updating and uploading the manifest.
+    """
+    return [
+        {
+            "name": "gcr.io/cloud-builders/gsutil",
+            "id": "Fetch deploy manifest",
+            "entrypoint": "bash",
+            "args": ["-c", f"gsutil cp {manifest_uri} deploy_manifest.json || echo '{{}}' > deploy_manifest.json"],
+        },
+        {
+            "name": "python:3.11-slim",
+            "id": "Record deploy manifest",
+            "entrypoint": "python",
+            "args": [
+                "scripts/deploy_closure.py", "record",
+                "--target=cloudfunction",
+                "--manifest=deploy_manifest.json",
+                f"--digests={json.dumps(digests, sort_keys=True)}",
+            ],
+        },
+        {
+            "name": "gcr.io/cloud-builders/gsutil",
+            "id": "Upload deploy manifest",
+            "args": ["cp", "deploy_manifest.json", manifest_uri],
+        },
+    ]
+
+
+def generate_unified_step(region: str = "us-central1") -> dict:
+    """
+    Generate the single deploy step of the unified layout.
 
+    Args:
+        region (str): GCP region for deployment.
 
-def generate_cloudbuild_yaml(cloud_functions: list[str], region: str = "us-central1") -> dict:
+    Returns:
+        dict: Cloud Build step deploying the `account_router` function.
+    """
+    step = dict(BASE_YAML_STEP)
+    step["id"] = "Deploy account_router"
+    step["args"] = [
+        "functions", "deploy", "account_router",
+        f"--region={region}",
+        "--runtime=python311",
+        "--source=.",
+        "--entry-point=function_router",
+        "--trigger-http",
+        "--set-env-vars=TARGET=cloudfunction,DEPLOY_LAYOUT=unified",
+        "--timeout=540s",
+        "--allow-unauthenticated",
+    ]
+    return step
+
+
+def generate_cloudbuild_yaml(cloud_functions: list[str], region: str = "us-central1", layout: str = "split") -> dict:
     """
     Generate the structure for the cloudbuild.yaml file with deployment steps for each Cloud Function.
 
     Args:
         cloud_functions (list[str]): List of function names to deploy.
         region (str): GCP region for deployment.
+        layout (str): "split" for one function per endpoint, "unified" for a single router function.
 
     Returns:
         dict: Dictionary ready to be serialized as YAML.
     """
     steps = [GENERATE_REQUIREMENTS_STEP]
 
+    if layout == "unified":
+        return {
+            "steps": steps + ([generate_unified_step(region)] if cloud_functions else []),
+            "options": {
+                "logging": "CLOUD_LOGGING_ONLY"
+            }
+        }
+
     # Optional: manual trigger mapping by function name
     trigger_mapping = {
         "main": {"trigger": "--trigger-topic=transactions.incoming"},
@@ -147,6 +206,13 @@ def main():
     Main execution function.
     Responsible for scanning functions and generating the cloudbuild.yaml file.
     """
+    parser = argparse.ArgumentParser(description="Generate cloudbuild.yaml from @deployable functions.")
+    parser.add_argument("--layout", choices=["split", "unified"], default="split")
+    parser.add_argument("--incremental", action="store_true", help="Only deploy functions whose dependency closure changed.")
+    parser.add_argument("--manifest", default="deploy_manifest.json", help="Local copy of the last deploy manifest.")
+    parser.add_argument("--manifest-uri", help="gs:// URI the build uploads the updated manifest to.")
+    args = parser.parse_args()
+
     print("🔍 Searching for functions with target 'cloudfunction'...")
 
     cloud_functions = find_cloudfunction_methods()
@@ -157,7 +223,19 @@ def main():
 
     print(f"✅ Functions found: {cloud_functions}")
 
-    cloudbuild_config = generate_cloudbuild_yaml(cloud_functions)
+    if args.incremental:
+        digests = closure_digests("cloudfunction")
+        changed = changed_functions(digests, load_manifest(args.manifest), "cloudfunction")
+        print(f"🧭 Changed since last deploy: {changed or 'nothing'}")
+        if args.layout == "split":
+            cloud_functions = changed
+        elif not changed:
+            cloud_functions = []
+
+    cloudbuild_config = generate_cloudbuild_yaml(cloud_functions, layout=args.layout)
+    if args.incremental and args.manifest_uri and cloud_functions:
+        deployed = {name: digests[name] for name in cloud_functions}
+        cloudbuild_config["steps"] += generate_record_steps(deployed, args.manifest_uri)
 
     output_file = "cloudbuild.yaml"
     with open(output_file, "w") as f:
@@ -2,85 +2,180 @@
 """
 Auto-generate serverless.yml for AWS Lambda deployment using Serverless Framework.
 
-Scans all functions decorated with @deployable(targets=[DeploymentTarget.LAMBDA])
-and generates serverless.yml with correct handlers and HTTP event configs.
+Finds all functions decorated with @deployable(targets=[DeploymentTarget.LAMBDA])
+by parsing the routers (without importing them) and generates serverless.yml with correct handlers and HTTP event configs.
+
+Layouts:
+- split (default): one Lambda per function.
+- unified: a single `router` Lambda exposing every route (see src/application/route_table.py),
+  so all endpoints share warm containers, connections and caches.
+
+Sizing:
+- Every function gets BASE_FUNCTION_TEMPLATE's memorySize/timeout (provider defaults).
+- With `--profile` (written by scripts/profile_lambda.py), each profiled function gets its
+  recommended memorySize/timeout; the unified router gets the largest of them.
 
 Requires:
 - Your project structure must have Python modules inside 'src/application/routers'.
 - Functions must use the @deployable decorator.
+
+Incremental deploys:
+- With `--incremental`, each function's dependency closure is hashed (scripts/deploy_closure.py;
+  the handler module's for STATIC_FUNCTIONS) and compared with `--manifest`; deploy_plan.json lists the commands to run: a full
+  `serverless deploy` when serverless.yml changed, otherwise `serverless deploy function`
+  for the changed functions only. Record the manifest after the deploy succeeds.
+
+Usage:
+    python scripts/generate_lambda.py [--layout split|unified] [--profile lambda_profile.json] [--incremental]
 """
 
+import argparse
+import json
 import os
 import sys
-import inspect
-import importlib.util
 from pathlib import Path
 import yaml
 
 # Corrige path para importar os módulos da aplicação
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from utilities.frameworks.deployment_target import DeploymentTarget
+from scripts.deploy_closure import (
+    PROJECT_ROOT,
+    changed_functions,
+    closure_digests,
+    file_digest,
+    find_deployable_functions,
+    load_manifest,
+    module_digests,
+)
 
-USE_CASES_PATH = Path("src/application/routers")
 BASE_FUNCTION_TEMPLATE = {
     "runtime": "python3.11",
     "memorySize": 512,
     "timeout": 30,
 }
 
+# Functions not exposed through @deployable (e.g. stream consumers, internal routes), emitted as-is.
+STATIC_FUNCTIONS = {
+    "internal_lookup": {
+        "handler": "main.lambda_internal_lookup",
+        # Service-to-service only: callers sign with SigV4 and need execute-api:Invoke on the route.
+        "events": [{"httpApi": {"path": "/internal/lookups", "method": "post", "authorizer": {"type": "aws_iam"}}}],
+    },
+    "account_change_stream": {
+        "handler": "main.lambda_account_change_stream",
+        "events": [
+            {
+                "stream": {
+                    "type": "dynamodb",
+                    "arn": "${env:ACCOUNT_TABLE_STREAM_ARN}",
+                    "batchSize": 100,
+                    "maximumBatchingWindow": 1,
+                    "startingPosition": "LATEST",
+                    "functionResponseType": "ReportBatchItemFailures",
+                }
+            }
+        ],
+    },
+}
 
-def import_module_from_path(module_name: str, path: Path):
-    """Dynamically import a Python module from a file path."""
-    spec = importlib.util.spec_from_file_location(module_name, path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+# Module defining the code of each static function, hashed (with main.py) for incremental deploys.
+STATIC_FUNCTION_MODULES = {
+    "internal_lookup": "src.application.routers.account_routers",
+    "account_change_stream": "src.application.consumers.account_change_consumer",
+}
 
 
 def find_lambda_functions():
+    """
+    Find the @deployable functions targeting Lambda by parsing the routers (nothing is imported).
+    """
     functions = {}
 
-    project_root = Path(__file__).resolve().parent.parent
-    routers_path = project_root / USE_CASES_PATH
+    for function in find_deployable_functions():
+        if "lambda" not in function.targets:
+            continue
 
-    for file in routers_path.rglob("*.py"):
-        rel_path = file.relative_to(project_root)
+        if not function.route or not function.methods:
+            print(f"⚠️ Function '{function.name}' missing route or methods. Skipping.")
+            continue
 
-        # Exemplo: src/application/routers/account_routers.py → src.application.routers.account_routers
-        module_name = ".".join(rel_path.with_suffix("").parts)
+        functions[function.name] = {
+            "handler": f"{function.module.replace('.', '/')}.{function.name}",
+            "methods": function.methods,
+            "route": function.route,
+        }
 
-        try:
-            module = import_module_from_path(module_name, file)
-        except Exception as e:
-            print(f"⚠️ Error importing module '{module_name}': {e}")
-            continue
+    return functions
 
-        for name, func in inspect.getmembers(module, inspect.isfunction):
-            targets = getattr(func, "_deploy_targets", None)
-            if targets and DeploymentTarget.LAMBDA in targets:
-                route = getattr(func, "_route", None)
-                methods = getattr(func, "_methods", [])
 
-                if not route or not methods:
-                    print(f"⚠️ Function '{name}' missing route or methods. Skipping.")
-                    continue
+def plan_deploy(lambda_functions, layout, manifest_path, config_path="serverless.yml", root=PROJECT_ROOT):
+    """
+    Decide what an incremental deploy has to push, from the manifest of the last deploy.
+
+    - "full" (`serverless deploy`): no manifest yet, or the generated serverless.yml
+      changed (new routes, sizing, events, provider settings): CloudFormation must run.
+    - "functions" (`serverless deploy function -f <name>`): only the code of the
+      functions whose dependency closure changed is updated.
+    - "none": nothing changed.
+
+    The unified router is redeployed when any of its routes changed. The static
+    functions (internal routes, stream consumers) are hashed from their handler
+    module and redeployed on their own in both layouts.
+    """
+    digests = closure_digests("lambda", root)
+    digests = {name: digest for name, digest in digests.items() if name in lambda_functions}
+    digests.update(module_digests(STATIC_FUNCTION_MODULES, root))
+    manifest = load_manifest(manifest_path)
+    changed = changed_functions(digests, manifest, "lambda")
+    config_changed = manifest.get("targets", {}).get("lambda", {}).get("config") != file_digest(config_path)
+
+    # Recorded after the deploy (`deploy_closure.py record --plan`): hashing again later would
+    # see the requirements.txt rewritten with the private token.
+    recorded = {"digests": digests, "config": file_digest(config_path)}
+
+    if not manifest or config_changed:
+        return {"mode": "full", "functions": list(digests), "commands": ["serverless deploy --stage $ENVIRONMENT"], **recorded}
+    if not changed:
+        return {"mode": "none", "functions": [], "commands": [], **recorded}
+
+    deployed = changed
+    if layout == "unified":
+        static = [name for name in changed if name in STATIC_FUNCTIONS]
+        deployed = (["router"] if len(static) < len(changed) else []) + static
+    return {
+        "mode": "functions",
+        "functions": changed,
+        "commands": [f"serverless deploy function -f {name} --stage $ENVIRONMENT" for name in deployed],
+        **recorded,
+    }
 
-                functions[name] = {
-                    "handler": f"{module_name.replace('.', '/')}.{name}",
-                    "methods": methods,
-                    "route": route,
-                }
 
-    return functions
+def load_profile(path):
+    """Load the per-function sizing written by scripts/profile_lambda.py ({} when absent)."""
+    if not path:
+        return {}
+    if not os.path.exists(path):
+        print(f"⚠️ Profile '{path}' not found. Using default sizing.")
+        return {}
 
-def generate_serverless_yaml(lambda_functions):
+    with open(path) as f:
+        profiled = json.load(f)["functions"]
+
+    return {
+        name: {"memorySize": int(settings["memorySize"]), "timeout": int(settings["timeout"])}
+        for name, settings in profiled.items()
+    }
+
+
+def generate_serverless_yaml(lambda_functions, layout="split", sizing=None):
+    sizing = sizing or {}
     functions = {}
 
     for func_name, details in lambda_functions.items():
         function_config = {
             "handler": f"main.lambda_{func_name}",
+            **sizing.get(func_name, {}),
             "events": [],
         }
 
@@ -95,16 +190,35 @@ def generate_serverless_yaml(lambda_functions):
 
         functions[func_name] = function_config
 
+    if layout == "unified":
+        router_sizing = [sizing[name] for name in lambda_functions if name in sizing]
+        functions = {
+            "router": {
+                "handler": "main.lambda_router",
+                **({
+                    "memorySize": max(settings["memorySize"] for settings in router_sizing),
+                    "timeout": max(settings["timeout"] for settings in router_sizing),
+                } if router_sizing else {}),
+                "events": [event for config in functions.values() for event in config["events"]],
+            }
+        }
+
+    functions.update(STATIC_FUNCTIONS)
+
     serverless_config = {
         "service": "account",  # seu serviço hardcoded como "account"
         "frameworkVersion": "3",
         "provider": {
             "name": "aws",
-            "runtime": "python3.11",
+            **BASE_FUNCTION_TEMPLATE,
             "region": "us-east-1",
             "environment": {
                 "TARGET": "lambda",
                 "ENVIRONMENT": "${env:ENVIRONMENT}",
+                # The Lambda file system is read-only: statement exports go to S3.
+                "STATEMENT_EXPORT_STORE": "s3",
+                "STATEMENT_EXPORT_BUCKET": "${env:STATEMENT_EXPORT_BUCKET}",
+                **({"DEPLOY_LAYOUT": "unified"} if layout == "unified" else {}),
             },
         },
         "plugins": [
@@ -126,6 +240,13 @@ def generate_serverless_yaml(lambda_functions):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate serverless.yml from @deployable functions.")
+    parser.add_argument("--layout", choices=["split", "unified"], default="split")
+    parser.add_argument("--profile", help="Sizing recommendations written by scripts/profile_lambda.py.")
+    parser.add_argument("--incremental", action="store_true", help="Also write deploy_plan.json with only the changed functions.")
+    parser.add_argument("--manifest", default="deploy_manifest.json", help="Manifest of the last deploy (see scripts/deploy_closure.py).")
+    args = parser.parse_args()
+
     print("🔎 Scanning for Lambda functions...")
 
     lambda_functions = find_lambda_functions()
@@ -136,13 +257,26 @@ def main():
 
     print(f"✅ Found Lambda functions: {list(lambda_functions.keys())}")
 
-    serverless_config = generate_serverless_yaml(lambda_functions)
+    sizing = load_profile(args.profile)
+    if sizing:
+        print(f"📏 Sizing from profile: {sizing}")
+
+    serverless_config = generate_serverless_yaml(lambda_functions, layout=args.layout, sizing=sizing)
 
     with open("serverless.yml", "w") as f:
         yaml.dump(serverless_config, f, sort_keys=False, default_flow_style=False)
 
     print("🎉 serverless.yml generated successfully!")
 
+    if args.incremental:
+        plan = plan_deploy(lambda_functions, args.layout, args.manifest)
+        with open("deploy_plan.json", "w") as f:
+            json.dump(plan, f, indent=2)
+
+        print(f"🧭 Deploy plan ({plan['mode']}): {plan['functions'] or 'nothing changed'}")
+        for command in plan["commands"]:
+            print(f"   {command}")
+
 
 if __name__ == "__main__":
     main()
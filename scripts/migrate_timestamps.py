@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Rewrite `created_at` / `updated_at` of `account-table` in the canonical encoding.
+
+Items written before the encoding change carry `updated_at` as
+"%d-%m-%Y %H:%M:%S" (no timezone, not sortable). This tool rewrites them as
+ISO-8601 UTC with milliseconds ("2025-06-11T14:30:00.000Z").
+
+What it does:
+
+1. Scans the table with `AccountRepository.parallel_scan` over `--segments`
+   segments (Segment/TotalSegments), optionally capped at `--max-rcu`.
+2. Rewrites every item whose timestamps are not canonical, with a conditional
+   update on the old values (`--writers` at a time), so accounts updated
+   concurrently are left alone.
+3. Records the `LastEvaluatedKey` of every segment in `--checkpoint` after each
+   page. Running the tool again with the same checkpoint resumes where it stopped.
+4. Prints items scanned, items rewritten and items/sec.
+
+Usage:
+    python scripts/migrate_timestamps.py --segments 8 --checkpoint migrate_timestamps.json
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/migrate_timestamps.py --dry-run
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.entity.timestamps import is_canonical, normalize_timestamp
+from src.infra.repositories.account_repository import AccountRepository
+from src.infra.repositories.parallel_scan import ScanCheckpoint
+
+TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+
+def pending_rewrite(item: dict) -> tuple[dict, dict]:
+    """Return (expected, replacement) for the non-canonical timestamps of an item."""
+    expected, replacement = {}, {}
+    for field in TIMESTAMP_FIELDS:
+        value = item.get(field)
+        if value is None or is_canonical(value):
+            continue
+        try:
+            replacement[field] = normalize_timestamp(value)
+        except ValueError:
+            print(f"⚠️ {item.get('id')}: cannot decode {field}={value!r}, left unchanged")
+            continue
+        expected[field] = value
+    return expected, replacement
+
+
+def rewrite(repository: AccountRepository, item: dict, dry_run: bool) -> bool:
+    """Rewrite one item if needed. Return whether it was (or would be) rewritten."""
+    expected, replacement = pending_rewrite(item)
+    if not replacement:
+        return False
+    return dry_run or repository.rewrite_timestamps(item["id"], expected, replacement)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate account timestamps to ISO-8601 UTC.")
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--writers", type=int, default=16, help="Concurrent conditional updates.")
+    parser.add_argument("--max-rcu", type=float, default=None, help="Read capacity units per second.")
+    parser.add_argument("--checkpoint", default="migrate_timestamps.json", help="Progress file. Empty to disable.")
+    parser.add_argument("--dry-run", action="store_true", help="Count items to rewrite without writing.")
+    args = parser.parse_args()
+
+    repository = AccountRepository()
+    checkpoint = ScanCheckpoint(args.checkpoint or None, args.segments)
+    scanner = repository.parallel_scan(
+        args.segments,
+        page_size=args.page_size,
+        checkpoint=checkpoint,
+        max_read_units_per_second=args.max_rcu,
+        projection=["id", *TIMESTAMP_FIELDS],
+    )
+    already_scanned = checkpoint.scanned
+
+    print(f"🕒 Migrating timestamps of {repository.table_name} with {args.segments} segments...")
+    started = time.perf_counter()
+    rewritten = 0
+
+    with ThreadPoolExecutor(max_workers=args.writers) as writers:
+        for page in scanner.pages():
+            rewritten += sum(writers.map(lambda item: rewrite(repository, item, args.dry_run), page.items))
+
+    elapsed = time.perf_counter() - started
+    this_run = checkpoint.scanned - already_scanned
+
+    verb = "to rewrite" if args.dry_run else "rewritten"
+    print(f"✅ {checkpoint.scanned} items scanned, {rewritten} {verb} this run ({scanner.consumed_capacity:,.0f} RCU).")
+    print(f"⏱️ {this_run} items in {elapsed:.1f}s this run ({this_run / elapsed if elapsed else 0:,.0f} items/sec).")
+
+
+if __name__ == "__main__":
+    main()
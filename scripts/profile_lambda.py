@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Profile every Lambda handler and recommend its memorySize and timeout.
+
+What it does:
+
+1. Runs each handler of `main.py` (TARGET=lambda) in its own fresh process,
+   so peak RSS reflects one container: imports, warm-up, then the workload.
+2. Replays `--invocations` API Gateway v2 events per function (the same
+   request shapes the routes receive in production) against the configured
+   tables (e.g. the `dynamodb-local` of `docker-compose.yaml`), and records:
+   - wall and CPU time per invocation (p50/p99),
+   - peak RSS of the process,
+   - with tracemalloc, in a separate pass so it does not skew timings:
+     peak traced memory per invocation and blocks still allocated
+     afterwards (retained per invocation; steady growth means a leak).
+3. Recommends per function:
+   - memorySize: peak RSS × `--headroom`, rounded up to 64 MB (at least 128 MB).
+     CPU-bound handlers (CPU time ≥ 80% of wall time) get at least
+     `--cpu-bound-memory`, since Lambda allocates CPU in proportion to memory.
+   - timeout: p99 wall time × `--timeout-factor`, at least 3s and at most 30s
+     (the API Gateway integration limit). `bulk_update_status` keeps room for
+     its whole time budget.
+4. Writes the measurements and recommendations to `--output`, read by
+   `scripts/generate_lambda.py --profile`.
+
+Usage:
+    docker compose up -d dynamodb-local
+    DYNAMODB_ENDPOINT_URL=http://localhost:8000 python scripts/profile_lambda.py --invocations 200
+    python scripts/generate_lambda.py --profile lambda_profile.json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+MIN_MEMORY_MB = 128
+MAX_MEMORY_MB = 10_240
+MEMORY_STEP_MB = 64
+MIN_TIMEOUT_SECONDS = 3
+HTTP_API_MAX_TIMEOUT_SECONDS = 30
+CPU_BOUND_SHARE = 0.8
+
+FUNCTIONS = [
+    "create_account",
+    "get_account",
+    "get_account_by_owner",
+    "update_status",
+    "bulk_update_status",
+    "record_transaction",
+    "get_transactions",
+    "get_transaction_summary",
+    "get_balance",
+    "export_statement",
+    "internal_lookup",
+]
+
+
+class ProfileContext:
+    """Lambda context with an unbounded remaining time, as in a fresh invocation."""
+
+    function_name = "profile"
+    memory_limit_in_mb = MAX_MEMORY_MB
+    invoked_function_arn = "arn:aws:lambda:local:000000000000:function:profile"
+    aws_request_id = "profile-request"
+
+    @staticmethod
+    def get_remaining_time_in_millis() -> int:
+        return 900_000
+
+
+def http_event(method: str, path: str, route: str, body: dict | None = None, path_parameters: dict | None = None) -> dict:
+    return {
+        "version": "2.0",
+        "routeKey": f"{method} {route}",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"content-type": "application/json", "x-tenant-id": "profile-tenant"},
+        "pathParameters": path_parameters or {},
+        "requestContext": {"accountId": "profile", "http": {"method": method, "path": path}},
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def build_workload(account_id: str):
+    """
+    Returns `{function_name: event_for(index)}` replaying realistic requests for one account.
+    """
+    from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+
+    ulids = MonotonicUlidGenerator()
+    statuses = ["suspended", "active"]
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    return {
+        "create_account": lambda index: http_event(
+            "POST", "/accounts/create", "/accounts/create",
+            {"tenant_id": "profile-tenant", "owner_id": f"profile-owner-{index}"},
+        ),
+        "get_account": lambda index: http_event(
+            "GET", f"/accounts/{account_id}", "/accounts/{accountId}", path_parameters={"accountId": account_id},
+        ),
+        "get_account_by_owner": lambda index: http_event(
+            "GET", "/tenants/profile-tenant/owners/profile-owner/account", "/tenants/{tenantId}/owners/{ownerId}/account",
+            path_parameters={"tenantId": "profile-tenant", "ownerId": "profile-owner"},
+        ),
+        "update_status": lambda index: http_event(
+            "PATCH", "/accounts/update_status", "/accounts/update_status",
+            {"account_id": account_id, "status": statuses[index % 2], "reason": "profile"},
+        ),
+        "bulk_update_status": lambda index: http_event(
+            "POST", "/accounts/bulk_update_status", "/accounts/bulk_update_status",
+            {"account_ids": [account_id], "status": statuses[index % 2], "reason": "profile"},
+        ),
+        "record_transaction": lambda index: http_event(
+            "POST", "/accounts/transactions", "/accounts/transactions",
+            {
+                "id": ulids.new(), "account_id": account_id, "timestamp": datetime.now(timezone.utc).isoformat(),
+                "amount": 10.0 + index, "type": "CREDIT", "product": "pix", "reference": f"profile-{index}",
+            },
+        ),
+        "get_transactions": lambda index: http_event(
+            "GET", f"/accounts/{account_id}/transactions", "/accounts/{accountId}/transactions",
+            path_parameters={"accountId": account_id},
+        ),
+        "get_transaction_summary": lambda index: http_event(
+            "GET", f"/accounts/{account_id}/transactions/summary", "/accounts/{accountId}/transactions/summary",
+            path_parameters={"accountId": account_id},
+        ),
+        "get_balance": lambda index: http_event(
+            "GET", f"/accounts/{account_id}/balance", "/accounts/{accountId}/balance",
+            path_parameters={"accountId": account_id},
+        ),
+        "export_statement": lambda index: http_event(
+            "POST", "/accounts/statements/export", "/accounts/statements/export",
+            {"account_id": account_id, "start": f"{today}T00:00:00Z", "end": f"{today}T23:59:59Z", "format": "csv.gz"},
+        ),
+        "internal_lookup": lambda index: http_event(
+            "POST", "/internal/lookups", "/internal/lookups",
+            {"lookups": [
+                {"op": "balance", "account_id": account_id},
+                {"op": "statement", "account_id": account_id, "start": f"{today}T00:00:00Z", "end": f"{today}T23:59:59Z"},
+            ]},
+        ),
+    }
+
+
+def seed_account() -> str:
+    """Creates the account every workload reads and updates, or reuses the one of a previous run."""
+    from utilities.depency_injections.injection_manager import InjectionManager
+
+    from src.domain.entity.account import Account, AccountStatus
+    from src.infra.repositories.base_account_repository import BaseAccountRepository, DuplicateOwner
+
+    account = Account(tenant_id="profile-tenant", owner_id="profile-owner", status=AccountStatus.ACTIVE).generate_ulid()
+    try:
+        InjectionManager.get_dependency(BaseAccountRepository).create(account)
+    except DuplicateOwner as duplicate:
+        return duplicate.account_id
+    return account.id
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def profile_function(name: str, invocations: int, warmup: int, traced_invocations: int) -> dict:
+    """
+    Runs in a fresh process: imports the handlers, then measures one function.
+    """
+    os.environ["TARGET"] = "lambda"
+    import main
+
+    handler = getattr(main, f"lambda_{name}")
+    event_for = build_workload(seed_account())[name]
+    context = ProfileContext()
+    import_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    for index in range(warmup):
+        handler(event_for(index), context)
+
+    wall, cpu = [], []
+    for index in range(invocations):
+        event = event_for(warmup + index)
+        started_wall, started_cpu = time.perf_counter(), time.process_time()
+        handler(event, context)
+        wall.append(time.perf_counter() - started_wall)
+        cpu.append(time.process_time() - started_cpu)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    traced_peaks = []
+    for index in range(traced_invocations):
+        tracemalloc.reset_peak()
+        handler(event_for(warmup + invocations + index), context)
+        traced_peaks.append(tracemalloc.get_traced_memory()[1])
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "invocations": invocations,
+        "import_rss_mb": round(import_rss_kb / 1024, 1),
+        "peak_rss_mb": round(peak_rss_kb / 1024, 1),
+        "traced_peak_kb": round(max(traced_peaks, default=0) / 1024, 1),
+        "retained_blocks_per_invocation": round(retained_blocks / max(traced_invocations, 1), 2),
+        "wall_ms_p50": round(statistics.median(wall) * 1000, 2),
+        "wall_ms_p99": round(percentile(wall, 0.99) * 1000, 2),
+        "cpu_ms_p50": round(statistics.median(cpu) * 1000, 2),
+        "cpu_ms_p99": round(percentile(cpu, 0.99) * 1000, 2),
+    }
+
+
+def timeout_floor(name: str) -> float:
+    """Seconds a function needs regardless of the measured latency."""
+    if name != "bulk_update_status":
+        return MIN_TIMEOUT_SECONDS
+
+    from src.config.custom_config import ENVIRONMENT
+
+    return (
+        ENVIRONMENT.bulk_status_time_budget_seconds
+        + ENVIRONMENT.request_deadline_short_seconds
+        + ENVIRONMENT.request_deadline_reserve_seconds
+    )
+
+
+def recommend(name: str, measurements: dict, headroom: float, timeout_factor: float, cpu_bound_memory: int) -> dict:
+    memory = math.ceil(measurements["peak_rss_mb"] * headroom / MEMORY_STEP_MB) * MEMORY_STEP_MB
+    if measurements["cpu_ms_p50"] >= CPU_BOUND_SHARE * measurements["wall_ms_p50"]:
+        memory = max(memory, cpu_bound_memory)
+    memory = min(max(memory, MIN_MEMORY_MB), MAX_MEMORY_MB)
+
+    timeout = math.ceil(max(measurements["wall_ms_p99"] / 1000 * timeout_factor, timeout_floor(name)))
+    timeout = min(timeout, HTTP_API_MAX_TIMEOUT_SECONDS)
+
+    return {"memorySize": memory, "timeout": timeout}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile Lambda handlers and recommend memorySize/timeout.")
+    parser.add_argument("--functions", default=",".join(FUNCTIONS))
+    parser.add_argument("--invocations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--traced-invocations", type=int, default=50)
+    parser.add_argument("--headroom", type=float, default=1.5)
+    parser.add_argument("--timeout-factor", type=float, default=3.0)
+    parser.add_argument("--cpu-bound-memory", type=int, default=1769, help="1769 MB is one full vCPU.")
+    parser.add_argument("--output", default="lambda_profile.json")
+    args = parser.parse_args()
+
+    functions = {}
+    for name in args.functions.split(","):
+        print(f"🔬 Profiling {name}...")
+        # A fresh interpreter per function: peak RSS is per process and never decreases.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            measurements = executor.submit(
+                profile_function, name, args.invocations, args.warmup, args.traced_invocations
+            ).result()
+
+        recommendation = recommend(name, measurements, args.headroom, args.timeout_factor, args.cpu_bound_memory)
+        functions[name] = {**recommendation, "measurements": measurements}
+        print(
+            f"   peak RSS {measurements['peak_rss_mb']:.1f} MB, p99 {measurements['wall_ms_p99']:.1f} ms "
+            f"(CPU p50 {measurements['cpu_ms_p50']:.1f} ms) → memorySize {recommendation['memorySize']}, "
+            f"timeout {recommendation['timeout']}s"
+        )
+
+    profile = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "settings": {
+            "invocations": args.invocations,
+            "headroom": args.headroom,
+            "timeout_factor": args.timeout_factor,
+            "cpu_bound_memory": args.cpu_bound_memory,
+        },
+        "functions": functions,
+    }
+    with open(args.output, "w") as f:
+        json.dump(profile, f, indent=2)
+
+    print(f"🎉 Recommendations written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
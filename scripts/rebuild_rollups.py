@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Check or rebuild the daily per-product rollups of `account-rollup-table`.
+
+What it does:
+
+1. Recomputes the rollups from the raw transactions of `account-transaction-table`:
+   - `--account-id`: one account, through `account_id-timestamp-index` and,
+     with TRANSACTION_ARCHIVE_ENABLED, the transaction archive
+     (`TieredTransactionRepository`), so archived days are recomputed too,
+   - `--all`: every account, through a parallel scan (`--segments`, `--max-rcu`).
+     The scan only reads the table: with the archive enabled, `--start-day`
+     is moved to the first day after the archive horizon, leaving the rollups
+     of archived days untouched.
+2. Reads the stored rollups of the same accounts and days, their write shards summed.
+3. `--mode check` (default): prints every missing, extra or different rollup and
+   exits with status 1 if there is any.
+   `--mode rebuild`: overwrites the differing rollups (folding their shards into
+   one item) and deletes the extra ones.
+
+The current UTC day is skipped unless `--include-today` is given: ingest keeps
+adding to it while the job runs, and a rebuild would overwrite those increments.
+
+Usage:
+    python scripts/rebuild_rollups.py --account-id 01HYXY... --start-day 2025-06-01 --end-day 2025-06-30
+    python scripts/rebuild_rollups.py --all --segments 16 --max-rcu 1000 --mode rebuild
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.entity.daily_rollup import DailyRollup, day_end, day_of, day_start, shift_day
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.exports.object_store import build_object_store
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository, sum_shards
+from src.infra.repositories.parallel_scan import ParallelScanner
+from src.infra.repositories.tiered_transaction_repository import TieredTransactionRepository
+from src.infra.repositories.transaction_repository import TransactionRepository
+
+RollupKey = tuple[str, str, str]  # (account_id, day, product)
+
+
+def accumulate(rollups: dict[RollupKey, DailyRollup], item: dict) -> None:
+    """Add one raw transaction to the recomputed rollups."""
+    key = (item["account_id"], day_of(item["timestamp"]), item["product"])
+    if key not in rollups:
+        rollups[key] = DailyRollup(account_id=key[0], tenant_id=item.get("tenant_id") or "", day=key[1], product=key[2])
+    rollups[key].add(item["type"], item["amount"])
+
+
+def clamp_to_archive(args, transaction_repository: TransactionRepository | TieredTransactionRepository) -> None:
+    """Moves `--start-day` of a full scan past the archive horizon: archived days are not in the table."""
+    if args.account_id or not isinstance(transaction_repository, TieredTransactionRepository):
+        return
+    first_day = shift_day(day_of(transaction_repository.archive_boundary()), 1)
+    if args.start_day < first_day:
+        print(f"⚠️ Days before {first_day} may be archived and are skipped (use --account-id to include them).")
+        args.start_day = first_day
+
+
+def recompute(args, transaction_repository: TransactionRepository | TieredTransactionRepository) -> dict[RollupKey, DailyRollup]:
+    rollups: dict[RollupKey, DailyRollup] = {}
+    if args.account_id:
+        for items, _ in transaction_repository.query_range_pages(
+            day_start(args.start_day), day_end(args.end_day), account_id=args.account_id
+        ):
+            for item in items:
+                accumulate(rollups, item)
+        return rollups
+
+    hot = transaction_repository.hot if isinstance(transaction_repository, TieredTransactionRepository) else transaction_repository
+    scanner = ParallelScanner(
+        get_dynamodb_client(), hot.table_name, total_segments=args.segments,
+        max_read_units_per_second=args.max_rcu,
+        projection=["account_id", "tenant_id", "timestamp", "product", "type", "amount"],
+    )
+    for item in scanner.items():
+        if args.start_day <= day_of(item["timestamp"]) <= args.end_day:
+            accumulate(rollups, item)
+    return rollups
+
+
+def stored(args, rollup_repository: DailyRollupRepository) -> dict[RollupKey, DailyRollup]:
+    if args.account_id:
+        rollups = rollup_repository.query(args.account_id, args.start_day, args.end_day)
+    else:
+        scanner = ParallelScanner(
+            get_dynamodb_client(), rollup_repository.table_name, total_segments=args.segments,
+            max_read_units_per_second=args.max_rcu,
+        )
+        rollups = []
+        for item in scanner.items():
+            item.pop("rollup_key", None)
+            if args.start_day <= item["day"] <= args.end_day:
+                rollups.append(DailyRollup(**item))
+        rollups = sum_shards(rollups)
+    return {(rollup.account_id, rollup.day, rollup.product): rollup for rollup in rollups}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or rebuild daily transaction rollups.")
+    selector = parser.add_mutually_exclusive_group(required=True)
+    selector.add_argument("--account-id")
+    selector.add_argument("--all", action="store_true")
+    parser.add_argument("--start-day", default="2000-01-01")
+    parser.add_argument("--end-day", default="9999-12-31")
+    parser.add_argument("--include-today", action="store_true")
+    parser.add_argument("--mode", choices=["check", "rebuild"], default="check")
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--max-rcu", type=float, default=None)
+    args = parser.parse_args()
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    if not args.include_today and args.end_day >= today:
+        args.end_day = shift_day(today, -1)
+
+    transaction_repository = TransactionRepository(index_shards=ENVIRONMENT.transaction_account_index_shards)
+    if ENVIRONMENT.transaction_archive_enabled:
+        transaction_repository = TieredTransactionRepository(
+            hot=transaction_repository,
+            archive=TransactionArchive(build_object_store(
+                ENVIRONMENT.transaction_archive_store,
+                path=ENVIRONMENT.transaction_archive_path,
+                bucket=ENVIRONMENT.transaction_archive_bucket,
+            )),
+            horizon_days=ENVIRONMENT.transaction_archive_horizon_days,
+        )
+        clamp_to_archive(args, transaction_repository)
+    rollup_repository = DailyRollupRepository(shard_count=ENVIRONMENT.rollup_write_shards)
+
+    print(f"🧮 Recomputing rollups {args.start_day} → {args.end_day} ({args.account_id or 'all accounts'})...")
+    expected = recompute(args, transaction_repository)
+    actual = stored(args, rollup_repository)
+
+    missing = [key for key in expected if key not in actual]
+    extra = [key for key in actual if key not in expected]
+    different = [key for key in expected if key in actual and not expected[key].matches(actual[key])]
+
+    for label, keys in (("missing", missing), ("extra", extra), ("different", different)):
+        for key in sorted(keys)[:50]:
+            print(f"  {label:<9} {' '.join(key)}  expected={expected.get(key)}  stored={actual.get(key)}")
+
+    print(f"📊 {len(expected)} rollups expected, {len(actual)} stored: "
+          f"{len(missing)} missing, {len(extra)} extra, {len(different)} different.")
+
+    if args.mode == "rebuild":
+        for key in missing + different:
+            rollup_repository.put(expected[key])
+        for account_id, day, product in extra:
+            rollup_repository.delete(account_id, day, product)
+        print(f"✅ {len(missing) + len(different)} rollups rewritten, {len(extra)} deleted.")
+    elif missing or extra or different:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Replay account change events into the configured sink.
+
+Two sources are supported:
+
+1. `file`: a JSON Lines file written by the local sink (`CHANGE_EVENT_SINK=file`).
+   Events are replayed exactly as they were recorded.
+2. `table`: a scan of `account-table`. One snapshot event (old_status = None) is
+   emitted per account with its current status and version, which lets a new
+   consumer bootstrap its state.
+
+Events can be filtered by account, tenant and minimum timestamp. Consumers
+deduplicate on `account_id` + `version`, so replaying overlapping ranges is safe.
+
+Usage:
+    python scripts/replay_account_events.py --source file --path account_change_events.jsonl --since 2025-06-01T00:00:00Z
+    python scripts/replay_account_events.py --source table --tenant-id tenant_123 --sink file --sink-path replay.jsonl
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from boto3.dynamodb.types import TypeDeserializer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.entity.account import AccountStatus
+from src.domain.entity.account_change_event import AccountChangeEvent
+from src.domain.entity.timestamps import normalize_timestamp
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.events.change_event_sink import BatchingChangeEventPublisher, build_change_event_sink
+
+ACCOUNT_TABLE = "account-table"
+
+
+def read_file_events(path: str) -> Iterator[AccountChangeEvent]:
+    """Yield events recorded in a JSON Lines file."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield AccountChangeEvent.model_validate_json(line)
+
+
+def read_table_events() -> Iterator[AccountChangeEvent]:
+    """Yield one snapshot event per account stored in the table."""
+    deserializer = TypeDeserializer()
+    paginator = get_dynamodb_client().get_paginator("scan")
+
+    for page in paginator.paginate(TableName=ACCOUNT_TABLE):
+        for raw_item in page.get("Items", []):
+            item = {key: deserializer.deserialize(value) for key, value in raw_item.items()}
+            if "status" not in item or "tenant_id" not in item:
+                continue
+            yield AccountChangeEvent(
+                account_id=item["id"],
+                tenant_id=item["tenant_id"],
+                new_status=AccountStatus(item["status"]),
+                version=int(item.get("version", 0)),
+                timestamp=normalize_timestamp(item.get("updated_at") or item.get("created_at")) or "",
+            )
+
+
+def matches(event: AccountChangeEvent, args: argparse.Namespace) -> bool:
+    """Apply the command line filters to an event."""
+    if args.account_id and event.account_id != args.account_id:
+        return False
+    if args.tenant_id and event.tenant_id != args.tenant_id:
+        return False
+    if args.since and event.timestamp < args.since:
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay account change events.")
+    parser.add_argument("--source", choices=["file", "table"], required=True)
+    parser.add_argument("--path", help="JSON Lines file (source=file).")
+    parser.add_argument("--account-id")
+    parser.add_argument("--tenant-id")
+    parser.add_argument("--since", help="Minimum ISO-8601 UTC timestamp (source=file).")
+    parser.add_argument("--sink", default=ENVIRONMENT.change_event_sink, choices=["eventbridge", "file", "memory"])
+    parser.add_argument("--sink-path", default=ENVIRONMENT.change_event_file_path)
+    parser.add_argument("--bus-name", default=ENVIRONMENT.change_event_bus_name)
+    parser.add_argument("--dry-run", action="store_true", help="Count matching events without publishing.")
+    args = parser.parse_args()
+
+    if args.source == "file" and not args.path:
+        parser.error("--path is required when --source is file")
+
+    events = read_file_events(args.path) if args.source == "file" else read_table_events()
+    sink = build_change_event_sink(args.sink, bus_name=args.bus_name, file_path=args.sink_path)
+    publisher = BatchingChangeEventPublisher(sink, ENVIRONMENT.change_event_batch_size)
+
+    print(f"🔁 Replaying account change events from {args.source} into {args.sink}...")
+
+    matched = 0
+    for event in events:
+        if not matches(event, args):
+            continue
+        matched += 1
+        if not args.dry_run:
+            publisher.add(event)
+
+    if not args.dry_run:
+        publisher.flush()
+
+    print(f"✅ {matched} events matched, {publisher.published} published.")
+
+
+if __name__ == "__main__":
+    main()
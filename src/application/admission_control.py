@@ -0,0 +1,164 @@
+import logging
+import math
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable
+
+from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+
+from src.application.request_context import current_request
+from src.infra.rate_limit.token_bucket import Admission, TokenBucketStore
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED_TENANT = "unresolved"
+"""
+Bucket shared by the requests whose tenant cannot be resolved.
+"""
+
+
+@dataclass(frozen=True)
+class TenantQuota:
+    """
+    Token bucket parameters of a tenant.
+
+    Attributes:
+        rate (float): Sustained requests per second.
+        burst (float): Requests that can be served at once after an idle period.
+    """
+    rate: float
+    burst: float
+
+
+def parse_tenant_quotas(spec: str | None) -> dict[str, TenantQuota]:
+    """
+    Parses per-tenant quota overrides: "tenant_a=200:400,tenant_b=5:10" (rate:burst).
+    """
+    quotas = {}
+    for entry in (spec or "").split(","):
+        if not entry.strip():
+            continue
+        tenant_id, _, limits = entry.rpartition("=")
+        rate, _, burst = limits.partition(":")
+        quotas[tenant_id.strip()] = TenantQuota(rate=float(rate), burst=float(burst or rate))
+    return quotas
+
+
+class TenantAdmissionControl:
+    """
+    Per-tenant admission control for the router functions.
+
+    Every tenant has a token bucket (`default_quota`, or its entry in `quotas`).
+    A request takes `cost` tokens before the use case runs; when the bucket is
+    empty it is answered with 429 and a `Retry-After` header, and never reaches
+    the use case.
+
+    The tenant is taken from what the caller cannot forge: the tenant claim
+    the gateway authorizer put in the request context or, on routes acting on
+    one account, the tenant that account is stored under. The request body
+    and headers are never trusted for it. Requests whose tenant cannot be
+    resolved are charged to the shared `unresolved_tenant` bucket; none is
+    admitted unmetered. An instance can key its buckets by something else
+    than the tenant (`bucket_of`), e.g. the IAM principal of internal callers.
+
+    Usage:
+        admission = TenantAdmissionControl(InMemoryTokenBucketStore(), TenantQuota(rate=50, burst=100))
+
+        @deployable(...)
+        @admission.limit(cost=10)
+        def bulk_update_status(bulk_schema: BulkUpdateStatusSchema):
+            ...
+    """
+
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        default_quota: TenantQuota,
+        quotas: dict[str, TenantQuota] | None = None,
+        tenant_claim: str = "tenant_id",
+        account_tenant: Callable[[str], str | None] | None = None,
+        unresolved_tenant: str = UNRESOLVED_TENANT,
+        bucket_of: Callable[[object], str | None] | None = None,
+    ) -> None:
+        """
+        :param store: Where the buckets are kept (in-process or Redis).
+        :param default_quota: Quota of tenants without an override. A rate <= 0 disables admission control.
+        :param quotas: Per-tenant overrides.
+        :param tenant_claim: Authorizer context key or JWT claim carrying the tenant of the caller.
+        :param account_tenant: Returns the stored tenant of an account ID (None if unknown),
+            for requests without an authorizer tenant.
+        :param unresolved_tenant: Bucket charged for requests whose tenant cannot be resolved.
+            Its quota can be overridden in `quotas` like any tenant's.
+        :param bucket_of: Returns the bucket of a request instead of `tenant_of` (e.g. the
+            IAM principal of service-to-service calls), or None if it cannot be resolved.
+        """
+        self.store = store
+        self.default_quota = default_quota
+        self.quotas = quotas or {}
+        self.tenant_claim = tenant_claim
+        self.account_tenant = account_tenant
+        self.unresolved_tenant = unresolved_tenant
+        self.bucket_of = bucket_of or self.tenant_of
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_quota.rate > 0
+
+    def tenant_of(self, schema) -> str | None:
+        """
+        Returns the trusted tenant of a request, or None if it cannot be resolved.
+        """
+        tenant_id = current_request().authorizer_claim(self.tenant_claim)
+        if tenant_id is None and self.account_tenant is not None:
+            account_id = getattr(schema, "account_id", None)
+            if account_id:
+                tenant_id = self.account_tenant(account_id)
+        return tenant_id
+
+    def admit(self, tenant_id: str, cost: float = 1.0) -> Admission:
+        """
+        Takes `cost` tokens from the tenant's bucket.
+        """
+        quota = self.quotas.get(tenant_id, self.default_quota)
+        return self.store.take(tenant_id, quota.rate, quota.burst, cost)
+
+    @staticmethod
+    def throttled_response(tenant_id: str, admission: Admission) -> dict:
+        """
+        Builds the 429 HTTP response of a rejected request, with its `Retry-After` header.
+        """
+        logger.warning(f"Tenant {tenant_id} throttled, retry after {admission.retry_after_seconds:.2f}s")
+        http_response = to_lambda_http_response(ErrorResponse(
+            body=ErrorMessage(error=f"Request rate limit exceeded for tenant {tenant_id}"),
+            message="Too Many Requests",
+            status_code=429,
+        ))
+        http_response.setdefault("headers", {})["Retry-After"] = str(max(1, math.ceil(admission.retry_after_seconds)))
+        return http_response
+
+    def limit(self, cost: float | Callable[[object], float] = 1.0):
+        """
+        Decorator applying admission control to a router function.
+
+        Must sit below `@deployable` so it receives the validated schema. When
+        admission control is disabled the function is returned unchanged.
+
+        :param cost: Tokens taken per request; expensive endpoints take more.
+            A callable gets the schema, for requests carrying a variable amount of work.
+        """
+        def decorator(handler):
+            if not self.enabled:
+                return handler
+
+            @wraps(handler)
+            def wrapper(schema, *args, **kwargs):
+                tenant_id = self.bucket_of(schema) or self.unresolved_tenant
+                admission = self.admit(tenant_id, cost(schema) if callable(cost) else cost)
+                if not admission.allowed:
+                    return self.throttled_response(tenant_id, admission)
+                return handler(schema, *args, **kwargs)
+
+            return wrapper
+
+        return decorator
@@ -0,0 +1,148 @@
+import logging
+import os
+
+from src.application.request_context import flush_logs, install_request_context_middleware
+from src.config.custom_config import ENVIRONMENT
+
+logger = logging.getLogger(__name__)
+
+APP_FACTORY = "src.application.asgi_server:create_app"
+
+
+def worker_count(configured: int) -> int:
+    """
+    Number of server processes: `configured`, or one per usable core when 0.
+
+    Usable cores come from the scheduler affinity, so a container limited
+    to some cpusets does not start a worker per host core.
+    """
+    if configured > 0:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def use_fast_json(app) -> bool:
+    """
+    Serializes JSON responses with orjson (`ORJSONResponse`) when it is installed.
+
+    Routes registered by `deployable` are built with FastAPI's default
+    `JSONResponse`; their handler is rebuilt with the faster response class.
+    Endpoints returning a `Response` themselves are not affected.
+
+    Returns:
+        bool: Whether orjson is in use.
+    """
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+
+    from fastapi.datastructures import DefaultPlaceholder
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import APIRoute, request_response
+
+    app.router.default_response_class = ORJSONResponse
+    for route in app.routes:
+        response_class = getattr(route, "response_class", None)
+        if isinstance(route, APIRoute) and isinstance(response_class, DefaultPlaceholder) and response_class.value is JSONResponse:
+            route.response_class = ORJSONResponse
+            route.app = request_response(route.get_route_handler())
+    return True
+
+
+def configure_app(app):
+    """
+    Prepares the FastAPI app built by `HandlerResolver` for serving.
+
+    - Binds the request context of every request (headers, query string).
+    - Uses orjson for JSON responses when available.
+    - Flushes the log handlers once the server has drained in-flight requests.
+    """
+    install_request_context_middleware(app)
+    fast_json = use_fast_json(app)
+    app.add_event_handler("shutdown", flush_logs)
+    logger.info(f"FastAPI app ready in process {os.getpid()} (orjson responses: {fast_json})")
+    return app
+
+
+def setup_logging() -> None:
+    """
+    Sends the logs of this process to Logtail, at `log_level`.
+    """
+    from utilities.logger.log_utils import Logger
+    from utilities.logger.logail_handler import LogtailHandler
+
+    Logger.setup(LogtailHandler(), ENVIRONMENT.log_level)
+
+
+def build_app():
+    """
+    Builds the FastAPI app from the routers, with their dependencies, and prepares it for serving.
+    """
+    from utilities.frameworks.handler_resolver import HandlerResolver
+
+    from src.application import routers
+
+    return configure_app(HandlerResolver(routers, "fastapi").get_handler())
+
+
+def create_app():
+    """
+    ASGI app factory, called once in every worker process.
+
+    Workers are spawned, not forked, so each one sets up its own logging,
+    imports the routers itself and gets its own repository clients and
+    connection pools.
+    """
+    setup_logging()
+    return build_app()
+
+
+def server_options() -> dict:
+    """
+    uvicorn settings from `CustomConfig`.
+    """
+    options = {
+        "host": ENVIRONMENT.server_host,
+        "port": ENVIRONMENT.server_port,
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard]).
+        "loop": ENVIRONMENT.server_loop,
+        "http": ENVIRONMENT.server_http,
+        "backlog": ENVIRONMENT.server_backlog,
+        "timeout_keep_alive": ENVIRONMENT.server_keep_alive_seconds,
+        "timeout_graceful_shutdown": ENVIRONMENT.server_graceful_shutdown_seconds,
+        "access_log": ENVIRONMENT.server_access_log,
+        "proxy_headers": True,
+        "forwarded_allow_ips": "*",
+    }
+    if ENVIRONMENT.server_limit_concurrency > 0:
+        options["limit_concurrency"] = ENVIRONMENT.server_limit_concurrency
+    return options
+
+
+def serve(app=None) -> None:
+    """
+    Runs the FastAPI target with uvicorn.
+
+    With one worker, the app is built and served in this process. With more,
+    uvicorn supervises that many worker processes, each building its app
+    through `create_app`, and this process never builds it; on SIGTERM every
+    worker stops accepting connections and drains in-flight requests for up
+    to `server_graceful_shutdown_seconds`.
+
+    Args:
+        app: A FastAPI app for the single-worker mode. Built with `build_app` when omitted.
+    """
+    import uvicorn
+
+    setup_logging()
+    workers = worker_count(ENVIRONMENT.server_workers)
+    options = server_options()
+    logger.info(f"Serving on {options['host']}:{options['port']} with {workers} worker(s)")
+
+    if workers == 1:
+        uvicorn.run(configure_app(app) if app is not None else build_app(), **options)
+    else:
+        uvicorn.run(APP_FACTORY, factory=True, workers=workers, **options)
@@ -0,0 +1,158 @@
+import base64
+from dataclasses import dataclass
+from typing import Callable
+
+from pydantic import BaseModel, ValidationError
+from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+from utilities.frameworks.deployment_decorator import deployable
+
+
+@dataclass(slots=True)
+class CompiledRoute:
+    """
+    A router function with its request parser, built once at import time.
+
+    Attributes:
+        name (str): Name of the router function (the key of its handler).
+        handler (Callable): The function below `@deployable`, taking the validated schema.
+        parse (Callable[[dict], BaseModel]): Builds the schema from an API Gateway v2 event.
+    """
+    name: str
+    handler: Callable
+    parse: Callable[[dict], BaseModel]
+
+
+COMPILED_ROUTES: dict[str, CompiledRoute] = {}
+
+
+def compile_parser(schema_cls: type[BaseModel], source: str) -> Callable[[dict], BaseModel]:
+    """
+    Builds the parser of one route from the schema's compiled pydantic-core validator.
+
+    - "json": the body (str, or bytes when base64-encoded) is decoded and
+      validated into the schema in one step by `validate_json`, without an
+      intermediate dict.
+    - "path": `pathParameters` are validated into the schema.
+
+    Only the event keys the source needs are read; headers, query string and
+    the request context are left to `with_request_context`.
+
+    Args:
+        schema_cls (type[BaseModel]): The request schema of the route.
+        source (str): Where the schema comes from, as passed to `deployable`: "json" or "path".
+
+    Returns:
+        Callable[[dict], BaseModel]: The parser.
+    """
+    validator = schema_cls.__pydantic_validator__
+
+    match source:
+        case "json":
+            validate_json = validator.validate_json
+
+            def parse_json(event: dict) -> BaseModel:
+                body = event.get("body") or "{}"
+                if event.get("isBase64Encoded"):
+                    body = base64.b64decode(body)
+                return validate_json(body)
+
+            return parse_json
+        case "path":
+            validate_python = validator.validate_python
+
+            def parse_path(event: dict) -> BaseModel:
+                return validate_python(event.get("pathParameters") or {})
+
+            return parse_path
+
+    raise ValueError(f"Unsupported request source '{source}'")
+
+
+def precompiled(schema_cls: type[BaseModel], source: str):
+    """
+    Decorator registering a router function for the compiled Lambda parsing path.
+
+    The function is returned unchanged; other targets keep using `deployable`.
+    Routers use `precompiled_deployable`, which takes the schema and source
+    from the `deployable` declaration instead of repeating them.
+    """
+    parse = compile_parser(schema_cls, source)
+
+    def decorator(handler):
+        COMPILED_ROUTES[handler.__name__] = CompiledRoute(handler.__name__, handler, parse)
+        return handler
+
+    return decorator
+
+
+def precompiled_deployable(targets, *, schema_cls: type[BaseModel], source: str, **options):
+    """
+    `@deployable`, with the route also registered for the compiled Lambda parsing path.
+
+    Takes the same arguments as `deployable`; the compiled parser is built from
+    its `schema_cls` and `source`, so the two parsing paths can never disagree.
+    The compiled handler runs the decorators below this one (admission control,
+    deadline), like the `deployable` one.
+
+    Usage:
+        @precompiled_deployable([LAMBDA_TARGET], methods=["POST"], schema_cls=AccountSchema, source="json", route="/accounts/create")
+        @admission.limit()
+        def create_account(account_schema: AccountSchema):
+            ...
+    """
+    register = precompiled(schema_cls, source)
+    deploy = deployable(targets, schema_cls=schema_cls, source=source, **options)
+
+    def decorator(handler):
+        return deploy(register(handler))
+
+    return decorator
+
+
+def invalid_request_response(error: ValidationError) -> dict:
+    """
+    Builds the 400 HTTP response of a request that does not match its schema.
+    """
+    details = "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'body'}: {detail['msg']}"
+        for detail in error.errors(include_url=False)
+    )
+    return to_lambda_http_response(ErrorResponse(
+        body=ErrorMessage(error=details),
+        message="Bad Request",
+        status_code=400,
+    ))
+
+
+def build_compiled_handler(route: CompiledRoute):
+    """
+    Builds the Lambda handler of a compiled route: parse, then call the router function.
+    """
+    parse, handler = route.parse, route.handler
+
+    def compiled_handler(event: dict, context=None):
+        try:
+            schema = parse(event)
+        except ValidationError as error:
+            return invalid_request_response(error)
+        return handler(schema)
+
+    compiled_handler.__name__ = route.name
+    return compiled_handler
+
+
+def compiled_lambda_handlers(handlers: dict) -> dict:
+    """
+    Returns the Lambda handlers with every precompiled route replaced by its compiled handler.
+
+    Args:
+        handlers (dict): Per-function handlers, as returned by `HandlerResolver.get_handler()`.
+
+    Returns:
+        dict: The same mapping; routes without `@precompiled` keep the `deployable` handler.
+    """
+    return {
+        name: build_compiled_handler(COMPILED_ROUTES[name]) if name in COMPILED_ROUTES else handler
+        for name, handler in handlers.items()
+    }
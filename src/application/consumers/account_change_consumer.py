@@ -0,0 +1,135 @@
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.entity.account import AccountStatus
+from src.domain.entity.account_change_event import AccountChangeEvent
+from src.domain.entity.timestamps import format_timestamp
+from src.infra.events.change_event_sink import BatchingChangeEventPublisher, ChangeEventSink, build_change_event_sink
+
+logger = logging.getLogger(__name__)
+
+_deserializer = TypeDeserializer()
+
+
+def stream_record_to_event(record: dict) -> AccountChangeEvent | None:
+    """
+    Converts a DynamoDB stream record of `account-table` into an AccountChangeEvent.
+
+    Only inserts and modifications that change the status produce an event.
+    Items that are not accounts (no `status` or `tenant_id`) are ignored.
+
+    Args:
+        record (dict): A record of a DynamoDB stream event (NEW_AND_OLD_IMAGES view).
+
+    Returns:
+        Optional[AccountChangeEvent]: The event, or None if the record is not a status change.
+    """
+    if record.get("eventName") not in ("INSERT", "MODIFY"):
+        return None
+
+    stream = record["dynamodb"]
+    new_image = {key: _deserializer.deserialize(value) for key, value in stream.get("NewImage", {}).items()}
+    old_image = {key: _deserializer.deserialize(value) for key, value in stream.get("OldImage", {}).items()}
+
+    if "status" not in new_image or "tenant_id" not in new_image:
+        return None
+
+    old_status = old_image.get("status")
+    if old_status == new_image["status"]:
+        return None
+
+    committed_at = datetime.fromtimestamp(float(stream["ApproximateCreationDateTime"]), tz=timezone.utc)
+
+    return AccountChangeEvent(
+        account_id=new_image["id"],
+        tenant_id=new_image["tenant_id"],
+        old_status=AccountStatus(old_status) if old_status else None,
+        new_status=AccountStatus(new_image["status"]),
+        version=int(new_image.get("version", 0)),
+        timestamp=format_timestamp(committed_at),
+    )
+
+
+class AccountChangeConsumer:
+    """
+    DynamoDB stream consumer that turns account changes into AccountChangeEvents.
+
+    Responsibilities:
+    - Filter stream records down to account creations and status changes.
+    - Deliver the events to the configured sink in batches.
+    - Report partial failures so Lambda retries only the undelivered records.
+
+    Additional Notes:
+    - Requires the function to be configured with `functionResponseType: ReportBatchItemFailures`.
+    - Delivery is at-least-once; consumers deduplicate using `account_id` + `version`.
+    """
+
+    def __init__(self, sink: ChangeEventSink, batch_size: int | None = None) -> None:
+        """
+        Initializes the consumer with the sink events are delivered to.
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+
+    def handle(self, stream_event: dict) -> dict:
+        """
+        Processes one batch of DynamoDB stream records.
+
+        Args:
+            stream_event (dict): The Lambda event received from the DynamoDB stream.
+
+        Returns:
+            dict: The partial batch response, listing the first undelivered record if any.
+        """
+        publisher = BatchingChangeEventPublisher(self.sink, self.batch_size)
+        sequence_numbers: list[str] = []
+        events: list[AccountChangeEvent] = []
+
+        for record in stream_event.get("Records", []):
+            event = stream_record_to_event(record)
+            if event is not None:
+                sequence_numbers.append(record["dynamodb"]["SequenceNumber"])
+                events.append(event)
+
+        try:
+            for event in events:
+                publisher.add(event)
+            publisher.flush()
+        except Exception as error:
+            failed_sequence_number = sequence_numbers[publisher.published]
+            logger.error(f"Failed to deliver account change events from sequence {failed_sequence_number}: {error}")
+            return {"batchItemFailures": [{"itemIdentifier": failed_sequence_number}]}
+
+        logger.info(f"Delivered {publisher.published} account change events")
+        return {"batchItemFailures": []}
+
+
+@lru_cache(maxsize=1)
+def _account_change_consumer() -> AccountChangeConsumer:
+    """
+    Builds the process-wide consumer from the environment configuration.
+    """
+    sink = build_change_event_sink(
+        ENVIRONMENT.change_event_sink,
+        bus_name=ENVIRONMENT.change_event_bus_name,
+        file_path=ENVIRONMENT.change_event_file_path,
+    )
+    return AccountChangeConsumer(sink, batch_size=ENVIRONMENT.change_event_batch_size)
+
+
+def handle_account_change_stream(event: dict, context) -> dict:
+    """
+    Lambda entry point for the `account-table` DynamoDB stream.
+
+    Args:
+        event (dict): DynamoDB stream event.
+        context: Lambda context (unused).
+
+    Returns:
+        dict: Partial batch response for `ReportBatchItemFailures`.
+    """
+    return _account_change_consumer().handle(event)
@@ -0,0 +1,51 @@
+import logging
+import math
+from functools import wraps
+
+from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+
+from src.application.request_context import current_request
+from src.domain.deadlines.request_deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+
+def deadline_exceeded_response(error: DeadlineExceeded) -> dict:
+    """
+    Builds the 503 HTTP response of a request that ran out of time.
+    """
+    http_response = to_lambda_http_response(ErrorResponse(
+        body=ErrorMessage(error=f"Request deadline exceeded before {error.operation}"),
+        message="Service Unavailable",
+        status_code=503,
+    ))
+    http_response.setdefault("headers", {})["Retry-After"] = str(max(1, math.ceil(error.remaining_seconds)))
+    return http_response
+
+
+def respect_deadline(handler):
+    """
+    Decorator answering 503 when a router function cannot finish within the request deadline.
+
+    Must sit below `@deployable`. The request is rejected upfront if the
+    deadline has already expired, and a DeadlineExceeded raised further down
+    (a capped DynamoDB timeout, a write not started for lack of time) becomes
+    a 503 with `Retry-After` instead of a hard function timeout.
+
+    Usage:
+        @deployable(...)
+        @respect_deadline
+        def get_account(get_schema: GetAccountSchema):
+            ...
+    """
+    @wraps(handler)
+    def wrapper(schema, *args, **kwargs):
+        try:
+            current_request().deadline.check(handler.__name__)
+            return handler(schema, *args, **kwargs)
+        except DeadlineExceeded as error:
+            logger.warning(f"{handler.__name__} answered 503: {error}")
+            return deadline_exceeded_response(error)
+
+    return wrapper
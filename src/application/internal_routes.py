@@ -0,0 +1,123 @@
+import base64
+from dataclasses import dataclass
+from typing import Callable
+
+from pydantic import BaseModel, ValidationError
+from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+
+from src.application.compiled_routes import invalid_request_response
+from src.application.request_context import current_request
+from src.application.wire_codecs import WireCodec, available_codecs, codec_for_content_type, negotiate
+
+
+@dataclass(slots=True)
+class InternalRoute:
+    """
+    A service-to-service router function, answered in the encoding the caller negotiates.
+
+    Attributes:
+        name (str): Name of the router function.
+        handler (Callable): The function, taking the validated schema and returning a response schema
+            (or an HTTP response dict, e.g. a 429 from admission control).
+        schema_cls (type[BaseModel]): The request schema.
+    """
+    name: str
+    handler: Callable
+    schema_cls: type[BaseModel]
+
+
+INTERNAL_ROUTES: dict[str, InternalRoute] = {}
+
+
+def internal(schema_cls: type[BaseModel]):
+    """
+    Decorator registering a router function as an internal route.
+
+    Internal routes are not `deployable`: they are Lambda functions called by
+    other services, with no `SuccessResponse` envelope. The request body is
+    decoded by its `Content-Type` and the response encoded by `Accept`
+    (JSON, or MessagePack when installed); the response schema is the body
+    itself. Stack the other decorators below it, as with `@deployable`.
+
+    Usage:
+        @internal(LookupBatchSchema)
+        @admission.limit(cost=lambda batch: len(batch.lookups))
+        @respect_deadline
+        def internal_lookup(batch_schema: LookupBatchSchema):
+            ...
+    """
+    def decorator(handler):
+        INTERNAL_ROUTES[handler.__name__] = InternalRoute(handler.__name__, handler, schema_cls)
+        return handler
+
+    return decorator
+
+
+def _error_response(status_code: int, message: str, error: str) -> dict:
+    return to_lambda_http_response(ErrorResponse(body=ErrorMessage(error=error), message=message, status_code=status_code))
+
+
+def encoded_response(codec: WireCodec, model: BaseModel, status_code: int = 200) -> dict:
+    """
+    Builds the HTTP response of an internal route; binary encodings are base64-encoded for API Gateway.
+    """
+    body = codec.encode(model)
+    return {
+        "statusCode": status_code,
+        "headers": {"Content-Type": codec.media_type, "Vary": "Accept"},
+        "body": base64.b64encode(body).decode() if codec.binary else body.decode(),
+        "isBase64Encoded": codec.binary,
+    }
+
+
+def build_internal_handler(route: InternalRoute, codecs: list[WireCodec] | None = None):
+    """
+    Builds the Lambda handler of an internal route: negotiate, decode, call, encode.
+
+    Negotiation failures (406, 415) and invalid requests (400) are answered
+    with the usual JSON `ErrorResponse`, as are HTTP responses returned by
+    the decorators (429, 503).
+    """
+    codecs = codecs or available_codecs()
+    handler, schema_cls = route.handler, route.schema_cls
+
+    def internal_handler(event: dict, context=None):
+        request = current_request()
+        response_codec = negotiate(request.header("Accept"), codecs)
+        if response_codec is None:
+            supported = ", ".join(codec.media_type for codec in codecs)
+            return _error_response(406, "Not Acceptable", f"Supported encodings: {supported}")
+
+        request_codec = codec_for_content_type(request.header("Content-Type"), codecs)
+        if request_codec is None:
+            return _error_response(415, "Unsupported Media Type", f"Unsupported Content-Type {request.header('Content-Type')}")
+
+        body = event.get("body") or b""
+        if event.get("isBase64Encoded"):
+            body = base64.b64decode(body)
+        elif isinstance(body, str):
+            body = body.encode()
+
+        try:
+            schema = request_codec.decode(body, schema_cls)
+        except ValidationError as error:
+            return invalid_request_response(error)
+        except ValueError as error:
+            return _error_response(400, "Bad Request", str(error))
+
+        result = handler(schema)
+        if isinstance(result, BaseModel):
+            return encoded_response(response_codec, result)
+        return result
+
+    internal_handler.__name__ = route.name
+    return internal_handler
+
+
+def internal_lambda_handlers() -> dict:
+    """
+    Returns `{function_name: lambda_handler}` of every registered internal route.
+    """
+    codecs = available_codecs()
+    return {name: build_internal_handler(route, codecs) for name, route in INTERNAL_ROUTES.items()}
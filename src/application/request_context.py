@@ -0,0 +1,172 @@
+import logging
+from contextvars import ContextVar
+from functools import wraps
+
+from pydantic import BaseModel
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
+
+
+class RequestContext(BaseModel):
+    """
+    Transport-level data of the request being handled.
+
+    `deployable` only hands the validated schema to the router functions. This
+    context carries what the schema does not: headers, query string and the
+    Lambda context. It is bound per request by `with_request_context` (Lambda
+    and Cloud Functions) or by the FastAPI middleware.
+
+    Attributes:
+        headers (dict[str, str]): Request headers, with lower-cased names.
+        query (dict[str, str]): Query string parameters.
+        authorizer (dict): `requestContext.authorizer` of the API Gateway event, set by the gateway
+            after authenticating the caller (empty outside Lambda or on routes without an authorizer).
+        lambda_context (Any): The Lambda context object, when running on Lambda.
+        deadline (Deadline): Deadline derived from the Lambda remaining time (unbounded elsewhere).
+    """
+    headers: dict[str, str] = {}
+    query: dict[str, str] = {}
+    authorizer: dict = {}
+    lambda_context: object | None = None
+    deadline: Deadline = NO_DEADLINE
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def header(self, name: str) -> str | None:
+        """
+        Returns a header value by case-insensitive name.
+        """
+        return self.headers.get(name.lower())
+
+    def authorizer_claim(self, name: str) -> str | None:
+        """
+        Returns a value set by the gateway authorizer: a key of the Lambda
+        authorizer context or a claim of the JWT authorizer.
+
+        Unlike headers, these cannot be set by the caller.
+        """
+        value = (self.authorizer.get("lambda") or {}).get(name)
+        if value is None:
+            value = ((self.authorizer.get("jwt") or {}).get("claims") or {}).get(name)
+        return None if value is None else str(value)
+
+    def iam_principal(self) -> str | None:
+        """
+        Returns the ARN of the IAM principal that signed the request (routes with the `aws_iam` authorizer).
+
+        The session name of an assumed role is dropped: every container of a
+        calling Lambda function assumes its role under a different session,
+        and they are one caller.
+        """
+        iam = self.authorizer.get("iam") or {}
+        arn = iam.get("userArn")
+        if not arn:
+            return iam.get("callerId")
+        if ":assumed-role/" in arn:
+            return arn.rsplit("/", 1)[0]
+        return arn
+
+
+_EMPTY_CONTEXT = RequestContext()
+_current_request: ContextVar[RequestContext] = ContextVar("current_request", default=_EMPTY_CONTEXT)
+
+
+def current_request() -> RequestContext:
+    """
+    Returns the context of the request being handled (empty outside a request).
+    """
+    return _current_request.get()
+
+
+def bind_request_context(
+    headers: dict | None = None, query: dict | None = None, lambda_context=None, authorizer: dict | None = None
+):
+    """
+    Binds a new request context and returns the token used to reset it.
+
+    The values are already typed, so the context is constructed without validation.
+    """
+    return _current_request.set(RequestContext.model_construct(
+        headers={str(name).lower(): value for name, value in (headers or {}).items()},
+        query=dict(query or {}),
+        authorizer=dict(authorizer or {}),
+        lambda_context=lambda_context,
+        deadline=Deadline.from_lambda_context(
+            lambda_context,
+            reserve_seconds=ENVIRONMENT.request_deadline_reserve_seconds,
+            short_seconds=ENVIRONMENT.request_deadline_short_seconds,
+        ),
+    ))
+
+
+def reset_request_context(token) -> None:
+    """
+    Restores the context that was active before `bind_request_context`.
+    """
+    _current_request.reset(token)
+
+
+def flush_logs() -> None:
+    """
+    Flushes the handlers of the root logger (e.g. the Logtail handler).
+
+    A Lambda container is frozen as soon as the handler returns, so buffered
+    records would otherwise wait for the next invocation.
+    """
+    for handler in logging.getLogger().handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+def with_request_context(handler):
+    """
+    Wraps a Lambda or Cloud Function handler so the request context is bound while it runs.
+
+    Accepts an API Gateway v2 event (dict) or a Flask request, as produced by
+    the `lambda` and `cloudfunction` targets respectively.
+
+    After the handler returns, logs are flushed (`FLUSH_LOGS_ON_RETURN`) unless
+    the request deadline is short: the response comes first.
+
+    Usage:
+        lambda_create_account = with_request_context(app_or_functions["create_account"])
+    """
+    @wraps(handler)
+    def wrapper(event, context=None, *args, **kwargs):
+        if isinstance(event, dict):
+            headers = event.get("headers")
+            query = event.get("queryStringParameters")
+            authorizer = (event.get("requestContext") or {}).get("authorizer")
+        else:
+            headers = getattr(event, "headers", None)
+            query = getattr(event, "args", None)
+            authorizer = None
+
+        token = bind_request_context(dict(headers or {}), dict(query or {}), context, authorizer)
+        try:
+            if context is None:
+                return handler(event, *args, **kwargs)
+            return handler(event, context, *args, **kwargs)
+        finally:
+            if ENVIRONMENT.flush_logs_on_return and not current_request().deadline.is_short:
+                flush_logs()
+            reset_request_context(token)
+
+    return wrapper
+
+
+def install_request_context_middleware(app) -> None:
+    """
+    Registers a FastAPI middleware binding the request context for every request.
+    """
+    @app.middleware("http")
+    async def request_context_middleware(request, call_next):
+        token = bind_request_context(dict(request.headers), dict(request.query_params))
+        try:
+            return await call_next(request)
+        finally:
+            reset_request_context(token)
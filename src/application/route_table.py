@@ -0,0 +1,144 @@
+import importlib
+import json
+import pkgutil
+import re
+
+_PARAMETER = re.compile(r"^\{(\w+)\}$")
+
+
+class RouteTable:
+    """
+    Precompiled table mapping (HTTP method, path template) to a `@deployable` function name.
+
+    Built once at import time. Resolution is a single dictionary lookup:
+
+    - API Gateway v2 events carry the matched template in `routeKey`
+      (e.g. "GET /accounts/{accountId}"), which is the table key itself.
+    - Concrete paths (Cloud Functions, `$default` routes) hit the static
+      routes first, then the templates indexed by (method, segment count),
+      of which there are only a handful per bucket.
+
+    Usage:
+        table = RouteTable.from_routes({"get_account": (["GET"], "/accounts/{accountId}")})
+        name = table.resolve("GET", "/accounts/01JXN4...")
+    """
+
+    def __init__(self) -> None:
+        self._by_route_key: dict[str, str] = {}
+        self._static: dict[tuple[str, str], str] = {}
+        self._templates: dict[tuple[str, int], list[tuple[tuple[str | None, ...], str]]] = {}
+
+    @classmethod
+    def from_routes(cls, routes: dict[str, tuple[list[str], str]]) -> "RouteTable":
+        """
+        Compiles a table from `{function_name: (methods, route_template)}`.
+        """
+        table = cls()
+        for name, (methods, template) in routes.items():
+            for method in methods:
+                table.add(method, template, name)
+        return table
+
+    def add(self, method: str, template: str, name: str) -> None:
+        """
+        Registers one route.
+        """
+        method = method.upper()
+        self._by_route_key[f"{method} {template}"] = name
+
+        segments = tuple(None if _PARAMETER.match(segment) else segment for segment in template.strip("/").split("/"))
+        if None not in segments:
+            self._static[(method, template.rstrip("/") or "/")] = name
+        else:
+            self._templates.setdefault((method, len(segments)), []).append((segments, name))
+
+    def resolve(self, method: str, path: str, route_key: str | None = None) -> str | None:
+        """
+        Returns the function name serving a request, or None if no route matches.
+
+        :param method: HTTP method of the request.
+        :param path: Concrete request path.
+        :param route_key: API Gateway v2 `routeKey`, when available.
+        """
+        if route_key:
+            name = self._by_route_key.get(route_key)
+            if name is not None:
+                return name
+
+        method = method.upper()
+        path = path.rstrip("/") or "/"
+        name = self._static.get((method, path))
+        if name is not None:
+            return name
+
+        segments = path.strip("/").split("/")
+        for template, name in self._templates.get((method, len(segments)), ()):
+            if all(expected is None or expected == actual for expected, actual in zip(template, segments)):
+                return name
+
+        return None
+
+    @property
+    def route_keys(self) -> list[str]:
+        """
+        Every registered "METHOD /template" key.
+        """
+        return list(self._by_route_key)
+
+
+def collect_deployable_routes(package) -> dict[str, tuple[list[str], str]]:
+    """
+    Collects `{function_name: (methods, route)}` from every `@deployable` function of a package.
+
+    Args:
+        package: The routers package (e.g. `src.application.routers`).
+
+    Returns:
+        dict[str, tuple[list[str], str]]: The HTTP routes of the package.
+    """
+    routes = {}
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        for name, member in vars(module).items():
+            route = getattr(member, "_route", None)
+            methods = getattr(member, "_methods", None)
+            if callable(member) and route and methods:
+                routes[name] = (list(methods), route)
+    return routes
+
+
+def build_unified_handler(route_table: RouteTable, handlers: dict):
+    """
+    Builds one handler dispatching every HTTP route to the per-function handlers.
+
+    Accepts API Gateway v2 events (Lambda) and Flask requests (Cloud Functions),
+    so a single deployed function serves every endpoint and shares one warm
+    container, one DynamoDB connection pool and one set of caches.
+
+    Args:
+        route_table (RouteTable): The compiled routes.
+        handlers (dict): Per-function handlers, as returned by `HandlerResolver.get_handler()`.
+
+    Returns:
+        Callable: The unified handler.
+    """
+    def unified_handler(event, context=None):
+        if isinstance(event, dict):
+            http = event.get("requestContext", {}).get("http", {})
+            method, path = http.get("method", ""), event.get("rawPath") or http.get("path", "")
+            route_key = event.get("routeKey")
+        else:
+            method, path, route_key = event.method, event.path, None
+
+        name = route_table.resolve(method, path, route_key)
+        if name is None:
+            return {
+                "statusCode": 404,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps({"error": f"No route for {method} {path}"}),
+            }
+
+        handler = handlers[name]
+        return handler(event) if context is None else handler(event, context)
+
+    return unified_handler
@@ -1,31 +1,169 @@
 from utilities.cross_cutting.application.routers.http_response_adapter import to_lambda_http_response
 from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse
 from utilities.depency_injections.injection_manager import InjectionManager
-from utilities.frameworks.deployment_decorator import deployable
 from utilities.frameworks.deployment_target import DeploymentTarget
 
-from src.application.schemas.acchount_schema import AccountSchema, GetAccountSchema, UpdateStatusAccountSchema
+from src.application.schemas.acchount_schema import (
+    AccountSchema,
+    BulkUpdateStatusSchema,
+    GetAccountByOwnerSchema,
+    GetAccountSchema,
+    UpdateStatusAccountSchema,
+)
+from src.application.schemas.transaction_schema import (
+    CreateTransactionSchema,
+    ExportStatementSchema,
+    GetBalanceSchema,
+    ListTransactionsSchema,
+    LookupBatchSchema,
+    TransactionSummarySchema,
+)
+from src.application.admission_control import TenantAdmissionControl, TenantQuota, parse_tenant_quotas
+from src.application.compiled_routes import precompiled_deployable
+from src.application.deadline_guard import respect_deadline
+from src.application.internal_routes import internal
+from src.application.request_context import current_request
+from src.config.custom_config import ENVIRONMENT
 from src.config.dependency_start import start_account_dependencies
 from src.application.use_cases.account_use_case import AccountUseCase
+from src.application.use_cases.transaction_use_case import TransactionUseCase
+from src.domain.entity.session_token import SESSION_TOKEN_HEADER
 from src.domain.services.account_service import AccountService
-from src.infra.repositories.account_repository import AccountRepository
+from src.domain.services.balance_counter_service import BalanceCounterService
+from src.domain.services.bulk_status_service import BulkStatusService
+from src.domain.services.idempotency_service import IdempotencyService
+from src.domain.services.transaction_service import TransactionService
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.exports.object_store import build_object_store
+from src.infra.rate_limit.token_bucket import build_token_bucket_store
+from src.infra.repositories.balance_counter_repository import BalanceCounterRepository
+from src.infra.repositories.base_account_repository import BaseAccountRepository
+from src.infra.repositories.bulk_status_job_repository import BulkStatusJobRepository
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository
+from src.infra.repositories.idempotency_repository import IdempotencyRepository
+from src.infra.repositories.tiered_transaction_repository import TieredTransactionRepository
+from src.infra.repositories.transaction_repository import TransactionRepository
 
 start_account_dependencies()
 
+account_service = AccountService(
+    account_repository=InjectionManager.get_dependency(BaseAccountRepository),
+    account_cache=TTLCache(
+        ttl_seconds=ENVIRONMENT.account_cache_ttl_seconds,
+        max_entries=ENVIRONMENT.account_cache_max_entries,
+    ),
+    consistent_reads=ENVIRONMENT.account_read_consistency == "strong",
+    tenant_cache=TTLCache(
+        ttl_seconds=ENVIRONMENT.account_tenant_cache_ttl_seconds,
+        max_entries=ENVIRONMENT.account_cache_max_entries,
+    ),
+)
+
 account_use_case = AccountUseCase(
-    account_service=AccountService(account_repository=InjectionManager.get_dependency(AccountRepository))
+    account_service=account_service,
+    bulk_status_service=BulkStatusService(
+        account_service=account_service,
+        job_repository=InjectionManager.get_dependency(BulkStatusJobRepository),
+        page_size=ENVIRONMENT.bulk_status_page_size,
+        max_workers=ENVIRONMENT.bulk_status_max_workers,
+    ),
+    idempotency_service=IdempotencyService(
+        repository=InjectionManager.get_dependency(IdempotencyRepository),
+        ttl_seconds=ENVIRONMENT.idempotency_ttl_seconds,
+        lease_seconds=ENVIRONMENT.idempotency_lease_seconds,
+        cache=TTLCache(
+            ttl_seconds=ENVIRONMENT.idempotency_cache_ttl_seconds,
+            max_entries=ENVIRONMENT.idempotency_cache_max_entries,
+        ),
+    ),
+)
+
+transaction_repository = InjectionManager.get_dependency(TransactionRepository)
+if ENVIRONMENT.transaction_archive_enabled:
+    transaction_repository = TieredTransactionRepository(
+        hot=transaction_repository,
+        archive=TransactionArchive(build_object_store(
+            ENVIRONMENT.transaction_archive_store,
+            path=ENVIRONMENT.transaction_archive_path,
+            bucket=ENVIRONMENT.transaction_archive_bucket,
+        )),
+        horizon_days=ENVIRONMENT.transaction_archive_horizon_days,
+    )
+
+transaction_use_case = TransactionUseCase(
+    transaction_service=TransactionService(
+        transaction_repository=transaction_repository,
+        object_store=build_object_store(
+            ENVIRONMENT.statement_export_store,
+            path=ENVIRONMENT.statement_export_path,
+            bucket=ENVIRONMENT.statement_export_bucket,
+        ),
+        export_page_size=ENVIRONMENT.statement_export_page_size,
+        rollup_repository=InjectionManager.get_dependency(DailyRollupRepository),
+        account_service=account_service,
+        balance_service=BalanceCounterService(
+            repository=InjectionManager.get_dependency(BalanceCounterRepository),
+            hot_shard_count=ENVIRONMENT.balance_hot_shard_count,
+            promote_writes_per_second=ENVIRONMENT.balance_promote_writes_per_second,
+            demote_writes_per_second=ENVIRONMENT.balance_demote_writes_per_second,
+            window_seconds=ENVIRONMENT.balance_rate_window_seconds,
+            layout_cache=TTLCache(ttl_seconds=ENVIRONMENT.balance_layout_cache_ttl_seconds),
+            balance_cache=TTLCache(ttl_seconds=ENVIRONMENT.balance_cache_ttl_seconds),
+        ),
+    ),
+)
+
+admission = TenantAdmissionControl(
+    store=build_token_bucket_store(
+        ENVIRONMENT.tenant_rate_limit_store,
+        redis_url=ENVIRONMENT.tenant_rate_limit_redis_url,
+    ),
+    default_quota=TenantQuota(
+        rate=ENVIRONMENT.tenant_rate_limit_per_second,
+        burst=ENVIRONMENT.tenant_rate_limit_burst,
+    ),
+    quotas=parse_tenant_quotas(ENVIRONMENT.tenant_rate_limit_overrides),
+    tenant_claim=ENVIRONMENT.tenant_authorizer_claim,
+    account_tenant=lambda account_id: account_service.get_account_tenant(account_id, deadline=current_request().deadline),
+)
+# Bucket shared by the internal frames whose IAM principal is unknown.
+INTERNAL_CALLERS_TENANT = "internal-callers"
+# Service-to-service calls are metered per IAM principal, with their own quotas.
+internal_admission = TenantAdmissionControl(
+    store=admission.store,
+    default_quota=TenantQuota(
+        rate=ENVIRONMENT.internal_rate_limit_per_second,
+        burst=ENVIRONMENT.internal_rate_limit_burst,
+    ),
+    quotas=parse_tenant_quotas(ENVIRONMENT.internal_rate_limit_overrides),
+    unresolved_tenant=INTERNAL_CALLERS_TENANT,
+    bucket_of=lambda batch_schema: current_request().iam_principal(),
 )
 
 LAMBDA_TARGET = DeploymentTarget.LAMBDA
 FASTAPI_TARGET = DeploymentTarget.FASTAPI
 
-@deployable(
+
+def with_session_token(http_response: dict, response: SuccessResponse | ErrorResponse) -> dict:
+    """
+    Adds the read-your-writes session token of an account response as a header.
+    """
+    token = AccountUseCase.session_token(response)
+    if token is not None:
+        http_response.setdefault("headers", {})[SESSION_TOKEN_HEADER] = token
+    return http_response
+
+
+@precompiled_deployable(
     [LAMBDA_TARGET],
     methods=["POST"],
     schema_cls=AccountSchema,
     source="json",
     route="/accounts/create"
 )
+@admission.limit()
+@respect_deadline
 def create_account(account_schema: AccountSchema):
     """
     Endpoint to create a new account.
@@ -44,21 +182,38 @@ def create_account(account_schema: AccountSchema):
     Request Body:
         AccountSchema: Contains tenant_id and owner_id.
 
+    Headers:
+        Idempotency-Key (optional): Retries carrying the same key return the
+        response of the first request instead of creating another account.
+
+    Business Rules:
+        - A tenant has at most one account per owner, enforced in the same transactional write.
+
     Response:
-        SuccessResponse: Account created successfully.
+        SuccessResponse: Account created successfully, with an X-Session-Token header.
         ErrorResponse: In case of validation or persistence failure.
+        ErrorResponse: 409 if the owner already has an account in the tenant.
+        ErrorResponse: 503 with Retry-After if the request deadline is reached first.
     """
-    response: SuccessResponse | ErrorResponse = account_use_case.create_account(account_schema, create_account)
-    return to_lambda_http_response(response)
+    request = current_request()
+    response: SuccessResponse | ErrorResponse = account_use_case.create_account(
+        account_schema,
+        create_account,
+        idempotency_key=request.header("Idempotency-Key"),
+        deadline=request.deadline,
+    )
+    return with_session_token(to_lambda_http_response(response), response)
 
 
-@deployable(
+@precompiled_deployable(
     [LAMBDA_TARGET],
     methods=["GET"],
     schema_cls=GetAccountSchema,
     source="path",
     route="/accounts/{accountId}"
 )
+@admission.limit()
+@respect_deadline
 def get_account(get_schema: GetAccountSchema):
     """
     Endpoint to retrieve an account by ID.
@@ -76,22 +231,85 @@ def get_account(get_schema: GetAccountSchema):
 
     Query Parameters:
         GetAccountSchema: Contains the account_id.
+        fields (optional): Comma-separated attributes to return, e.g. `?fields=status`.
+
+    Headers:
+        If-None-Match (optional): ETag of a previous response. Answered with 304 when unchanged.
+        X-Session-Token (optional): Token of a create/update_status response. The account
+        returned is at least that version (strongly consistent read or write-through cache);
+        without it the read is eventually consistent.
 
     Response:
-        SuccessResponse: Returns the Account object if found.
+        SuccessResponse: Returns the Account object (or the projected fields) if found, with an ETag header.
         ErrorResponse: If the account does not exist.
+        ErrorResponse: 503 with Retry-After if the request deadline is reached first.
+    """
+    request = current_request()
+    if get_schema.fields is None and request.query.get("fields"):
+        get_schema.fields = request.query["fields"]
+
+    response, etag = account_use_case.get_account_conditional(
+        get_schema,
+        if_none_match=request.header("If-None-Match"),
+        deadline=request.deadline,
+        session_token=request.header(SESSION_TOKEN_HEADER),
+    )
+    http_response = to_lambda_http_response(response)
+
+    if etag is not None:
+        http_response.setdefault("headers", {})["ETag"] = etag
+    if response.status_code == 304:
+        http_response["body"] = ""
+
+    return http_response
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["GET"],
+    schema_cls=GetAccountByOwnerSchema,
+    source="path",
+    route="/tenants/{tenantId}/owners/{ownerId}/account"
+)
+@admission.limit()
+@respect_deadline
+def get_account_by_owner(owner_schema: GetAccountByOwnerSchema):
+    """
+    Endpoint to retrieve the account of an owner in a tenant.
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        GET
+
+    Route:
+        /tenants/{tenantId}/owners/{ownerId}/account
+
+    Business Rules:
+        - The account ID is read from the owner's uniqueness guard (one key lookup, no scan
+          or index query); the account is then read as in get_account.
+
+    Response:
+        SuccessResponse: The Account object.
+        ErrorResponse: If the owner has no account in the tenant.
+        ErrorResponse: 503 with Retry-After if the request deadline is reached first.
     """
-    response: SuccessResponse | ErrorResponse = account_use_case.get_account(get_schema.account_id)
+    response: SuccessResponse | ErrorResponse = account_use_case.get_account_by_owner(
+        owner_schema, deadline=current_request().deadline
+    )
     return to_lambda_http_response(response)
 
 
-@deployable(
+@precompiled_deployable(
     [LAMBDA_TARGET],
     methods=["PATCH"],
     schema_cls=UpdateStatusAccountSchema,
     source="json",
     route="/accounts/update_status"
 )
+@admission.limit()
+@respect_deadline
 def update_status(update_status_schema: UpdateStatusAccountSchema):
     """
     Endpoint to update the status of an existing account.
@@ -116,8 +334,291 @@ def update_status(update_status_schema: UpdateStatusAccountSchema):
         - CLOSED → ❌ No transitions allowed.
 
     Response:
-        SuccessResponse: If status update is successful.
+        SuccessResponse: If status update is successful, with an X-Session-Token header.
         ErrorResponse: If validation fails or update is not allowed.
+        ErrorResponse: 503 with Retry-After if the request deadline is reached first.
+    """
+    response: SuccessResponse | ErrorResponse = account_use_case.update_status(
+        update_status_schema, deadline=current_request().deadline
+    )
+    return with_session_token(to_lambda_http_response(response), response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["POST"],
+    schema_cls=BulkUpdateStatusSchema,
+    source="json",
+    route="/accounts/bulk_update_status"
+)
+@admission.limit(cost=10)
+@respect_deadline
+def bulk_update_status(bulk_schema: BulkUpdateStatusSchema):
+    """
+    Endpoint to transition many accounts to the same status.
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        POST
+
+    Route:
+        /accounts/bulk_update_status
+
+    Request Body:
+        BulkUpdateStatusSchema: Either `account_ids` or `tenant_id`, the target `status` and optional `reason`.
+        To resume a job that returned 202, send only its `job_id`.
+
+    Business Rules:
+        - Same transitions as update_status, applied per account as conditional writes.
+        - Accounts that cannot transition are reported in `outcomes` and do not fail the job.
+
+    Response:
+        SuccessResponse: 200 when the job completed, 202 when it must be resumed.
+        ErrorResponse: If the job to resume does not exist.
+    """
+    deadline = current_request().deadline
+    response: SuccessResponse | ErrorResponse = account_use_case.bulk_update_status(
+        bulk_schema,
+        # The page running when the budget ends must still finish before the deadline.
+        time_budget_seconds=max(0.0, min(
+            ENVIRONMENT.bulk_status_time_budget_seconds, deadline.remaining() - deadline.short_seconds
+        )),
+    )
+    return to_lambda_http_response(response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["POST"],
+    schema_cls=CreateTransactionSchema,
+    source="json",
+    route="/accounts/transactions"
+)
+@admission.limit()
+@respect_deadline
+def record_transaction(transaction_schema: CreateTransactionSchema):
+    """
+    Endpoint to ingest one transaction (used by the `transaction-worker`).
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        POST
+
+    Route:
+        /accounts/transactions
+
+    Request Body:
+        CreateTransactionSchema: The transaction, including the producer's ULID `id` and the `account_id`.
+
+    Business Rules:
+        - Only ACTIVE accounts accept transactions.
+        - The transaction and its daily rollup increment are written atomically.
+        - An `id` already ingested is rejected without touching the rollups.
+
+    Response:
+        SuccessResponse: 201 with the stored transaction.
+        ErrorResponse: 404 unknown account, 400 account not ACTIVE, 409 duplicate transaction.
+    """
+    response: SuccessResponse | ErrorResponse = transaction_use_case.record_transaction(transaction_schema)
+    return to_lambda_http_response(response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["GET"],
+    schema_cls=GetBalanceSchema,
+    source="path",
+    route="/accounts/{accountId}/balance"
+)
+@admission.limit()
+@respect_deadline
+def get_balance(balance_schema: GetBalanceSchema):
+    """
+    Endpoint to read the running balance of an account (credits minus debits).
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        GET
+
+    Route:
+        /accounts/{accountId}/balance
+
+    Business Rules:
+        - The balance is kept in counters updated with every ingested transaction.
+        - Hot accounts spread their writes over several counters; the balance is their sum.
+        - Served from a short-lived in-process cache (`BALANCE_CACHE_TTL_SECONDS`).
+
+    Response:
+        SuccessResponse: The balance and the number of counters it was summed from.
+    """
+    response: SuccessResponse | ErrorResponse = transaction_use_case.get_balance(balance_schema)
+    return to_lambda_http_response(response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["GET"],
+    schema_cls=TransactionSummarySchema,
+    source="path",
+    route="/accounts/{accountId}/transactions/summary"
+)
+@admission.limit()
+@respect_deadline
+def get_transaction_summary(summary_schema: TransactionSummarySchema):
+    """
+    Endpoint to read the credits, debits and counts of an account per day and product.
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        GET
+
+    Route:
+        /accounts/{accountId}/transactions/summary
+
+    Query Parameters:
+        start, end (required): Time range, inclusive.
+        product (optional): Only this product.
+
+    Business Rules:
+        - Whole days are answered from the daily rollups.
+        - Only the partial days at the range edges (e.g. today) are summed from raw transactions.
+
+    Response:
+        SuccessResponse: Range totals and the per-day, per-product breakdown.
+        ErrorResponse: If the time range is missing or invalid.
     """
-    response: SuccessResponse | ErrorResponse = account_use_case.update_status(update_status_schema)
+    query = current_request().query
+    summary_schema = TransactionSummarySchema(
+        account_id=summary_schema.account_id,
+        **{name: query[name] for name in ("start", "end", "product") if query.get(name) is not None},
+    )
+
+    response: SuccessResponse | ErrorResponse = transaction_use_case.summarize(summary_schema)
     return to_lambda_http_response(response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["GET"],
+    schema_cls=ListTransactionsSchema,
+    source="path",
+    route="/accounts/{accountId}/transactions"
+)
+@admission.limit()
+@respect_deadline
+def get_transactions(list_schema: ListTransactionsSchema):
+    """
+    Endpoint to read the statement of an account, one page at a time.
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        GET
+
+    Route:
+        /accounts/{accountId}/transactions
+
+    Query Parameters:
+        start, end (required): Time range, inclusive.
+        product (optional): Only transactions of this product.
+        cursor (optional): Cursor returned by the previous page.
+        limit (optional): Page size, up to 1000.
+
+    Response:
+        SuccessResponse: The transactions and the cursor of the next page.
+        ErrorResponse: If the time range is missing or invalid.
+    """
+    query = current_request().query
+    list_schema = ListTransactionsSchema(
+        account_id=list_schema.account_id,
+        **{name: query[name] for name in ("start", "end", "product", "cursor", "limit") if query.get(name) is not None},
+    )
+
+    response: SuccessResponse | ErrorResponse = transaction_use_case.list_transactions(list_schema)
+    return to_lambda_http_response(response)
+
+
+@precompiled_deployable(
+    [LAMBDA_TARGET],
+    methods=["POST"],
+    schema_cls=ExportStatementSchema,
+    source="json",
+    route="/accounts/statements/export"
+)
+@admission.limit(cost=20)
+@respect_deadline
+def export_statement(export_schema: ExportStatementSchema):
+    """
+    Endpoint to export the statement of an account or tenant to a compressed file.
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        POST
+
+    Route:
+        /accounts/statements/export
+
+    Request Body:
+        ExportStatementSchema: `account_id` or `tenant_id`, `start`, `end`, optional `product`
+        and `format` ("parquet", "arrow" or "csv.gz").
+
+    Business Rules:
+        - The time-range query is streamed into the file page by page (bounded memory).
+        - Without pyarrow the export falls back to csv.gz; the response reports the actual format.
+
+    Response:
+        SuccessResponse: Location (`uri`), format and row count of the export.
+    """
+    response: SuccessResponse | ErrorResponse = transaction_use_case.export_statement(export_schema)
+    return to_lambda_http_response(response)
+
+
+
+@internal(LookupBatchSchema)
+@internal_admission.limit(cost=lambda batch_schema: len(batch_schema.lookups))
+@respect_deadline
+def internal_lookup(batch_schema: LookupBatchSchema):
+    """
+    Internal endpoint answering a frame of balance and statement lookups (service-to-service).
+
+    Supported Deployment Types:
+        - AWS Lambda
+
+    HTTP Method:
+        POST
+
+    Route:
+        /internal/lookups
+
+    Request Body:
+        LookupBatchSchema: Up to 100 `lookups`, each `{"op": "balance", "account_id"}` or
+        `{"op": "statement", "account_id", "start", "end", "product", "cursor", "limit"}`.
+        JSON, or MessagePack with `Content-Type: application/msgpack`.
+
+    Headers:
+        Accept (optional): `application/msgpack` for a MessagePack response; JSON otherwise.
+
+    Business Rules:
+        - Each lookup is answered as `get_balance` / `get_transactions` would, without the
+          `SuccessResponse` envelope; a failed lookup does not fail the frame.
+        - Admission control takes one token per lookup from the bucket of the calling IAM
+          principal (`INTERNAL_RATE_LIMIT_*`), or from the shared `INTERNAL_CALLERS_TENANT`
+          bucket when the principal is unknown.
+        - Exposed with IAM authorization only: callers sign their requests (SigV4).
+
+    Response:
+        LookupResultsSchema: `results`, one `{status, body | error}` per lookup, in request order.
+        ErrorResponse: 400 invalid frame, 406/415 unsupported encoding, 429 throttled, 503 deadline.
+    """
+    return transaction_use_case.lookup(batch_schema)
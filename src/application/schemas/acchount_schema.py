@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.domain.entity.account import ACCOUNT_FIELDS, AccountStatus
 
 
 class AccountSchema(BaseModel):
@@ -20,9 +22,37 @@ class GetAccountSchema(BaseModel):
     Schema for retrieving account information.
 
     Inherits from AccountSchema and can be extended with additional fields
-    specific to retrieval operations if needed.
+    specific to retrieval operations if needed. `fields` restricts the response
+    to a subset of the account attributes (e.g. `?fields=status`).
     """
     account_id: str = Field(alias="accountId")
+    fields: list[str] | None = None
+
+    class Config:
+        validate_assignment = True
+        populate_by_name = True
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value):
+        """
+        Accepts the projection as a list or as a comma-separated query string value.
+        """
+        if isinstance(value, str):
+            value = [field.strip() for field in value.split(",") if field.strip()]
+        if value is not None:
+            unknown = set(value) - ACCOUNT_FIELDS
+            if unknown:
+                raise ValueError(f"unknown account fields: {', '.join(sorted(unknown))}")
+        return value or None
+
+
+class GetAccountByOwnerSchema(BaseModel):
+    """
+    Schema for retrieving the account of an owner in a tenant.
+    """
+    tenant_id: str = Field(alias="tenantId")
+    owner_id: str = Field(alias="ownerId")
 
     class Config:
         validate_assignment = True
@@ -41,4 +71,58 @@ class UpdateStatusAccountSchema(BaseModel):
     reason: str | None = None
 
     class Config:
-        validate_assignment = True
\ No newline at end of file
+        validate_assignment = True
+
+
+class BulkUpdateStatusSchema(BaseModel):
+    """
+    Schema for transitioning many accounts to the same status.
+
+    Either `account_ids` or `tenant_id` selects the accounts of a new job.
+    Sending `job_id` alone resumes a job that stopped before completing.
+    """
+    account_ids: list[str] | None = Field(default=None, max_length=5000)
+    tenant_id: str | None = None
+    status: AccountStatus | None = None
+    reason: str | None = None
+    job_id: str | None = None
+
+    class Config:
+        validate_assignment = True
+
+    @model_validator(mode="after")
+    def check_selector(self):
+        if self.job_id is not None:
+            return self
+        if (self.account_ids is None) == (self.tenant_id is None):
+            raise ValueError("exactly one of account_ids or tenant_id must be provided")
+        if self.status is None:
+            raise ValueError("status is required when starting a bulk status job")
+        return self
+
+
+class BulkStatusOutcomeSchema(BaseModel):
+    """
+    Schema for the outcome of one account within a bulk status transition.
+    """
+    account_id: str
+    status_code: int
+    status: str | None = None
+    error: str | None = None
+
+
+class BulkStatusJobResponseSchema(BaseModel):
+    """
+    Schema for the response of a bulk status transition invocation.
+
+    `outcomes` only lists the accounts processed by this invocation, while the
+    counters cover the whole job. A RUNNING job is resumed by sending `job_id` back.
+    """
+    job_id: str
+    state: str
+    processed: int
+    updated: int
+    skipped: int
+    replayed: int = 0
+    failed: int
+    outcomes: list[BulkStatusOutcomeSchema]
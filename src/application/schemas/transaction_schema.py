@@ -0,0 +1,197 @@
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.domain.entity.money import Money
+from src.domain.entity.timestamps import normalize_timestamp
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+
+
+class CreateTransactionSchema(BaseModel):
+    """
+    Schema for ingesting one transaction (used by the `transaction-worker`).
+
+    The `id` is the ULID assigned by the producer; sending the same `id` twice
+    is rejected, so retries are safe.
+    """
+    id: str
+    account_id: str
+    timestamp: str
+    amount: Money = Field(gt=0)
+    type: TransactionType
+    currency: str = "BRL"
+    product: str
+    reference: str = Field(min_length=1)
+    metadata: dict | None = None
+    balance_snapshot: Money | None = None
+
+    class Config:
+        validate_assignment = True
+
+    _normalize_timestamp = field_validator("timestamp", mode="before")(normalize_timestamp)
+
+
+class ListTransactionsSchema(BaseModel):
+    """
+    Schema for reading one page of the statement of an account.
+
+    `start` and `end` are mandatory and accept any supported timestamp encoding;
+    they are normalized to the canonical one.
+    """
+    account_id: str = Field(alias="accountId")
+    start: str | None = None
+    end: str | None = None
+    product: str | None = None
+    cursor: str | None = None
+    limit: int = Field(default=100, ge=1, le=1000)
+
+    class Config:
+        validate_assignment = True
+        populate_by_name = True
+
+    _normalize_range = field_validator("start", "end", mode="before")(normalize_timestamp)
+
+
+class TransactionPageSchema(BaseModel):
+    """
+    Schema of one statement page. `cursor` is None on the last page.
+    """
+    items: list[TransactionEntry]
+    cursor: str | None = None
+
+
+class ExportStatementSchema(BaseModel):
+    """
+    Schema for exporting the statement of an account or of a whole tenant.
+
+    Exactly one of `account_id` or `tenant_id` selects the transactions.
+    """
+    account_id: str | None = None
+    tenant_id: str | None = None
+    start: str
+    end: str
+    product: str | None = None
+    format: Literal["parquet", "arrow", "csv.gz"] = "parquet"
+
+    class Config:
+        validate_assignment = True
+
+    _normalize_range = field_validator("start", "end", mode="before")(normalize_timestamp)
+
+    @model_validator(mode="after")
+    def check_selector(self):
+        """
+        Requires exactly one selector and an ordered range.
+        """
+        if (self.account_id is None) == (self.tenant_id is None):
+            raise ValueError("provide exactly one of account_id or tenant_id")
+        if self.start > self.end:
+            raise ValueError("start must not be after end")
+        return self
+
+
+class StatementExportResponseSchema(BaseModel):
+    """
+    Schema of a completed statement export.
+    """
+    uri: str
+    format: str
+    rows: int
+
+
+class TransactionSummarySchema(BaseModel):
+    """
+    Schema for the per-day, per-product totals of an account over a time range.
+    """
+    account_id: str = Field(alias="accountId")
+    start: str | None = None
+    end: str | None = None
+    product: str | None = None
+
+    class Config:
+        validate_assignment = True
+        populate_by_name = True
+
+    _normalize_range = field_validator("start", "end", mode="before")(normalize_timestamp)
+
+
+class GetBalanceSchema(BaseModel):
+    """
+    Schema for reading the running balance of an account.
+    """
+    account_id: str = Field(alias="accountId")
+
+    class Config:
+        validate_assignment = True
+        populate_by_name = True
+
+
+class DailyTotalsSchema(BaseModel):
+    """
+    Totals of one day and product.
+    """
+    day: str
+    product: str
+    credits: Money
+    debits: Money
+    net: Money
+    count: int
+
+
+class TransactionSummaryResponseSchema(BaseModel):
+    """
+    Schema of a statement summary: range totals and their per-day breakdown.
+    """
+    account_id: str
+    start: str
+    end: str
+    credits: Money
+    debits: Money
+    net: Money
+    count: int
+    days: list[DailyTotalsSchema]
+
+
+MAX_LOOKUPS_PER_FRAME = 100
+
+
+class BalanceLookupSchema(GetBalanceSchema):
+    """
+    One balance lookup of an internal lookup frame.
+    """
+    op: Literal["balance"]
+
+
+class StatementLookupSchema(ListTransactionsSchema):
+    """
+    One statement page lookup of an internal lookup frame.
+    """
+    op: Literal["statement"]
+
+
+class LookupBatchSchema(BaseModel):
+    """
+    Schema of an internal lookup frame: balance and statement lookups answered in one request.
+
+    Each lookup is told apart by `op` and takes the fields of its public
+    endpoint (`account_id` or `accountId`).
+    """
+    lookups: list[Annotated[BalanceLookupSchema | StatementLookupSchema, Field(discriminator="op")]] = Field(
+        min_length=1, max_length=MAX_LOOKUPS_PER_FRAME
+    )
+
+
+class LookupResultSchema(BaseModel):
+    """
+    Outcome of one lookup: its status code and either the body or the error.
+    """
+    status: int
+    body: Any = None
+    error: str | None = None
+
+
+class LookupResultsSchema(BaseModel):
+    """
+    Schema of an internal lookup response: one result per lookup, in request order.
+    """
+    results: list[LookupResultSchema]
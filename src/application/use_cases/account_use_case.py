@@ -1,9 +1,25 @@
-from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse
+import hashlib
+
+from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse, ErrorMessage
 from utilities.cross_cutting.domain.builders.fingerprint_builder import FingerprintBuilder
 
-from src.application.schemas.acchount_schema import AccountSchema, UpdateStatusAccountSchema
+from src.application.schemas.acchount_schema import (
+    AccountSchema,
+    BulkStatusJobResponseSchema,
+    GetAccountByOwnerSchema,
+    GetAccountSchema,
+    BulkStatusOutcomeSchema,
+    BulkUpdateStatusSchema,
+    UpdateStatusAccountSchema,
+)
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
 from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.bulk_status_job import BulkStatusJob, BulkStatusJobState
+from src.domain.entity.idempotency_record import IdempotencyRecord, IdempotencyState
+from src.domain.entity.session_token import SessionToken
 from src.domain.services.account_service import AccountService
+from src.domain.services.bulk_status_service import BulkStatusService
+from src.domain.services.idempotency_service import IdempotencyService
 
 
 class AccountUseCase:
@@ -18,31 +34,114 @@ class AccountUseCase:
 
     Features:
     - Account creation.
-    - Account retrieval.
+    - Account retrieval, by ID or by tenant and owner.
     - Account status updates with validation.
+    - Bulk status transitions with resumable checkpoints.
+    - Idempotent account creation through `Idempotency-Key`.
+    - Request deadline passed down to the services, which raise DeadlineExceeded
+      (answered with 503 by the routers) rather than run past it.
+    - Read-your-writes: create and status update responses carry a session
+      token (`session_token`); reads presenting it see at least that version.
     """
 
-    def __init__(self, account_service: AccountService) -> None:
+    def __init__(
+        self,
+        account_service: AccountService,
+        bulk_status_service: BulkStatusService | None = None,
+        idempotency_service: IdempotencyService | None = None,
+    ) -> None:
         """
         Initializes the AccountUseCase with the required service dependency.
         """
         self.account_service = account_service
+        self.bulk_status_service = bulk_status_service
+        self.idempotency_service = idempotency_service
 
 
-    def create_account(self, account_data: AccountSchema, function) -> SuccessResponse | ErrorResponse:
+    def create_account(
+        self,
+        account_data: AccountSchema,
+        function,
+        idempotency_key: str | None = None,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> SuccessResponse | ErrorResponse:
         """
         Creates a new account with default status ACTIVE.
 
         Business Rules:
         - New accounts always start as ACTIVE.
         - The caller provides only tenant_id and owner_id.
+        - With an `idempotency_key`, a repeated request returns the stored response
+          of the first one instead of creating another account.
 
         Args:
             account_data (AccountSchema): Input data for account creation.
+            idempotency_key (Optional[str]): Value of the `Idempotency-Key` header.
+            deadline (Deadline): Deadline of the request.
 
         Returns:
-            SuccessResponse: If account creation succeeds.
-            ErrorResponse: If creation fails due to validation or persistence issues.
+            SuccessResponse: If account creation succeeds (or is replayed).
+            ErrorResponse: If creation fails due to validation or persistence issues,
+            the key is reused with a different payload (422), or the first request
+            holding the key is still running (409).
+        """
+        if idempotency_key and self.idempotency_service is not None:
+            return self._create_account_idempotent(account_data, function, idempotency_key, deadline)
+
+        return self._create_account(account_data, function, deadline)
+
+    def _create_account_idempotent(
+        self,
+        account_data: AccountSchema,
+        function,
+        idempotency_key: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> SuccessResponse | ErrorResponse:
+        """
+        Runs `_create_account` at most once per idempotency key.
+        """
+        scoped_key = f"create_account#{account_data.tenant_id}#{idempotency_key}"
+        request_hash = IdempotencyService.hash_request(account_data.tenant_id, account_data.owner_id)
+
+        existing: IdempotencyRecord | None = self.idempotency_service.begin(scoped_key, request_hash)
+
+        if existing is not None:
+            if existing.request_hash != request_hash:
+                return ErrorResponse(
+                    body=ErrorMessage(error="Idempotency-Key was already used with a different request"),
+                    message="Unprocessable Entity",
+                    status_code=422,
+                )
+            if existing.state == IdempotencyState.IN_PROGRESS:
+                return ErrorResponse(
+                    body=ErrorMessage(error="A request with this Idempotency-Key is still in progress"),
+                    message="Conflict",
+                    status_code=409,
+                )
+            return SuccessResponse(
+                status_code=existing.status_code,
+                body=Account.model_validate_json(existing.body),
+                message=existing.message,
+            )
+
+        try:
+            response = self._create_account(account_data, function, deadline)
+        except Exception:
+            self.idempotency_service.abandon(scoped_key)
+            raise
+
+        if isinstance(response, SuccessResponse):
+            self.idempotency_service.complete(
+                scoped_key, request_hash, response.status_code, response.message, response.body.model_dump_json()
+            )
+        else:
+            self.idempotency_service.abandon(scoped_key)
+
+        return response
+
+    def _create_account(self, account_data: AccountSchema, function, deadline: Deadline = NO_DEADLINE) -> SuccessResponse | ErrorResponse:
+        """
+        Maps the schema to an ACTIVE Account and creates it.
         """
         account_data = Account(
             tenant_id=account_data.tenant_id,
@@ -50,32 +149,132 @@ class AccountUseCase:
             status=AccountStatus.ACTIVE,
             fingerprint=FingerprintBuilder.from_handler_function(function)
         )
-        account: Account | ErrorResponse = self.account_service.create_account(account_data)
+        account: Account | ErrorResponse = self.account_service.create_account(account_data, deadline=deadline)
 
         if isinstance(account, Account):
             return SuccessResponse(status_code=200, body=account, message="Account created successfully")
 
         return account
 
-    def get_account(self, account_id: str) -> SuccessResponse | ErrorResponse:
+    def get_account(self, account_id: str, deadline: Deadline = NO_DEADLINE) -> SuccessResponse | ErrorResponse:
         """
         Retrieves an account by its ID.
 
         Args:
             account_id (str): The unique identifier of the account.
+            deadline (Deadline): Deadline of the request.
 
         Returns:
             SuccessResponse: If the account exists.
             ErrorResponse: If the account is not found.
         """
-        account: Account | ErrorResponse = self.account_service.get_account(account_id)
+        account: Account | ErrorResponse = self.account_service.get_account(account_id, deadline=deadline)
+
+        if isinstance(account, Account):
+            return SuccessResponse(status_code=200, body=account, message="Account retrieved successfully")
+
+        return account
+
+    def get_account_by_owner(
+        self, owner_schema: GetAccountByOwnerSchema, deadline: Deadline = NO_DEADLINE
+    ) -> SuccessResponse | ErrorResponse:
+        """
+        Retrieves the account of an owner in a tenant.
+
+        Args:
+            owner_schema (GetAccountByOwnerSchema): The tenant and owner.
+            deadline (Deadline): Deadline of the request.
+
+        Returns:
+            SuccessResponse: If the owner has an account.
+            ErrorResponse: If the owner has no account in the tenant (404).
+        """
+        account: Account | ErrorResponse = self.account_service.get_account_by_owner(
+            owner_schema.tenant_id, owner_schema.owner_id, deadline=deadline
+        )
 
         if isinstance(account, Account):
             return SuccessResponse(status_code=200, body=account, message="Account retrieved successfully")
 
         return account
 
-    def update_status(self, update_status_schema: UpdateStatusAccountSchema) -> SuccessResponse | ErrorResponse:
+    def get_account_conditional(
+        self,
+        get_schema: GetAccountSchema,
+        if_none_match: str | None = None,
+        deadline: Deadline = NO_DEADLINE,
+        session_token: str | None = None,
+    ) -> tuple[SuccessResponse | ErrorResponse, str | None]:
+        """
+        Retrieves an account, optionally projected, honouring `If-None-Match`.
+
+        The ETag is derived from the account `version` and `updated_at`, plus
+        the requested projection, so it changes whenever the returned
+        representation can change.
+
+        Reads are eventually consistent unless `session_token` names this
+        account: the response then reflects at least the version it carries.
+
+        Args:
+            get_schema (GetAccountSchema): Contains the account_id and the optional `fields` projection.
+            if_none_match (Optional[str]): Value of the `If-None-Match` header.
+            deadline (Deadline): Deadline of the request.
+            session_token (Optional[str]): Value of the `X-Session-Token` header.
+
+        Returns:
+            tuple: The response and its ETag (None for errors). The response is
+            304 with no body when `if_none_match` matches the current ETag.
+        """
+        token = SessionToken.parse(session_token)
+        min_version = token.version if token is not None and token.account_id == get_schema.account_id else None
+
+        if get_schema.fields:
+            result: dict | ErrorResponse = self.account_service.get_account_fields(
+                get_schema.account_id, get_schema.fields, deadline=deadline, min_version=min_version
+            )
+            if isinstance(result, ErrorResponse):
+                return result, None
+            version, updated_at = result.get("version", 0), result.get("updated_at")
+            body = {field: result.get(field) for field in get_schema.fields}
+        else:
+            account: Account | ErrorResponse = self.account_service.get_account(
+                get_schema.account_id, deadline=deadline, min_version=min_version
+            )
+            if isinstance(account, ErrorResponse):
+                return account, None
+            version, updated_at = account.version, account.updated_at
+            body = account
+
+        etag = self._etag(get_schema.account_id, version, updated_at, get_schema.fields)
+
+        if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]):
+            return SuccessResponse(status_code=304, body=None, message="Not Modified"), etag
+
+        return SuccessResponse(status_code=200, body=body, message="Account retrieved successfully"), etag
+
+    @staticmethod
+    def session_token(response: SuccessResponse | ErrorResponse) -> str | None:
+        """
+        Session token of a response carrying an account (create, status update), None otherwise.
+        """
+        if isinstance(response, SuccessResponse) and isinstance(response.body, Account):
+            return SessionToken.of(response.body).encode()
+        return None
+
+    @staticmethod
+    def _etag(account_id: str, version: int, updated_at, fields: list[str] | None) -> str:
+        """
+        Builds a strong ETag for one representation of an account.
+        """
+        projection = ",".join(sorted(fields)) if fields else "*"
+        digest = hashlib.sha1(f"{account_id}:{version}:{updated_at}:{projection}".encode()).hexdigest()
+        return f'"{digest[:20]}"'
+
+    def update_status(
+        self,
+        update_status_schema: UpdateStatusAccountSchema,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> SuccessResponse | ErrorResponse:
         """
         Updates the status of an account, enforcing all business rules.
 
@@ -96,6 +295,7 @@ class AccountUseCase:
 
         Args:
             update_status_schema (UpdateStatusAccountSchema): Contains `account_id`, target `status`, and optional `reason`.
+            deadline (Deadline): Deadline of the request.
 
         Returns:
             SuccessResponse: If status update succeeds.
@@ -104,10 +304,66 @@ class AccountUseCase:
         account: Account | ErrorResponse = self.account_service.update_status(
             account_id=update_status_schema.account_id,
             update_status=AccountStatus(update_status_schema.status),
-            reason=update_status_schema.reason
+            reason=update_status_schema.reason,
+            deadline=deadline,
         )
 
         if isinstance(account, Account):
             return SuccessResponse(status_code=200, body=account, message="Account status updated successfully")
 
         return account
+
+
+    def bulk_update_status(self, bulk_schema: BulkUpdateStatusSchema, time_budget_seconds: float) -> SuccessResponse | ErrorResponse:
+        """
+        Starts or resumes a bulk status transition.
+
+        The same business rules as `update_status` apply to every account;
+        accounts that cannot transition are reported individually and do not
+        fail the job.
+
+        Args:
+            bulk_schema (BulkUpdateStatusSchema): Selector and target status, or the `job_id` to resume.
+            time_budget_seconds (float): Time after which no new page is started in this invocation.
+
+        Returns:
+            SuccessResponse: 200 if the job completed, 202 if it must be resumed with `job_id`.
+            ErrorResponse: If the job to resume does not exist.
+        """
+        if bulk_schema.job_id is not None:
+            job: BulkStatusJob | ErrorResponse = self.bulk_status_service.get_job(bulk_schema.job_id)
+            if isinstance(job, ErrorResponse):
+                return job
+        else:
+            job = self.bulk_status_service.start_job(
+                target_status=bulk_schema.status,
+                reason=bulk_schema.reason,
+                tenant_id=bulk_schema.tenant_id,
+                account_ids=bulk_schema.account_ids,
+            )
+
+        outcomes = [
+            BulkStatusOutcomeSchema(
+                account_id=account_id,
+                status_code=200 if isinstance(result, Account) else result.status_code,
+                status=result.status if isinstance(result, Account) else None,
+                error=None if isinstance(result, Account) else result.body.error,
+            )
+            for account_id, result in self.bulk_status_service.run(job, time_budget_seconds)
+        ]
+
+        body = BulkStatusJobResponseSchema(
+            job_id=job.id,
+            state=job.state,
+            processed=job.processed,
+            updated=job.updated,
+            skipped=job.skipped,
+            replayed=job.replayed,
+            failed=job.failed,
+            outcomes=outcomes,
+        )
+
+        if job.state == BulkStatusJobState.COMPLETED:
+            return SuccessResponse(status_code=200, body=body, message="Bulk status update completed")
+
+        return SuccessResponse(status_code=202, body=body, message="Bulk status update in progress, resume with job_id")
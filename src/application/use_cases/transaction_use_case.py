@@ -0,0 +1,224 @@
+from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse, ErrorMessage
+
+from src.application.schemas.transaction_schema import (
+    CreateTransactionSchema,
+    DailyTotalsSchema,
+    ExportStatementSchema,
+    GetBalanceSchema,
+    ListTransactionsSchema,
+    LookupBatchSchema,
+    LookupResultSchema,
+    LookupResultsSchema,
+    StatementLookupSchema,
+    StatementExportResponseSchema,
+    TransactionPageSchema,
+    TransactionSummaryResponseSchema,
+    TransactionSummarySchema,
+)
+from src.domain.entity.transaction_entry import TransactionEntry
+from src.domain.services.transaction_service import StatementExport, TransactionService
+
+
+class TransactionUseCase:
+    """
+    Application Use Case layer for transaction and statement operations.
+
+    Responsibilities:
+    - Validate statement requests.
+    - Call the transaction service.
+    - Format and wrap responses.
+
+    Features:
+    - Transaction ingestion.
+    - Paginated statement of an account, filtered by time range and product.
+    - Per-day, per-product statement totals served from rollups.
+    - Running balance of an account, summed from its balance counters.
+    - Statement export of an account or tenant to a compressed columnar file.
+    - Batched balance and statement lookups for internal callers, without response envelopes.
+    """
+
+    def __init__(self, transaction_service: TransactionService) -> None:
+        """
+        Initializes the TransactionUseCase with the required service dependency.
+        """
+        self.transaction_service = transaction_service
+
+    @staticmethod
+    def _invalid_range(start: str | None, end: str | None) -> ErrorResponse | None:
+        """
+        Returns a 400 response if a statement time range is missing or inverted.
+        """
+        if start is None or end is None:
+            return ErrorResponse(
+                body=ErrorMessage(error="start and end are required"),
+                message="Bad Request",
+                status_code=400,
+            )
+        if start > end:
+            return ErrorResponse(
+                body=ErrorMessage(error="start must not be after end"),
+                message="Bad Request",
+                status_code=400,
+            )
+        return None
+
+    def record_transaction(self, transaction_schema: CreateTransactionSchema) -> SuccessResponse | ErrorResponse:
+        """
+        Ingests one transaction and updates its daily rollup.
+
+        Args:
+            transaction_schema (CreateTransactionSchema): The transaction, with the producer's ULID.
+
+        Returns:
+            SuccessResponse: The stored transaction.
+            ErrorResponse: If the account does not exist (404), is not ACTIVE (400)
+            or the transaction was already ingested (409).
+        """
+        entry = TransactionEntry(**transaction_schema.model_dump())
+        result: TransactionEntry | ErrorResponse = self.transaction_service.record_transaction(entry)
+
+        if isinstance(result, TransactionEntry):
+            return SuccessResponse(status_code=201, body=result, message="Transaction recorded successfully")
+
+        return result
+
+    def summarize(self, summary_schema: TransactionSummarySchema) -> SuccessResponse | ErrorResponse:
+        """
+        Returns the totals of an account over a time range, per day and product.
+
+        Args:
+            summary_schema (TransactionSummarySchema): Account, time range and optional product.
+
+        Returns:
+            SuccessResponse: Range totals and the per-day breakdown.
+            ErrorResponse: If the time range is missing or inverted (400).
+        """
+        invalid = self._invalid_range(summary_schema.start, summary_schema.end)
+        if invalid is not None:
+            return invalid
+
+        summary = self.transaction_service.summarize(
+            account_id=summary_schema.account_id,
+            start=summary_schema.start,
+            end=summary_schema.end,
+            product=summary_schema.product,
+        )
+        days = [
+            DailyTotalsSchema(
+                day=rollup.day,
+                product=rollup.product,
+                credits=round(rollup.credits, 2),
+                debits=round(rollup.debits, 2),
+                net=round(rollup.net, 2),
+                count=rollup.count,
+            )
+            for rollup in summary.rollups
+        ]
+        credits = sum(rollup.credits for rollup in summary.rollups)
+        debits = sum(rollup.debits for rollup in summary.rollups)
+        body = TransactionSummaryResponseSchema(
+            account_id=summary_schema.account_id,
+            start=summary_schema.start,
+            end=summary_schema.end,
+            credits=round(credits, 2),
+            debits=round(debits, 2),
+            net=round(credits - debits, 2),
+            count=sum(rollup.count for rollup in summary.rollups),
+            days=days,
+        )
+        return SuccessResponse(status_code=200, body=body, message="Transaction summary retrieved successfully")
+
+    def get_balance(self, balance_schema: GetBalanceSchema) -> SuccessResponse | ErrorResponse:
+        """
+        Returns the running balance of an account.
+
+        Args:
+            balance_schema (GetBalanceSchema): The account.
+
+        Returns:
+            SuccessResponse: The balance and the number of counters it was summed from.
+        """
+        balance = self.transaction_service.get_balance(balance_schema.account_id)
+        body = balance.model_copy(update={"balance": round(balance.balance, 2)})
+        return SuccessResponse(status_code=200, body=body, message="Account balance retrieved successfully")
+
+    def list_transactions(self, list_schema: ListTransactionsSchema) -> SuccessResponse | ErrorResponse:
+        """
+        Returns one page of the statement of an account.
+
+        Args:
+            list_schema (ListTransactionsSchema): Account, time range, optional product and cursor.
+
+        Returns:
+            SuccessResponse: The page and the cursor of the next one.
+            ErrorResponse: If the time range is missing or inverted (400).
+        """
+        invalid = self._invalid_range(list_schema.start, list_schema.end)
+        if invalid is not None:
+            return invalid
+
+        items, cursor = self.transaction_service.list_transactions(
+            account_id=list_schema.account_id,
+            start=list_schema.start,
+            end=list_schema.end,
+            product=list_schema.product,
+            cursor=list_schema.cursor,
+            limit=list_schema.limit,
+        )
+        return SuccessResponse(
+            status_code=200,
+            body=TransactionPageSchema(items=items, cursor=cursor),
+            message="Transactions retrieved successfully",
+        )
+
+    def lookup(self, batch_schema: LookupBatchSchema) -> LookupResultsSchema:
+        """
+        Answers a frame of balance and statement lookups, each as its public endpoint would.
+
+        A failing lookup (e.g. an invalid time range) does not fail the others.
+
+        Args:
+            batch_schema (LookupBatchSchema): The lookups.
+
+        Returns:
+            LookupResultsSchema: One status and body (or error) per lookup, in request order.
+        """
+        results = []
+        for lookup in batch_schema.lookups:
+            if isinstance(lookup, StatementLookupSchema):
+                response = self.list_transactions(lookup)
+            else:
+                response = self.get_balance(lookup)
+
+            if isinstance(response, SuccessResponse):
+                results.append(LookupResultSchema(status=response.status_code, body=response.body))
+            else:
+                results.append(LookupResultSchema(status=response.status_code, error=str(response.body.error)))
+        return LookupResultsSchema(results=results)
+
+    def export_statement(self, export_schema: ExportStatementSchema) -> SuccessResponse | ErrorResponse:
+        """
+        Exports the statement of an account or tenant to the object store.
+
+        Args:
+            export_schema (ExportStatementSchema): Selector, time range, optional product and format.
+
+        Returns:
+            SuccessResponse: Location, format and row count of the export.
+            ErrorResponse: If the format is not available (400).
+        """
+        export: StatementExport | ErrorResponse = self.transaction_service.export_statement(
+            start=export_schema.start,
+            end=export_schema.end,
+            account_id=export_schema.account_id,
+            tenant_id=export_schema.tenant_id,
+            product=export_schema.product,
+            export_format=export_schema.format,
+        )
+        if isinstance(export, ErrorResponse):
+            return export
+        return SuccessResponse(
+            status_code=200,
+            body=StatementExportResponseSchema(uri=export.uri, format=export.format, rows=export.rows),
+            message="Statement exported successfully",
+        )
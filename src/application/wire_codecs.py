@@ -0,0 +1,175 @@
+import logging
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_ALIASES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+logger = logging.getLogger(__name__)
+
+
+def _load_msgpack():
+    """
+    Imports msgpack (pinned in requirements.txt). Returns None, with a warning,
+    when the package was left out of the deployment.
+    """
+    try:
+        import msgpack
+    except ImportError:
+        logger.warning("msgpack is not installed: internal routes will only answer application/json")
+        return None
+    return msgpack
+
+
+class WireCodec(ABC):
+    """
+    Encoding of the request and response bodies of the internal routes.
+
+    Codecs go straight between bytes and the pydantic schemas, so no
+    intermediate envelope or dict is built when the encoding allows it.
+    Responses leave out None fields: internal callers read a missing field as None.
+    """
+
+    media_type: str
+    media_types: frozenset[str]
+    binary: bool
+
+    @abstractmethod
+    def decode(self, body: bytes, schema_cls: type[BaseModel]) -> BaseModel:
+        """
+        Decodes and validates a request body into its schema. Raises ValueError (or ValidationError) if invalid.
+        """
+
+    @abstractmethod
+    def encode(self, model: BaseModel) -> bytes:
+        """
+        Encodes a response schema.
+        """
+
+
+class JsonCodec(WireCodec):
+    """
+    JSON, validated and serialized by pydantic-core (`validate_json` / `to_json`).
+    """
+
+    media_type = JSON_MEDIA_TYPE
+    media_types = frozenset({JSON_MEDIA_TYPE})
+    binary = False
+
+    def decode(self, body: bytes, schema_cls: type[BaseModel]) -> BaseModel:
+        return schema_cls.__pydantic_validator__.validate_json(body or b"{}")
+
+    def encode(self, model: BaseModel) -> bytes:
+        return model.__pydantic_serializer__.to_json(model, exclude_none=True)
+
+
+class MessagePackCodec(WireCodec):
+    """
+    MessagePack: floats, ints and strings keep their binary form, no escaping or number formatting.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+    media_types = MSGPACK_ALIASES
+    binary = True
+
+    def __init__(self, msgpack) -> None:
+        # Enums (str subclasses) pack as strings and money as floats, like the JSON codec;
+        # other non-native values go through their JSON form.
+        self.packb = msgpack.Packer(use_bin_type=True, default=_pack_default).pack
+        self.unpackb = msgpack.unpackb
+
+    def decode(self, body: bytes, schema_cls: type[BaseModel]) -> BaseModel:
+        try:
+            data = self.unpackb(body, raw=False) if body else {}
+        except Exception as error:
+            raise ValueError(f"Invalid MessagePack body: {error}") from error
+        return schema_cls.__pydantic_validator__.validate_python(data)
+
+    def encode(self, model: BaseModel) -> bytes:
+        return self.packb(model.__pydantic_serializer__.to_python(model, exclude_none=True))
+
+
+def _pack_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return to_jsonable_python(value)
+
+
+def available_codecs() -> list[WireCodec]:
+    """
+    Returns the codecs this process can serve, in order of preference for a wildcard `Accept`.
+
+    JSON comes first so clients accepting anything keep getting JSON;
+    MessagePack is only offered when msgpack is installed.
+    """
+    codecs: list[WireCodec] = [JsonCodec()]
+    msgpack = _load_msgpack()
+    if msgpack is not None:
+        codecs.append(MessagePackCodec(msgpack))
+    return codecs
+
+
+def _media_type(value: str) -> str:
+    return value.split(";", 1)[0].strip().lower()
+
+
+def codec_for_content_type(content_type: str | None, codecs: list[WireCodec]) -> WireCodec | None:
+    """
+    Returns the codec of a request body. A missing Content-Type is read as JSON.
+
+    :param content_type: The `Content-Type` header.
+    :param codecs: The codecs served.
+    :return: The codec, or None if the encoding is not supported (415).
+    """
+    media_type = _media_type(content_type) if content_type else JSON_MEDIA_TYPE
+    return next((codec for codec in codecs if media_type in codec.media_types), None)
+
+
+def negotiate(accept: str | None, codecs: list[WireCodec]) -> WireCodec | None:
+    """
+    Picks the response codec from an `Accept` header.
+
+    The highest `q` wins; an exact media type beats `type/*`, which beats
+    `*/*`; remaining ties go to the order of `codecs`. Without `Accept` the
+    first codec is used.
+
+    Usage:
+        negotiate("application/msgpack, application/json;q=0.5", available_codecs())
+
+    :param accept: The `Accept` header.
+    :param codecs: The codecs served.
+    :return: The codec, or None if none is acceptable (406).
+    """
+    if not accept:
+        return codecs[0]
+
+    best, best_rank = None, None
+    for entry in accept.split(","):
+        media_type, *parameters = entry.split(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            continue
+
+        for order, codec in enumerate(codecs):
+            if media_type in codec.media_types:
+                specificity = 2
+            elif media_type == "*/*" or media_type == f"{codec.media_type.split('/')[0]}/*":
+                specificity = 0 if media_type == "*/*" else 1
+            else:
+                continue
+            rank = (quality, specificity, -order)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = codec, rank
+    return best
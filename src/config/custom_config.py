@@ -13,11 +13,162 @@ class CustomConfig(EnvConfig):
     Usage:
         You can define additional properties or override methods here if custom environment logic is required.
 
+    Attributes:
+        bulk_status_time_budget_seconds (float): Time a bulk status invocation may spend before checkpointing and returning.
+        bulk_status_page_size (int): Accounts processed between two bulk status checkpoints.
+        bulk_status_max_workers (int): Maximum concurrent writes of a bulk status transition.
+        change_event_sink (str): Destination of account change events: "eventbridge", "file" or "memory".
+        change_event_bus_name (str): EventBridge bus used by the "eventbridge" sink.
+        change_event_file_path (str): JSON Lines file used by the "file" sink.
+        change_event_batch_size (int): Maximum events per delivery (capped by the sink).
+        dynamodb_endpoint_url (Optional[str]): DynamoDB endpoint override (e.g. http://localhost:8000 for dynamodb-local).
+        dynamodb_region (Optional[str]): Region of the DynamoDB client. Defaults to the AWS environment.
+        dynamodb_max_pool_connections (int): Size of the HTTP connection pool shared by all repositories.
+        dynamodb_connect_timeout (float): Seconds to establish a connection.
+        dynamodb_read_timeout (float): Seconds to wait for a response.
+        dynamodb_max_attempts (int): Total attempts per call, including the first one.
+        dynamodb_retry_mode (str): botocore retry mode ("adaptive", "standard" or "legacy").
+        dynamodb_tcp_keepalive (bool): Enables TCP keep-alive on pooled connections.
+        idempotency_ttl_seconds (int): How long a stored response is replayed for a repeated Idempotency-Key.
+        idempotency_lease_seconds (int): How long an unfinished Idempotency-Key claim blocks retries
+            (at least the function timeout); after it a retry takes the key over.
+        idempotency_cache_ttl_seconds (float): Lifetime of completed idempotency records in the in-process cache.
+        idempotency_cache_max_entries (int): Maximum idempotency records kept in the in-process cache.
+        account_cache_ttl_seconds (float): Lifetime of accounts in the in-process read cache (0 disables it).
+        account_cache_max_entries (int): Maximum accounts kept in the in-process read cache.
+        account_tenant_cache_ttl_seconds (float): Lifetime of the tenant of an account in the in-process cache (used by admission control).
+        account_read_consistency (str): "eventual" (default: half-cost reads, strong only for session tokens)
+            or "strong" (every account read is strongly consistent).
+        statement_export_store (str): Destination of statement exports: "local" or "s3".
+        statement_export_path (str): Root directory ("local") or key prefix ("s3") of statement exports.
+        statement_export_bucket (Optional[str]): Bucket of the "s3" statement export store.
+        statement_export_page_size (int): Transactions read per query page while exporting.
+        transaction_archive_enabled (bool): Merges the transaction archive into statement reads.
+        transaction_archive_horizon_days (int): Age after which the archival job moves transactions to the archive.
+        transaction_archive_store (str): Where archived segments live: "local" or "s3".
+        transaction_archive_path (str): Root directory ("local") or key prefix ("s3") of the archive.
+        transaction_archive_bucket (Optional[str]): Bucket of the "s3" archive store.
+        transaction_account_index_shards (int): Write shards of the per-account transaction index
+            (`account_shard-timestamp-index`). 1 keeps the unsharded `account_id-timestamp-index`.
+        rollup_write_shards (int): Write shards of each daily rollup item, summed on read. 1 disables sharding.
+        balance_hot_shard_count (int): Balance counters of an account promoted to sharded writes.
+        balance_promote_writes_per_second (float): Per-instance write rate above which an account's balance is sharded.
+        balance_demote_writes_per_second (float): Per-instance write rate below which it is written unsharded again.
+        balance_rate_window_seconds (float): Window over which the write rate of an account is measured.
+        balance_cache_ttl_seconds (float): Lifetime of summed balances in the in-process cache.
+        balance_layout_cache_ttl_seconds (float): Lifetime of the shard layout of an account in the in-process cache.
+        group_commit_enabled (bool): Batches concurrent account creations and transaction writes
+            (`BatchWriteItem`/`TransactWriteItems`). For long-running targets (fastapi) only.
+        group_commit_max_delay_ms (float): Longest time a write waits for others before its batch is sent.
+        group_commit_max_batch_items (int): Pending operations that send a batch right away (max 100).
+        group_commit_max_in_flight (int): Batches sent concurrently.
+        tenant_rate_limit_store (str): Where the per-tenant token buckets live: "memory" (per process) or "redis" (shared).
+        tenant_rate_limit_redis_url (Optional[str]): Redis URL of the "redis" store.
+        tenant_rate_limit_per_second (float): Sustained requests per second of a tenant (0 disables admission control).
+        tenant_rate_limit_burst (float): Requests a tenant can send at once after an idle period.
+        tenant_rate_limit_overrides (str): Per-tenant quotas, "tenant_a=200:400,tenant_b=5:10" (rate:burst).
+        tenant_authorizer_claim (str): Authorizer context key (Lambda authorizer) or JWT claim carrying the caller's tenant.
+        internal_rate_limit_per_second (float): Sustained lookups per second of each IAM principal calling the
+            internal routes (0 disables their admission control).
+        internal_rate_limit_burst (float): Lookups an IAM principal can send at once after an idle period.
+        internal_rate_limit_overrides (str): Per-principal quotas, "arn:aws:iam::123456789012:role/statement=2000:4000" (rate:burst).
+        request_deadline_reserve_seconds (float): Part of the Lambda remaining time kept for returning the response.
+        request_deadline_short_seconds (float): Remaining time below which optional work (cache fills, log flushes) is skipped.
+        flush_logs_on_return (bool): Flushes the log handlers after every invocation, time permitting.
+        account_repository_backend (str): Storage of Account entities: "dynamodb", "mongodb", "firestore" or "memory".
+        mongodb_uri (Optional[str]): Connection string of the "mongodb" account backend.
+        mongodb_database (str): Database of the "mongodb" account backend.
+        firestore_project (Optional[str]): GCP project of the "firestore" account backend. Defaults to the environment.
+        firestore_database (Optional[str]): Firestore database of the "firestore" account backend. Defaults to "(default)".
+        compiled_request_parsing (bool): On Lambda, parses events with the per-route validators compiled at import
+            instead of deployable's generic parsing.
+        server_host (str): Bind address of the FastAPI target.
+        server_port (int): Port of the FastAPI target.
+        server_workers (int): Server processes of the FastAPI target (0: one per usable core).
+        server_loop (str): uvicorn event loop ("auto" uses uvloop when installed).
+        server_http (str): uvicorn HTTP parser ("auto" uses httptools when installed).
+        server_backlog (int): Pending connections queued by the listening socket.
+        server_keep_alive_seconds (int): Idle keep-alive timeout. Keep it above the load balancer idle timeout.
+        server_graceful_shutdown_seconds (int): Time in-flight requests get to finish on SIGTERM.
+        server_limit_concurrency (int): Concurrent connections per worker before answering 503 (0: unlimited).
+        server_access_log (bool): Writes one access log line per request.
+
     Example:
         config = CustomConfig()
         print(config.ENVIRONMENT)
     """
-    ...
+    bulk_status_time_budget_seconds: float = 20.0
+    bulk_status_page_size: int = 100
+    bulk_status_max_workers: int = 8
+    change_event_sink: str = "eventbridge"
+    change_event_bus_name: str = "default"
+    change_event_file_path: str = "account_change_events.jsonl"
+    change_event_batch_size: int = 10
+    dynamodb_endpoint_url: str | None = None
+    dynamodb_region: str | None = None
+    dynamodb_max_pool_connections: int = 50
+    dynamodb_connect_timeout: float = 1.0
+    dynamodb_read_timeout: float = 2.0
+    dynamodb_max_attempts: int = 3
+    dynamodb_retry_mode: str = "adaptive"
+    dynamodb_tcp_keepalive: bool = True
+    idempotency_ttl_seconds: int = 86_400
+    idempotency_lease_seconds: int = 30
+    idempotency_cache_ttl_seconds: float = 60.0
+    idempotency_cache_max_entries: int = 10_000
+    account_cache_ttl_seconds: float = 2.0
+    account_cache_max_entries: int = 10_000
+    account_tenant_cache_ttl_seconds: float = 300.0
+    account_read_consistency: str = "eventual"
+    statement_export_store: str = "local"
+    statement_export_path: str = "statement_exports"
+    statement_export_bucket: str | None = None
+    statement_export_page_size: int = 1000
+    transaction_archive_enabled: bool = False
+    transaction_archive_horizon_days: int = 180
+    transaction_archive_store: str = "local"
+    transaction_archive_path: str = "transaction_archive"
+    transaction_archive_bucket: str | None = None
+    transaction_account_index_shards: int = 1
+    rollup_write_shards: int = 8
+    balance_hot_shard_count: int = 10
+    balance_promote_writes_per_second: float = 100.0
+    balance_demote_writes_per_second: float = 20.0
+    balance_rate_window_seconds: float = 10.0
+    balance_cache_ttl_seconds: float = 1.0
+    balance_layout_cache_ttl_seconds: float = 5.0
+    group_commit_enabled: bool = False
+    group_commit_max_delay_ms: float = 5.0
+    group_commit_max_batch_items: int = 100
+    group_commit_max_in_flight: int = 8
+    tenant_rate_limit_store: str = "memory"
+    tenant_rate_limit_redis_url: str | None = None
+    tenant_rate_limit_per_second: float = 50.0
+    tenant_rate_limit_burst: float = 100.0
+    tenant_rate_limit_overrides: str = ""
+    tenant_authorizer_claim: str = "tenant_id"
+    internal_rate_limit_per_second: float = 500.0
+    internal_rate_limit_burst: float = 1000.0
+    internal_rate_limit_overrides: str = ""
+    request_deadline_reserve_seconds: float = 0.25
+    request_deadline_short_seconds: float = 0.5
+    flush_logs_on_return: bool = True
+    account_repository_backend: str = "dynamodb"
+    mongodb_uri: str | None = None
+    mongodb_database: str = "account"
+    firestore_project: str | None = None
+    firestore_database: str | None = None
+    compiled_request_parsing: bool = True
+    server_host: str = "0.0.0.0"
+    server_port: int = 8080
+    server_workers: int = 1
+    server_loop: str = "auto"
+    server_http: str = "auto"
+    server_backlog: int = 2048
+    server_keep_alive_seconds: int = 75
+    server_graceful_shutdown_seconds: int = 25
+    server_limit_concurrency: int = 0
+    server_access_log: bool = False
 
 
 # Global singleton instance for accessing environment configurations throughout the application.
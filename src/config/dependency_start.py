@@ -1,10 +1,21 @@
+import atexit
+
 from utilities.depency_injections.injection_manager import InjectionManager
 from utilities.depency_injections.utilities_injections import UtilitiesInjections
 
 from src.application.use_cases.account_use_case import AccountUseCase
 
+from src.config.custom_config import ENVIRONMENT
 from src.domain.services.account_service import AccountService
 from src.infra.repositories.account_repository import AccountRepository
+from src.infra.repositories.account_repository_factory import build_account_repository
+from src.infra.repositories.balance_counter_repository import BalanceCounterRepository
+from src.infra.repositories.base_account_repository import BaseAccountRepository
+from src.infra.repositories.bulk_status_job_repository import BulkStatusJobRepository
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository
+from src.infra.repositories.group_commit import GroupCommitWriter
+from src.infra.repositories.idempotency_repository import IdempotencyRepository
+from src.infra.repositories.transaction_repository import TransactionRepository
 
 def start_account_dependencies():
     """
@@ -17,7 +28,16 @@ def start_account_dependencies():
     - Register repository, service, and use case dependencies for the Account domain.
 
     Registered Dependencies:
-        - AccountRepository: Provides access to Firestore for Account entities.
+        - BaseAccountRepository: The Account storage selected by `account_repository_backend`
+          (DynamoDB, MongoDB, Firestore or in-memory).
+        - AccountRepository (DynamoDB backend only): The same instance as BaseAccountRepository.
+        - BulkStatusJobRepository: Persists checkpoints of bulk status transitions.
+        - IdempotencyRepository: Stores responses of requests sent with an Idempotency-Key.
+        - TransactionRepository: Provides time-range statement queries over TransactionEntry items.
+        - DailyRollupRepository: Stores the daily per-product transaction totals.
+        - BalanceCounterRepository: Stores the (write-sharded) running balance counters.
+        - GroupCommitWriter (when `group_commit_enabled`): batches the account creations and
+          transaction writes of concurrent requests; closed (flushed) at process exit.
         - AccountService: Contains business logic for account management.
         - AccountUseCase: Coordinates application-level logic for account operations.
 
@@ -30,4 +50,31 @@ def start_account_dependencies():
     UtilitiesInjections.configure()
 
     # Account-related dependencies
-    InjectionManager.add_dependency(AccountRepository, AccountRepository())
\ No newline at end of file
+    account_repository = build_account_repository(
+        ENVIRONMENT.account_repository_backend,
+        mongodb_uri=ENVIRONMENT.mongodb_uri,
+        mongodb_database=ENVIRONMENT.mongodb_database,
+        firestore_project=ENVIRONMENT.firestore_project,
+        firestore_database=ENVIRONMENT.firestore_database,
+    )
+    transaction_repository = TransactionRepository(index_shards=ENVIRONMENT.transaction_account_index_shards)
+    if ENVIRONMENT.group_commit_enabled:
+        writer = GroupCommitWriter(
+            max_delay_ms=ENVIRONMENT.group_commit_max_delay_ms,
+            max_batch_items=ENVIRONMENT.group_commit_max_batch_items,
+            max_in_flight=ENVIRONMENT.group_commit_max_in_flight,
+        )
+        # Only the DynamoDB backend batches account creations; the others write directly.
+        if isinstance(account_repository, AccountRepository):
+            account_repository.use_group_commit(writer)
+        transaction_repository.use_group_commit(writer)
+        atexit.register(writer.close)
+
+    InjectionManager.add_dependency(BaseAccountRepository, account_repository)
+    if isinstance(account_repository, AccountRepository):
+        InjectionManager.add_dependency(AccountRepository, account_repository)
+    InjectionManager.add_dependency(BulkStatusJobRepository, BulkStatusJobRepository())
+    InjectionManager.add_dependency(IdempotencyRepository, IdempotencyRepository())
+    InjectionManager.add_dependency(TransactionRepository, transaction_repository)
+    InjectionManager.add_dependency(DailyRollupRepository, DailyRollupRepository(shard_count=ENVIRONMENT.rollup_write_shards))
+    InjectionManager.add_dependency(BalanceCounterRepository, BalanceCounterRepository())
@@ -0,0 +1,103 @@
+import math
+import time
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when an operation cannot complete within the request deadline.
+
+    Routers answer it with 503: the caller can retry, whereas letting the
+    operation run on would end in a hard function timeout.
+    """
+
+    def __init__(self, operation: str, remaining_seconds: float):
+        self.operation = operation
+        self.remaining_seconds = remaining_seconds
+        super().__init__(f"Deadline exceeded before {operation} ({remaining_seconds * 1000:.0f} ms left)")
+
+
+class Deadline:
+    """
+    Point in time by which a request must have produced its response.
+
+    Built from the Lambda remaining-time budget minus a reserve kept for
+    serializing and returning the response. Passed explicitly from the router
+    down to the repositories, which cap their DynamoDB timeouts and retries to
+    `remaining()`. Below `short_seconds` the deadline is "short": optional work
+    (cache fills, log flushes) is skipped.
+
+    A deadline without `expires_at` never expires (FastAPI, Cloud Functions, scripts).
+
+    Usage:
+        deadline = Deadline.from_lambda_context(context, reserve_seconds=0.25)
+        deadline.check("get account")
+        timeout = deadline.cap(2.0)
+    """
+
+    def __init__(self, expires_at: float | None = None, short_seconds: float = 0.5, clock=time.monotonic) -> None:
+        """
+        :param expires_at: Expiry on `clock`, or None for an unbounded deadline.
+        :param short_seconds: Remaining time below which the deadline is short.
+        :param clock: Monotonic clock in seconds. Injectable for tests.
+        """
+        self.expires_at = expires_at
+        self.short_seconds = short_seconds
+        self._clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, short_seconds: float = 0.5, clock=time.monotonic) -> "Deadline":
+        """
+        Deadline `seconds` from now.
+        """
+        return cls(clock() + seconds, short_seconds=short_seconds, clock=clock)
+
+    @classmethod
+    def from_lambda_context(cls, context, reserve_seconds: float = 0.25, short_seconds: float = 0.5) -> "Deadline":
+        """
+        Deadline of a Lambda invocation, or an unbounded one without a Lambda context.
+
+        :param context: The Lambda context (anything with `get_remaining_time_in_millis`).
+        :param reserve_seconds: Time kept for returning the response.
+        :param short_seconds: Remaining time below which the deadline is short.
+        """
+        remaining_millis = getattr(context, "get_remaining_time_in_millis", None)
+        if remaining_millis is None:
+            return cls(short_seconds=short_seconds)
+        return cls.after(remaining_millis() / 1000 - reserve_seconds, short_seconds=short_seconds)
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> float:
+        """
+        Seconds left, never negative (`math.inf` when unbounded).
+        """
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def is_short(self) -> bool:
+        return self.remaining() < self.short_seconds
+
+    def cap(self, seconds: float) -> float:
+        """
+        Caps a duration (timeout, time budget) to the remaining time.
+        """
+        return min(seconds, self.remaining())
+
+    def check(self, operation: str) -> None:
+        """
+        Raises DeadlineExceeded if no time is left to start `operation`.
+        """
+        if self.expired:
+            raise DeadlineExceeded(operation, 0.0)
+
+
+# Default of every `deadline` parameter: callers without a budget are never cut short.
+NO_DEADLINE = Deadline()
@@ -1,6 +1,9 @@
 from enum import Enum
+from pydantic import field_validator
 from utilities.cross_cutting.domain.entities.base_entity import BaseEntity
 
+from src.domain.entity.timestamps import normalize_timestamp
+
 class AccountStatus(str, Enum):
     """
     Enumeration for possible account statuses.
@@ -27,6 +30,7 @@ class Account(BaseEntity):
         owner_id (str): The ID of the user who owns this account.
         status (AccountStatus): The current status of the account.
         suspension_reason (Optional[str]): Reason for suspension or closure, if applicable.
+        version (int): Incremented on every status change. Used to order change events.
 
     Inherits:
         BaseEntity: Provides base fields like 'id', 'created_at', and 'updated_at'.
@@ -34,6 +38,8 @@ class Account(BaseEntity):
     Business Notes:
         - Accounts can only transition between statuses according to the defined business rules.
         - The 'suspension_reason' field is typically used when the account is suspended or closed.
+        - 'created_at' and 'updated_at' are normalized to ISO-8601 UTC with milliseconds,
+          so items written in the legacy "%d-%m-%Y %H:%M:%S" format are still readable.
 
     Example:
         account = Account(
@@ -46,6 +52,9 @@ class Account(BaseEntity):
     owner_id: str
     status: AccountStatus
     suspension_reason: str | None = None
+    version: int = 0
+
+    _normalize_timestamps = field_validator("created_at", "updated_at", mode="before")(normalize_timestamp)
 
     def __init__(self, **data):
         """
@@ -55,3 +64,37 @@ class Account(BaseEntity):
             **data: Arbitrary keyword arguments matching the Account fields.
         """
         super().__init__(**data)
+
+
+ACCOUNT_FIELDS: frozenset[str] = frozenset({
+    "id", "tenant_id", "owner_id", "status", "suspension_reason", "version", "created_at", "updated_at",
+})
+"""
+Account attributes that may be requested through a field projection.
+"""
+
+
+ALLOWED_STATUS_TRANSITIONS: dict[AccountStatus, frozenset[AccountStatus]] = {
+    AccountStatus.ACTIVE: frozenset({AccountStatus.SUSPENDED, AccountStatus.CLOSED}),
+    AccountStatus.SUSPENDED: frozenset({AccountStatus.ACTIVE, AccountStatus.CLOSED}),
+    AccountStatus.CLOSED: frozenset(),
+}
+"""
+Status transition table used by conditional (single-write) status updates.
+
+Maps each current status to the set of statuses it may move to. It mirrors the
+rules enforced by `AccountService.update_status`.
+"""
+
+
+def allowed_source_statuses(target: AccountStatus) -> list[AccountStatus]:
+    """
+    Returns every status from which `target` can be reached.
+
+    Args:
+        target (AccountStatus): The desired status.
+
+    Returns:
+        list[AccountStatus]: Statuses that may transition to `target`.
+    """
+    return [source for source, targets in ALLOWED_STATUS_TRANSITIONS.items() if target in targets]
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from src.domain.entity.money import Money
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceLayout:
+    """
+    How the balance counter of one account is split across shards.
+
+    A hot account gets `write_shards` counters; each write adds to one of
+    them. `read_shards` is the highest count the account ever had: shards
+    are never dropped on demotion, since they still hold part of the balance,
+    so reads always sum `read_shards` counters.
+
+    Attributes:
+        write_shards (int): Counters a new write may land on. 1 means unsharded.
+        read_shards (int): Counters summed by reads (>= write_shards).
+    """
+    write_shards: int = 1
+    read_shards: int = 1
+
+    @property
+    def sharded(self) -> bool:
+        return self.read_shards > 1
+
+
+UNSHARDED = BalanceLayout()
+
+
+class AccountBalance(BaseModel):
+    """
+    Running balance of an account: credits minus debits of every ingested transaction.
+
+    Attributes:
+        account_id (str): The account.
+        balance (Decimal): Sum of the balance counters of the account.
+        shards (int): Number of counters summed.
+    """
+    account_id: str
+    balance: Money = Decimal(0)
+    shards: int = 1
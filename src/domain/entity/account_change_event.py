@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+from src.domain.entity.account import AccountStatus
+
+
+class AccountChangeEvent(BaseModel):
+    """
+    Compact event describing a change of an Account status.
+
+    Emitted for every account creation (`old_status` is None) and every status
+    update, so downstream services can react to suspensions and closures
+    instead of polling `GET /accounts/{accountId}`.
+
+    Attributes:
+        account_id (str): The account that changed.
+        tenant_id (str): The tenant the account belongs to.
+        old_status (Optional[AccountStatus]): Status before the change, None on creation.
+        new_status (AccountStatus): Status after the change.
+        version (int): Account version after the change. Consumers should ignore
+            events whose version is not greater than the last one they applied.
+        timestamp (str): When the change was committed, in the canonical encoding (`format_timestamp`).
+
+    Example:
+        event = AccountChangeEvent(
+            account_id="01HYXY...",
+            tenant_id="tenant_123",
+            old_status=AccountStatus.ACTIVE,
+            new_status=AccountStatus.SUSPENDED,
+            version=1,
+            timestamp="2025-06-11T14:30:00.000Z",
+        )
+    """
+    account_id: str
+    tenant_id: str
+    old_status: AccountStatus | None = None
+    new_status: AccountStatus
+    version: int
+    timestamp: str
@@ -0,0 +1,71 @@
+from enum import Enum
+from pydantic import field_validator
+from utilities.cross_cutting.domain.entities.base_entity import BaseEntity
+
+from src.domain.entity.account import AccountStatus
+from src.domain.entity.timestamps import normalize_timestamp
+
+
+class BulkStatusJobState(str, Enum):
+    """
+    Enumeration for the lifecycle of a bulk status transition job.
+
+    Status Values:
+        - RUNNING: The job still has accounts left to process.
+        - COMPLETED: Every selected account was processed.
+    """
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+
+class BulkStatusJob(BaseEntity):
+    """
+    Domain entity representing the checkpoint of a bulk status transition.
+
+    A job is persisted after every processed page, so an invocation that runs out
+    of time (or is killed by the Lambda timeout) can be resumed by sending the
+    job `id` back.
+
+    Attributes:
+        tenant_id (Optional[str]): Tenant selector. Every account of the tenant is transitioned.
+        account_ids (Optional[list[str]]): Explicit selector. Only these accounts are transitioned.
+        target_status (AccountStatus): Status every selected account should move to.
+        reason (Optional[str]): Reason stored on each transitioned account.
+        state (BulkStatusJobState): Whether the job is still running.
+        offset (int): Next position in `account_ids` (explicit selector only).
+        cursor (Optional[str]): Serialized `LastEvaluatedKey` of the tenant query (tenant selector only).
+        page_in_progress (bool): The page at `offset`/`cursor` was started but not checkpointed.
+        processed (int): Accounts processed so far.
+        updated (int): Accounts successfully transitioned.
+        skipped (int): Accounts already in the target status or not allowed to transition.
+        replayed (int): Accounts of a replayed page found already in the target status
+            (usually moved by the invocation that died before the checkpoint).
+        failed (int): Accounts that failed with an unexpected error.
+
+    Inherits:
+        BaseEntity: Provides base fields like 'id', 'created_at', and 'updated_at'.
+    """
+    tenant_id: str | None = None
+    account_ids: list[str] | None = None
+    target_status: AccountStatus
+    reason: str | None = None
+    state: BulkStatusJobState = BulkStatusJobState.RUNNING
+    offset: int = 0
+    cursor: str | None = None
+    page_in_progress: bool = False
+    processed: int = 0
+    updated: int = 0
+    skipped: int = 0
+    replayed: int = 0
+    failed: int = 0
+
+    _normalize_timestamps = field_validator("created_at", "updated_at", mode="before")(normalize_timestamp)
+
+    def __init__(self, **data):
+        """
+        Initializes a BulkStatusJob entity.
+
+        Args:
+            **data: Arbitrary keyword arguments matching the BulkStatusJob fields.
+        """
+        super().__init__(**data)
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from src.domain.entity.money import Money, to_money
+from src.domain.entity.transaction_entry import TransactionType
+
+
+class DailyRollup(BaseModel):
+    """
+    Totals of the transactions of one account, for one UTC day and one product.
+
+    Rollups are maintained incrementally with atomic `ADD` expressions written
+    in the same DynamoDB transaction as the TransactionEntry, so they never
+    diverge from the raw transactions of a day. A busy day may be stored as
+    several write shards, summed back into one rollup when read.
+
+    Attributes:
+        account_id (str): The account.
+        tenant_id (str): The tenant the account belongs to.
+        day (str): UTC day, "YYYY-MM-DD" (the first 10 characters of a canonical timestamp).
+        product (str): The product.
+        credits (Decimal): Sum of the CREDIT amounts.
+        debits (Decimal): Sum of the DEBIT amounts.
+        credit_count (int): Number of CREDIT transactions.
+        debit_count (int): Number of DEBIT transactions.
+
+    Example:
+        rollup = DailyRollup(account_id="01HYXY...", tenant_id="tenant_123", day="2025-06-11", product="VOUCHER")
+        rollup.add(TransactionType.CREDIT, Decimal("100.00"))
+    """
+    account_id: str
+    tenant_id: str
+    day: str
+    product: str
+    credits: Money = Decimal(0)
+    debits: Money = Decimal(0)
+    credit_count: int = 0
+    debit_count: int = 0
+
+    @property
+    def rollup_key(self) -> str:
+        """
+        Sort key of the rollup item: "YYYY-MM-DD#PRODUCT".
+        """
+        return rollup_key(self.day, self.product)
+
+    @property
+    def count(self) -> int:
+        return self.credit_count + self.debit_count
+
+    @property
+    def net(self) -> Decimal:
+        return self.credits - self.debits
+
+    def add(self, transaction_type: TransactionType | str, amount: Decimal) -> None:
+        """
+        Accumulates one transaction.
+        """
+        amount = to_money(amount)
+        if TransactionType(transaction_type) == TransactionType.CREDIT:
+            self.credits += amount
+            self.credit_count += 1
+        else:
+            self.debits += amount
+            self.debit_count += 1
+
+    def merge(self, other: "DailyRollup") -> None:
+        """
+        Accumulates the totals of another rollup of the same day and product (e.g. a write shard).
+        """
+        self.credits += other.credits
+        self.debits += other.debits
+        self.credit_count += other.credit_count
+        self.debit_count += other.debit_count
+
+    def matches(self, other: "DailyRollup") -> bool:
+        """
+        Whether two rollups hold the same counts and totals.
+        """
+        return (
+            self.credit_count == other.credit_count
+            and self.debit_count == other.debit_count
+            and self.credits == other.credits
+            and self.debits == other.debits
+        )
+
+
+def rollup_key(day: str, product: str) -> str:
+    """
+    Builds the sort key of a rollup item.
+    """
+    return f"{day}#{product}"
+
+
+def day_of(timestamp: str) -> str:
+    """
+    Returns the UTC day of a canonical timestamp.
+    """
+    return timestamp[:10]
+
+
+def shift_day(day: str, days: int) -> str:
+    """
+    Returns the day `days` after (or before, if negative) `day`.
+    """
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
+
+
+def day_start(day: str) -> str:
+    """
+    First canonical timestamp of a day.
+    """
+    return f"{day}T00:00:00.000Z"
+
+
+def day_end(day: str) -> str:
+    """
+    Last canonical timestamp of a day.
+    """
+    return f"{day}T23:59:59.999Z"
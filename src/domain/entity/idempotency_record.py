@@ -0,0 +1,42 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class IdempotencyState(str, Enum):
+    """
+    Enumeration for the lifecycle of an idempotency key.
+
+    Status Values:
+        - IN_PROGRESS: The first request holding the key is still running.
+        - COMPLETED: The response of the first request is stored and replayed.
+    """
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+
+
+class IdempotencyRecord(BaseModel):
+    """
+    Stored outcome of a request sent with an `Idempotency-Key` header.
+
+    Attributes:
+        idempotency_key (str): Scoped key (operation, tenant and client key).
+        request_hash (str): Hash of the request payload. A key reused with a
+            different payload is rejected instead of replayed.
+        state (IdempotencyState): Whether the response is available yet.
+        status_code (Optional[int]): Status code of the stored response.
+        message (Optional[str]): Message of the stored response.
+        body (Optional[str]): JSON body of the stored response.
+        expires_at (int): Epoch seconds after which DynamoDB TTL deletes the record.
+        lease_expires_at (Optional[int]): Epoch seconds after which an IN_PROGRESS claim
+            is considered abandoned (its invocation crashed or timed out) and a retry
+            with the same payload can take it over.
+    """
+    idempotency_key: str
+    request_hash: str
+    state: IdempotencyState = IdempotencyState.IN_PROGRESS
+    status_code: int | None = None
+    message: str | None = None
+    body: str | None = None
+    expires_at: int
+    lease_expires_at: int | None = None
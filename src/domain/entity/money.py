@@ -0,0 +1,33 @@
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import PlainSerializer
+
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+"""
+An amount of money. Kept as Decimal in the domain and in DynamoDB (whose
+numbers are decimal), so sums are exact; JSON responses still carry numbers.
+"""
+
+MONEY_FIELDS = frozenset({"amount", "balance_snapshot", "credits", "debits", "balance"})
+"""
+Attributes holding money in the transaction, rollup and balance items.
+"""
+
+
+def to_money(value) -> Decimal:
+    """
+    Converts an amount to Decimal.
+
+    Floats go through their shortest representation, so 10.1 becomes
+    Decimal("10.1") and not the binary approximation.
+
+    Args:
+        value (Decimal | int | float | str): The amount.
+
+    Returns:
+        Decimal: The amount.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
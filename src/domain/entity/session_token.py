@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from src.domain.entity.account import Account
+
+SESSION_TOKEN_HEADER = "X-Session-Token"
+"""
+Header carrying the session token: set on create/update responses, sent back on reads.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionToken:
+    """
+    Read-your-writes token: the version of an account a caller has written.
+
+    Reads are eventually consistent by default. A read presenting a token is
+    only answered with that `version` or a newer one: from the write-through
+    account cache when it holds it, otherwise with a strongly consistent read.
+
+    Encoded as "<account_id>.<version>".
+
+    Attributes:
+        account_id (str): The written account.
+        version (int): The account `version` after the write.
+
+    Example:
+        token = SessionToken.of(account).encode()   # "01HYXY....3"
+        SessionToken.parse(token)                   # SessionToken(account_id="01HYXY...", version=3)
+    """
+    account_id: str
+    version: int
+
+    @classmethod
+    def of(cls, account: Account) -> "SessionToken":
+        return cls(account_id=account.id, version=account.version)
+
+    @classmethod
+    def parse(cls, value: str | None) -> "SessionToken | None":
+        """
+        Decodes a token, or returns None when it is missing or malformed.
+        """
+        if not value:
+            return None
+        account_id, _, version = value.strip().rpartition(".")
+        if not account_id or not version.isdigit():
+            return None
+        return cls(account_id=account_id, version=int(version))
+
+    def encode(self) -> str:
+        return f"{self.account_id}.{self.version}"
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+LEGACY_TIMESTAMP_FORMAT = "%d-%m-%Y %H:%M:%S"
+"""
+Format previously written to `updated_at` (`datetime.now().strftime(...)`). No
+timezone; the Lambda runtime clock is UTC, so legacy values are read as UTC.
+"""
+
+_EPOCH_MILLIS_THRESHOLD = 100_000_000_000
+
+
+def utc_now() -> str:
+    """
+    Returns the current time in the canonical encoding.
+
+    Returns:
+        str: ISO-8601 UTC with milliseconds, e.g. "2025-06-11T14:30:00.000Z".
+    """
+    return format_timestamp(datetime.now(timezone.utc))
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Encodes a datetime in the canonical encoding.
+
+    The encoding is fixed-width and always UTC, so string order equals
+    chronological order and values can back DynamoDB range conditions.
+
+    Args:
+        value (datetime): The instant to encode. Naive values are taken as UTC.
+
+    Returns:
+        str: ISO-8601 UTC with milliseconds, e.g. "2025-06-11T14:30:00.000Z".
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def parse_timestamp(value) -> datetime:
+    """
+    Decodes any timestamp encoding found in stored items.
+
+    Accepted encodings:
+    - datetime objects (naive values are taken as UTC),
+    - epoch seconds or epoch milliseconds (int, float, Decimal or numeric string),
+    - ISO-8601 strings, with or without offset or "Z",
+    - the legacy "%d-%m-%Y %H:%M:%S" format.
+
+    Args:
+        value: The stored value.
+
+    Returns:
+        datetime: A timezone-aware UTC datetime.
+
+    Raises:
+        ValueError: If the value matches none of the encodings.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, (int, float, Decimal)) or (isinstance(value, str) and value.strip().isdigit()):
+        number = float(value)
+        seconds = number / 1000 if number >= _EPOCH_MILLIS_THRESHOLD else number
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    elif isinstance(value, str):
+        text = value.strip()
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            parsed = datetime.strptime(text, LEGACY_TIMESTAMP_FORMAT)
+    else:
+        raise ValueError(f"Unsupported timestamp value: {value!r}")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def normalize_timestamp(value) -> str | None:
+    """
+    Re-encodes any supported timestamp in the canonical encoding. None stays None.
+    """
+    if value is None or value == "":
+        return None
+    return format_timestamp(parse_timestamp(value))
+
+
+def to_epoch_millis(value) -> int:
+    """
+    Returns any supported timestamp as epoch milliseconds.
+    """
+    parsed = parse_timestamp(value)
+    return int(parsed.timestamp() * 1000)
+
+
+def is_canonical(value) -> bool:
+    """
+    Whether a stored value already uses the canonical encoding.
+    """
+    return isinstance(value, str) and len(value) == 24 and value.endswith("Z") and value[10] == "T"
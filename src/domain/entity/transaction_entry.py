@@ -0,0 +1,67 @@
+from enum import Enum
+from typing import Any
+
+from pydantic import field_validator
+from utilities.cross_cutting.domain.entities.base_entity import BaseEntity
+
+from src.domain.entity.money import Money
+from src.domain.entity.timestamps import normalize_timestamp
+
+
+class TransactionType(str, Enum):
+    """
+    Enumeration for the direction of a transaction.
+
+    Type Values:
+        - DEBIT: Money leaving the account.
+        - CREDIT: Money entering the account.
+    """
+    DEBIT = "DEBIT"
+    CREDIT = "CREDIT"
+
+
+class TransactionEntry(BaseEntity):
+    """
+    Domain entity representing one transaction of an account statement.
+
+    Attributes:
+        tenant_id (Optional[str]): The tenant to which the account belongs. Filled from the account on ingest.
+        account_id (str): Account the transaction is booked on.
+        timestamp (str): Moment of the transaction, ISO-8601 UTC with milliseconds.
+        amount (Decimal): Absolute value of the transaction.
+        type (TransactionType): Direction of the transaction.
+        currency (str): Currency of the transaction (e.g. "BRL").
+        product (str): Product or service that generated the transaction.
+        reference (str): Human-readable identifier of the transaction.
+        metadata (Optional[dict]): Free-form contextual information.
+        balance_snapshot (Optional[Decimal]): Balance of the account right after this transaction.
+
+    Inherits:
+        BaseEntity: Provides base fields like 'id', 'created_at', and 'updated_at'.
+
+    Business Notes:
+        - `timestamp` uses the canonical encoding, so it is the sort key of the
+          statement indexes and time ranges are plain string comparisons.
+    """
+    tenant_id: str | None = None
+    account_id: str
+    timestamp: str
+    amount: Money
+    type: TransactionType
+    currency: str = "BRL"
+    product: str
+    reference: str
+    metadata: dict[str, Any] | None = None
+    balance_snapshot: Money | None = None
+
+    _normalize_timestamps = field_validator("timestamp", "created_at", "updated_at", mode="before")(normalize_timestamp)
+
+    def __init__(self, **data):
+        """
+        Initializes a TransactionEntry entity.
+
+        Args:
+            **data: Arbitrary keyword arguments matching the TransactionEntry fields.
+        """
+        super().__init__(**data)
+
@@ -0,0 +1,152 @@
+import base64
+import os
+import threading
+import time
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_RFC4648_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_TO_CROCKFORD = bytes.maketrans(_RFC4648_ALPHABET, CROCKFORD_ALPHABET.encode())
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+# The last 4 characters (20 bits) are rendered from two 10-bit lookups, so
+# consecutive IDs only re-encode their shared 22-character prefix once.
+_SUFFIX_BITS = 20
+_SUFFIX_MASK = (1 << _SUFFIX_BITS) - 1
+_CHAR_PAIRS = [CROCKFORD_ALPHABET[index >> 5] + CROCKFORD_ALPHABET[index & 31] for index in range(1024)]
+
+
+def encode_ulid(value: int) -> str:
+    """
+    Encodes a 128-bit integer as a 26-character Crockford base32 ULID.
+
+    The value is shifted so its 130-bit base32 representation (two leading zero
+    bits) lines up with byte boundaries, then encoded with the C implementation
+    of `base64.b32encode` and translated to the Crockford alphabet.
+
+    Args:
+        value (int): The 128-bit ULID value.
+
+    Returns:
+        str: The ULID string.
+    """
+    return base64.b32encode((value << 6).to_bytes(17, "big"))[:26].translate(_TO_CROCKFORD).decode()
+
+
+def decode_ulid_timestamp(ulid: str) -> int:
+    """
+    Returns the timestamp (epoch milliseconds) embedded in a ULID.
+
+    Args:
+        ulid (str): A 26-character ULID.
+
+    Returns:
+        int: Milliseconds since the Unix epoch.
+    """
+    value = 0
+    for char in ulid[:10].upper():
+        value = (value << 5) | CROCKFORD_ALPHABET.index(char)
+    return value
+
+
+class MonotonicUlidGenerator:
+    """
+    Thread-safe, monotonic ULID generator with batch allocation.
+
+    Within the same millisecond the random component is incremented instead of
+    redrawn, so IDs produced by one generator are strictly increasing (the
+    monotonic variant of the ULID spec). `allocate(n)` reserves `n` consecutive
+    IDs under a single lock acquisition, which is the fast path for bulk
+    onboarding.
+
+    Additional Notes:
+    - If the random component would overflow within a millisecond, the
+      generator moves on to the next millisecond instead of blocking.
+    - IDs are globally unique across processes thanks to the 80 random bits
+      drawn at every new millisecond.
+
+    Usage:
+        generator = MonotonicUlidGenerator()
+        account_id = generator.new()
+        ids = generator.allocate(1000)
+    """
+
+    def __init__(self, clock=time.time_ns, entropy=os.urandom) -> None:
+        """
+        Initializes the generator.
+
+        :param clock: Returns the current time in nanoseconds. Injectable for tests.
+        :param entropy: Returns `n` random bytes. Injectable for tests.
+        """
+        self._clock = clock
+        self._entropy = entropy
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+        self._prefix_block = -1
+        self._prefix = ""
+
+    def new(self) -> str:
+        """
+        Returns a new ULID, greater than every ULID previously returned by this generator.
+        """
+        return self.allocate(1)[0]
+
+    def allocate(self, count: int) -> list[str]:
+        """
+        Reserves `count` consecutive ULIDs.
+
+        :param count: Number of IDs to allocate.
+        :return: Strictly increasing ULIDs.
+        """
+        if count <= 0:
+            return []
+
+        with self._lock:
+            now_ms = self._clock() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Leave room for the batch so it never overflows the random component.
+                self._last_random = int.from_bytes(self._entropy(10), "big") & (_RANDOM_MAX >> 1)
+                first_random = self._last_random
+            else:
+                first_random = self._last_random + 1
+
+            if first_random + count - 1 > _RANDOM_MAX:
+                self._last_ms += 1
+                first_random = int.from_bytes(self._entropy(10), "big") & (_RANDOM_MAX >> 1)
+
+            self._last_random = first_random + count - 1
+            return self._encode_range((self._last_ms << _RANDOM_BITS) | first_random, count)
+
+    def _encode_range(self, start: int, count: int) -> list[str]:
+        """
+        Encodes `count` consecutive ULID values starting at `start`.
+
+        Values sharing the same upper 108 bits share their 22-character prefix,
+        which is encoded once and cached across calls.
+        """
+        ids: list[str] = []
+        while count:
+            low = start & _SUFFIX_MASK
+            run = min(count, _SUFFIX_MASK + 1 - low)
+
+            block = start >> _SUFFIX_BITS
+            if block != self._prefix_block:
+                self._prefix_block = block
+                self._prefix = encode_ulid(start)[:22]
+            prefix = self._prefix
+
+            ids.extend([prefix + _CHAR_PAIRS[value >> 10] + _CHAR_PAIRS[value & 1023] for value in range(low, low + run)])
+            start += run
+            count -= run
+
+        return ids
+
+
+ULID_GENERATOR = MonotonicUlidGenerator()
+"""
+Process-wide generator shared by every service, so IDs minted in the same
+process are strictly increasing.
+"""
@@ -1,11 +1,16 @@
 import logging
-from datetime import datetime
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
 
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
 from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.timestamps import utc_now
+from src.domain.ids.ulid_generator import ULID_GENERATOR, MonotonicUlidGenerator
+from src.infra.cache.ttl_cache import TTLCache
 
-from src.infra.repositories.account_repository import AccountRepository
+from src.infra.repositories.base_account_repository import BaseAccountRepository, DuplicateOwner, StatusTransitionConflict
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +20,8 @@ class AccountService:
     Service layer responsible for managing accounts and enforcing business rules.
 
     Responsibilities:
-    - Create new accounts.
-    - Retrieve existing accounts.
+    - Create new accounts, at most one per tenant and owner.
+    - Retrieve existing accounts, by ID or by tenant and owner.
     - Update account status while applying business validations.
 
     Status Transition Rules:
@@ -34,25 +39,53 @@ class AccountService:
     Additional Notes:
     - When transitioning to CLOSED, a reason SHOULD be provided (currently not enforced at code level).
     - Updating status also updates the `updated_at` timestamp.
+    - Reads may be served from a short-lived in-process account cache, written
+      through by every create and status update made by this process.
+    - Reads are eventually consistent (half the read cost on DynamoDB) unless
+      `consistent_reads` is set. A read given `min_version` (from a caller's
+      session token) is answered from the cache when it holds that version,
+      and otherwise read strongly consistent, so callers see their own writes.
+    - Every operation takes the request `deadline`: repository calls are capped
+      to the time left, writes are not started once it has expired, and cache
+      fills after reads and creates are skipped when it is short (updates still
+      write through, or the cache would serve the previous version).
     """
 
-    def __init__(self, account_repository: AccountRepository) -> None:
+    def __init__(
+        self,
+        account_repository: BaseAccountRepository,
+        id_generator: MonotonicUlidGenerator = ULID_GENERATOR,
+        account_cache: TTLCache[Account] | None = None,
+        consistent_reads: bool = False,
+        tenant_cache: TTLCache[str] | None = None,
+    ) -> None:
         """
         Initializes the AccountService with its dependencies.
 
         :param account_repository: The repository used for persisting and retrieving Account entities.
+        :param id_generator: Generator of account IDs. Defaults to the process-wide monotonic generator.
+        :param account_cache: Short-lived in-process cache of accounts. Disabled when None.
+        :param consistent_reads: Reads every account strongly consistent, even without a session token.
+        :param tenant_cache: In-process cache of the tenant of each account. Disabled when None.
         """
         self.account_repository = account_repository
+        self.id_generator = id_generator
+        self.account_cache = account_cache or TTLCache(ttl_seconds=0)
+        self.consistent_reads = consistent_reads
+        self.tenant_cache = tenant_cache or TTLCache(ttl_seconds=0)
 
-    def create_account(self, account_data: Account) -> Account | ErrorResponse:
+    def create_account(self, account_data: Account, deadline: Deadline = NO_DEADLINE) -> Account | ErrorResponse:
         """
         Creates a new account.
 
         Business Rules:
         - The account ID must not be provided by the client. It is generated internally.
         - If an ID is present in the input, the creation will fail with a validation error.
+        - A tenant has at most one account per owner; the repository checks it in
+          the write itself and a second creation is answered with 409.
 
         :param account_data: The Account object with initial account data (without ID).
+        :param deadline: Deadline of the request.
         :return: The created Account object with generated ID, or ErrorResponse in case of failure.
         """
         if account_data.id is not None:
@@ -63,8 +96,20 @@ class AccountService:
                 status_code=400,
             )
 
-        account_with_id = account_data.generate_ulid()
-        id = self.account_repository.create(account_with_id)
+        deadline.check("create account")
+        account_data.id = self.id_generator.new()
+        account_with_id = account_data
+        try:
+            id = self.account_repository.create(account_with_id)
+        except DuplicateOwner as duplicate:
+            logger.warning(f"Account creation rejected: {duplicate}")
+            return ErrorResponse(
+                body=ErrorMessage(
+                    error=f"Owner {duplicate.owner_id} already has account {duplicate.account_id} in tenant {duplicate.tenant_id}"
+                ),
+                message="Conflict",
+                status_code=409,
+            )
 
         if not id:
             logger.error(f"Failed to persist account: {account_data}")
@@ -74,16 +119,32 @@ class AccountService:
                 status_code=500,
             )
 
+        if not deadline.is_short:
+            self.account_cache.set(account_with_id.id, account_with_id)
         return account_with_id
 
-    def get_account(self, account_id: str) -> Account | ErrorResponse:
+    def get_account(
+        self, account_id: str, deadline: Deadline = NO_DEADLINE, min_version: int | None = None
+    ) -> Account | ErrorResponse:
         """
         Retrieves an account by its unique ID.
 
+        Served from the account cache when possible; a miss reads the full
+        account and fills the cache.
+
         :param account_id: The unique identifier of the account.
+        :param deadline: Deadline of the request.
+        :param min_version: Version the caller wrote (session token). A cached
+            account older than it is ignored and the read is strongly consistent.
         :return: The Account object if found, or ErrorResponse if not found.
         """
-        account: Account = self.account_repository.get_by_id(account_id)
+        account: Account | None = self.account_cache.get(account_id)
+        if account is not None and min_version is not None and account.version < min_version:
+            account = None
+        if account is None:
+            account = self.account_repository.find_by_id(
+                account_id, deadline=deadline, consistent=self.consistent_reads or min_version is not None
+            )
         # TODO: cahnge satatus code to 204
         if not account:
             logger.error(f"Account with ID {account_id} not found")
@@ -93,9 +154,108 @@ class AccountService:
                 status_code=404,
             )
 
+        if not deadline.is_short:
+            self.account_cache.set(account_id, account)
         return account
 
-    def update_status(self, account_id: str, update_status: AccountStatus, reason: str | None = None) -> Account | ErrorResponse:
+    def get_account_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE
+    ) -> Account | ErrorResponse:
+        """
+        Retrieves the account of an owner in a tenant.
+
+        The owner's account ID comes from its uniqueness guard (one key lookup,
+        strongly consistent so an account just created is found); the account
+        itself is then read like `get_account`, from the cache when possible.
+
+        :param tenant_id: The tenant.
+        :param owner_id: The owner.
+        :param deadline: Deadline of the request.
+        :return: The Account object if the owner has one, or ErrorResponse if not found.
+        """
+        account_id = self.account_repository.find_id_by_owner(tenant_id, owner_id, deadline=deadline, consistent=True)
+        if account_id is None:
+            logger.info(f"No account for owner {owner_id} in tenant {tenant_id}")
+            return ErrorResponse(
+                body=ErrorMessage(error="Account not found"),
+                message="Account not found",
+                status_code=404,
+            )
+        return self.get_account(account_id, deadline=deadline)
+
+    def get_account_fields(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, min_version: int | None = None
+    ) -> dict | ErrorResponse:
+        """
+        Retrieves only some attributes of an account.
+
+        When the account cache is enabled, the full account is read (an account
+        item is far below the 4 KB read unit, so it costs the same as a
+        projection), cached, and projected in memory. Without the cache only the
+        requested attributes (plus `version` and `updated_at`, needed for ETags)
+        are read, using a projection.
+
+        :param account_id: The unique identifier of the account.
+        :param fields: Attributes to return.
+        :param deadline: Deadline of the request.
+        :param min_version: Version the caller wrote (session token), see `get_account`.
+        :return: The requested attributes plus `version` and `updated_at`, or ErrorResponse if not found.
+        """
+        wanted = sorted(set(fields) | {"version", "updated_at"})
+
+        if self.account_cache.ttl_seconds > 0:
+            account: Account | ErrorResponse = self.get_account(account_id, deadline=deadline, min_version=min_version)
+            if isinstance(account, ErrorResponse):
+                return account
+            return account.model_dump(mode="json", include=set(wanted))
+
+        item = self.account_repository.get_projected(
+            account_id, wanted, deadline=deadline, consistent=self.consistent_reads or min_version is not None
+        )
+        if item is None:
+            logger.error(f"Account with ID {account_id} not found")
+            return ErrorResponse(
+                body=ErrorMessage(error="Account not found"),
+                message="Account not found",
+                status_code=404,
+            )
+
+        return item
+
+    def get_account_tenant(self, account_id: str, deadline: Deadline = NO_DEADLINE) -> str | None:
+        """
+        Returns the tenant an account belongs to, as stored.
+
+        An account never changes tenant, so the answer is kept in the tenant
+        cache for much longer than accounts are; a miss is answered from the
+        account cache or by reading the `tenant_id` attribute alone.
+
+        :param account_id: The unique identifier of the account.
+        :param deadline: Deadline of the request.
+        :return: The tenant ID, or None if the account does not exist.
+        """
+        tenant_id = self.tenant_cache.get(account_id)
+        if tenant_id is not None:
+            return tenant_id
+
+        account: Account | None = self.account_cache.get(account_id)
+        if account is not None:
+            tenant_id = account.tenant_id
+        else:
+            item = self.account_repository.get_projected(account_id, ["tenant_id"], deadline=deadline)
+            tenant_id = item.get("tenant_id") if item else None
+
+        if tenant_id is not None:
+            self.tenant_cache.set(account_id, tenant_id)
+        return tenant_id
+
+    def update_status(
+        self,
+        account_id: str,
+        update_status: AccountStatus,
+        reason: str | None = None,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account | ErrorResponse:
         """
         Updates the status of an account while validating business rules.
 
@@ -110,58 +270,142 @@ class AccountService:
 
         Additional Notes:
         - When setting an account to CLOSED, providing a reason is recommended (though not enforced in code).
-        - Updates the `updated_at` field with the current timestamp.
+        - Updates the `updated_at` field with the current timestamp and increments `version`.
+        - Goes through `transition_status`: the backend checks the current status and
+          increments `version` in the write itself, so of two concurrent updates only
+          an allowed one succeeds and every write gets its own version.
 
         :param account_id: The ID of the account to update.
         :param update_status: The new AccountStatus to set.
         :param reason: Optional reason for the status change.
+        :param deadline: Deadline of the request.
         :return: The updated Account object, or ErrorResponse if validation fails.
         """
-        account: Account = self.account_repository.get_by_id(account_id)
+        return self.transition_status(account_id, update_status, reason=reason, deadline=deadline)
 
-        if not account:
-            logger.error(f"Account with ID {account_id} not found for status update")
 
+    def transition_status(
+        self,
+        account_id: str,
+        update_status: AccountStatus,
+        reason: str | None = None,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account | ErrorResponse:
+        """
+        Updates the status of an account with a single conditional write.
+
+        Applies the same business rules as `update_status`, but lets DynamoDB
+        validate the current status instead of reading the account first. The
+        error responses are identical to the ones returned by `update_status`.
+
+        :param account_id: The ID of the account to update.
+        :param update_status: The new AccountStatus to set.
+        :param reason: Optional reason for the status change.
+        :param deadline: Deadline of the request.
+        :return: The updated Account object, or ErrorResponse if validation fails.
+        """
+        try:
+            updated_account = self.account_repository.transition_status(
+                account_id=account_id,
+                new_status=update_status,
+                reason=reason,
+                updated_at=utc_now(),
+                deadline=deadline,
+            )
+            self.account_cache.set(account_id, updated_account)
+            return updated_account
+        except StatusTransitionConflict as conflict:
+            current = conflict.current
+
+        if current is None:
+            logger.error(f"Account with ID {account_id} not found for status update")
             return ErrorResponse(
                 body=ErrorMessage(error="Account not found"),
                 message="Account not found",
                 status_code=404,
             )
 
-        if update_status == account.status:
-            logger.warning(f"Account {account_id} is already in status {account.status}")
+        if current.status == update_status:
+            logger.warning(f"Account {account_id} is already in status {current.status}")
             return ErrorResponse(
-                body=ErrorMessage(error=f"Account is already in {account.status} status"),
-                message=f"Bad Request",
+                body=ErrorMessage(error=f"Account is already in {current.status} status"),
+                message="Bad Request",
                 status_code=409,
             )
 
-        match account.status:
-            case AccountStatus.ACTIVE:
-                if update_status == AccountStatus.SUSPENDED:
-                    account.status = AccountStatus.SUSPENDED
-                    account.suspension_reason = reason
-                elif update_status == AccountStatus.CLOSED:
-                    account.status = AccountStatus.CLOSED
-                    account.suspension_reason = reason
-
-            case AccountStatus.SUSPENDED:
-                if update_status == AccountStatus.ACTIVE:
-                    account.status = AccountStatus.ACTIVE
-                    account.suspension_reason = reason  # Optional: Could be cleared here if needed
-                elif update_status == AccountStatus.CLOSED:
-                    account.status = AccountStatus.CLOSED
-                    account.suspension_reason = reason
-
-            case AccountStatus.CLOSED:
-                logger.error(f"Attempted status change on CLOSED account {account_id}")
-                return ErrorResponse(
-                    body=ErrorMessage(error="Cannot change status of a closed account"),
-                    message="Bad Request",
-                    status_code=400,
-                )
-
-        account.updated_at = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        updated_account: Account = self.account_repository.update(entity_id=account.id, entity=account)
-
-        return updated_account
+        logger.error(f"Attempted status change on CLOSED account {account_id}")
+        return ErrorResponse(
+            body=ErrorMessage(error="Cannot change status of a closed account"),
+            message="Bad Request",
+            status_code=400,
+        )
+
+    def bulk_update_status(
+        self,
+        account_ids: Iterable[str],
+        update_status: AccountStatus,
+        reason: str | None = None,
+        max_workers: int = 8,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Iterator[tuple[str, Account | ErrorResponse]]:
+        """
+        Transitions many accounts with bounded parallelism, yielding each outcome as soon as it is known.
+
+        At most `max_workers` conditional writes are in flight at any time, and
+        `account_ids` is consumed lazily, so memory stays bounded regardless of
+        the number of accounts. Outcomes are yielded in completion order.
+        Once `deadline` expires no further write is started; the writes already
+        in flight are still awaited, so the remaining accounts get no outcome.
+
+        :param account_ids: IDs of the accounts to update.
+        :param update_status: The new AccountStatus to set.
+        :param reason: Optional reason for the status change.
+        :param max_workers: Maximum number of concurrent writes.
+        :param deadline: Time after which no new write is scheduled.
+        :return: Iterator of (account_id, updated Account or ErrorResponse).
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict[Future, str] = {}
+
+            for account_id in account_ids:
+                if len(pending) >= max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), self._transition_result(future)
+
+                if deadline.expired:
+                    break
+
+                future = executor.submit(self.transition_status, account_id, update_status, reason)
+                pending[future] = account_id
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), self._transition_result(future)
+
+    def list_tenant_account_ids(self, tenant_id: str, cursor: str | None = None, limit: int = 100) -> tuple[list[str], str | None]:
+        """
+        Returns one page of account IDs belonging to a tenant.
+
+        :param tenant_id: The tenant to list.
+        :param cursor: Cursor returned by the previous page, or None for the first page.
+        :param limit: Maximum number of IDs in the page.
+        :return: The page of IDs and the cursor of the next page (None when exhausted).
+        """
+        return self.account_repository.query_ids_by_tenant(tenant_id, cursor=cursor, limit=limit)
+
+    @staticmethod
+    def _transition_result(future: Future) -> Account | ErrorResponse:
+        """
+        Unwraps a transition future, turning unexpected errors into a 500 ErrorResponse.
+        """
+        try:
+            return future.result()
+        except Exception as error:
+            logger.error(f"Unexpected error during bulk status transition: {error}")
+            return ErrorResponse(
+                body=ErrorMessage(error="Failed to update account status"),
+                message="Internal Server Error",
+                status_code=500,
+            )
@@ -0,0 +1,169 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+from src.domain.entity.account_balance import AccountBalance, BalanceLayout
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.repositories.balance_counter_repository import BalanceCounterRepository
+from src.infra.repositories.key_sharding import KeySharding
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _WriteWindow:
+    """
+    Writes of one account observed by this process since `started_at`.
+    """
+    started_at: float
+    writes: int = 0
+
+
+class BalanceCounterService:
+    """
+    Service layer keeping the running balance of the accounts in write-sharded counters.
+
+    A single DynamoDB item absorbs about 1,000 writes per second; a large
+    merchant receiving more credits than that would be throttled if its
+    balance lived on one item. Hot accounts are therefore spread over
+    `hot_shard_count` counters, and reads sum them.
+
+    Responsibilities:
+    - Build the counter increment written with each transaction.
+    - Observe the write rate of every account and promote it to sharded
+      counters above `promote_writes_per_second`, or demote it below
+      `demote_writes_per_second` (measured over `window_seconds`).
+    - Sum the counters of an account on reads, cached for a short time.
+
+    Additional Notes:
+    - The shard of a write is a hash of the transaction ID (`KeySharding`):
+      ULIDs spread writes evenly, and a retried transaction hits the same counter.
+    - Rates are observed per process, so thresholds are per instance. The
+      layout is stored on the shard 0 counter and `layout_cache` expires
+      quickly, so every instance follows a promotion within seconds.
+    - Demotion narrows writes to shard 0 but keeps reading every shard the
+      account ever had (`BalanceLayout.read_shards`).
+    """
+
+    def __init__(
+        self,
+        repository: BalanceCounterRepository,
+        hot_shard_count: int = 10,
+        promote_writes_per_second: float = 100.0,
+        demote_writes_per_second: float = 20.0,
+        window_seconds: float = 10.0,
+        layout_cache: TTLCache[BalanceLayout] | None = None,
+        balance_cache: TTLCache[AccountBalance] | None = None,
+        clock=time.monotonic,
+    ) -> None:
+        """
+        Initializes the BalanceCounterService.
+
+        :param repository: Repository of the balance counters.
+        :param hot_shard_count: Counters of a promoted account.
+        :param promote_writes_per_second: Observed rate above which an account is sharded.
+        :param demote_writes_per_second: Observed rate below which a sharded account is written unsharded again.
+        :param window_seconds: Length of the rate observation window.
+        :param layout_cache: Cache of the account layouts.
+        :param balance_cache: Cache of the summed balances.
+        :param clock: Monotonic clock in seconds. Injectable for tests.
+        """
+        if demote_writes_per_second >= promote_writes_per_second:
+            raise ValueError("demote_writes_per_second must be below promote_writes_per_second")
+        self.repository = repository
+        self.hot_shard_count = hot_shard_count
+        self.promote_writes_per_second = promote_writes_per_second
+        self.demote_writes_per_second = demote_writes_per_second
+        self.window_seconds = window_seconds
+        self.layout_cache = layout_cache or TTLCache(ttl_seconds=5.0)
+        self.balance_cache = balance_cache or TTLCache(ttl_seconds=1.0)
+        self._clock = clock
+        self._windows: TTLCache[_WriteWindow] = TTLCache(ttl_seconds=window_seconds * 6, clock=clock)
+        self._lock = threading.Lock()
+
+    def increment_operation(self, entry: TransactionEntry) -> dict:
+        """
+        Builds the counter update of a transaction, for `TransactWriteItems`.
+
+        :param entry: The ingested transaction.
+        :return: The operation adding the signed amount to one counter of the account.
+        """
+        layout = self._layout(entry.account_id)
+        shard = KeySharding(layout.write_shards).shard_for(entry.id)
+        delta = entry.amount if entry.type == TransactionType.CREDIT else -entry.amount
+        return self.repository.increment_operation(entry.account_id, shard, delta)
+
+    def observe_write(self, account_id: str) -> None:
+        """
+        Counts one stored write and, when a window closes, promotes or demotes the account.
+
+        :param account_id: The account written.
+        """
+        self.balance_cache.delete(account_id)
+        now = self._clock()
+        with self._lock:
+            window = self._windows.get(account_id)
+            if window is None:
+                self._windows.set(account_id, _WriteWindow(started_at=now, writes=1))
+                return
+            window.writes += 1
+            elapsed = now - window.started_at
+            if elapsed < self.window_seconds:
+                return
+            rate = window.writes / elapsed
+            self._windows.set(account_id, _WriteWindow(started_at=now))
+
+        layout = self._layout(account_id)
+        if rate >= self.promote_writes_per_second and layout.write_shards < self.hot_shard_count:
+            self._set_write_shards(account_id, self.hot_shard_count, rate)
+        elif rate <= self.demote_writes_per_second and layout.write_shards > 1:
+            self._set_write_shards(account_id, 1, rate)
+
+    def get_balance(self, account_id: str) -> AccountBalance:
+        """
+        Returns the running balance of an account, summing its counters.
+
+        :param account_id: The account.
+        :return: The balance (0 for an account without transactions).
+        """
+        balance = self.balance_cache.get(account_id)
+        if balance is not None:
+            return balance
+
+        cached = self._layout(account_id)
+        layout, counters = self.repository.get_counters(account_id, cached.read_shards)
+        if layout.read_shards > cached.read_shards:
+            layout, counters = self.repository.get_counters(account_id, layout.read_shards)
+        self.layout_cache.set(account_id, layout)
+
+        balance = AccountBalance(
+            account_id=account_id,
+            balance=sum(counters.values(), Decimal(0)),
+            shards=max(layout.read_shards, cached.read_shards),
+        )
+        self.balance_cache.set(account_id, balance)
+        return balance
+
+    def _layout(self, account_id: str) -> BalanceLayout:
+        """
+        Returns the cached layout of an account, reading it on a miss.
+        """
+        layout = self.layout_cache.get(account_id)
+        if layout is None:
+            layout = self.repository.get_layout(account_id)
+            self.layout_cache.set(account_id, layout)
+        return layout
+
+    def _set_write_shards(self, account_id: str, write_shards: int, rate: float) -> None:
+        """
+        Stores a promotion or demotion and caches the resulting layout.
+        """
+        layout = self.repository.set_write_shards(account_id, write_shards)
+        self.layout_cache.set(account_id, layout)
+        logger.info(
+            f"Balance of account {account_id} now written to {layout.write_shards} shard(s) "
+            f"({rate:.0f} writes/s observed, {layout.read_shards} read)"
+        )
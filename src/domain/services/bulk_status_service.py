@@ -0,0 +1,181 @@
+import logging
+from collections.abc import Iterator
+
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.deadlines.request_deadline import Deadline
+from src.domain.entity.bulk_status_job import BulkStatusJob, BulkStatusJobState
+from src.domain.entity.timestamps import utc_now
+from src.domain.services.account_service import AccountService
+
+from src.infra.repositories.bulk_status_job_repository import BulkStatusJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BulkStatusService:
+    """
+    Service layer responsible for tenant-wide and list-based status transitions.
+
+    Responsibilities:
+    - Create and resume bulk transition jobs.
+    - Page through the selected accounts (explicit list or tenant selector).
+    - Run the transitions through `AccountService.bulk_update_status`.
+    - Persist a checkpoint after every page so a timed-out invocation can resume.
+
+    Additional Notes:
+    - Every transition is a conditional write, so resuming a job never applies
+      a transition twice: accounts already in the target status are reported as skipped.
+    - Counters are added to the job with the checkpoint of their page. A page
+      replayed after a crash is marked (`page_in_progress`): its accounts
+      already in the target status were most likely moved by the lost run and
+      are counted as `replayed`, so the totals still add up to the accounts selected.
+    - Once its time budget is spent a job schedules no further write and is
+      left RUNNING. A page cut short is not checkpointed: it stays marked and
+      is replayed by the next invocation.
+    """
+
+    def __init__(
+        self,
+        account_service: AccountService,
+        job_repository: BulkStatusJobRepository,
+        page_size: int = 100,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Initializes the BulkStatusService with its dependencies.
+
+        :param account_service: Service used to run the conditional transitions.
+        :param job_repository: Repository used to persist job checkpoints.
+        :param page_size: Number of accounts processed between two checkpoints.
+        :param max_workers: Maximum number of concurrent writes.
+        """
+        self.account_service = account_service
+        self.job_repository = job_repository
+        self.page_size = page_size
+        self.max_workers = max_workers
+
+    def start_job(
+        self,
+        target_status: AccountStatus,
+        reason: str | None = None,
+        tenant_id: str | None = None,
+        account_ids: list[str] | None = None,
+    ) -> BulkStatusJob:
+        """
+        Creates and persists a new bulk transition job.
+
+        :param target_status: Status every selected account should move to.
+        :param reason: Optional reason for the status change.
+        :param tenant_id: Tenant selector (mutually exclusive with `account_ids`).
+        :param account_ids: Explicit list of accounts (mutually exclusive with `tenant_id`).
+        :return: The persisted job.
+        """
+        job = BulkStatusJob(
+            tenant_id=tenant_id,
+            account_ids=account_ids,
+            target_status=target_status,
+            reason=reason,
+        ).generate_ulid()
+        self.job_repository.create(job)
+        logger.info(f"Bulk status job {job.id} created: target={target_status} tenant={tenant_id}")
+
+        return job
+
+    def get_job(self, job_id: str) -> BulkStatusJob | ErrorResponse:
+        """
+        Retrieves a bulk transition job by its ID.
+
+        :param job_id: The unique identifier of the job.
+        :return: The job if found, or ErrorResponse if not found.
+        """
+        job: BulkStatusJob = self.job_repository.get_by_id(job_id)
+
+        if not job:
+            logger.error(f"Bulk status job {job_id} not found")
+            return ErrorResponse(
+                body=ErrorMessage(error="Bulk status job not found"),
+                message="Bulk status job not found",
+                status_code=404,
+            )
+
+        return job
+
+    def run(self, job: BulkStatusJob, time_budget_seconds: float) -> Iterator[tuple[str, Account | ErrorResponse]]:
+        """
+        Processes pages of the job until it completes or the time budget is spent.
+
+        Outcomes are yielded as soon as each write finishes. The checkpoint is
+        written after each page, so at most one page is replayed when an
+        invocation dies before finishing it. The page is marked as started
+        before its first write, so a replay is recognized and not counted twice.
+
+        :param job: The job to run. It is updated in place.
+        :param time_budget_seconds: Wall-clock time after which no new write is scheduled. Negative budgets count as 0.
+        :return: Iterator of (account_id, updated Account or ErrorResponse).
+        """
+        budget = Deadline.after(max(0.0, time_budget_seconds))
+
+        while job.state == BulkStatusJobState.RUNNING and not budget.expired:
+            account_ids, next_offset, next_cursor, exhausted = self._next_page(job)
+            replay = job.page_in_progress
+            if not replay:
+                job.page_in_progress = True
+                self.job_repository.update(entity_id=job.id, entity=job)
+
+            counts = dict.fromkeys(("processed", "updated", "skipped", "replayed", "failed"), 0)
+            for account_id, result in self.account_service.bulk_update_status(
+                account_ids, job.target_status, job.reason, max_workers=self.max_workers, deadline=budget
+            ):
+                self._count(counts, result, replay)
+                yield account_id, result
+
+            if counts["processed"] < len(account_ids):
+                break
+
+            for counter, value in counts.items():
+                setattr(job, counter, getattr(job, counter) + value)
+            job.page_in_progress = False
+            job.offset = next_offset
+            job.cursor = next_cursor
+            if exhausted:
+                job.state = BulkStatusJobState.COMPLETED
+            job.updated_at = utc_now()
+            self.job_repository.update(entity_id=job.id, entity=job)
+
+        logger.info(
+            f"Bulk status job {job.id} {job.state}: processed={job.processed} "
+            f"updated={job.updated} skipped={job.skipped} replayed={job.replayed} failed={job.failed}"
+        )
+
+    def _next_page(self, job: BulkStatusJob) -> tuple[list[str], int, str | None, bool]:
+        """
+        Returns the next page of account IDs and the checkpoint that follows it.
+
+        :return: (account_ids, next_offset, next_cursor, exhausted)
+        """
+        if job.account_ids is not None:
+            next_offset = job.offset + self.page_size
+            page = job.account_ids[job.offset:next_offset]
+            return page, next_offset, None, next_offset >= len(job.account_ids)
+
+        page, next_cursor = self.account_service.list_tenant_account_ids(
+            job.tenant_id, cursor=job.cursor, limit=self.page_size
+        )
+        return page, job.offset + len(page), next_cursor, next_cursor is None
+
+    @staticmethod
+    def _count(counts: dict[str, int], result: Account | ErrorResponse, replay: bool) -> None:
+        """
+        Updates the page counters with the outcome of one transition.
+        """
+        counts["processed"] += 1
+        if isinstance(result, Account):
+            counts["updated"] += 1
+        elif replay and result.status_code == 409:
+            counts["replayed"] += 1
+        elif result.status_code < 500:
+            counts["skipped"] += 1
+        else:
+            counts["failed"] += 1
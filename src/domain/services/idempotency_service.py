@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import time
+
+from src.domain.entity.idempotency_record import IdempotencyRecord, IdempotencyState
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.repositories.idempotency_repository import IdempotencyRepository
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyService:
+    """
+    Service layer responsible for `Idempotency-Key` handling.
+
+    Responsibilities:
+    - Claim a key before the operation runs (conditional put).
+    - Store the response once the operation succeeds.
+    - Return the stored response for repeated requests without re-running the operation.
+    - Release the key when the operation fails, so the client can retry.
+
+    Additional Notes:
+    - Completed records are also kept in an in-process cache, so repeats hitting
+      a warm container are answered without a DynamoDB read.
+    - A key reused with a different payload is reported through `request_hash`
+      and must be rejected by the caller.
+    - A claim is leased for `lease_seconds` (about the function timeout). If the
+      invocation dies without completing or releasing it, a retry of the same
+      request takes the key over once the lease has passed instead of getting
+      409 until the record expires.
+    """
+
+    def __init__(
+        self,
+        repository: IdempotencyRepository,
+        ttl_seconds: int = 86_400,
+        cache: TTLCache[IdempotencyRecord] | None = None,
+        lease_seconds: int = 30,
+        clock=time.time,
+    ) -> None:
+        """
+        Initializes the IdempotencyService with its dependencies.
+
+        :param repository: Repository used to store idempotency records.
+        :param ttl_seconds: How long a completed response is replayed.
+        :param cache: In-process cache of completed records.
+        :param lease_seconds: How long an unfinished claim blocks retries. Must not be
+            shorter than the function timeout, or a slow request could run twice.
+        :param clock: Returns the current epoch seconds. Injectable for tests.
+        """
+        self.repository = repository
+        self.ttl_seconds = ttl_seconds
+        self.cache = cache or TTLCache(ttl_seconds=60)
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+
+    @staticmethod
+    def hash_request(*parts: str) -> str:
+        """
+        Returns a stable hash of the request payload.
+        """
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def begin(self, idempotency_key: str, request_hash: str) -> IdempotencyRecord | None:
+        """
+        Claims a key, or returns the record of the request that already holds it.
+
+        :param idempotency_key: Scoped idempotency key.
+        :param request_hash: Hash of the request payload.
+        :return: None if this request owns the key and must run the operation,
+            otherwise the existing record (IN_PROGRESS or COMPLETED).
+        """
+        cached = self.cache.get(idempotency_key)
+        if cached is not None:
+            return cached
+
+        now = int(self.clock())
+        existing = self.repository.claim(IdempotencyRecord(
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            expires_at=now + self.ttl_seconds,
+            lease_expires_at=now + self.lease_seconds,
+        ), now=now)
+
+        if existing is not None and existing.state == IdempotencyState.COMPLETED:
+            self.cache.set(idempotency_key, existing)
+
+        return existing
+
+    def complete(self, idempotency_key: str, request_hash: str, status_code: int, message: str, body: str) -> None:
+        """
+        Stores the response of the request that owns the key.
+
+        :param idempotency_key: Scoped idempotency key.
+        :param request_hash: Hash of the request payload.
+        :param status_code: Status code of the response.
+        :param message: Message of the response.
+        :param body: JSON body of the response.
+        """
+        record = IdempotencyRecord(
+            idempotency_key=idempotency_key,
+            request_hash=request_hash,
+            state=IdempotencyState.COMPLETED,
+            status_code=status_code,
+            message=message,
+            body=body,
+            expires_at=int(self.clock()) + self.ttl_seconds,
+        )
+        self.repository.complete(idempotency_key, status_code, message, body, record.expires_at)
+        self.cache.set(idempotency_key, record)
+
+    def abandon(self, idempotency_key: str) -> None:
+        """
+        Releases a key whose operation failed, so a retry runs the operation again.
+        """
+        try:
+            self.repository.release(idempotency_key)
+        except Exception as error:
+            logger.error(f"Failed to release idempotency key {idempotency_key}: {error}")
@@ -0,0 +1,268 @@
+import logging
+from dataclasses import dataclass, field
+
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse, ErrorMessage
+
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.account_balance import AccountBalance
+from src.domain.entity.daily_rollup import DailyRollup, day_end, day_of, day_start, shift_day
+from src.domain.entity.transaction_entry import TransactionEntry
+from src.domain.ids.ulid_generator import ULID_GENERATOR, MonotonicUlidGenerator
+from src.domain.services.account_service import AccountService
+from src.domain.services.balance_counter_service import BalanceCounterService
+from src.infra.exports.object_store import ObjectStore
+from src.infra.exports.statement_writer import STATEMENT_FORMATS, build_statement_writer, statement_format_available
+
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository
+from src.infra.repositories.transaction_repository import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StatementExport:
+    """
+    Result of a statement export.
+
+    Attributes:
+        uri (str): Location of the exported file.
+        format (str): Format written ("parquet", "arrow" or "csv.gz").
+        rows (int): Number of exported transactions.
+    """
+    uri: str
+    format: str
+    rows: int
+
+
+@dataclass
+class StatementSummary:
+    """
+    Totals of a statement range, per day and product.
+
+    Attributes:
+        rollups (list[DailyRollup]): One entry per day and product with transactions.
+        raw_transactions (int): Transactions read individually (partial days at the range edges).
+    """
+    rollups: list[DailyRollup] = field(default_factory=list)
+    raw_transactions: int = 0
+
+
+class TransactionService:
+    """
+    Service layer responsible for account transactions and statements.
+
+    Responsibilities:
+    - Ingest transactions, keeping the daily per-product rollups and the
+      running balance up to date.
+    - Page through the transactions of an account within a time range.
+    - Summarize a range from the rollups, reading raw transactions only for partial days.
+    - Export long ranges (one account or a whole tenant) to a compressed file.
+
+    Business Rules:
+    - Transactions are only accepted for ACTIVE accounts.
+    - A transaction `id` is accepted once; repetitions are rejected and do not touch the rollups.
+
+    Additional Notes:
+    - Exports stream query pages straight into the writer: only one query page
+      and one row group are held in memory, whatever the size of the range.
+    """
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        object_store: ObjectStore | None = None,
+        export_page_size: int = 1000,
+        id_generator: MonotonicUlidGenerator = ULID_GENERATOR,
+        rollup_repository: DailyRollupRepository | None = None,
+        account_service: AccountService | None = None,
+        balance_service: BalanceCounterService | None = None,
+    ) -> None:
+        """
+        Initializes the TransactionService with its dependencies.
+
+        :param transaction_repository: Repository used to store and query transactions.
+        :param object_store: Destination of statement exports.
+        :param export_page_size: Query page size used by exports.
+        :param id_generator: Generator of export file names.
+        :param rollup_repository: Repository of the daily per-product rollups.
+        :param account_service: Service used to check the account of an ingested transaction.
+        :param balance_service: Service keeping the running balance counters.
+        """
+        self.transaction_repository = transaction_repository
+        self.rollup_repository = rollup_repository
+        self.account_service = account_service
+        self.balance_service = balance_service
+        self.object_store = object_store
+        self.export_page_size = export_page_size
+        self.id_generator = id_generator
+
+    def record_transaction(self, entry: TransactionEntry) -> TransactionEntry | ErrorResponse:
+        """
+        Stores a transaction and adds it to its daily rollup and to the account balance, atomically.
+
+        :param entry: The transaction. Its `tenant_id` is taken from the account.
+        :return: The stored transaction, or ErrorResponse if the account does not
+            exist (404), is not ACTIVE (400), or the `id` was already ingested (409).
+        """
+        account: Account | ErrorResponse = self.account_service.get_account(entry.account_id)
+        if isinstance(account, ErrorResponse):
+            return account
+
+        if account.status != AccountStatus.ACTIVE:
+            logger.warning(f"Transaction {entry.id} rejected: account {account.id} is {account.status.value}")
+            return ErrorResponse(
+                body=ErrorMessage(error=f"Transactions are only accepted for active accounts, account is {account.status.value}"),
+                message="Bad Request",
+                status_code=400,
+            )
+
+        entry.tenant_id = account.tenant_id
+        operations = [self.rollup_repository.increment_operation(entry)] if self.rollup_repository else []
+        if self.balance_service is not None:
+            operations.append(self.balance_service.increment_operation(entry))
+
+        if not self.transaction_repository.create_once(entry, operations):
+            logger.warning(f"Duplicate transaction {entry.id} rejected for account {entry.account_id}")
+            return ErrorResponse(
+                body=ErrorMessage(error=f"Transaction {entry.id} already exists"),
+                message="Conflict",
+                status_code=409,
+            )
+
+        if self.balance_service is not None:
+            self.balance_service.observe_write(entry.account_id)
+
+        logger.info(f"Transaction {entry.id} recorded for account {entry.account_id}")
+        return entry
+
+    def get_balance(self, account_id: str) -> AccountBalance:
+        """
+        Returns the running balance of an account (credits minus debits).
+
+        :param account_id: The account.
+        :return: The balance, summed from its counters and cached for a short time.
+        """
+        return self.balance_service.get_balance(account_id)
+
+    def summarize(self, account_id: str, start: str, end: str, product: str | None = None) -> StatementSummary:
+        """
+        Returns the per-day, per-product totals of an account for a time range.
+
+        Whole days come from the rollups (one query, O(days)). Only the partial
+        days at the edges of the range (typically the current day, when `end`
+        is "now") are summed from raw transactions.
+
+        :param account_id: The account.
+        :param start: Inclusive lower bound (canonical timestamp).
+        :param end: Inclusive upper bound (canonical timestamp).
+        :param product: Only this product, or None for every product.
+        :return: The rollups of the range and how many raw transactions were read.
+        """
+        summary = StatementSummary()
+        first_day, last_day = day_of(start), day_of(end)
+        partial_ranges = []
+
+        if first_day == last_day and (start != day_start(first_day) or end != day_end(last_day)):
+            partial_ranges.append((start, end))
+            first_full, last_full = first_day, shift_day(first_day, -1)
+        else:
+            first_full, last_full = first_day, last_day
+            if start != day_start(first_day):
+                partial_ranges.append((start, day_end(first_day)))
+                first_full = shift_day(first_day, 1)
+            if end != day_end(last_day):
+                partial_ranges.append((day_start(last_day), end))
+                last_full = shift_day(last_day, -1)
+
+        if first_full <= last_full:
+            summary.rollups.extend(self.rollup_repository.query(account_id, first_full, last_full, product=product))
+
+        for range_start, range_end in partial_ranges:
+            partial: dict[tuple[str, str], DailyRollup] = {}
+            for items, _ in self.transaction_repository.query_range_pages(
+                range_start, range_end, account_id=account_id, product=product, page_size=self.export_page_size
+            ):
+                for item in items:
+                    key = (day_of(item["timestamp"]), item["product"])
+                    if key not in partial:
+                        partial[key] = DailyRollup(
+                            account_id=account_id, tenant_id=item["tenant_id"], day=key[0], product=key[1]
+                        )
+                    partial[key].add(item["type"], item["amount"])
+                    summary.raw_transactions += 1
+            summary.rollups.extend(partial.values())
+
+        summary.rollups.sort(key=lambda rollup: (rollup.day, rollup.product))
+        return summary
+
+    def list_transactions(
+        self,
+        account_id: str,
+        start: str,
+        end: str,
+        product: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[TransactionEntry], str | None]:
+        """
+        Returns one page of the statement of an account.
+
+        :param account_id: The account.
+        :param start: Inclusive lower bound (canonical timestamp).
+        :param end: Inclusive upper bound (canonical timestamp).
+        :param product: Only transactions of this product, or None for every product.
+        :param cursor: Cursor of the previous page.
+        :param limit: Maximum number of transactions evaluated for the page.
+        :return: The transactions and the cursor of the next page (None on the last page).
+        """
+        items, next_cursor = self.transaction_repository.query_range(
+            start, end, account_id=account_id, product=product, cursor=cursor, limit=limit
+        )
+        return [TransactionEntry(**item) for item in items], next_cursor
+
+    def export_statement(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+        export_format: str = "parquet",
+    ) -> StatementExport | ErrorResponse:
+        """
+        Streams the statement of an account or tenant into the object store.
+
+        :param start: Inclusive lower bound (canonical timestamp).
+        :param end: Inclusive upper bound (canonical timestamp).
+        :param account_id: Account selector.
+        :param tenant_id: Tenant selector, used when account_id is not given.
+        :param product: Only transactions of this product.
+        :param export_format: "parquet", "arrow" or "csv.gz".
+        :return: The location, format and row count of the export, or ErrorResponse (400)
+            if the format cannot be written by this deployment (Parquet and Arrow need pyarrow).
+        """
+        if self.object_store is None:
+            raise RuntimeError("Statement exports require an object store")
+
+        if not statement_format_available(export_format):
+            logger.error(f"pyarrow is not installed, statement cannot be exported as {export_format}")
+            return ErrorResponse(
+                body=ErrorMessage(error=f"Format {export_format} is not available, use csv.gz"),
+                message="Bad Request",
+                status_code=400,
+            )
+
+        owner = f"accounts/{account_id}" if account_id else f"tenants/{tenant_id}"
+        key = f"statements/{owner}/{start[:10]}_{end[:10]}_{self.id_generator.new()}.{STATEMENT_FORMATS[export_format]}"
+
+        pages = self.transaction_repository.query_range_pages(
+            start, end, account_id=account_id, tenant_id=tenant_id, product=product, page_size=self.export_page_size
+        )
+        with self.object_store.open_write(key) as stream:
+            writer = build_statement_writer(export_format, stream)
+            for items, _ in pages:
+                writer.write_rows(items)
+            writer.close()
+
+        logger.info(f"Exported {writer.rows} transactions of {owner} to {key}")
+        return StatementExport(uri=self.object_store.uri(key), format=export_format, rows=writer.rows)
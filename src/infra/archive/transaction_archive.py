@@ -0,0 +1,231 @@
+import gzip
+import heapq
+import io
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+
+from src.domain.entity.money import MONEY_FIELDS, to_money
+from src.domain.ids.ulid_generator import ULID_GENERATOR, MonotonicUlidGenerator
+from src.infra.exports.object_store import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+
+def _with_money(row: dict) -> dict:
+    """
+    Restores the money attributes of an archived row to Decimal (written as strings or, by older segments, numbers).
+    """
+    for field in MONEY_FIELDS.intersection(row):
+        if row[field] is not None:
+            row[field] = to_money(row[field])
+    return row
+
+
+@dataclass(slots=True)
+class ArchiveSegment:
+    """
+    One archived segment: the transactions of one account for (part of) one month.
+
+    Attributes:
+        key (str): Object key of the segment (gzip-compressed JSON Lines, sorted by timestamp).
+        tenant_id (str): Tenant of the account.
+        account_id (str): The account.
+        min_timestamp (str): Earliest transaction timestamp in the segment.
+        max_timestamp (str): Latest transaction timestamp in the segment.
+        rows (int): Number of transactions in the segment.
+    """
+    key: str
+    tenant_id: str
+    account_id: str
+    min_timestamp: str
+    max_timestamp: str
+    rows: int
+
+    def overlaps(self, start: str, end: str) -> bool:
+        """
+        Whether the segment may hold transactions within [start, end].
+        """
+        return self.min_timestamp <= end and self.max_timestamp >= start
+
+
+class TransactionArchive:
+    """
+    Cold tier of the ledger: transactions moved out of `account-transaction-table`.
+
+    Layout in the object store (under `prefix`):
+
+    - `segments/<tenant>/<account>/<YYYY-MM>/<ulid>.jsonl.gz`: one segment per
+      account, month and archival run, rows sorted by timestamp.
+    - `index/accounts/<account>.json` and `index/tenants/<tenant>.json`: the
+      segments of an account or tenant with their min/max timestamps, so a
+      statement only opens the segments overlapping its range.
+
+    Segments are written first and become visible when the indexes are
+    committed; a run interrupted before `commit` only leaves unreferenced objects.
+
+    Usage:
+        archive = TransactionArchive(build_object_store("s3", path="archive", bucket="ledger"))
+        archive.commit(archive.write_segments(items))
+        for item in archive.read_range(start, end, account_id=account_id):
+            ...
+    """
+
+    def __init__(
+        self,
+        object_store: ObjectStore,
+        prefix: str = "transactions",
+        id_generator: MonotonicUlidGenerator = ULID_GENERATOR,
+        compresslevel: int = 6,
+    ) -> None:
+        """
+        Initializes the archive.
+
+        :param object_store: Where segments and indexes are stored.
+        :param prefix: Key prefix of the archive.
+        :param id_generator: Generator of segment names.
+        :param compresslevel: gzip level of the segments.
+        """
+        self.object_store = object_store
+        self.prefix = prefix.strip("/")
+        self.id_generator = id_generator
+        self.compresslevel = compresslevel
+
+    def _index_key(self, account_id: str | None = None, tenant_id: str | None = None) -> str:
+        if account_id is not None:
+            return f"{self.prefix}/index/accounts/{account_id}.json"
+        return f"{self.prefix}/index/tenants/{tenant_id}.json"
+
+    def _read_index(self, key: str) -> list[ArchiveSegment]:
+        try:
+            with self.object_store.open_read(key) as stream:
+                return [ArchiveSegment(**segment) for segment in json.load(stream)["segments"]]
+        except FileNotFoundError:
+            return []
+
+    def _write_index(self, key: str, segments: list[ArchiveSegment]) -> None:
+        segments = sorted(segments, key=lambda segment: (segment.min_timestamp, segment.key))
+        with self.object_store.open_write(key) as stream:
+            stream.write(json.dumps({"segments": [asdict(segment) for segment in segments]}).encode())
+
+    def write_segment(self, rows: list[dict]) -> ArchiveSegment:
+        """
+        Writes the transactions of one account and month as a new segment.
+
+        :param rows: Transactions (plain dicts) of a single account and month.
+        :return: The segment, not yet visible to readers (see `commit`).
+        """
+        rows = sorted(rows, key=lambda row: (row["timestamp"], row["id"]))
+        first = rows[0]
+        tenant_id, account_id = first.get("tenant_id") or "", first["account_id"]
+        key = f"{self.prefix}/segments/{tenant_id}/{account_id}/{first['timestamp'][:7]}/{self.id_generator.new()}.jsonl.gz"
+
+        with self.object_store.open_write(key) as stream:
+            with gzip.GzipFile(fileobj=stream, mode="wb", compresslevel=self.compresslevel) as compressed:
+                for row in rows:
+                    compressed.write(json.dumps(row, separators=(",", ":"), default=str).encode())
+                    compressed.write(b"\n")
+
+        return ArchiveSegment(
+            key=key, tenant_id=tenant_id, account_id=account_id,
+            min_timestamp=first["timestamp"], max_timestamp=rows[-1]["timestamp"], rows=len(rows),
+        )
+
+    def write_segments(self, rows: Iterable[dict]) -> list[ArchiveSegment]:
+        """
+        Partitions transactions by account and month and writes one segment per partition.
+
+        :param rows: Transactions of any accounts and months.
+        :return: The written segments, to be passed to `commit`.
+        """
+        partitions: dict[tuple[str, str], list[dict]] = {}
+        for row in rows:
+            partitions.setdefault((row["account_id"], row["timestamp"][:7]), []).append(row)
+        return [self.write_segment(partition) for partition in partitions.values()]
+
+    def commit(self, segments: list[ArchiveSegment]) -> None:
+        """
+        Adds segments to the account and tenant indexes, making them visible to readers.
+
+        Indexes are rewritten whole (read, merge, replace): run one archival job at a time.
+        """
+        by_index: dict[str, list[ArchiveSegment]] = {}
+        for segment in segments:
+            by_index.setdefault(self._index_key(account_id=segment.account_id), []).append(segment)
+            if segment.tenant_id:
+                by_index.setdefault(self._index_key(tenant_id=segment.tenant_id), []).append(segment)
+
+        for key, added in by_index.items():
+            self._write_index(key, self._read_index(key) + added)
+        logger.info(f"Committed {len(segments)} archive segments to {len(by_index)} indexes")
+
+    def segments(self, start: str, end: str, account_id: str | None = None, tenant_id: str | None = None) -> list[ArchiveSegment]:
+        """
+        The segments of an account or tenant overlapping [start, end], from the min/max index.
+        """
+        if account_id is None and tenant_id is None:
+            raise ValueError("account_id or tenant_id is required")
+        index = self._read_index(self._index_key(account_id=account_id, tenant_id=tenant_id))
+        return [segment for segment in index if segment.overlaps(start, end)]
+
+    def read_segment(self, segment: ArchiveSegment) -> Iterator[dict]:
+        """
+        Streams the rows of a segment, in timestamp order.
+        """
+        with self.object_store.open_read(segment.key) as stream:
+            with gzip.GzipFile(fileobj=stream, mode="rb") as compressed:
+                for line in io.BufferedReader(compressed):
+                    yield _with_money(json.loads(line))
+
+    def read_range(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Streams the archived transactions of an account or tenant within [start, end], in timestamp order.
+
+        Only segments whose min/max range overlaps the query are opened.
+        Segments are taken in `min_timestamp` order and grouped into runs of
+        overlapping ones (e.g. a month archived by two jobs). Runs are read one
+        after the other, a run of several segments being merged lazily; most
+        runs are a single segment, read directly. Only the segments of the
+        current run are open at a time, so memory and open streams do not
+        grow with the range.
+        """
+        def rows(segment: ArchiveSegment) -> Iterator[dict]:
+            for row in self.read_segment(segment):
+                if row["timestamp"] > end:
+                    return
+                if row["timestamp"] >= start and (product is None or row.get("product") == product):
+                    yield row
+
+        segments = sorted(
+            self.segments(start, end, account_id=account_id, tenant_id=tenant_id),
+            key=lambda segment: (segment.min_timestamp, segment.key),
+        )
+        for run in _overlapping_runs(segments):
+            if len(run) == 1:
+                yield from rows(run[0])
+            else:
+                yield from heapq.merge(*(rows(segment) for segment in run), key=lambda row: row["timestamp"])
+
+
+def _overlapping_runs(segments: list[ArchiveSegment]) -> Iterator[list[ArchiveSegment]]:
+    """
+    Groups segments sorted by `min_timestamp` into consecutive runs whose ranges overlap.
+    """
+    run: list[ArchiveSegment] = []
+    run_end = ""
+    for segment in segments:
+        if run and segment.min_timestamp > run_end:
+            yield run
+            run, run_end = [], ""
+        run.append(segment)
+        run_end = max(run_end, segment.max_timestamp)
+    if run:
+        yield run
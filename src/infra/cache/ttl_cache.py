@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Small thread-safe in-process cache with per-entry expiry and LRU eviction.
+
+    Lives for the lifetime of the process, so it is shared by every request
+    served by a warm Lambda container or a FastAPI worker. Entries expire
+    `ttl_seconds` after being set; when `max_entries` is reached the least
+    recently used entry is evicted.
+
+    Usage:
+        cache = TTLCache[str](ttl_seconds=30, max_entries=1000)
+        cache.set("key", "value")
+        value = cache.get("key")
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000, clock=time.monotonic) -> None:
+        """
+        Initializes the cache.
+
+        :param ttl_seconds: Lifetime of an entry. A value <= 0 disables the cache.
+        :param max_entries: Maximum number of entries kept.
+        :param clock: Monotonic clock in seconds. Injectable for tests.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> V | None:
+        """
+        Returns the cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V, ttl_seconds: float | None = None) -> None:
+        """
+        Stores a value, replacing any previous one.
+
+        :param ttl_seconds: Overrides the default lifetime for this entry.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Removes an entry if present.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
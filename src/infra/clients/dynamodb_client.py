@@ -0,0 +1,194 @@
+import os
+import threading
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from src.config.custom_config import ENVIRONMENT
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline, DeadlineExceeded
+
+# Read timeouts of the clients used when the remaining budget is below the
+# normal worst case. Quantized so that only a handful of clients ever exist.
+DEADLINE_TIMEOUT_TIERS = (0.1, 0.25, 0.5, 1.0)
+
+_lock = threading.Lock()
+_client = None
+_session = None
+_deadline_clients: dict[tuple[float, int], object] = {}
+
+
+def build_client_config() -> Config:
+    """
+    Builds the botocore configuration of the DynamoDB client from `CustomConfig`.
+
+    Timeouts are deliberately tight: a Lambda invocation has a fixed budget, and
+    a fast failure (that the caller can retry or turn into a 503) is better
+    than a call that hangs until the function times out. Adaptive retries add
+    client-side rate limiting when DynamoDB starts throttling.
+
+    Returns:
+        Config: The client configuration.
+    """
+    return Config(
+        region_name=ENVIRONMENT.dynamodb_region,
+        max_pool_connections=ENVIRONMENT.dynamodb_max_pool_connections,
+        connect_timeout=ENVIRONMENT.dynamodb_connect_timeout,
+        read_timeout=ENVIRONMENT.dynamodb_read_timeout,
+        tcp_keepalive=ENVIRONMENT.dynamodb_tcp_keepalive,
+        retries={
+            "mode": ENVIRONMENT.dynamodb_retry_mode,
+            "total_max_attempts": ENVIRONMENT.dynamodb_max_attempts,
+        },
+    )
+
+
+def _get_session():
+    """
+    Returns the boto3 session shared by every client, so the DynamoDB service
+    model is loaded once. Must be called with `_lock` held.
+    """
+    global _session
+
+    if _session is None:
+        _session = boto3.session.Session()
+    return _session
+
+
+def get_dynamodb_client(deadline: Deadline = NO_DEADLINE):
+    """
+    Returns the DynamoDB client shared by every repository of the process.
+
+    The client (and its connection pool) is created on first use and reused
+    for the lifetime of the process, so warm Lambda invocations and FastAPI
+    requests never pay for a new TLS handshake. Low-level clients are
+    thread-safe, so the same instance is used by worker threads.
+
+    When the `deadline` leaves less time than the worst case of the shared
+    client (every attempt timing out), a client with shorter timeouts and fewer
+    attempts is returned instead. See `deadline_client_settings`.
+
+    Args:
+        deadline (Deadline): Deadline of the request the call belongs to.
+
+    Returns:
+        botocore.client.DynamoDB: The shared client, or a budget-capped one.
+
+    Raises:
+        DeadlineExceeded: If not even the shortest timeout fits in the remaining time.
+    """
+    global _client
+
+    if deadline.bounded:
+        settings = deadline_client_settings(deadline.remaining())
+        if settings is not None:
+            return _get_deadline_client(*settings)
+
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = _get_session().client(
+                    "dynamodb",
+                    endpoint_url=ENVIRONMENT.dynamodb_endpoint_url,
+                    config=build_client_config(),
+                )
+
+    return _client
+
+
+def deadline_client_settings(remaining_seconds: float) -> tuple[float, int] | None:
+    """
+    Picks the read timeout and attempt count fitting in a remaining budget.
+
+    Args:
+        remaining_seconds (float): Time left before the request deadline.
+
+    Returns:
+        Optional[tuple[float, int]]: (read timeout, total attempts), or None when
+        the shared client already fits (its timeouts times its attempts).
+
+    Raises:
+        DeadlineExceeded: If the remaining time is below the shortest tier.
+    """
+    attempt_seconds = ENVIRONMENT.dynamodb_connect_timeout + ENVIRONMENT.dynamodb_read_timeout
+    if remaining_seconds >= attempt_seconds * ENVIRONMENT.dynamodb_max_attempts:
+        return None
+
+    fitting = [tier for tier in DEADLINE_TIMEOUT_TIERS if tier <= remaining_seconds and tier < ENVIRONMENT.dynamodb_read_timeout]
+    if not fitting:
+        raise DeadlineExceeded("DynamoDB call", remaining_seconds)
+
+    read_timeout = fitting[-1]
+    attempts = max(1, min(ENVIRONMENT.dynamodb_max_attempts, int(remaining_seconds // (2 * read_timeout))))
+    return read_timeout, attempts
+
+
+def _get_deadline_client(read_timeout: float, attempts: int):
+    """
+    Returns the cached client for one (read timeout, attempts) pair.
+
+    Connect timeout equals the read timeout, and retries use the "standard"
+    mode: "adaptive" may sleep client-side, which a short budget cannot afford.
+    """
+    key = (read_timeout, attempts)
+    client = _deadline_clients.get(key)
+    if client is None:
+        with _lock:
+            client = _deadline_clients.get(key)
+            if client is None:
+                config = build_client_config().merge(Config(
+                    connect_timeout=min(read_timeout, ENVIRONMENT.dynamodb_connect_timeout),
+                    read_timeout=read_timeout,
+                    retries={"mode": "standard", "total_max_attempts": attempts},
+                ))
+                client = _deadline_clients[key] = _get_session().client(
+                    "dynamodb",
+                    endpoint_url=ENVIRONMENT.dynamodb_endpoint_url,
+                    config=config,
+                )
+    return client
+
+
+def call_dynamodb(operation: str, deadline: Deadline = NO_DEADLINE, **params) -> dict:
+    """
+    Runs one DynamoDB operation within a request deadline.
+
+    Timeouts of a bounded deadline surface as DeadlineExceeded, so the router
+    answers 503 instead of 500.
+
+    Args:
+        operation (str): Client method name, e.g. "get_item".
+        deadline (Deadline): Deadline of the request.
+        **params: Parameters of the operation.
+
+    Returns:
+        dict: The response of the operation.
+    """
+    deadline.check(operation)
+    client = get_dynamodb_client(deadline)
+    try:
+        return getattr(client, operation)(**params)
+    except (ConnectTimeoutError, ReadTimeoutError) as error:
+        if deadline.bounded:
+            raise DeadlineExceeded(operation, deadline.remaining()) from error
+        raise
+
+
+def reset_dynamodb_client() -> None:
+    """
+    Drops the shared client so the next call creates a new one.
+
+    Called automatically in forked children, whose inherited sockets must not
+    be shared with the parent process.
+    """
+    global _client, _lock, _session, _deadline_clients
+
+    # A fresh lock as well: the parent's lock may have been held by another thread at fork time.
+    _lock = threading.Lock()
+    _client = None
+    _session = None
+    _deadline_clients = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_dynamodb_client)
@@ -0,0 +1,172 @@
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import boto3
+
+from src.domain.entity.account_change_event import AccountChangeEvent
+
+logger = logging.getLogger(__name__)
+
+EVENT_SOURCE = "fluxpay.account"
+EVENT_DETAIL_TYPE = "AccountStatusChanged"
+
+
+class ChangeEventSink(ABC):
+    """
+    Destination of AccountChangeEvent batches.
+
+    Implementations receive batches of at most `max_batch_size` events and must
+    either deliver the whole batch or raise, so callers can retry it.
+    """
+
+    max_batch_size: int = 100
+
+    @abstractmethod
+    def publish(self, events: list[AccountChangeEvent]) -> None:
+        """
+        Delivers a batch of events.
+
+        Args:
+            events (list[AccountChangeEvent]): Events to deliver, in commit order.
+
+        Raises:
+            Exception: If any event of the batch could not be delivered.
+        """
+
+
+class InMemoryChangeEventSink(ChangeEventSink):
+    """
+    Sink that keeps events in memory. Intended for tests and local runs.
+    """
+
+    def __init__(self):
+        self.events: list[AccountChangeEvent] = []
+        self._lock = threading.Lock()
+
+    def publish(self, events: list[AccountChangeEvent]) -> None:
+        with self._lock:
+            self.events.extend(events)
+
+
+class LocalFileChangeEventSink(ChangeEventSink):
+    """
+    Local stand-in sink that appends events to a JSON Lines file.
+
+    The file can be fed back through `scripts/replay_account_events.py`.
+    """
+
+    max_batch_size = 500
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def publish(self, events: list[AccountChangeEvent]) -> None:
+        lines = "".join(event.model_dump_json() + "\n" for event in events)
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class EventBridgeChangeEventSink(ChangeEventSink):
+    """
+    Sink that publishes events to an Amazon EventBridge bus.
+
+    EventBridge accepts at most 10 entries per PutEvents call, and reports
+    failures per entry instead of failing the call, so partial failures are
+    turned into an exception here.
+    """
+
+    max_batch_size = 10
+
+    def __init__(self, bus_name: str):
+        self.bus_name = bus_name
+        self._client = boto3.client("events")
+
+    def publish(self, events: list[AccountChangeEvent]) -> None:
+        response = self._client.put_events(Entries=[
+            {
+                "Source": EVENT_SOURCE,
+                "DetailType": EVENT_DETAIL_TYPE,
+                "Detail": event.model_dump_json(),
+                "EventBusName": self.bus_name,
+            }
+            for event in events
+        ])
+
+        if response.get("FailedEntryCount"):
+            raise RuntimeError(f"{response['FailedEntryCount']} account change events were not delivered to {self.bus_name}")
+
+
+class BatchingChangeEventPublisher:
+    """
+    Buffers AccountChangeEvents and delivers them to a sink in batches.
+
+    Events are flushed whenever the buffer reaches the sink's batch size and on
+    `flush()`. A failed batch stays in the buffer so the caller can decide
+    whether to retry or to report it.
+
+    Usage:
+        publisher = BatchingChangeEventPublisher(sink)
+        publisher.add(event)
+        publisher.flush()
+    """
+
+    def __init__(self, sink: ChangeEventSink, batch_size: int | None = None):
+        self.sink = sink
+        self.batch_size = min(batch_size or sink.max_batch_size, sink.max_batch_size)
+        self.published = 0
+        self._buffer: list[AccountChangeEvent] = []
+
+    @property
+    def pending(self) -> list[AccountChangeEvent]:
+        """
+        Events added but not delivered yet.
+        """
+        return list(self._buffer)
+
+    def add(self, event: AccountChangeEvent) -> None:
+        """
+        Adds an event to the buffer, flushing full batches.
+        """
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Delivers every buffered event, one batch at a time.
+
+        Raises:
+            Exception: Propagated from the sink. Undelivered events stay buffered.
+        """
+        while self._buffer:
+            batch = self._buffer[:self.batch_size]
+            self.sink.publish(batch)
+            del self._buffer[:len(batch)]
+            self.published += len(batch)
+
+
+def build_change_event_sink(kind: str, bus_name: str = "default", file_path: str = "account_change_events.jsonl") -> ChangeEventSink:
+    """
+    Builds the sink selected by configuration.
+
+    Args:
+        kind (str): One of "eventbridge", "file" or "memory".
+        bus_name (str): EventBridge bus used by the "eventbridge" sink.
+        file_path (str): JSON Lines file used by the "file" sink.
+
+    Returns:
+        ChangeEventSink: The configured sink.
+    """
+    match kind:
+        case "eventbridge":
+            return EventBridgeChangeEventSink(bus_name)
+        case "file":
+            return LocalFileChangeEventSink(file_path)
+        case "memory":
+            return InMemoryChangeEventSink()
+
+    raise ValueError(f"Unknown change event sink '{kind}'")
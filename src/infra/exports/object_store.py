@@ -0,0 +1,148 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+import boto3
+
+
+class ObjectStore(ABC):
+    """
+    Destination of exported files.
+
+    Implementations expose a binary stream per object. The object only becomes
+    visible once the stream is closed without error, so a failed export never
+    leaves a truncated file behind.
+    """
+
+    @abstractmethod
+    def open_write(self, key: str) -> AbstractContextManager[BinaryIO]:
+        """
+        Opens an object for writing.
+
+        Args:
+            key (str): Object key, e.g. "statements/01HYXY.../2025-06.parquet".
+
+        Returns:
+            A context manager yielding a writable binary stream.
+        """
+
+    @abstractmethod
+    def open_read(self, key: str) -> AbstractContextManager[BinaryIO]:
+        """
+        Opens an object for reading.
+
+        Args:
+            key (str): Object key.
+
+        Returns:
+            A context manager yielding a readable binary stream.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+
+    @abstractmethod
+    def uri(self, key: str) -> str:
+        """
+        Returns the location of an object, as handed to the caller of an export.
+        """
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Object store stand-in backed by a local directory.
+
+    Objects are written to a temporary file next to their final path and
+    renamed into place on success.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    @contextmanager
+    def open_write(self, key: str) -> Iterator[BinaryIO]:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(descriptor, "wb") as stream:
+                yield stream
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def open_read(self, key: str) -> Iterator[BinaryIO]:
+        with open(self.root / key, "rb") as stream:
+            yield stream
+
+    def uri(self, key: str) -> str:
+        return (self.root / key).resolve().as_uri()
+
+
+class S3ObjectStore(ObjectStore):
+    """
+    Object store backed by an S3 bucket.
+
+    The export is spooled to a temporary file (bounded memory) and uploaded on
+    close with the managed transfer, which switches to multipart uploads for
+    large files.
+    """
+
+    def __init__(self, bucket: str, prefix: str = ""):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self._client = boto3.client("s3")
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    @contextmanager
+    def open_write(self, key: str) -> Iterator[BinaryIO]:
+        with tempfile.TemporaryFile() as stream:
+            yield stream
+            stream.seek(0)
+            self._client.upload_fileobj(stream, self.bucket, self._key(key))
+
+    @contextmanager
+    def open_read(self, key: str) -> Iterator[BinaryIO]:
+        try:
+            response = self._client.get_object(Bucket=self.bucket, Key=self._key(key))
+        except self._client.exceptions.NoSuchKey as error:
+            raise FileNotFoundError(self.uri(key)) from error
+        body = response["Body"]
+        try:
+            yield body
+        finally:
+            body.close()
+
+    def uri(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self._key(key)}"
+
+
+def build_object_store(kind: str, path: str = "statement_exports", bucket: str | None = None) -> ObjectStore:
+    """
+    Builds the object store selected by configuration.
+
+    Args:
+        kind (str): One of "local" or "s3".
+        path (str): Root directory of the "local" store, or key prefix of the "s3" store.
+        bucket (Optional[str]): Bucket of the "s3" store.
+
+    Returns:
+        ObjectStore: The configured store.
+    """
+    match kind:
+        case "local":
+            return LocalObjectStore(path)
+        case "s3":
+            if not bucket:
+                raise ValueError("The s3 object store requires a bucket")
+            return S3ObjectStore(bucket, prefix=path)
+
+    raise ValueError(f"Unknown object store '{kind}'")
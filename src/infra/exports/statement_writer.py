@@ -0,0 +1,235 @@
+import csv
+import gzip
+import io
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+from src.domain.entity.money import to_money
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_COLUMNS: tuple[str, ...] = (
+    "id", "tenant_id", "account_id", "timestamp", "amount", "type",
+    "currency", "product", "reference", "balance_snapshot", "metadata",
+)
+"""
+Column order of exported statements. `metadata` is written as a JSON string.
+"""
+
+MONEY_COLUMNS: tuple[str, ...] = ("amount", "balance_snapshot")
+"""
+Columns written as decimal(38, 9) in the Arrow formats, so amounts are exported exactly.
+"""
+
+STATEMENT_FORMATS: dict[str, str] = {
+    "parquet": "parquet",
+    "arrow": "arrows",
+    "csv.gz": "csv.gz",
+}
+"""
+Supported export formats and their file extensions.
+"""
+
+
+def _load_pyarrow():
+    """
+    Imports pyarrow. Returns None when it is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+class StatementWriter(ABC):
+    """
+    Streams statement rows into a binary output, one batch at a time.
+
+    Writers never hold more than one batch (or one row group) in memory, so
+    exports of any length run in bounded memory.
+    """
+
+    format: str
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.rows = 0
+
+    @abstractmethod
+    def write_rows(self, rows: list[dict]) -> None:
+        """
+        Appends rows (plain dicts keyed by STATEMENT_COLUMNS) to the output.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Writes trailing metadata and flushes the output. The stream itself is not closed.
+        """
+
+
+class GzipCsvStatementWriter(StatementWriter):
+    """
+    Writes statements as gzip-compressed CSV. Needs only the standard library.
+    """
+
+    format = "csv.gz"
+
+    def __init__(self, stream: BinaryIO, compresslevel: int = 6):
+        super().__init__(stream)
+        self._gzip = gzip.GzipFile(fileobj=stream, mode="wb", compresslevel=compresslevel)
+        self._text = io.TextIOWrapper(self._gzip, encoding="utf-8", newline="")
+        self._csv = csv.writer(self._text)
+        self._csv.writerow(STATEMENT_COLUMNS)
+
+    def write_rows(self, rows: list[dict]) -> None:
+        self._csv.writerows(
+            [
+                row.get(column) if column != "metadata" else (json.dumps(row["metadata"]) if row.get("metadata") else None)
+                for column in STATEMENT_COLUMNS
+            ]
+            for row in rows
+        )
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self._text.flush()
+        self._text.detach()
+        self._gzip.close()
+
+
+class _ArrowStatementWriter(StatementWriter):
+    """
+    Base of the pyarrow writers: converts row batches to record batches and
+    groups them into row groups of `batch_rows` rows.
+    """
+
+    def __init__(self, stream: BinaryIO, pyarrow, compression: str = "zstd", batch_rows: int = 65_536):
+        super().__init__(stream)
+        self.pa = pyarrow
+        self.compression = compression
+        self.batch_rows = batch_rows
+        self.schema = pyarrow.schema([
+            ("id", pyarrow.string()),
+            ("tenant_id", pyarrow.string()),
+            ("account_id", pyarrow.string()),
+            ("timestamp", pyarrow.string()),
+            ("amount", pyarrow.decimal128(38, 9)),
+            ("type", pyarrow.string()),
+            ("currency", pyarrow.string()),
+            ("product", pyarrow.string()),
+            ("reference", pyarrow.string()),
+            ("balance_snapshot", pyarrow.decimal128(38, 9)),
+            ("metadata", pyarrow.string()),
+        ])
+        self._pending: list[dict] = []
+
+    def write_rows(self, rows: list[dict]) -> None:
+        self._pending.extend(rows)
+        self.rows += len(rows)
+        if len(self._pending) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        columns = {column: [row.get(column) for row in self._pending] for column in STATEMENT_COLUMNS}
+        columns["metadata"] = [json.dumps(value) if value else None for value in columns["metadata"]]
+        for column in MONEY_COLUMNS:
+            columns[column] = [None if value is None else to_money(value) for value in columns[column]]
+        self._write_batch(self.pa.RecordBatch.from_pydict(columns, schema=self.schema))
+        self._pending = []
+
+    @abstractmethod
+    def _write_batch(self, batch) -> None:
+        """
+        Writes one record batch.
+        """
+
+    def close(self) -> None:
+        self._flush()
+
+
+class ParquetStatementWriter(_ArrowStatementWriter):
+    """
+    Writes statements as Parquet, one row group per `batch_rows` rows.
+    """
+
+    format = "parquet"
+
+    def __init__(self, stream: BinaryIO, pyarrow, compression: str = "zstd", batch_rows: int = 65_536):
+        super().__init__(stream, pyarrow, compression, batch_rows)
+        self._writer = pyarrow.parquet.ParquetWriter(stream, self.schema, compression=compression)
+
+    def _write_batch(self, batch) -> None:
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+class ArrowIpcStatementWriter(_ArrowStatementWriter):
+    """
+    Writes statements as an Arrow IPC stream with compressed buffers.
+    """
+
+    format = "arrow"
+
+    def __init__(self, stream: BinaryIO, pyarrow, compression: str = "zstd", batch_rows: int = 65_536):
+        super().__init__(stream, pyarrow, compression, batch_rows)
+        options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+        self._writer = pyarrow.ipc.new_stream(stream, self.schema, options=options)
+
+    def _write_batch(self, batch) -> None:
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+def statement_format_available(export_format: str) -> bool:
+    """
+    Whether this deployment can write a format.
+
+    Parquet and Arrow need pyarrow (pinned in requirements.txt); gzip CSV only
+    needs the standard library.
+
+    Args:
+        export_format (str): One of STATEMENT_FORMATS.
+
+    Returns:
+        bool: False when the format needs pyarrow and it is not installed.
+    """
+    if export_format not in STATEMENT_FORMATS:
+        raise ValueError(f"Unknown statement format '{export_format}'")
+    return export_format not in ("parquet", "arrow") or _load_pyarrow() is not None
+
+
+def build_statement_writer(export_format: str, stream: BinaryIO, batch_rows: int = 65_536) -> StatementWriter:
+    """
+    Builds the writer of an available format (see `statement_format_available`).
+
+    Args:
+        export_format (str): "parquet", "arrow" or "csv.gz".
+        stream (BinaryIO): Output stream.
+        batch_rows (int): Rows per Parquet row group / Arrow record batch.
+
+    Returns:
+        StatementWriter: The writer.
+    """
+    match export_format:
+        case "parquet":
+            return ParquetStatementWriter(stream, _load_pyarrow(), batch_rows=batch_rows)
+        case "arrow":
+            return ArrowIpcStatementWriter(stream, _load_pyarrow(), batch_rows=batch_rows)
+        case "csv.gz":
+            return GzipCsvStatementWriter(stream)
+
+    raise ValueError(f"Unknown statement format '{export_format}'")
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Admission:
+    """
+    Outcome of taking tokens from a bucket.
+
+    Attributes:
+        allowed (bool): Whether the tokens were taken.
+        retry_after_seconds (float): When rejected, time until enough tokens are available again.
+        remaining (float): Tokens left in the bucket after the call.
+    """
+    allowed: bool
+    retry_after_seconds: float = 0.0
+    remaining: float = 0.0
+
+
+class TokenBucketStore(ABC):
+    """
+    Keeps token buckets, one per key, refilled continuously at `rate` tokens
+    per second up to `burst` tokens.
+
+    A new key starts with a full bucket.
+    """
+
+    @abstractmethod
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Admission:
+        """
+        Takes `cost` tokens from the bucket of `key` if it holds enough of them.
+
+        Args:
+            key (str): Bucket key (e.g. the tenant).
+            rate (float): Refill rate, in tokens per second.
+            burst (float): Bucket capacity.
+            cost (float): Tokens taken by the request.
+
+        Returns:
+            Admission: Whether the tokens were taken and, if not, when to retry.
+        """
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """
+    Buckets kept in the process. Each warm Lambda container or FastAPI worker
+    enforces its own share of the quota.
+
+    A bucket is two floats; `max_keys` bounds the number of buckets by dropping
+    the ones that have refilled completely (indistinguishable from new ones).
+    """
+
+    def __init__(self, max_keys: int = 10_000, clock=time.monotonic) -> None:
+        """
+        :param max_keys: Bucket count above which full buckets are dropped.
+        :param clock: Monotonic clock in seconds. Injectable for tests.
+        """
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Admission:
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._drop_full(now, rate, burst)
+                bucket = self._buckets[key] = [burst, now]
+
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return Admission(allowed=True, remaining=bucket[0])
+
+            bucket[0] = tokens
+            return Admission(allowed=False, retry_after_seconds=(cost - tokens) / rate, remaining=tokens)
+
+    def _drop_full(self, now: float, rate: float, burst: float) -> None:
+        full_after = burst / rate
+        for key in [key for key, (_, updated_at) in self._buckets.items() if now - updated_at >= full_after]:
+            del self._buckets[key]
+
+
+# Refills and takes in one round trip. The bucket is a hash {tokens, ts} that
+# expires once it would be full again, so idle tenants cost no memory.
+_REDIS_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+def _load_redis():
+    """
+    Imports redis lazily: only the "redis" store needs it.
+    """
+    import redis
+
+    return redis
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """
+    Buckets shared by every container through Redis, so the quota holds for
+    the whole fleet rather than per process.
+
+    Refill and take run atomically in a Lua script, using the Redis clock.
+    If Redis is unreachable the request is admitted: admission control must
+    not take the service down with it.
+    """
+
+    def __init__(self, url: str, prefix: str = "account:ratelimit:", timeout_seconds: float = 0.05) -> None:
+        """
+        :param url: Redis URL, e.g. redis://localhost:6379/0.
+        :param prefix: Prefix of the bucket keys.
+        :param timeout_seconds: Connect and socket timeout of every call.
+        """
+        redis = _load_redis()
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=timeout_seconds, socket_connect_timeout=timeout_seconds
+        )
+        self._script = self._client.register_script(_REDIS_TAKE_SCRIPT)
+
+    def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Admission:
+        try:
+            allowed, tokens = self._script(keys=[self.prefix + key], args=[rate, burst, cost])
+        except Exception as error:
+            logger.warning(f"Rate limit store unavailable, admitting request for {key}: {error}")
+            return Admission(allowed=True, remaining=burst)
+
+        tokens = float(tokens)
+        if allowed:
+            return Admission(allowed=True, remaining=tokens)
+        return Admission(allowed=False, retry_after_seconds=(cost - tokens) / rate, remaining=tokens)
+
+
+def build_token_bucket_store(kind: str, redis_url: str | None = None) -> TokenBucketStore:
+    """
+    Builds the token bucket store selected by configuration.
+
+    Args:
+        kind (str): One of "memory" or "redis".
+        redis_url (Optional[str]): URL of the "redis" store.
+
+    Returns:
+        TokenBucketStore: The configured store.
+    """
+    match kind:
+        case "memory":
+            return InMemoryTokenBucketStore()
+        case "redis":
+            if not redis_url:
+                raise ValueError("The redis rate limit store requires a redis_url")
+            return RedisTokenBucketStore(redis_url)
+
+    raise ValueError(f"Unknown rate limit store '{kind}'")
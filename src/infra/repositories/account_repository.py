@@ -1,22 +1,60 @@
+import json
+import time
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
 from utilities.cross_cutting.infra.repositories.dynamodb_base_repository import DynamoDBBaseRepository
 
 from utilities.depency_injections.injection_manager import utilities_injections
-from src.domain.entity.account import Account
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
+from src.domain.entity.account import Account, AccountStatus, allowed_source_statuses
+from src.infra.clients.dynamodb_client import call_dynamodb, get_dynamodb_client
+from src.infra.repositories.base_account_repository import (
+    BaseAccountRepository,
+    DuplicateOwner,
+    StatusTransitionConflict,
+    owner_key,
+)
+from src.infra.repositories.group_commit import GroupCommitWriter
+from src.infra.repositories.parallel_scan import ParallelScanner
+
+TENANT_INDEX_NAME = "tenant_id-index"
+OWNER_TABLE_NAME = "account-owner-table"
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _to_plain(value):
+    """
+    Converts DynamoDB numbers (Decimal) back to int or float.
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
 
 @utilities_injections
-class AccountRepository(DynamoDBBaseRepository[Account]):
+class AccountRepository(DynamoDBBaseRepository[Account], BaseAccountRepository):
     """
-    Repository for managing Account entities in Firestore.
+    Repository for managing Account entities in DynamoDB (`account-table`).
 
-    Inherits all basic CRUD operations from FirestoreBaseRepository.
+    Inherits all basic CRUD operations from DynamoDBBaseRepository.
 
     Responsibilities:
     - Persist and retrieve Account entities.
-    - Map Firestore documents to the Account domain model.
-    - Provide a dedicated repository interface for the Account domain.
+    - Map DynamoDB items to the Account domain model.
+    - Implement BaseAccountRepository, the interface shared with the MongoDB
+      and Firestore backends.
+    - Keep one owner guard per tenant and owner in `account-owner-table`
+      (key `owner_key` = "<tenant_id>#<owner_id>", pointing at `account_id`),
+      written in the same `TransactWriteItems` as the account.
 
     Dependencies:
-    - Firestore (Google Cloud Firestore)
+    - Amazon DynamoDB
     - Dependency Injection via utilities_injections
 
     Usage:
@@ -29,8 +67,472 @@ class AccountRepository(DynamoDBBaseRepository[Account]):
 
     def __init__(self):
         """
-        Initializes the AccountRepository with the 'accounts' collection.
+        Initializes the AccountRepository with the 'account-table' table.
 
         Automatically injects dependencies via utilities_injections.
         """
         super().__init__(table_name="account-table", model_class=Account)
+        self.owner_table_name = OWNER_TABLE_NAME
+        self.group_commit: GroupCommitWriter | None = None
+
+    def use_group_commit(self, writer: GroupCommitWriter) -> None:
+        """
+        Sends `create` through a group-commit writer (long-running targets only).
+        """
+        writer.register_table(self.table_name, ("id",))
+        writer.register_table(self.owner_table_name, ("owner_key",))
+        self.group_commit = writer
+
+    @property
+    def client(self):
+        """
+        Low-level DynamoDB client used by the conditional and paginated operations.
+
+        This is the process-wide client tuned through `CustomConfig` (pool size,
+        timeouts, adaptive retries). Low-level clients are thread-safe, so it is
+        shared by the worker threads of a bulk transition.
+        """
+        return get_dynamodb_client()
+
+    def find_by_id(self, account_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False) -> Account | None:
+        """
+        Reads an account within a request deadline.
+
+        Same result as `get_by_id`, but the call goes through `call_dynamodb`,
+        which caps its timeouts and retries to the time left.
+
+        Eventually consistent reads cost half a read unit and may miss a write
+        made in the last second; `consistent=True` costs a full unit and
+        always sees the latest write.
+
+        Args:
+            account_id (str): The account to read.
+            deadline (Deadline): Deadline of the request.
+            consistent (bool): Whether to read with `ConsistentRead`.
+
+        Returns:
+            Optional[Account]: The account, or None if it does not exist.
+
+        Raises:
+            DeadlineExceeded: If the read cannot complete before the deadline.
+        """
+        response = call_dynamodb(
+            "get_item", deadline, TableName=self.table_name, Key={"id": _serializer.serialize(account_id)},
+            ConsistentRead=consistent,
+        )
+        item = response.get("Item")
+        return self._to_account(item) if item else None
+
+    def update(self, entity_id: str, entity: Account) -> Account | None:
+        """
+        Replaces a stored account with one unconditional `PutItem` on the shared client.
+
+        Status changes do not use it: they go through `transition_status`, which
+        checks the current status and increments `version` in the write itself.
+
+        Args:
+            entity_id (str): The account to replace.
+            entity (Account): The new state of the account.
+
+        Returns:
+            Optional[Account]: The stored account.
+        """
+        item = self._to_item(entity)
+        item["id"] = _serializer.serialize(entity_id)
+        call_dynamodb("put_item", TableName=self.table_name, Item=item)
+        return entity
+
+    def transition_status(
+        self,
+        account_id: str,
+        new_status: AccountStatus,
+        reason: str | None,
+        updated_at: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account:
+        """
+        Moves an account to `new_status` in a single conditional write.
+
+        The write only succeeds if the account exists and its current status is
+        allowed to transition to `new_status`, so no prior read is needed.
+        The account `version` is incremented atomically.
+
+        Args:
+            account_id (str): The account to transition.
+            new_status (AccountStatus): The target status.
+            reason (Optional[str]): Reason stored in `suspension_reason`.
+            updated_at (str): Value stored in `updated_at`.
+            deadline (Deadline): Deadline of the request.
+
+        Returns:
+            Account: The account after the update.
+
+        Raises:
+            StatusTransitionConflict: If the account does not exist or cannot move to `new_status`.
+            DeadlineExceeded: If the write cannot complete before the deadline.
+        """
+        sources = allowed_source_statuses(new_status)
+        source_placeholders = [f":source{index}" for index in range(len(sources))]
+        values = {
+            ":status": _serializer.serialize(new_status.value),
+            ":reason": _serializer.serialize(reason),
+            ":updated_at": _serializer.serialize(updated_at),
+            ":one": _serializer.serialize(1),
+        }
+        values.update({
+            placeholder: _serializer.serialize(source.value)
+            for placeholder, source in zip(source_placeholders, sources)
+        })
+        condition = f"attribute_exists(id) AND #status IN ({', '.join(source_placeholders)})"
+
+        try:
+            response = call_dynamodb(
+                "update_item",
+                deadline,
+                TableName=self.table_name,
+                Key={"id": _serializer.serialize(account_id)},
+                UpdateExpression="SET #status = :status, suspension_reason = :reason, updated_at = :updated_at ADD version :one",
+                ConditionExpression=condition,
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues=values,
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            item = error.response.get("Item")
+            raise StatusTransitionConflict(account_id, self._to_account(item) if item else None) from error
+
+        return self._to_account(response["Attributes"])
+
+    def get_projected(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> dict | None:
+        """
+        Reads only some attributes of an account, using a `ProjectionExpression`.
+
+        Args:
+            account_id (str): The account to read.
+            fields (list[str]): Attributes to return.
+            deadline (Deadline): Deadline of the request.
+            consistent (bool): Whether to read with `ConsistentRead`.
+
+        Returns:
+            Optional[dict]: The requested attributes, or None if the account does not exist.
+        """
+        names = {f"#f{index}": field for index, field in enumerate(fields)}
+        response = call_dynamodb(
+            "get_item",
+            deadline,
+            TableName=self.table_name,
+            Key={"id": _serializer.serialize(account_id)},
+            ProjectionExpression=", ".join(names),
+            ExpressionAttributeNames=names,
+            ConsistentRead=consistent,
+        )
+        item = response.get("Item")
+        if item is None:
+            return None
+
+        return {key: _to_plain(_deserializer.deserialize(value)) for key, value in item.items()}
+
+    def query_ids_by_tenant(
+        self,
+        tenant_id: str,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[str], str | None]:
+        """
+        Returns one page of account IDs belonging to a tenant.
+
+        Uses the `tenant_id-index` global secondary index, so the cost is
+        proportional to the tenant size rather than the table size.
+
+        Args:
+            tenant_id (str): The tenant to list.
+            cursor (Optional[str]): Cursor returned by the previous page, or None for the first page.
+            limit (int): Maximum number of IDs in the page.
+
+        Returns:
+            tuple[list[str], Optional[str]]: The page of IDs and the cursor of the next page
+            (None when the tenant is exhausted).
+        """
+        params = {
+            "TableName": self.table_name,
+            "IndexName": TENANT_INDEX_NAME,
+            "KeyConditionExpression": "tenant_id = :tenant_id",
+            "ExpressionAttributeValues": {":tenant_id": _serializer.serialize(tenant_id)},
+            "ProjectionExpression": "id",
+            "Limit": limit,
+        }
+        if cursor:
+            params["ExclusiveStartKey"] = json.loads(cursor)
+
+        response = self.client.query(**params)
+        ids = [_deserializer.deserialize(item["id"]) for item in response.get("Items", [])]
+        last_key = response.get("LastEvaluatedKey")
+
+        return ids, json.dumps(last_key) if last_key else None
+
+    def batch_get(self, account_ids: list[str]) -> list[Account]:
+        """
+        Reads many accounts with `BatchGetItem`, 100 keys per request.
+
+        Unprocessed keys (throttling) are retried with exponential backoff.
+
+        Args:
+            account_ids (list[str]): IDs to read. Missing IDs are left out of the result.
+
+        Returns:
+            list[Account]: The accounts found, in no particular order.
+        """
+        accounts = []
+        unique_ids = list(dict.fromkeys(account_ids))
+        for start in range(0, len(unique_ids), BATCH_GET_LIMIT):
+            request = {self.table_name: {"Keys": [
+                {"id": _serializer.serialize(account_id)} for account_id in unique_ids[start:start + BATCH_GET_LIMIT]
+            ]}}
+            attempt = 0
+            while request:
+                if attempt:
+                    time.sleep(min(1.0, 0.05 * 2 ** attempt))
+                response = self.client.batch_get_item(RequestItems=request)
+                accounts.extend(self._to_account(item) for item in response["Responses"].get(self.table_name, []))
+                request = response.get("UnprocessedKeys") or None
+                attempt += 1
+        return accounts
+
+    def create(self, entity: Account) -> str | None:
+        """
+        Stores a new account and claims its owner, in one `TransactWriteItems`.
+
+        The account put and the owner guard put are both conditioned on
+        `attribute_not_exists`: if the tenant already has an account for the
+        owner, nothing is written. No read or index query is needed. With a
+        group-commit writer, concurrent creations share the request.
+
+        Args:
+            entity (Account): The account, with its generated ID.
+
+        Returns:
+            Optional[str]: The ID of the stored account.
+
+        Raises:
+            DuplicateOwner: If the owner guard already exists (carries the existing account ID).
+        """
+        operations = [
+            {"Put": {
+                "TableName": self.table_name,
+                "Item": self._to_item(entity),
+                "ConditionExpression": "attribute_not_exists(id)",
+            }},
+            {"Put": {
+                "TableName": self.owner_table_name,
+                "Item": self._owner_item(entity.id, entity.tenant_id, entity.owner_id),
+                "ConditionExpression": "attribute_not_exists(owner_key)",
+                "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+            }},
+        ]
+        try:
+            if self.group_commit is None:
+                self.client.transact_write_items(TransactItems=operations)
+            else:
+                self.group_commit.transact(operations).result()
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = error.response.get("CancellationReasons") or []
+            guard = reasons[1] if len(reasons) > 1 else {}
+            if guard.get("Code") != "ConditionalCheckFailed":
+                raise
+            existing = guard.get("Item", {}).get("account_id")
+            raise DuplicateOwner(
+                entity.tenant_id, entity.owner_id, _deserializer.deserialize(existing) if existing else None
+            ) from error
+        return entity.id
+
+    def find_id_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> str | None:
+        """
+        Reads the owner guard of a tenant and owner: one `GetItem`, no scan or index query.
+
+        Args:
+            tenant_id (str): The tenant.
+            owner_id (str): The owner.
+            deadline (Deadline): Deadline of the request.
+            consistent (bool): Whether to read with `ConsistentRead`.
+
+        Returns:
+            Optional[str]: The ID of the owner's account, or None if the owner has none.
+        """
+        response = call_dynamodb(
+            "get_item", deadline, TableName=self.owner_table_name,
+            Key={"owner_key": _serializer.serialize(owner_key(tenant_id, owner_id))},
+            ProjectionExpression="account_id",
+            ConsistentRead=consistent,
+        )
+        item = response.get("Item")
+        return _deserializer.deserialize(item["account_id"]) if item else None
+
+    def claim_owner(self, account_id: str, tenant_id: str, owner_id: str) -> str | None:
+        """
+        Points the owner guard at an existing account unless it points at an older one.
+
+        Used by the backfill: when several accounts of the same owner exist,
+        the oldest (smallest ULID) keeps the guard whatever the scan order.
+
+        Args:
+            account_id (str): The account.
+            tenant_id (str): Its tenant.
+            owner_id (str): Its owner.
+
+        Returns:
+            Optional[str]: The ID of the other account of the owner that lost the guard
+            (a duplicate), or None if there is none.
+        """
+        try:
+            response = self.client.put_item(
+                TableName=self.owner_table_name,
+                Item=self._owner_item(account_id, tenant_id, owner_id),
+                ConditionExpression="attribute_not_exists(owner_key) OR account_id > :account_id",
+                ExpressionAttributeValues={":account_id": _serializer.serialize(account_id)},
+                ReturnValues="ALL_OLD",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+            previous = response.get("Attributes")
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            previous = error.response.get("Item")
+
+        other = _deserializer.deserialize(previous["account_id"]) if previous else None
+        return other if other != account_id else None
+
+    def delete(self, entity_id: str) -> None:
+        """
+        Deletes an account and releases its owner guard, when the guard points at it.
+
+        Args:
+            entity_id (str): The account to delete.
+        """
+        account = self.find_by_id(entity_id, consistent=True)
+        operations = [{"Delete": {"TableName": self.table_name, "Key": {"id": _serializer.serialize(entity_id)}}}]
+        if account is not None and self.find_id_by_owner(account.tenant_id, account.owner_id, consistent=True) == entity_id:
+            operations.append({"Delete": {
+                "TableName": self.owner_table_name,
+                "Key": {"owner_key": _serializer.serialize(owner_key(account.tenant_id, account.owner_id))},
+                "ConditionExpression": "account_id = :account_id",
+                "ExpressionAttributeValues": {":account_id": _serializer.serialize(entity_id)},
+            }})
+        self.client.transact_write_items(TransactItems=operations)
+
+    def batch_create(self, accounts: list[Account]) -> None:
+        """
+        Stores many accounts with `BatchWriteItem`, 25 items per request.
+
+        Unprocessed items (throttling) are retried with exponential backoff.
+
+        Args:
+            accounts (list[Account]): The accounts to store.
+        """
+        for start in range(0, len(accounts), BATCH_WRITE_LIMIT):
+            request = {self.table_name: [
+                {"PutRequest": {"Item": self._to_item(account)}} for account in accounts[start:start + BATCH_WRITE_LIMIT]
+            ]}
+            attempt = 0
+            while request:
+                if attempt:
+                    time.sleep(min(1.0, 0.05 * 2 ** attempt))
+                response = self.client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or None
+                attempt += 1
+
+    def parallel_scan(self, total_segments: int = 8, **options) -> ParallelScanner:
+        """
+        Returns a parallel segmented scan over the whole account table.
+
+        Used by whole-table jobs (audits, exports, backfills, migrations). See
+        `ParallelScanner` for the available options (rate limit, checkpoint,
+        projection, filter).
+
+        Args:
+            total_segments (int): Number of segments scanned concurrently.
+            **options: Keyword arguments forwarded to `ParallelScanner`.
+
+        Returns:
+            ParallelScanner: The scanner. Iterate `items()` or `pages()` to run it.
+        """
+        return ParallelScanner(self.client, self.table_name, total_segments=total_segments, **options)
+
+    def rewrite_timestamps(self, account_id: str, expected: dict, replacement: dict) -> bool:
+        """
+        Rewrites the timestamp attributes of an account if they still hold the expected values.
+
+        Used by the timestamp migration: the condition makes the rewrite a no-op
+        when the account was updated concurrently (it then already carries a
+        canonical `updated_at`).
+
+        Args:
+            account_id (str): The account to rewrite.
+            expected (dict): Current values, e.g. {"created_at": "11-06-2025 14:30:00"}.
+            replacement (dict): New values for the same attributes.
+
+        Returns:
+            bool: Whether the item was rewritten.
+        """
+        names, values, assignments, conditions = {}, {}, [], []
+        for index, (field, new_value) in enumerate(replacement.items()):
+            names[f"#f{index}"] = field
+            values[f":new{index}"] = _serializer.serialize(new_value)
+            old_value = expected[field]
+            values[f":old{index}"] = _serializer.serialize(
+                Decimal(str(old_value)) if isinstance(old_value, float) else old_value
+            )
+            assignments.append(f"#f{index} = :new{index}")
+            conditions.append(f"#f{index} = :old{index}")
+
+        try:
+            self.client.update_item(
+                TableName=self.table_name,
+                Key={"id": _serializer.serialize(account_id)},
+                UpdateExpression=f"SET {', '.join(assignments)}",
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            return False
+        return True
+
+    @staticmethod
+    def _to_item(account: Account) -> dict:
+        """
+        Maps an Account to a low-level DynamoDB item (null attributes left out).
+        """
+        return {
+            key: _serializer.serialize(value)
+            for key, value in account.model_dump(mode="json").items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _owner_item(account_id: str, tenant_id: str, owner_id: str) -> dict:
+        """
+        Builds the owner guard item of an account.
+        """
+        return {
+            "owner_key": _serializer.serialize(owner_key(tenant_id, owner_id)),
+            "account_id": _serializer.serialize(account_id),
+            "tenant_id": _serializer.serialize(tenant_id),
+            "owner_id": _serializer.serialize(owner_id),
+        }
+
+    def _to_account(self, item: dict) -> Account:
+        """
+        Maps a low-level DynamoDB item to the Account domain model.
+        """
+        return Account(**{key: _deserializer.deserialize(value) for key, value in item.items()})
@@ -0,0 +1,49 @@
+from src.infra.repositories.base_account_repository import BaseAccountRepository
+
+
+def build_account_repository(
+    kind: str,
+    mongodb_uri: str | None = None,
+    mongodb_database: str = "account",
+    firestore_project: str | None = None,
+    firestore_database: str | None = None,
+) -> BaseAccountRepository:
+    """
+    Builds the account repository of the backend selected by configuration.
+
+    `TARGET=cloudfunction` deployments on GCP use "firestore" or "mongodb" to
+    keep account reads and writes in the same cloud as the function.
+
+    Args:
+        kind (str): One of "dynamodb", "mongodb", "firestore" or "memory".
+        mongodb_uri (Optional[str]): Connection string of the "mongodb" backend.
+        mongodb_database (str): Database of the "mongodb" backend.
+        firestore_project (Optional[str]): GCP project of the "firestore" backend (defaults to the environment).
+        firestore_database (Optional[str]): Firestore database (defaults to "(default)").
+
+    Returns:
+        BaseAccountRepository: The configured repository.
+    """
+    match kind:
+        case "dynamodb":
+            from src.infra.repositories.account_repository import AccountRepository
+
+            return AccountRepository()
+        case "mongodb":
+            from src.infra.repositories.mongo_account_repository import MongoAccountRepository
+
+            if not mongodb_uri:
+                raise ValueError("The mongodb account repository requires a mongodb_uri")
+            repository = MongoAccountRepository.from_uri(mongodb_uri, database=mongodb_database)
+            repository.ensure_indexes()
+            return repository
+        case "firestore":
+            from src.infra.repositories.firestore_account_repository import FirestoreAccountRepository
+
+            return FirestoreAccountRepository.from_project(firestore_project, database=firestore_database)
+        case "memory":
+            from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+            return InMemoryAccountRepository()
+
+    raise ValueError(f"Unknown account repository backend '{kind}'")
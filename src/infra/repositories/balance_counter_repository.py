@@ -0,0 +1,164 @@
+from decimal import Decimal
+
+from botocore.exceptions import ClientError
+
+from src.domain.entity.account_balance import UNSHARDED, BalanceLayout
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.repositories.dynamodb_items import deserialize_item, serialize_value
+
+BATCH_GET_LIMIT = 100
+
+
+def counter_key(account_id: str, shard: int) -> str:
+    """
+    Partition key of one balance counter: the account ID for shard 0, "<account_id>#<shard>" otherwise.
+    """
+    return account_id if shard == 0 else f"{account_id}#{shard}"
+
+
+class BalanceCounterRepository:
+    """
+    Repository for the balance counters stored in `account-balance-table`.
+
+    The table is keyed by `counter_key` (partition) only, so every shard of a
+    hot account is a separate partition key and gets its own write throughput.
+    Shard 0 (key = account ID) also holds the `BalanceLayout` of the account.
+
+    Counters are maintained with atomic `ADD` expressions written in the same
+    `TransactWriteItems` call as the transaction, like the daily rollups.
+
+    Usage:
+        repository = BalanceCounterRepository()
+        operation = repository.increment_operation(account_id, shard=3, delta=-12.5)
+        counters = repository.get_counters(account_id, shard_count=8)
+    """
+
+    def __init__(self, table_name: str = "account-balance-table"):
+        """
+        Initializes the repository with the balance table.
+        """
+        self.table_name = table_name
+
+    @property
+    def client(self):
+        """
+        The process-wide DynamoDB client.
+        """
+        return get_dynamodb_client()
+
+    def increment_operation(self, account_id: str, shard: int, delta: Decimal) -> dict:
+        """
+        Builds the `Update` operation adding `delta` to one counter of an account.
+
+        Args:
+            account_id (str): The account.
+            shard (int): The counter written.
+            delta (Decimal): Signed amount (credits positive, debits negative).
+
+        Returns:
+            dict: A `TransactWriteItems` operation.
+        """
+        return {
+            "Update": {
+                "TableName": self.table_name,
+                "Key": {"counter_key": serialize_value(counter_key(account_id, shard))},
+                "UpdateExpression": "SET account_id = :account_id ADD balance :delta",
+                "ExpressionAttributeValues": {
+                    ":account_id": serialize_value(account_id),
+                    ":delta": serialize_value(delta),
+                },
+            }
+        }
+
+    def get_layout(self, account_id: str) -> BalanceLayout:
+        """
+        Reads the layout of an account from its shard 0 counter.
+
+        Returns:
+            BalanceLayout: The stored layout, or an unsharded one.
+        """
+        response = self.client.get_item(
+            TableName=self.table_name,
+            Key={"counter_key": serialize_value(account_id)},
+            ProjectionExpression="write_shards, read_shards",
+        )
+        return self._to_layout(deserialize_item(response["Item"]) if "Item" in response else {})
+
+    def get_counters(self, account_id: str, shard_count: int) -> tuple[BalanceLayout, dict[int, Decimal]]:
+        """
+        Reads the first `shard_count` counters of an account with `BatchGetItem`.
+
+        Reads are eventually consistent: the balance is cached briefly anyway.
+
+        Args:
+            account_id (str): The account.
+            shard_count (int): Number of counters to read.
+
+        Returns:
+            tuple[BalanceLayout, dict[int, Decimal]]: The layout stored on shard 0
+            and the balance of every existing counter, by shard.
+        """
+        shards = {counter_key(account_id, shard): shard for shard in range(shard_count)}
+        keys = list(shards)
+        layout, counters = UNSHARDED, {}
+        for start in range(0, len(keys), BATCH_GET_LIMIT):
+            request = {self.table_name: {"Keys": [{"counter_key": serialize_value(key)} for key in keys[start:start + BATCH_GET_LIMIT]]}}
+            while request:
+                response = self.client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    values = deserialize_item(item)
+                    shard = shards[values["counter_key"]]
+                    counters[shard] = values.get("balance", Decimal(0))
+                    if shard == 0:
+                        layout = self._to_layout(values)
+                request = response.get("UnprocessedKeys") or None
+        return layout, counters
+
+    def set_write_shards(self, account_id: str, write_shards: int) -> BalanceLayout:
+        """
+        Promotes or demotes an account.
+
+        `read_shards` only grows: a promotion raises it together with
+        `write_shards` in one update, so no reader can miss a new shard; a
+        demotion lowers `write_shards` only.
+
+        Args:
+            account_id (str): The account.
+            write_shards (int): New number of counters written.
+
+        Returns:
+            BalanceLayout: The layout after the update.
+        """
+        key = {"counter_key": serialize_value(account_id)}
+        try:
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key=key,
+                UpdateExpression="SET account_id = :account_id, write_shards = :shards, read_shards = :shards",
+                ConditionExpression="attribute_not_exists(read_shards) OR read_shards <= :shards",
+                ExpressionAttributeValues={
+                    ":account_id": serialize_value(account_id),
+                    ":shards": serialize_value(write_shards),
+                },
+                ReturnValues="ALL_NEW",
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key=key,
+                UpdateExpression="SET write_shards = :shards",
+                ExpressionAttributeValues={":shards": serialize_value(write_shards)},
+                ReturnValues="ALL_NEW",
+            )
+        return self._to_layout(deserialize_item(response["Attributes"]))
+
+    @staticmethod
+    def _to_layout(values: dict) -> BalanceLayout:
+        """
+        Maps the layout attributes of a shard 0 counter to a BalanceLayout.
+        """
+        if "read_shards" not in values:
+            return UNSHARDED
+        return BalanceLayout(write_shards=int(values["write_shards"]), read_shards=int(values["read_shards"]))
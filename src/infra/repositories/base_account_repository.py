@@ -0,0 +1,151 @@
+from abc import ABC, abstractmethod
+
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
+from src.domain.entity.account import Account, AccountStatus
+
+
+class StatusTransitionConflict(Exception):
+    """
+    Raised when a conditional status transition is rejected by the backend.
+
+    Attributes:
+        current (Optional[Account]): The account as stored when the condition failed,
+            or None if the account does not exist.
+    """
+
+    def __init__(self, account_id: str, current: Account | None):
+        self.current = current
+        super().__init__(f"Conditional status transition rejected for account {account_id}")
+
+
+class DuplicateOwner(Exception):
+    """
+    Raised when an account is created for a tenant and owner that already have one.
+
+    Attributes:
+        tenant_id (str): The tenant.
+        owner_id (str): The owner.
+        account_id (Optional[str]): The account the owner already has, when the backend reports it.
+    """
+
+    def __init__(self, tenant_id: str, owner_id: str, account_id: str | None):
+        self.tenant_id = tenant_id
+        self.owner_id = owner_id
+        self.account_id = account_id
+        super().__init__(f"Owner {owner_id} already has account {account_id} in tenant {tenant_id}")
+
+
+def owner_key(tenant_id: str, owner_id: str) -> str:
+    """
+    Key of the owner guard of an account: one per tenant and owner.
+    """
+    return f"{tenant_id}#{owner_id}"
+
+
+class BaseAccountRepository(ABC):
+    """
+    Storage of Account entities, independent of the backend.
+
+    Implemented by DynamoDB (`AccountRepository`), MongoDB, Firestore and an
+    in-memory store; `build_account_repository` picks one from `CustomConfig`.
+    Every implementation passes the same conformance suite
+    (`tests/repository/test_account_repository_conformance.py`):
+
+    - `transition_status` is a single conditional write: it only applies when
+      the stored status may move to the target, and increments `version`.
+    - `query_ids_by_tenant` pages by account ID with an opaque cursor.
+    - `batch_get` / `batch_create` use the backend's batch primitives and
+      split requests above its batch limit.
+    - Calls taking a `deadline` cap their timeouts to it and raise
+      DeadlineExceeded when it is reached.
+    - Single-account reads are eventually consistent unless `consistent=True`
+      (backends without cheaper stale reads are always consistent).
+    - A tenant has at most one account per owner: `create` checks it in the
+      same atomic write that stores the account (a guard item or a unique
+      index), and `find_id_by_owner` reads it without scanning. Owners are
+      fixed at creation; `delete` releases the owner. `batch_create` is for
+      bulk loads and does not check it (see `scripts/backfill_owner_guards.py`).
+    """
+
+    @abstractmethod
+    def create(self, entity: Account) -> str | None:
+        """
+        Stores a new account. Returns its ID, or None if it could not be stored.
+
+        Raises:
+            DuplicateOwner: If the tenant already has an account for the owner.
+        """
+
+    @abstractmethod
+    def get_by_id(self, entity_id: str) -> Account | None:
+        """
+        Reads an account, or None if it does not exist.
+        """
+
+    @abstractmethod
+    def update(self, entity_id: str, entity: Account) -> Account | None:
+        """
+        Replaces a stored account. Returns the stored account.
+        """
+
+    @abstractmethod
+    def delete(self, entity_id: str) -> None:
+        """
+        Deletes an account.
+        """
+
+    @abstractmethod
+    def find_by_id(self, account_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False) -> Account | None:
+        """
+        Reads an account within a request deadline, strongly consistent when `consistent`.
+        """
+
+    @abstractmethod
+    def find_id_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> str | None:
+        """
+        Returns the ID of the account of an owner in a tenant, or None if it has none.
+        """
+
+    @abstractmethod
+    def get_projected(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> dict | None:
+        """
+        Reads only some attributes of an account, or None if it does not exist.
+        """
+
+    @abstractmethod
+    def transition_status(
+        self,
+        account_id: str,
+        new_status: AccountStatus,
+        reason: str | None,
+        updated_at: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account:
+        """
+        Moves an account to `new_status` in a single conditional write and increments `version`.
+
+        Raises:
+            StatusTransitionConflict: If the account does not exist or cannot move to `new_status`.
+        """
+
+    @abstractmethod
+    def query_ids_by_tenant(self, tenant_id: str, cursor: str | None = None, limit: int = 100) -> tuple[list[str], str | None]:
+        """
+        Returns one page of account IDs of a tenant and the cursor of the next page (None when exhausted).
+        """
+
+    @abstractmethod
+    def batch_get(self, account_ids: list[str]) -> list[Account]:
+        """
+        Reads many accounts. Missing IDs are left out; the order is not guaranteed.
+        """
+
+    @abstractmethod
+    def batch_create(self, accounts: list[Account]) -> None:
+        """
+        Stores many new accounts.
+        """
@@ -0,0 +1,25 @@
+from utilities.cross_cutting.infra.repositories.dynamodb_base_repository import DynamoDBBaseRepository
+
+from utilities.depency_injections.injection_manager import utilities_injections
+from src.domain.entity.bulk_status_job import BulkStatusJob
+
+@utilities_injections
+class BulkStatusJobRepository(DynamoDBBaseRepository[BulkStatusJob]):
+    """
+    Repository for persisting BulkStatusJob checkpoints in DynamoDB.
+
+    Each bulk status transition stores its progress here after every page,
+    allowing a timed-out invocation to resume from the last checkpoint.
+
+    Usage:
+        job_repo = BulkStatusJobRepository()
+        job_repo.create(job)
+        job_repo.update(job.id, job)
+        job = job_repo.get_by_id(job_id)
+    """
+
+    def __init__(self):
+        """
+        Initializes the BulkStatusJobRepository with the 'account-bulk-job-table' table.
+        """
+        super().__init__(table_name="account-bulk-job-table", model_class=BulkStatusJob)
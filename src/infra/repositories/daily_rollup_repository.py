@@ -0,0 +1,193 @@
+from collections.abc import Iterable
+
+from src.domain.entity.daily_rollup import DailyRollup, rollup_key
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.repositories.dynamodb_items import deserialize_item, serialize_item, serialize_value
+from src.infra.repositories.key_sharding import KeySharding
+
+
+class DailyRollupRepository:
+    """
+    Repository for DailyRollup items stored in `account-rollup-table`.
+
+    The table is keyed by `account_id` (partition) and `rollup_key`
+    ("YYYY-MM-DD#PRODUCT", sort), so the rollups of an account for a range of
+    days are a single `BETWEEN` query.
+
+    Every transaction of an account adds to the same rollup item of its day
+    and product, so a busy account makes that item as hot as its balance
+    counter. With `shard_count` > 1 the increments are write-sharded
+    (`KeySharding` on the sort key): a transaction adds to
+    "YYYY-MM-DD#PRODUCT#<shard>", the shard being a hash of its ID. The shards
+    of a day sort next to each other, so reads keep the single `BETWEEN`
+    query and sum the shards (`sum_shards`). Items written before sharding
+    was enabled, or by the rebuild job, keep the unsuffixed key and are
+    summed along with them.
+
+    Usage:
+        repository = DailyRollupRepository(shard_count=8)
+        operation = repository.increment_operation(entry)  # for TransactWriteItems
+        rollups = repository.query(account_id, "2025-06-01", "2025-06-30")
+    """
+
+    def __init__(self, table_name: str = "account-rollup-table", shard_count: int = 1):
+        """
+        Initializes the repository with the rollup table.
+
+        Args:
+            table_name (str): The rollup table.
+            shard_count (int): Write shards of each rollup. 1 disables sharding.
+        """
+        self.table_name = table_name
+        self.sharding = KeySharding(shard_count)
+
+    @property
+    def client(self):
+        """
+        The process-wide DynamoDB client.
+        """
+        return get_dynamodb_client()
+
+    def increment_operation(self, entry: TransactionEntry) -> dict:
+        """
+        Builds the `Update` operation adding one transaction to its rollup.
+
+        Meant to be written in the same `TransactWriteItems` call as the
+        transaction itself, so a retried (duplicate) transaction is never
+        counted twice. The item is the write shard of the transaction.
+
+        Args:
+            entry (TransactionEntry): The ingested transaction.
+
+        Returns:
+            dict: A `TransactWriteItems` operation.
+        """
+        amount_field, count_field = (
+            ("credits", "credit_count") if entry.type == TransactionType.CREDIT else ("debits", "debit_count")
+        )
+        day = entry.timestamp[:10]
+        return {
+            "Update": {
+                "TableName": self.table_name,
+                "Key": {
+                    "account_id": serialize_value(entry.account_id),
+                    "rollup_key": serialize_value(self.sharding.partition_key(rollup_key(day, entry.product), entry.id)),
+                },
+                "UpdateExpression": (
+                    f"SET tenant_id = :tenant_id, #day = :day, #product = :product "
+                    f"ADD {amount_field} :amount, {count_field} :one"
+                ),
+                "ExpressionAttributeNames": {"#day": "day", "#product": "product"},
+                "ExpressionAttributeValues": {
+                    ":tenant_id": serialize_value(entry.tenant_id),
+                    ":day": serialize_value(day),
+                    ":product": serialize_value(entry.product),
+                    ":amount": serialize_value(entry.amount),
+                    ":one": serialize_value(1),
+                },
+            }
+        }
+
+    def query(self, account_id: str, first_day: str, last_day: str, product: str | None = None) -> list[DailyRollup]:
+        """
+        Returns the rollups of an account for a range of days, their shards summed.
+
+        Args:
+            account_id (str): The account.
+            first_day (str): First day, inclusive ("YYYY-MM-DD").
+            last_day (str): Last day, inclusive ("YYYY-MM-DD").
+            product (Optional[str]): Only rollups of this product.
+
+        Returns:
+            list[DailyRollup]: Rollups ordered by day, then product.
+        """
+        params = {
+            "TableName": self.table_name,
+            "KeyConditionExpression": "account_id = :account_id AND rollup_key BETWEEN :first AND :last",
+            "ExpressionAttributeValues": {
+                ":account_id": serialize_value(account_id),
+                ":first": serialize_value(f"{first_day}#"),
+                ":last": serialize_value(f"{last_day}#\uffff"),
+            },
+        }
+        if product is not None:
+            params["FilterExpression"] = "#product = :product"
+            params["ExpressionAttributeNames"] = {"#product": "product"}
+            params["ExpressionAttributeValues"][":product"] = serialize_value(product)
+
+        rollups = []
+        paginator = self.client.get_paginator("query")
+        for page in paginator.paginate(**params):
+            rollups.extend(self._to_rollup(item) for item in page.get("Items", []))
+        return sum_shards(rollups)
+
+    def put(self, rollup: DailyRollup) -> None:
+        """
+        Overwrites a rollup, replacing all of its shards. Used by the rebuild job.
+
+        The rollup is written under its unsuffixed key and its shards are
+        deleted in the same transaction, so a read never sums both.
+        """
+        item = rollup.model_dump()
+        item["rollup_key"] = rollup.rollup_key
+        put = {"Put": {"TableName": self.table_name, "Item": serialize_item(item)}}
+        if not self.sharding.enabled:
+            self.client.put_item(**put["Put"])
+            return
+        self.client.transact_write_items(
+            TransactItems=[put, *self._shard_deletes(rollup.account_id, rollup.day, rollup.product)]
+        )
+
+    def delete(self, account_id: str, day: str, product: str) -> None:
+        """
+        Deletes a rollup, and all of its shards, that no longer has transactions. Used by the rebuild job.
+        """
+        key = {"account_id": serialize_value(account_id), "rollup_key": serialize_value(rollup_key(day, product))}
+        if not self.sharding.enabled:
+            self.client.delete_item(TableName=self.table_name, Key=key)
+            return
+        self.client.transact_write_items(TransactItems=[
+            {"Delete": {"TableName": self.table_name, "Key": key}},
+            *self._shard_deletes(account_id, day, product),
+        ])
+
+    def _shard_deletes(self, account_id: str, day: str, product: str) -> list[dict]:
+        """
+        Builds the `Delete` operations of every write shard of a rollup.
+        """
+        return [
+            {"Delete": {"TableName": self.table_name, "Key": {
+                "account_id": serialize_value(account_id), "rollup_key": serialize_value(shard_key),
+            }}}
+            for shard_key in self.sharding.partition_keys(rollup_key(day, product))
+        ]
+
+    @staticmethod
+    def _to_rollup(item: dict) -> DailyRollup:
+        """
+        Maps a low-level DynamoDB item to the DailyRollup model.
+        """
+        values = deserialize_item(item)
+        values.pop("rollup_key", None)
+        return DailyRollup(**values)
+
+
+def sum_shards(rollups: Iterable[DailyRollup]) -> list[DailyRollup]:
+    """
+    Sums the shards of each account, day and product into one rollup.
+
+    Args:
+        rollups (Iterable[DailyRollup]): Rollup items, shards included, in any order.
+
+    Returns:
+        list[DailyRollup]: One rollup per account, day and product, ordered by day, then product.
+    """
+    summed: dict[tuple[str, str, str], DailyRollup] = {}
+    for rollup in rollups:
+        key = (rollup.account_id, rollup.day, rollup.product)
+        if key in summed:
+            summed[key].merge(rollup)
+        else:
+            summed[key] = rollup
+    return sorted(summed.values(), key=lambda rollup: (rollup.day, rollup.product))
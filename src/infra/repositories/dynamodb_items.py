@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from src.domain.entity.money import MONEY_FIELDS
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def to_plain(value):
+    """
+    Converts DynamoDB numbers (Decimal) back to int or float, recursively.
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {key: to_plain(inner) for key, inner in value.items()}
+    if isinstance(value, (list, set)):
+        return [to_plain(inner) for inner in value]
+    return value
+
+
+def to_dynamodb(value):
+    """
+    Converts floats to Decimal, recursively, so values can be serialized.
+    """
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: to_dynamodb(inner) for key, inner in value.items()}
+    if isinstance(value, list):
+        return [to_dynamodb(inner) for inner in value]
+    return value
+
+
+def deserialize_item(item: dict) -> dict:
+    """
+    Maps a low-level DynamoDB item to plain Python values. Money attributes stay Decimal.
+    """
+    return {
+        key: value if key in MONEY_FIELDS else to_plain(value)
+        for key, value in ((key, _deserializer.deserialize(value)) for key, value in item.items())
+    }
+
+
+def serialize_item(item: dict) -> dict:
+    """
+    Maps plain Python values to a low-level DynamoDB item. None values are dropped.
+    """
+    return {key: _serializer.serialize(to_dynamodb(value)) for key, value in item.items() if value is not None}
+
+
+def serialize_value(value) -> dict:
+    """
+    Maps one plain Python value to a low-level DynamoDB attribute value.
+    """
+    return _serializer.serialize(to_dynamodb(value))
@@ -0,0 +1,223 @@
+import logging
+from urllib.parse import quote
+
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline, DeadlineExceeded
+from src.domain.entity.account import Account, AccountStatus, allowed_source_statuses
+from src.infra.repositories.base_account_repository import (
+    BaseAccountRepository,
+    DuplicateOwner,
+    StatusTransitionConflict,
+    owner_key,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_WRITE_LIMIT = 500
+TRANSITION_MAX_ATTEMPTS = 5
+
+
+def _load_firestore():
+    """
+    Imports the Firestore client lazily: only the "firestore" backend needs it.
+    """
+    from google.api_core import exceptions
+    from google.cloud import firestore
+    from google.cloud.firestore_v1.base_query import FieldFilter
+
+    return firestore, exceptions, FieldFilter
+
+
+class FirestoreAccountRepository(BaseAccountRepository):
+    """
+    Account storage in a Firestore collection (`accounts` by default).
+
+    Documents are keyed by account ID. Tenant pages are a `tenant_id ==`
+    query ordered by document ID (single-field index, created by default).
+
+    - `transition_status` reads the document and writes it back with a
+      `last_update_time` precondition: the write only applies if nothing changed
+      since the read, which together with the status check gives the semantics
+      of the DynamoDB conditional write. Concurrent writers are retried.
+    - Calls taking a bounded deadline pass `timeout=` the time left and, when
+      it is short, disable the client-side retries.
+    - Document reads are always strongly consistent: `consistent` is accepted and ignored.
+    - Owner uniqueness: every account has a guard document in
+      `<collection>_owners`, keyed by tenant and owner, created in the same
+      batch as the account. Batches are atomic and `create` fails on an
+      existing document, so a second account of the owner is never stored.
+
+    Usage:
+        repository = FirestoreAccountRepository.from_project("my-project")
+    """
+
+    def __init__(self, client, collection: str = "accounts") -> None:
+        """
+        :param client: A `google.cloud.firestore.Client` (or a compatible fake).
+        :param collection: Name of the accounts collection.
+        """
+        self.client = client
+        self.collection = client.collection(collection)
+        self.owners = client.collection(f"{collection}_owners")
+
+    def _owner_document(self, tenant_id: str, owner_id: str):
+        """
+        Guard document of an owner. Document IDs cannot contain "/", so the key is percent-encoded.
+        """
+        return self.owners.document(quote(owner_key(tenant_id, owner_id), safe=""))
+
+    @classmethod
+    def from_project(cls, project: str | None = None, database: str | None = None, collection: str = "accounts") -> "FirestoreAccountRepository":
+        """
+        Builds the repository on a new Firestore client. Honours FIRESTORE_EMULATOR_HOST.
+        """
+        firestore, _, _ = _load_firestore()
+        return cls(firestore.Client(project=project, database=database), collection)
+
+    @staticmethod
+    def _options(deadline: Deadline) -> dict:
+        """
+        Per-call `timeout`/`retry` arguments for a deadline.
+        """
+        if not deadline.bounded:
+            return {}
+        options = {"timeout": deadline.remaining()}
+        if deadline.is_short:
+            options["retry"] = None
+        return options
+
+    def _call(self, deadline: Deadline, operation: str, method, *args, **kwargs):
+        """
+        Runs one Firestore call within a deadline.
+        """
+        deadline.check(operation)
+        _, exceptions, _ = _load_firestore()
+        try:
+            return method(*args, **kwargs, **self._options(deadline))
+        except exceptions.DeadlineExceeded as error:
+            if deadline.bounded:
+                raise DeadlineExceeded(operation, deadline.remaining()) from error
+            raise
+
+    @staticmethod
+    def _to_account(snapshot) -> Account:
+        return Account(**{**snapshot.to_dict(), "id": snapshot.id})
+
+    def create(self, entity: Account) -> str | None:
+        _, exceptions, _ = _load_firestore()
+        batch = self.client.batch()
+        batch.create(self.collection.document(entity.id), entity.model_dump(mode="json"))
+        batch.create(
+            self._owner_document(entity.tenant_id, entity.owner_id),
+            {"account_id": entity.id, "tenant_id": entity.tenant_id, "owner_id": entity.owner_id},
+        )
+        try:
+            batch.commit()
+        except exceptions.AlreadyExists:
+            existing = self.find_id_by_owner(entity.tenant_id, entity.owner_id)
+            if existing is None or existing == entity.id:
+                raise
+            raise DuplicateOwner(entity.tenant_id, entity.owner_id, existing) from None
+        return entity.id
+
+    def get_by_id(self, entity_id: str) -> Account | None:
+        return self.find_by_id(entity_id)
+
+    def update(self, entity_id: str, entity: Account) -> Account | None:
+        self.collection.document(entity_id).set({**entity.model_dump(mode="json"), "id": entity_id})
+        return entity
+
+    def delete(self, entity_id: str) -> None:
+        account = self.find_by_id(entity_id)
+        batch = self.client.batch()
+        batch.delete(self.collection.document(entity_id))
+        if account is not None and self.find_id_by_owner(account.tenant_id, account.owner_id) == entity_id:
+            batch.delete(self._owner_document(account.tenant_id, account.owner_id))
+        batch.commit()
+
+    def find_by_id(self, account_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False) -> Account | None:
+        snapshot = self._call(deadline, "get account", self.collection.document(account_id).get)
+        return self._to_account(snapshot) if snapshot.exists else None
+
+    def find_id_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> str | None:
+        snapshot = self._call(deadline, "get account by owner", self._owner_document(tenant_id, owner_id).get)
+        return (snapshot.to_dict() or {}).get("account_id") if snapshot.exists else None
+
+    def get_projected(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> dict | None:
+        snapshot = self._call(
+            deadline, "get account", self.collection.document(account_id).get, field_paths=[field for field in fields if field != "id"]
+        )
+        if not snapshot.exists:
+            return None
+
+        item = snapshot.to_dict() or {}
+        if "id" in fields:
+            item["id"] = snapshot.id
+        return item
+
+    def transition_status(
+        self,
+        account_id: str,
+        new_status: AccountStatus,
+        reason: str | None,
+        updated_at: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account:
+        _, exceptions, _ = _load_firestore()
+        document = self.collection.document(account_id)
+        sources = allowed_source_statuses(new_status)
+
+        for attempt in range(TRANSITION_MAX_ATTEMPTS):
+            snapshot = self._call(deadline, "transition account status", document.get)
+            current = self._to_account(snapshot) if snapshot.exists else None
+            if current is None or current.status not in sources:
+                raise StatusTransitionConflict(account_id, current)
+
+            changes = {
+                "status": new_status.value,
+                "suspension_reason": reason,
+                "updated_at": updated_at,
+                "version": current.version + 1,
+            }
+            try:
+                self._call(
+                    deadline, "transition account status", document.update, changes,
+                    option=self.client.write_option(last_update_time=snapshot.update_time),
+                )
+            except exceptions.FailedPrecondition:
+                logger.info(f"Concurrent update of account {account_id}, retrying transition (attempt {attempt + 1})")
+                continue
+
+            return current.model_copy(update={**changes, "status": new_status})
+
+        raise StatusTransitionConflict(account_id, self.find_by_id(account_id, deadline))
+
+    def query_ids_by_tenant(self, tenant_id: str, cursor: str | None = None, limit: int = 100) -> tuple[list[str], str | None]:
+        _, _, FieldFilter = _load_firestore()
+        query = (
+            self.collection.where(filter=FieldFilter("tenant_id", "==", tenant_id))
+            .order_by("__name__")
+            .select([])
+            .limit(limit + 1)
+        )
+        if cursor:
+            query = query.start_after({"__name__": cursor})
+
+        # One extra document tells whether another page exists.
+        ids = [snapshot.id for snapshot in query.stream()]
+        page = ids[:limit]
+        return page, page[-1] if len(ids) > limit else None
+
+    def batch_get(self, account_ids: list[str]) -> list[Account]:
+        references = [self.collection.document(account_id) for account_id in dict.fromkeys(account_ids)]
+        return [self._to_account(snapshot) for snapshot in self.client.get_all(references) if snapshot.exists]
+
+    def batch_create(self, accounts: list[Account]) -> None:
+        for start in range(0, len(accounts), BATCH_WRITE_LIMIT):
+            batch = self.client.batch()
+            for account in accounts[start:start + BATCH_WRITE_LIMIT]:
+                batch.create(self.collection.document(account.id), account.model_dump(mode="json"))
+            batch.commit()
@@ -0,0 +1,331 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from botocore.exceptions import ClientError
+
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+
+logger = logging.getLogger(__name__)
+
+TRANSACT_WRITE_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+RETRYABLE_CANCELLATION_CODES = frozenset({"TransactionConflict", "ThrottlingError", "ProvisionedThroughputExceeded"})
+
+
+@dataclass(slots=True)
+class _Write:
+    """
+    One caller's write: operations applied atomically ("transact") or one item ("put").
+    """
+    kind: str
+    operations: list[dict]
+    keys: frozenset
+    enqueued_at: float
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+
+
+class GroupCommitWriter:
+    """
+    Group commit of concurrent DynamoDB writes for long-running processes.
+
+    Under the FastAPI target many requests write at the same time, each with
+    its own round trip. While a batch is in flight, the writer collects the
+    next writes for up to `max_delay_ms` (or until `max_batch_items`
+    operations are pending) and sends them together, with up to
+    `max_in_flight` requests at once. A write arriving when nothing is in
+    flight is sent right away, so an idle process adds no delay:
+
+    - `transact(operations)`: operations that must apply atomically (e.g. a
+      transaction, its rollup and its balance counter), packed with other
+      callers' into one `TransactWriteItems` (up to 100 items).
+    - `put(table_name, item)`: unconditional puts, packed into `BatchWriteItem`
+      (up to 25 items).
+
+    Every caller gets a Future resolved with its own outcome: None when
+    applied, or the `ClientError` a single call would have raised. A
+    cancelled `TransactWriteItems` is settled per caller from its
+    `CancellationReasons`: writes whose own condition failed get a
+    `TransactionCanceledException` carrying only their reasons, writes that
+    were only cancelled alongside them are sent again. Unprocessed batch
+    items and transient cancellations (conflicts, throttling) are retried
+    with exponential backoff, up to `max_attempts`.
+
+    Two operations on the same item cannot share a `TransactWriteItems` or a
+    `BatchWriteItem`, so a write touching an item already taken by the batch
+    being formed waits for the next one (e.g. two transactions of the same
+    account, day and product updating the same rollup). `Put` operations are
+    keyed with the key attributes of their table (`register_table`).
+
+    Not meant for Lambda: a single request per container would only pay the
+    collection delay.
+
+    Usage:
+        writer = GroupCommitWriter(max_delay_ms=5, max_batch_items=100)
+        writer.register_table("account-transaction-table", ("id",))
+        writer.transact([put, rollup_update]).result()
+        writer.close()
+    """
+
+    def __init__(
+        self,
+        max_delay_ms: float = 5.0,
+        max_batch_items: int = TRANSACT_WRITE_LIMIT,
+        max_in_flight: int = 4,
+        max_attempts: int = 5,
+        client_factory=get_dynamodb_client,
+        clock=time.monotonic,
+    ) -> None:
+        """
+        Initializes the writer and starts its collector thread.
+
+        :param max_delay_ms: Longest time the first write of a batch waits for others while a batch is in flight.
+        :param max_batch_items: Pending operations that trigger a flush without waiting (capped per API).
+        :param max_in_flight: Batches sent concurrently.
+        :param max_attempts: Attempts of a write before its last error is returned.
+        :param client_factory: Returns the DynamoDB client. Injectable for tests and benchmarks.
+        :param clock: Monotonic clock in seconds.
+        """
+        if max_batch_items < 1:
+            raise ValueError("max_batch_items must be at least 1")
+        self.max_delay_seconds = max_delay_ms / 1000
+        self.max_batch_items = max_batch_items
+        self.max_attempts = max_attempts
+        self._client_factory = client_factory
+        self._clock = clock
+        self._key_names: dict[str, tuple[str, ...]] = {}
+        self._pending: list[_Write] = []
+        self._pending_items = 0
+        self._flushing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="group-commit")
+        self._collector = threading.Thread(target=self._collect, name="group-commit-collector", daemon=True)
+        self._collector.start()
+
+    def register_table(self, table_name: str, key_names: tuple[str, ...]) -> None:
+        """
+        Declares the key attributes of a table, used to detect `Put` operations on the same item.
+        """
+        self._key_names[table_name] = key_names
+
+    def transact(self, operations: list[dict]) -> Future:
+        """
+        Queues operations to be applied atomically, as one `TransactWriteItems` would.
+
+        :param operations: `TransactWriteItems` operations of one caller.
+        :return: Future resolved with None, or failed with the error of these operations.
+        """
+        if not 0 < len(operations) <= TRANSACT_WRITE_LIMIT:
+            raise ValueError(f"A transaction takes 1 to {TRANSACT_WRITE_LIMIT} operations")
+        keys = frozenset(self._operation_key(operation) for operation in operations)
+        return self._enqueue(_Write("transact", operations, keys, self._clock()))
+
+    def put(self, table_name: str, item: dict) -> Future:
+        """
+        Queues an unconditional put, as one `PutItem` would.
+
+        :param table_name: The table.
+        :param item: Low-level DynamoDB item.
+        :return: Future resolved with None, or failed with the error of the put.
+        """
+        operation = {"Put": {"TableName": table_name, "Item": item}}
+        return self._enqueue(_Write("put", [operation], frozenset({self._operation_key(operation)}), self._clock()))
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Flushes the pending writes and stops the collector. Later writes raise RuntimeError.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._collector.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    def _enqueue(self, write: _Write) -> Future:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("GroupCommitWriter is closed")
+            self._pending.append(write)
+            self._pending_items += len(write.operations)
+            self._condition.notify()
+        return write.future
+
+    def _collect(self) -> None:
+        """
+        Collector loop: waits for a batch to fill or for its delay to expire, then hands it to the flushers.
+        """
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                flush_at = self._pending[0].enqueued_at + self.max_delay_seconds
+                while not self._closed and self._flushing and self._pending_items < self.max_batch_items:
+                    remaining = flush_at - self._clock()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batches = self._take_batches()
+                self._flushing += len(batches)
+
+            for batch in batches:
+                self._in_flight.acquire()
+                self._executor.submit(self._flush, batch)
+
+    def _take_batches(self) -> list[list[_Write]]:
+        """
+        Splits the pending writes into batches within the API limits and without repeated items.
+
+        Writes colliding with an item already taken stay pending for the next round.
+        """
+        batches: list[list[_Write]] = []
+        open_batches: dict[str, tuple[list[_Write], list[int]]] = {}
+        taken: set = set()
+        left: list[_Write] = []
+        for write in self._pending:
+            if write.keys & taken:
+                left.append(write)
+                continue
+            limit = min(self.max_batch_items, TRANSACT_WRITE_LIMIT if write.kind == "transact" else BATCH_WRITE_LIMIT)
+            batch, size = open_batches.get(write.kind, (None, [0]))
+            if batch is None or size[0] + len(write.operations) > limit:
+                batch, size = [], [0]
+                open_batches[write.kind] = (batch, size)
+                batches.append(batch)
+            batch.append(write)
+            size[0] += len(write.operations)
+            taken |= write.keys
+
+        self._pending = left
+        self._pending_items = sum(len(write.operations) for write in left)
+        return batches
+
+    def _flush(self, batch: list[_Write]) -> None:
+        try:
+            if batch[0].kind == "transact":
+                self._flush_transact(batch)
+            else:
+                self._flush_puts(batch)
+        except Exception as error:
+            logger.exception("Group commit flush failed")
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(error)
+        finally:
+            self._in_flight.release()
+            with self._condition:
+                self._flushing -= 1
+                self._condition.notify_all()
+
+    def _flush_transact(self, writes: list[_Write]) -> None:
+        """
+        Sends writes as one `TransactWriteItems` until each of them is settled.
+        """
+        client = self._client_factory()
+        while writes:
+            try:
+                client.transact_write_items(TransactItems=[operation for write in writes for operation in write.operations])
+            except ClientError as error:
+                code = error.response["Error"]["Code"]
+                if code == "TransactionCanceledException":
+                    writes, backoff = self._settle_cancelled(writes, error)
+                    if backoff:
+                        time.sleep(backoff)
+                    continue
+                if code == "ValidationException" and len(writes) > 1:
+                    # An invalid write fails the whole request: isolate it.
+                    for write in writes:
+                        self._flush_transact([write])
+                    return
+                for write in writes:
+                    write.future.set_exception(error)
+                return
+
+            for write in writes:
+                write.future.set_result(None)
+            return
+
+    def _settle_cancelled(self, writes: list[_Write], error: ClientError) -> tuple[list[_Write], float]:
+        """
+        Fails the writes whose own operations were rejected and returns the ones to send again.
+        """
+        reasons = error.response.get("CancellationReasons", [])
+        retry, backoff, offset = [], 0.0, 0
+        for write in writes:
+            own = reasons[offset:offset + len(write.operations)]
+            offset += len(write.operations)
+            codes = {reason.get("Code", "None") for reason in own} - {"None"}
+            if not codes:
+                retry.append(write)
+                continue
+            write.attempts += 1
+            if codes <= RETRYABLE_CANCELLATION_CODES and write.attempts < self.max_attempts:
+                retry.append(write)
+                backoff = max(backoff, min(1.0, 0.05 * 2 ** write.attempts))
+                continue
+            write.future.set_exception(ClientError(
+                {"Error": error.response["Error"], "CancellationReasons": own},
+                "TransactWriteItems",
+            ))
+        return retry, backoff
+
+    def _flush_puts(self, writes: list[_Write]) -> None:
+        """
+        Sends puts as one `BatchWriteItem`, retrying unprocessed items with backoff.
+        """
+        client = self._client_factory()
+        while writes:
+            request: dict[str, list[dict]] = {}
+            for write in writes:
+                put = write.operations[0]["Put"]
+                request.setdefault(put["TableName"], []).append({"PutRequest": {"Item": put["Item"]}})
+            try:
+                response = client.batch_write_item(RequestItems=request)
+            except ClientError as error:
+                if error.response["Error"]["Code"] == "ValidationException" and len(writes) > 1:
+                    for write in writes:
+                        self._flush_puts([write])
+                    return
+                for write in writes:
+                    write.future.set_exception(error)
+                return
+
+            unprocessed = {
+                self._operation_key({"Put": {"TableName": table_name, "Item": request_item["PutRequest"]["Item"]}})
+                for table_name, request_items in (response.get("UnprocessedItems") or {}).items()
+                for request_item in request_items
+            }
+            retry = []
+            for write in writes:
+                if not write.keys & unprocessed:
+                    write.future.set_result(None)
+                    continue
+                write.attempts += 1
+                if write.attempts >= self.max_attempts:
+                    write.future.set_exception(RuntimeError(f"Put still unprocessed after {write.attempts} attempts"))
+                    continue
+                retry.append(write)
+            if retry:
+                time.sleep(min(1.0, 0.05 * 2 ** max(write.attempts for write in retry)))
+            writes = retry
+
+    def _operation_key(self, operation: dict) -> tuple:
+        """
+        Identifies the item an operation touches: its table and key.
+        """
+        body = next(iter(operation.values()))
+        table_name = body["TableName"]
+        if "Key" in body:
+            key = body["Key"]
+        elif table_name in self._key_names:
+            key = {name: body["Item"][name] for name in self._key_names[table_name]}
+        else:
+            key = body["Item"]
+        return table_name, json.dumps(key, sort_keys=True)
@@ -0,0 +1,111 @@
+import time
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+from src.domain.entity.idempotency_record import IdempotencyRecord, IdempotencyState
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class IdempotencyRepository:
+    """
+    Repository for idempotency records stored in `account-idempotency-table`.
+
+    The table is keyed by `idempotency_key` and has DynamoDB TTL enabled on
+    `expires_at`, so records disappear on their own. Because TTL deletion is
+    lazy, expired records are also treated as absent by `claim`.
+
+    An IN_PROGRESS claim also carries `lease_expires_at`: once it has passed,
+    the invocation holding the key is assumed dead and `claim` lets a retry of
+    the same request take the key over.
+
+    Usage:
+        repository = IdempotencyRepository()
+        existing = repository.claim(record)
+        repository.complete(key, status_code, message, body, expires_at)
+    """
+
+    def __init__(self, table_name: str = "account-idempotency-table"):
+        """
+        Initializes the repository with the idempotency table.
+        """
+        self.table_name = table_name
+
+    @property
+    def client(self):
+        """
+        The process-wide DynamoDB client.
+        """
+        return get_dynamodb_client()
+
+    def claim(self, record: IdempotencyRecord, now: int | None = None) -> IdempotencyRecord | None:
+        """
+        Atomically claims a key with a conditional put.
+
+        The key is free when it does not exist, when its record expired, or when
+        it is an IN_PROGRESS claim of the same request whose lease has passed.
+
+        Args:
+            record (IdempotencyRecord): The IN_PROGRESS record to store.
+            now (Optional[int]): Current epoch seconds. Defaults to the system clock.
+
+        Returns:
+            Optional[IdempotencyRecord]: None if the key was claimed by this call,
+            otherwise the record already stored for the key.
+        """
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item={key: _serializer.serialize(value) for key, value in record.model_dump(mode="json").items() if value is not None},
+                ConditionExpression=(
+                    "attribute_not_exists(idempotency_key) OR expires_at < :now"
+                    " OR (#state = :in_progress AND lease_expires_at < :now AND request_hash = :request_hash)"
+                ),
+                ExpressionAttributeNames={"#state": "state"},
+                ExpressionAttributeValues={
+                    ":now": _serializer.serialize(int(time.time()) if now is None else now),
+                    ":in_progress": _serializer.serialize(IdempotencyState.IN_PROGRESS.value),
+                    ":request_hash": _serializer.serialize(record.request_hash),
+                },
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            item = error.response.get("Item", {})
+            return IdempotencyRecord(**{key: _deserializer.deserialize(value) for key, value in item.items()})
+
+        return None
+
+    def complete(self, idempotency_key: str, status_code: int, message: str, body: str, expires_at: int) -> None:
+        """
+        Stores the response of the request that claimed the key.
+        """
+        self.client.update_item(
+            TableName=self.table_name,
+            Key={"idempotency_key": _serializer.serialize(idempotency_key)},
+            UpdateExpression=(
+                "SET #state = :state, status_code = :status_code, message = :message, body = :body, expires_at = :expires_at"
+                " REMOVE lease_expires_at"
+            ),
+            ExpressionAttributeNames={"#state": "state"},
+            ExpressionAttributeValues={
+                ":state": _serializer.serialize(IdempotencyState.COMPLETED.value),
+                ":status_code": _serializer.serialize(status_code),
+                ":message": _serializer.serialize(message),
+                ":body": _serializer.serialize(body),
+                ":expires_at": _serializer.serialize(expires_at),
+            },
+        )
+
+    def release(self, idempotency_key: str) -> None:
+        """
+        Deletes a claim, so a retry of a failed request can run again.
+        """
+        self.client.delete_item(
+            TableName=self.table_name,
+            Key={"idempotency_key": _serializer.serialize(idempotency_key)},
+        )
@@ -0,0 +1,105 @@
+import threading
+
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline
+from src.domain.entity.account import Account, AccountStatus, allowed_source_statuses
+from src.infra.repositories.base_account_repository import (
+    BaseAccountRepository,
+    DuplicateOwner,
+    StatusTransitionConflict,
+    owner_key,
+)
+
+
+class InMemoryAccountRepository(BaseAccountRepository):
+    """
+    Account storage kept in the process. Intended for tests and local runs.
+
+    Accounts are stored as copies, so callers cannot mutate stored state
+    without going through the repository, exactly as with a remote backend.
+    """
+
+    def __init__(self) -> None:
+        self._accounts: dict[str, Account] = {}
+        self._owners: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def create(self, entity: Account) -> str | None:
+        key = owner_key(entity.tenant_id, entity.owner_id)
+        with self._lock:
+            if key in self._owners:
+                raise DuplicateOwner(entity.tenant_id, entity.owner_id, self._owners[key])
+            self._owners[key] = entity.id
+            self._accounts[entity.id] = entity.model_copy(deep=True)
+        return entity.id
+
+    def get_by_id(self, entity_id: str) -> Account | None:
+        account = self._accounts.get(entity_id)
+        return account.model_copy(deep=True) if account else None
+
+    def update(self, entity_id: str, entity: Account) -> Account | None:
+        with self._lock:
+            self._accounts[entity_id] = entity.model_copy(deep=True)
+        return entity
+
+    def delete(self, entity_id: str) -> None:
+        with self._lock:
+            account = self._accounts.pop(entity_id, None)
+            if account is not None:
+                key = owner_key(account.tenant_id, account.owner_id)
+                if self._owners.get(key) == entity_id:
+                    del self._owners[key]
+
+    def find_by_id(self, account_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False) -> Account | None:
+        deadline.check("get account")
+        return self.get_by_id(account_id)
+
+    def find_id_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> str | None:
+        deadline.check("get account by owner")
+        return self._owners.get(owner_key(tenant_id, owner_id))
+
+    def get_projected(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> dict | None:
+        account = self.find_by_id(account_id, deadline)
+        if account is None:
+            return None
+        return account.model_dump(mode="json", include=set(fields))
+
+    def transition_status(
+        self,
+        account_id: str,
+        new_status: AccountStatus,
+        reason: str | None,
+        updated_at: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account:
+        deadline.check("transition account status")
+        with self._lock:
+            account = self._accounts.get(account_id)
+            if account is None or account.status not in allowed_source_statuses(new_status):
+                raise StatusTransitionConflict(account_id, account.model_copy(deep=True) if account else None)
+
+            account.status = new_status
+            account.suspension_reason = reason
+            account.updated_at = updated_at
+            account.version += 1
+            return account.model_copy(deep=True)
+
+    def query_ids_by_tenant(self, tenant_id: str, cursor: str | None = None, limit: int = 100) -> tuple[list[str], str | None]:
+        ids = sorted(
+            account_id for account_id, account in self._accounts.items()
+            if account.tenant_id == tenant_id and (cursor is None or account_id > cursor)
+        )
+        page = ids[:limit]
+        return page, page[-1] if len(ids) > limit else None
+
+    def batch_get(self, account_ids: list[str]) -> list[Account]:
+        return [account for account in map(self.get_by_id, dict.fromkeys(account_ids)) if account is not None]
+
+    def batch_create(self, accounts: list[Account]) -> None:
+        with self._lock:
+            for account in accounts:
+                self._owners.setdefault(owner_key(account.tenant_id, account.owner_id), account.id)
+                self._accounts[account.id] = account.model_copy(deep=True)
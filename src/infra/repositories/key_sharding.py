@@ -0,0 +1,74 @@
+import zlib
+
+
+class KeySharding:
+    """
+    Write-sharding scheme for items whose sort key is a time-ordered ULID.
+
+    DynamoDB hashes partition keys, so ULID partition keys (such as the `id` of
+    `account-table`) are already spread evenly. The hot spot appears when many
+    time-ordered items share one partition key and are told apart only by
+    their sort key, e.g. every transaction of a busy account. This scheme
+    splits such a partition key into `shard_count` suffixed keys:
+
+        partition_key = "<base_key>#<shard>"
+
+    The shard is a hash of the item ID, so point lookups stay O(1): the
+    partition key is recomputed from the ID, with no scatter-gather. Only range
+    reads need to query every shard (`partition_keys`) and merge the results.
+
+    A `shard_count` of 1 disables sharding and leaves keys unchanged, so the
+    scheme can be enabled per table without touching existing data.
+
+    Usage:
+        sharding = KeySharding(shard_count=8)
+        pk = sharding.partition_key(account_id, transaction_id)
+        for pk in sharding.partition_keys(account_id):
+            ...
+    """
+
+    def __init__(self, shard_count: int = 1) -> None:
+        """
+        Initializes the scheme.
+
+        :param shard_count: Number of shards per base key. Must be at least 1.
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self.shard_count = shard_count
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether keys are actually sharded.
+        """
+        return self.shard_count > 1
+
+    def shard_for(self, item_id: str) -> int:
+        """
+        Returns the shard of an item, derived from its ID.
+
+        Uses CRC32 over the whole ID: the random component of a ULID changes
+        with every ID, so consecutive IDs land on different shards.
+        """
+        return zlib.crc32(item_id.encode()) % self.shard_count
+
+    def partition_key(self, base_key: str, item_id: str) -> str:
+        """
+        Returns the physical partition key of an item.
+
+        :param base_key: Logical partition key (e.g. the account ID).
+        :param item_id: ID of the item being written or read.
+        :return: `base_key` itself when sharding is disabled, otherwise `base_key#shard`.
+        """
+        if not self.enabled:
+            return base_key
+        return f"{base_key}#{self.shard_for(item_id)}"
+
+    def partition_keys(self, base_key: str) -> list[str]:
+        """
+        Returns every physical partition key of a logical key, for range reads.
+        """
+        if not self.enabled:
+            return [base_key]
+        return [f"{base_key}#{shard}" for shard in range(self.shard_count)]
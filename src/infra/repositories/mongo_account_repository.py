@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+
+from src.domain.deadlines.request_deadline import NO_DEADLINE, Deadline, DeadlineExceeded
+from src.domain.entity.account import Account, AccountStatus, allowed_source_statuses
+from src.infra.repositories.base_account_repository import BaseAccountRepository, DuplicateOwner, StatusTransitionConflict
+
+BATCH_WRITE_LIMIT = 1000
+
+
+def _load_pymongo():
+    """
+    Imports pymongo lazily: only the "mongodb" backend needs it.
+    """
+    import pymongo
+
+    return pymongo
+
+
+class MongoAccountRepository(BaseAccountRepository):
+    """
+    Account storage in a MongoDB collection (`accounts` by default).
+
+    Documents use the account ID as `_id`. Tenant pages are served by the
+    `(tenant_id, _id)` index created by `ensure_indexes`, and owner lookups
+    by the unique `(tenant_id, owner_id)` index, which also rejects a second
+    account of the same owner in the insert itself.
+
+    - `transition_status` is one `find_one_and_update` filtered on the allowed
+      source statuses, with `$inc` on `version`: the same single conditional
+      write as the DynamoDB `ConditionExpression`.
+    - Calls taking a deadline run inside `pymongo.timeout`, which caps server
+      selection, socket timeouts and `maxTimeMS` to the time left.
+    - Eventually consistent reads use `secondaryPreferred` (a standalone
+      server answers them from the primary); consistent reads use the primary.
+
+    Usage:
+        repository = MongoAccountRepository.from_uri("mongodb://localhost:27017", database="account")
+        repository.ensure_indexes()
+    """
+
+    def __init__(self, collection) -> None:
+        """
+        :param collection: A pymongo (or mongomock) collection.
+        """
+        self.collection = collection
+        self._secondary_collection = None
+
+    def _reader(self, consistent: bool):
+        """
+        The collection to read from: primary for consistent reads, secondaries preferred otherwise.
+        """
+        if consistent:
+            return self.collection
+        if self._secondary_collection is None:
+            pymongo = _load_pymongo()
+            self._secondary_collection = self.collection.with_options(
+                read_preference=pymongo.ReadPreference.SECONDARY_PREFERRED
+            )
+        return self._secondary_collection
+
+    @classmethod
+    def from_uri(cls, uri: str, database: str = "account", collection: str = "accounts") -> "MongoAccountRepository":
+        """
+        Builds the repository on a new MongoClient (one connection pool per process).
+        """
+        pymongo = _load_pymongo()
+        client = pymongo.MongoClient(uri, retryWrites=True)
+        return cls(client[database][collection])
+
+    def ensure_indexes(self) -> None:
+        """
+        Creates the indexes used by tenant queries and owner uniqueness (idempotent).
+
+        Building the unique owner index fails while duplicate owners exist;
+        they have to be resolved first.
+        """
+        self.collection.create_index([("tenant_id", 1), ("_id", 1)], name="tenant_id-index")
+        self.collection.create_index([("tenant_id", 1), ("owner_id", 1)], name="tenant_id-owner_id-index", unique=True)
+
+    @contextmanager
+    def _within(self, deadline: Deadline, operation: str):
+        """
+        Runs the block with the deadline as pymongo client-side timeout.
+        """
+        if not deadline.bounded:
+            yield
+            return
+
+        deadline.check(operation)
+        pymongo = _load_pymongo()
+        try:
+            with pymongo.timeout(deadline.remaining()):
+                yield
+        except pymongo.errors.PyMongoError as error:
+            if error.timeout:
+                raise DeadlineExceeded(operation, deadline.remaining()) from error
+            raise
+
+    @staticmethod
+    def _to_document(account: Account) -> dict:
+        document = account.model_dump(mode="json")
+        document["_id"] = document.pop("id")
+        return document
+
+    @staticmethod
+    def _to_account(document: dict) -> Account:
+        document = dict(document)
+        document["id"] = document.pop("_id")
+        return Account(**document)
+
+    def create(self, entity: Account) -> str | None:
+        pymongo = _load_pymongo()
+        try:
+            self.collection.insert_one(self._to_document(entity))
+        except pymongo.errors.DuplicateKeyError:
+            existing = self.find_id_by_owner(entity.tenant_id, entity.owner_id, consistent=True)
+            if existing is None or existing == entity.id:
+                raise
+            raise DuplicateOwner(entity.tenant_id, entity.owner_id, existing) from None
+        return entity.id
+
+    def get_by_id(self, entity_id: str) -> Account | None:
+        return self.find_by_id(entity_id, consistent=True)
+
+    def update(self, entity_id: str, entity: Account) -> Account | None:
+        document = self._to_document(entity)
+        document["_id"] = entity_id
+        self.collection.replace_one({"_id": entity_id}, document, upsert=True)
+        return entity
+
+    def delete(self, entity_id: str) -> None:
+        self.collection.delete_one({"_id": entity_id})
+
+    def find_by_id(self, account_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False) -> Account | None:
+        with self._within(deadline, "get account"):
+            document = self._reader(consistent).find_one({"_id": account_id})
+        return self._to_account(document) if document else None
+
+    def find_id_by_owner(
+        self, tenant_id: str, owner_id: str, deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> str | None:
+        with self._within(deadline, "get account by owner"):
+            document = self._reader(consistent).find_one({"tenant_id": tenant_id, "owner_id": owner_id}, {"_id": 1})
+        return document["_id"] if document else None
+
+    def get_projected(
+        self, account_id: str, fields: list[str], deadline: Deadline = NO_DEADLINE, consistent: bool = False
+    ) -> dict | None:
+        projection = {field: 1 for field in fields if field != "id"}
+        with self._within(deadline, "get account"):
+            document = self._reader(consistent).find_one({"_id": account_id}, projection or {"_id": 1})
+        if document is None:
+            return None
+
+        account_id = document.pop("_id")
+        if "id" in fields:
+            document["id"] = account_id
+        return document
+
+    def transition_status(
+        self,
+        account_id: str,
+        new_status: AccountStatus,
+        reason: str | None,
+        updated_at: str,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> Account:
+        pymongo = _load_pymongo()
+        sources = [source.value for source in allowed_source_statuses(new_status)]
+
+        with self._within(deadline, "transition account status"):
+            document = self.collection.find_one_and_update(
+                {"_id": account_id, "status": {"$in": sources}},
+                {
+                    "$set": {"status": new_status.value, "suspension_reason": reason, "updated_at": updated_at},
+                    "$inc": {"version": 1},
+                },
+                return_document=pymongo.ReturnDocument.AFTER,
+            )
+            if document is None:
+                current = self.collection.find_one({"_id": account_id})
+                raise StatusTransitionConflict(account_id, self._to_account(current) if current else None)
+
+        return self._to_account(document)
+
+    def query_ids_by_tenant(self, tenant_id: str, cursor: str | None = None, limit: int = 100) -> tuple[list[str], str | None]:
+        query = {"tenant_id": tenant_id}
+        if cursor:
+            query["_id"] = {"$gt": cursor}
+
+        # One extra document tells whether another page exists.
+        documents = list(self.collection.find(query, {"_id": 1}).sort("_id", 1).limit(limit + 1))
+        ids = [document["_id"] for document in documents[:limit]]
+        return ids, ids[-1] if len(documents) > limit else None
+
+    def batch_get(self, account_ids: list[str]) -> list[Account]:
+        unique_ids = list(dict.fromkeys(account_ids))
+        return [self._to_account(document) for document in self.collection.find({"_id": {"$in": unique_ids}})]
+
+    def batch_create(self, accounts: list[Account]) -> None:
+        for start in range(0, len(accounts), BATCH_WRITE_LIMIT):
+            self.collection.insert_many(
+                [self._to_document(account) for account in accounts[start:start + BATCH_WRITE_LIMIT]],
+                ordered=False,
+            )
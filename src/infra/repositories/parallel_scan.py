@@ -0,0 +1,289 @@
+import json
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.infra.repositories.dynamodb_items import deserialize_item
+
+
+@dataclass
+class ScanPage:
+    """
+    One page returned by one segment of a parallel scan.
+
+    Attributes:
+        segment (int): Segment the page belongs to.
+        items (list[dict]): Items of the page, as plain Python values.
+        next_key (Optional[dict]): `LastEvaluatedKey` of the segment, None when the segment is exhausted.
+        consumed_capacity (float): Read capacity units consumed by the page.
+    """
+    segment: int
+    items: list[dict]
+    next_key: dict | None
+    consumed_capacity: float = 0.0
+
+
+class CapacityRateLimiter:
+    """
+    Token bucket limiting the read capacity consumed per second, shared by every segment worker.
+
+    DynamoDB only reports the capacity of a scan page after it is read, so
+    workers wait for a non-negative balance before each request and are
+    charged the reported capacity afterwards. Bursts are capped at one
+    second worth of capacity.
+    """
+
+    def __init__(self, units_per_second: float, clock=time.monotonic, sleep=time.sleep) -> None:
+        self.units_per_second = units_per_second
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._balance = units_per_second
+        self._refilled_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._balance = min(self.units_per_second, self._balance + (now - self._refilled_at) * self.units_per_second)
+        self._refilled_at = now
+
+    def acquire(self) -> None:
+        """
+        Blocks until the bucket is no longer in debt.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._balance >= 0:
+                    return
+                wait = -self._balance / self.units_per_second
+            self._sleep(wait)
+
+    def consume(self, units: float) -> None:
+        """
+        Charges the capacity reported by DynamoDB.
+        """
+        with self._lock:
+            self._refill()
+            self._balance -= units
+
+
+class ScanCheckpoint:
+    """
+    Per-segment progress of a parallel scan, persisted to a JSON file.
+
+    A segment's `LastEvaluatedKey` is stored only once the consumer has
+    finished with the page, so a resumed scan re-reads at most one page per
+    segment (at-least-once delivery).
+    """
+
+    def __init__(self, path: str | None, total_segments: int) -> None:
+        self.path = path
+        self.total_segments = total_segments
+        self._lock = threading.Lock()
+        self.segments: dict[int, dict] = {}
+
+        if path and Path(path).exists():
+            state = json.loads(Path(path).read_text(encoding="utf-8"))
+            if state["total_segments"] != total_segments:
+                raise ValueError(
+                    f"Checkpoint {path} was written with {state['total_segments']} segments, not {total_segments}"
+                )
+            self.segments = {int(segment): progress for segment, progress in state["segments"].items()}
+
+        for segment in range(total_segments):
+            self.segments.setdefault(segment, {"start_key": None, "done": False, "scanned": 0})
+
+    @property
+    def scanned(self) -> int:
+        """
+        Items delivered across every run sharing this checkpoint.
+        """
+        return sum(progress["scanned"] for progress in self.segments.values())
+
+    @property
+    def done(self) -> bool:
+        return all(progress["done"] for progress in self.segments.values())
+
+    def start_key(self, segment: int) -> dict | None:
+        return self.segments[segment]["start_key"]
+
+    def is_done(self, segment: int) -> bool:
+        return self.segments[segment]["done"]
+
+    def advance(self, segment: int, next_key: dict | None, scanned: int) -> None:
+        """
+        Records that a page of `segment` was fully consumed.
+        """
+        with self._lock:
+            progress = self.segments[segment]
+            progress["start_key"] = next_key
+            progress["done"] = next_key is None
+            progress["scanned"] += scanned
+            if self.path:
+                state = {"total_segments": self.total_segments, "segments": self.segments}
+                Path(self.path).write_text(json.dumps(state), encoding="utf-8")
+
+
+class ParallelScanner:
+    """
+    Parallel segmented scan of a DynamoDB table, streamed as a generator.
+
+    Responsibilities:
+    - Fan out over `total_segments` scan segments (Segment/TotalSegments), one worker thread each.
+    - Stream pages to the caller through a bounded queue: workers block once
+      `max_buffered_pages` pages are waiting, so memory stays bounded regardless of table size.
+    - Throttle every worker against a shared read-capacity budget (`max_read_units_per_second`).
+    - Record per-segment progress in a `ScanCheckpoint`, so an interrupted scan can resume.
+
+    Additional Notes:
+    - Workers are threads: a scan is I/O bound and the low-level client is thread-safe.
+    - Closing the generator early (break) stops the workers after their current page.
+
+    Usage:
+        scanner = ParallelScanner(get_dynamodb_client(), "account-table", total_segments=8)
+        for item in scanner.items():
+            ...
+    """
+
+    def __init__(
+        self,
+        client,
+        table_name: str,
+        total_segments: int = 8,
+        page_size: int = 500,
+        max_read_units_per_second: float | None = None,
+        checkpoint: ScanCheckpoint | None = None,
+        max_buffered_pages: int | None = None,
+        projection: list[str] | None = None,
+        filter_expression: str | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+        expression_attribute_values: dict[str, dict] | None = None,
+        consistent_read: bool = False,
+    ) -> None:
+        """
+        Initializes the ParallelScanner.
+
+        :param client: Low-level DynamoDB client.
+        :param table_name: Table to scan.
+        :param total_segments: Number of segments, and of worker threads.
+        :param page_size: `Limit` of every scan request.
+        :param max_read_units_per_second: Read capacity budget shared by all workers, or None for no limit.
+        :param checkpoint: Progress store, or None to always scan from the start.
+        :param max_buffered_pages: Pages waiting for the consumer before workers block (default: 2 per segment).
+        :param projection: Attributes to return, or None for whole items.
+        :param filter_expression: Server-side `FilterExpression` (capacity is still charged for filtered items).
+        :param expression_attribute_names: Names used by the filter expression.
+        :param expression_attribute_values: Low-level (typed) values used by the filter expression.
+        :param consistent_read: Whether to use strongly consistent reads.
+        """
+        self.client = client
+        self.table_name = table_name
+        self.total_segments = total_segments
+        self.page_size = page_size
+        self.rate_limiter = CapacityRateLimiter(max_read_units_per_second) if max_read_units_per_second else None
+        self.checkpoint = checkpoint or ScanCheckpoint(None, total_segments)
+        self.max_buffered_pages = max_buffered_pages or 2 * total_segments
+        self.consumed_capacity = 0.0
+
+        if self.checkpoint.total_segments != total_segments:
+            raise ValueError("Checkpoint and scanner must use the same number of segments")
+
+        self._base_params = {"TableName": table_name, "Limit": page_size, "TotalSegments": total_segments,
+                             "ReturnConsumedCapacity": "TOTAL", "ConsistentRead": consistent_read}
+        names = dict(expression_attribute_names or {})
+        if projection:
+            projection_names = {f"#p{index}": field for index, field in enumerate(projection)}
+            names.update(projection_names)
+            self._base_params["ProjectionExpression"] = ", ".join(projection_names)
+        if filter_expression:
+            self._base_params["FilterExpression"] = filter_expression
+        if names:
+            self._base_params["ExpressionAttributeNames"] = names
+        if expression_attribute_values:
+            self._base_params["ExpressionAttributeValues"] = expression_attribute_values
+
+    def _read_page(self, segment: int, start_key: dict | None) -> ScanPage:
+        params = dict(self._base_params, Segment=segment)
+        if start_key:
+            params["ExclusiveStartKey"] = start_key
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        response = self.client.scan(**params)
+        consumed = float(response.get("ConsumedCapacity", {}).get("CapacityUnits", 0.0))
+        if self.rate_limiter:
+            self.rate_limiter.consume(consumed)
+
+        items = [deserialize_item(item) for item in response.get("Items", [])]
+        return ScanPage(segment, items, response.get("LastEvaluatedKey"), consumed)
+
+    def _scan_segment(self, segment: int, pages: queue.Queue, stop: threading.Event) -> None:
+        start_key = self.checkpoint.start_key(segment)
+        try:
+            while not stop.is_set():
+                page = self._read_page(segment, start_key)
+                while not stop.is_set():
+                    try:
+                        pages.put(page, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                start_key = page.next_key
+                if start_key is None:
+                    return
+        except Exception as error:
+            pages.put(error)
+        finally:
+            pages.put(segment)
+
+    def pages(self) -> Iterator[ScanPage]:
+        """
+        Yields pages from every segment as they arrive.
+
+        The checkpoint of a page's segment is advanced when the caller asks for
+        the next page, i.e. after the caller finished with it.
+
+        :raises Exception: The first error raised by a worker; the other workers are stopped.
+        """
+        segments = [segment for segment in range(self.total_segments) if not self.checkpoint.is_done(segment)]
+        if not segments:
+            return
+
+        pages: queue.Queue = queue.Queue(maxsize=self.max_buffered_pages)
+        stop = threading.Event()
+        running = len(segments)
+
+        with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix="scan-segment") as executor:
+            for segment in segments:
+                executor.submit(self._scan_segment, segment, pages, stop)
+
+            try:
+                while running:
+                    message = pages.get()
+                    if isinstance(message, int):
+                        running -= 1
+                    elif isinstance(message, Exception):
+                        raise message
+                    else:
+                        self.consumed_capacity += message.consumed_capacity
+                        yield message
+                        self.checkpoint.advance(message.segment, message.next_key, len(message.items))
+            finally:
+                stop.set()
+                while running:
+                    try:
+                        if isinstance(pages.get(timeout=0.1), int):
+                            running -= 1
+                    except queue.Empty:
+                        continue
+
+    def items(self) -> Iterator[dict]:
+        """
+        Yields every item of the table, across all segments, in no particular order.
+        """
+        for page in self.pages():
+            yield from page.items
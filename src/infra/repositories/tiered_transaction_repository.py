@@ -0,0 +1,162 @@
+import heapq
+import json
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entity.timestamps import format_timestamp
+from src.domain.entity.transaction_entry import TransactionEntry
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.repositories.transaction_repository import TransactionRepository
+
+
+class TieredTransactionRepository:
+    """
+    Statement reads over the hot table and the transaction archive, merged.
+
+    The archival job only moves transactions older than `horizon_days`, so a
+    range starting after `now - horizon_days` is answered by the hot table
+    alone, exactly like `TransactionRepository` (same pages, same cursors).
+    Older ranges merge the overlapping archive segments with the hot table, in
+    timestamp order:
+
+    - the hot side is queried over the whole range: archived rows are deleted
+      from it, and what remains there (late, back-dated transactions, or rows
+      of an interrupted archival run) must still be returned;
+    - a transaction present in both tiers is returned once.
+
+    Cursors of merged reads hold the last returned timestamp and the IDs
+    returned at that timestamp.
+
+    Usage:
+        repository = TieredTransactionRepository(TransactionRepository(), archive, horizon_days=180)
+        items, cursor = repository.query_range("2023-01-01T00:00:00.000Z", "2025-06-30T23:59:59.999Z", account_id=account_id)
+    """
+
+    def __init__(
+        self,
+        hot: TransactionRepository,
+        archive: TransactionArchive,
+        horizon_days: int,
+        clock=lambda: datetime.now(timezone.utc),
+    ) -> None:
+        """
+        Initializes the repository.
+
+        :param hot: Repository of `account-transaction-table`.
+        :param archive: The archived segments.
+        :param horizon_days: Age after which transactions may have been archived. Must match the archival job.
+        :param clock: Current UTC time.
+        """
+        self.hot = hot
+        self.archive = archive
+        self.horizon_days = horizon_days
+        self._clock = clock
+
+    def archive_boundary(self) -> str:
+        """
+        Timestamp before which transactions may live in the archive.
+        """
+        return format_timestamp(self._clock() - timedelta(days=self.horizon_days))
+
+    def create_once(self, entry: TransactionEntry, operations: list[dict] | None = None) -> bool:
+        """
+        Stores a transaction in the hot table. See `TransactionRepository.create_once`.
+        """
+        return self.hot.create_once(entry, operations)
+
+    def _merged(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None,
+        tenant_id: str | None,
+        product: str | None,
+        page_size: int,
+        after: dict | None,
+    ) -> Iterator[dict]:
+        if after:
+            start = after["archive_after"]
+        skipped = set(after["ids"]) if after else set()
+
+        archived = self.archive.read_range(start, end, account_id=account_id, tenant_id=tenant_id, product=product)
+        hot = (
+            item
+            for items, _ in self.hot.query_range_pages(
+                start, end, account_id=account_id, tenant_id=tenant_id, product=product, page_size=page_size
+            )
+            for item in items
+        )
+
+        timestamp, seen = None, set()
+        for item in heapq.merge(archived, hot, key=lambda row: row["timestamp"]):
+            if item["timestamp"] != timestamp:
+                timestamp, seen = item["timestamp"], set()
+            if item["id"] in seen:
+                continue
+            seen.add(item["id"])
+            if after and timestamp == after["archive_after"] and item["id"] in skipped:
+                continue
+            yield item
+
+    def query_range_pages(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+        page_size: int = 1000,
+        start_key: dict | None = None,
+    ) -> Iterator[tuple[list[dict], dict | None]]:
+        """
+        Yields the transactions of an account or tenant within a time range, page by page, from both tiers.
+
+        Same contract as `TransactionRepository.query_range_pages`; `start_key`
+        is either a hot-table `LastEvaluatedKey` or a merged-read position.
+        """
+        if account_id is None and tenant_id is None:
+            raise ValueError("account_id or tenant_id is required")
+
+        merged_read = start_key is not None and "archive_after" in start_key
+        if not merged_read and (start_key is not None or start >= self.archive_boundary()):
+            yield from self.hot.query_range_pages(
+                start, end, account_id=account_id, tenant_id=tenant_id, product=product,
+                page_size=page_size, start_key=start_key,
+            )
+            return
+
+        rows = self._merged(start, end, account_id, tenant_id, product, page_size, start_key)
+        page = []
+        for row in rows:
+            if len(page) == page_size:
+                last = page[-1]["timestamp"]
+                ids = [item["id"] for item in page if item["timestamp"] == last]
+                if start_key and start_key["archive_after"] == last:
+                    ids += start_key["ids"]
+                start_key = {"archive_after": last, "ids": ids}
+                yield page, start_key
+                page = []
+            page.append(row)
+        yield page, None
+
+    def query_range(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict], str | None]:
+        """
+        Returns one page of transactions within a time range, from both tiers.
+
+        Same contract as `TransactionRepository.query_range`.
+        """
+        pages = self.query_range_pages(
+            start, end, account_id=account_id, tenant_id=tenant_id, product=product,
+            page_size=limit, start_key=json.loads(cursor) if cursor else None,
+        )
+        items, last_key = next(pages)
+        return items, json.dumps(last_key) if last_key else None
@@ -0,0 +1,303 @@
+import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+from utilities.cross_cutting.infra.repositories.dynamodb_base_repository import DynamoDBBaseRepository
+
+from utilities.depency_injections.injection_manager import utilities_injections
+from src.domain.entity.money import MONEY_FIELDS
+from src.domain.entity.transaction_entry import TransactionEntry
+from src.infra.clients.dynamodb_client import get_dynamodb_client
+from src.infra.repositories.dynamodb_items import deserialize_item, serialize_item, serialize_value
+from src.infra.repositories.group_commit import GroupCommitWriter
+from src.infra.repositories.key_sharding import KeySharding
+
+ACCOUNT_TIMESTAMP_INDEX_NAME = "account_id-timestamp-index"
+ACCOUNT_SHARD_TIMESTAMP_INDEX_NAME = "account_shard-timestamp-index"
+TENANT_TIMESTAMP_INDEX_NAME = "tenant_id-timestamp-index"
+BATCH_WRITE_LIMIT = 25
+
+
+@utilities_injections
+class TransactionRepository(DynamoDBBaseRepository[TransactionEntry]):
+    """
+    Repository for TransactionEntry items stored in `account-transaction-table`.
+
+    Inherits the single-item CRUD operations from DynamoDBBaseRepository and adds
+    time-range queries for statements:
+
+    - `account_id-timestamp-index`: transactions of one account, sorted by time.
+    - `tenant_id-timestamp-index`: transactions of a whole tenant, sorted by time.
+
+    `timestamp` uses the canonical encoding (ISO-8601 UTC with milliseconds),
+    so a time range is a `BETWEEN` on the sort key.
+
+    With `index_shards` > 1, the per-account index is write-sharded
+    (`KeySharding`): every item carries `account_shard` = "<account_id>#<shard>",
+    indexed by `account_shard-timestamp-index`, so a busy account spreads its
+    writes over several index partitions. Reading an account then queries every
+    shard in parallel and merges them by (timestamp, id); pages and cursors keep
+    the same contract. Point reads by `id` are unchanged. Items written before
+    sharding was enabled have no `account_shard` and are not in that index.
+
+    Usage:
+        transaction_repo = TransactionRepository()
+        items, cursor = transaction_repo.query_range("2025-06-01T00:00:00.000Z", "2025-06-30T23:59:59.999Z", account_id=account_id)
+        for page in transaction_repo.query_range_pages(start, end, tenant_id=tenant_id):
+            ...
+    """
+
+    def __init__(self, index_shards: int = 1):
+        """
+        Initializes the TransactionRepository with the 'account-transaction-table' table.
+
+        Args:
+            index_shards (int): Write shards of the per-account index. 1 disables sharding.
+        """
+        super().__init__(table_name="account-transaction-table", model_class=TransactionEntry)
+        self.group_commit: GroupCommitWriter | None = None
+        self.sharding = KeySharding(index_shards)
+
+    def use_group_commit(self, writer: GroupCommitWriter) -> None:
+        """
+        Sends `create_once` through a group-commit writer (long-running targets only).
+        """
+        writer.register_table(self.table_name, ("id",))
+        self.group_commit = writer
+
+    @property
+    def client(self):
+        """
+        The process-wide DynamoDB client.
+        """
+        return get_dynamodb_client()
+
+    def create_once(self, entry: TransactionEntry, operations: list[dict] | None = None) -> bool:
+        """
+        Stores a transaction unless its `id` already exists, atomically with other writes.
+
+        The put and `operations` (e.g. rollup increments) are written in one
+        `TransactWriteItems` call: either all of them apply or none does, so a
+        retried transaction never updates the other items twice. With a
+        group-commit writer, the call is shared with concurrent transactions
+        and the outcome of this one is unchanged.
+
+        Args:
+            entry (TransactionEntry): The transaction to store.
+            operations (Optional[list[dict]]): Additional `TransactWriteItems` operations.
+
+        Returns:
+            bool: True if stored, False if a transaction with the same `id` already exists.
+        """
+        item = entry.model_dump(mode="json") | entry.model_dump(include=MONEY_FIELDS)
+        if self.sharding.enabled:
+            item["account_shard"] = self.sharding.partition_key(entry.account_id, entry.id)
+        put = {
+            "Put": {
+                "TableName": self.table_name,
+                "Item": serialize_item(item),
+                "ConditionExpression": "attribute_not_exists(id)",
+            }
+        }
+        try:
+            if self.group_commit is not None:
+                self.group_commit.transact([put, *(operations or [])]).result()
+            else:
+                self.client.transact_write_items(TransactItems=[put, *(operations or [])])
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = error.response.get("CancellationReasons", [])
+            if reasons and reasons[0].get("Code") == "ConditionalCheckFailed":
+                return False
+            raise
+        return True
+
+    def batch_delete(self, ids: list[str]) -> None:
+        """
+        Deletes many transactions with `BatchWriteItem`, 25 keys per request.
+
+        Used by the archival job once the transactions are stored in the archive.
+        Unprocessed keys (throttling) are retried with exponential backoff.
+
+        Args:
+            ids (list[str]): IDs of the transactions to delete.
+        """
+        for start in range(0, len(ids), BATCH_WRITE_LIMIT):
+            request = {self.table_name: [
+                {"DeleteRequest": {"Key": {"id": serialize_value(transaction_id)}}}
+                for transaction_id in ids[start:start + BATCH_WRITE_LIMIT]
+            ]}
+            attempt = 0
+            while request:
+                if attempt:
+                    time.sleep(min(1.0, 0.05 * 2 ** attempt))
+                response = self.client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or None
+                attempt += 1
+
+    def query_range_pages(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+        page_size: int = 1000,
+        start_key: dict | None = None,
+    ) -> Iterator[tuple[list[dict], dict | None]]:
+        """
+        Yields the transactions of an account or tenant within a time range, page by page.
+
+        Only one page is held in memory at a time, so the caller can stream
+        arbitrarily long ranges. With a sharded account index, the pages of an
+        account are merged from every shard (see `_sharded_pages`).
+
+        Args:
+            start (str): Inclusive lower bound, canonical timestamp.
+            end (str): Inclusive upper bound, canonical timestamp.
+            account_id (Optional[str]): Account selector.
+            tenant_id (Optional[str]): Tenant selector, used when `account_id` is not given.
+            product (Optional[str]): Only transactions of this product (server-side filter).
+            page_size (int): `Limit` of every query request.
+            start_key (Optional[dict]): `LastEvaluatedKey` to resume from.
+
+        Yields:
+            tuple[list[dict], Optional[dict]]: The items of a page (plain Python values)
+            and the `LastEvaluatedKey` after it (None on the last page).
+        """
+        if account_id is None and tenant_id is None:
+            raise ValueError("account_id or tenant_id is required")
+
+        key_name, key_value, index_name = (
+            ("account_id", account_id, ACCOUNT_TIMESTAMP_INDEX_NAME) if account_id is not None
+            else ("tenant_id", tenant_id, TENANT_TIMESTAMP_INDEX_NAME)
+        )
+        params = {
+            "TableName": self.table_name,
+            "IndexName": index_name,
+            "KeyConditionExpression": "#key = :key AND #timestamp BETWEEN :start AND :end",
+            "ExpressionAttributeNames": {"#key": key_name, "#timestamp": "timestamp"},
+            "ExpressionAttributeValues": {
+                ":key": serialize_value(key_value),
+                ":start": serialize_value(start),
+                ":end": serialize_value(end),
+            },
+            "Limit": page_size,
+        }
+        if product is not None:
+            params["FilterExpression"] = "#product = :product"
+            params["ExpressionAttributeNames"]["#product"] = "product"
+            params["ExpressionAttributeValues"][":product"] = serialize_value(product)
+
+        if account_id is not None and self.sharding.enabled:
+            params["IndexName"] = ACCOUNT_SHARD_TIMESTAMP_INDEX_NAME
+            params["ExpressionAttributeNames"]["#key"] = "account_shard"
+            yield from self._sharded_pages(params, account_id, start_key)
+            return
+
+        while True:
+            if start_key:
+                params["ExclusiveStartKey"] = start_key
+            response = self.client.query(**params)
+            start_key = response.get("LastEvaluatedKey")
+            yield [deserialize_item(item) for item in response.get("Items", [])], start_key
+            if start_key is None:
+                return
+
+    def _sharded_pages(self, params: dict, account_id: str, start_key: dict | None) -> Iterator[tuple[list[dict], dict | None]]:
+        """
+        Scatter-gather over the shards of an account, yielding pages in (timestamp, id) order.
+
+        Every round queries the shards that are not exhausted, in parallel. An
+        item is only returned once no shard can still hold a smaller one: the
+        page stops at the smallest last evaluated key among the shards that
+        have more, so a page can be shorter than `Limit` (or empty with a
+        filter). The position of every shard is kept in the cursor,
+        `{"shards": {partition_key: ExclusiveStartKey or {}}}`; exhausted shards are dropped.
+        """
+        positions: dict[str, dict] = (
+            start_key["shards"] if start_key else {key: {} for key in self.sharding.partition_keys(account_id)}
+        )
+        page_size = params["Limit"]
+
+        def query(partition_key: str) -> dict:
+            shard_params = {
+                **params,
+                "ExpressionAttributeValues": {**params["ExpressionAttributeValues"], ":key": serialize_value(partition_key)},
+            }
+            if positions[partition_key]:
+                shard_params["ExclusiveStartKey"] = positions[partition_key]
+            return self.client.query(**shard_params)
+
+        def order(key: dict) -> tuple[str, str]:
+            return key["timestamp"]["S"], key["id"]["S"]
+
+        with ThreadPoolExecutor(max_workers=len(positions) or 1) as executor:
+            while positions:
+                responses = dict(zip(positions, executor.map(query, list(positions))))
+                cutoff = min(
+                    (order(response["LastEvaluatedKey"]) for response in responses.values() if response.get("LastEvaluatedKey")),
+                    default=None,
+                )
+                candidates = sorted(
+                    ((order(item), partition_key, item) for partition_key, response in responses.items()
+                     for item in response.get("Items", [])),
+                    key=lambda candidate: candidate[0],
+                )
+                taken = [candidate for candidate in candidates if cutoff is None or candidate[0] <= cutoff][:page_size]
+
+                last_taken = {partition_key: item for _, partition_key, item in taken}
+                taken_count = {partition_key: 0 for partition_key in responses}
+                for _, partition_key, _ in taken:
+                    taken_count[partition_key] += 1
+                for partition_key, response in responses.items():
+                    if taken_count[partition_key] == len(response.get("Items", [])):
+                        if response.get("LastEvaluatedKey"):
+                            positions[partition_key] = response["LastEvaluatedKey"]
+                        else:
+                            del positions[partition_key]
+                    elif partition_key in last_taken:
+                        item = last_taken[partition_key]
+                        positions[partition_key] = {name: item[name] for name in ("id", "account_shard", "timestamp")}
+
+                items = [deserialize_item(item) for _, _, item in taken]
+                for item in items:
+                    item.pop("account_shard", None)
+                yield items, {"shards": positions} if positions else None
+                positions = dict(positions)
+
+    def query_range(
+        self,
+        start: str,
+        end: str,
+        account_id: str | None = None,
+        tenant_id: str | None = None,
+        product: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict], str | None]:
+        """
+        Returns one page of transactions within a time range.
+
+        Args:
+            start (str): Inclusive lower bound, canonical timestamp.
+            end (str): Inclusive upper bound, canonical timestamp.
+            account_id (Optional[str]): Account selector.
+            tenant_id (Optional[str]): Tenant selector, used when `account_id` is not given.
+            product (Optional[str]): Only transactions of this product.
+            cursor (Optional[str]): Cursor returned by the previous page.
+            limit (int): Maximum number of items evaluated for the page.
+
+        Returns:
+            tuple[list[dict], Optional[str]]: The page and the cursor of the next page
+            (None when the range is exhausted).
+        """
+        pages = self.query_range_pages(
+            start, end, account_id=account_id, tenant_id=tenant_id, product=product,
+            page_size=limit, start_key=json.loads(cursor) if cursor else None,
+        )
+        items, last_key = next(pages)
+        return items, json.dumps(last_key) if last_key else None
@@ -0,0 +1,54 @@
+from src.config import dependency_start
+from src.infra.repositories.account_repository import AccountRepository
+from src.infra.repositories.base_account_repository import BaseAccountRepository
+from src.infra.repositories.group_commit import GroupCommitWriter
+from src.infra.repositories.transaction_repository import TransactionRepository
+
+
+class RecordingInjectionManager:
+    dependencies = {}
+
+    @classmethod
+    def get_dependency(cls, key):
+        return cls.dependencies[key]
+
+    @classmethod
+    def add_dependency(cls, key, value):
+        cls.dependencies[key] = value
+
+
+def test_group_commit_writer_is_attached_to_the_repositories_in_use(monkeypatch):
+    closers = []
+    monkeypatch.setattr(dependency_start, "InjectionManager", RecordingInjectionManager)
+    monkeypatch.setattr(dependency_start.UtilitiesInjections, "configure", lambda: None)
+    monkeypatch.setattr(dependency_start.atexit, "register", closers.append)
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "account_repository_backend", "dynamodb")
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "group_commit_enabled", True)
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "group_commit_max_delay_ms", 2.0)
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "group_commit_max_batch_items", 50)
+
+    dependency_start.start_account_dependencies()
+    accounts = RecordingInjectionManager.dependencies[BaseAccountRepository]
+    transactions = RecordingInjectionManager.dependencies[TransactionRepository]
+    writer = accounts.group_commit
+    writer.close()
+
+    assert isinstance(writer, GroupCommitWriter)
+    assert transactions.group_commit is writer
+    assert writer.max_batch_items == 50
+    assert closers == [writer.close]
+
+
+def test_account_repository_resolves_to_the_wired_instance(monkeypatch):
+    monkeypatch.setattr(dependency_start, "InjectionManager", RecordingInjectionManager)
+    monkeypatch.setattr(dependency_start.UtilitiesInjections, "configure", lambda: None)
+    monkeypatch.setattr(dependency_start.atexit, "register", lambda close: None)
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "account_repository_backend", "dynamodb")
+    monkeypatch.setattr(dependency_start.ENVIRONMENT, "group_commit_enabled", True)
+
+    dependency_start.start_account_dependencies()
+    repository = RecordingInjectionManager.get_dependency(AccountRepository)
+    repository.group_commit.close()
+
+    assert repository is RecordingInjectionManager.get_dependency(BaseAccountRepository)
+    assert isinstance(repository.group_commit, GroupCommitWriter)
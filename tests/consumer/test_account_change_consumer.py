@@ -0,0 +1,75 @@
+from src.application.consumers.account_change_consumer import AccountChangeConsumer
+from src.domain.entity.account import AccountStatus
+from src.domain.entity.account_change_event import AccountChangeEvent
+from src.infra.events.change_event_sink import ChangeEventSink, InMemoryChangeEventSink
+
+
+class FailingSink(ChangeEventSink):
+    max_batch_size = 1
+
+    def __init__(self, fail_after: int):
+        self.fail_after = fail_after
+        self.events = []
+
+    def publish(self, events: list[AccountChangeEvent]) -> None:
+        if len(self.events) >= self.fail_after:
+            raise RuntimeError("sink unavailable")
+        self.events.extend(events)
+
+
+def _record(sequence: str, event_name: str, new_status: str, old_status: str | None = None, version: int = 0):
+    record = {
+        "eventName": event_name,
+        "dynamodb": {
+            "ApproximateCreationDateTime": 1749652200,
+            "SequenceNumber": sequence,
+            "NewImage": {
+                "id": {"S": "01JXN4DSSZPX14M9CK8BVV8TS8"},
+                "tenant_id": {"S": "tenant_123"},
+                "status": {"S": new_status},
+                "version": {"N": str(version)},
+            },
+        },
+    }
+    if old_status:
+        record["dynamodb"]["OldImage"] = {"status": {"S": old_status}}
+    return record
+
+
+def test_status_changes_are_delivered():
+    sink = InMemoryChangeEventSink()
+    consumer = AccountChangeConsumer(sink)
+
+    response = consumer.handle({"Records": [
+        _record("1", "INSERT", "active"),
+        _record("2", "MODIFY", "suspended", old_status="active", version=1),
+    ]})
+
+    assert response == {"batchItemFailures": []}
+    assert [event.new_status for event in sink.events] == [AccountStatus.ACTIVE, AccountStatus.SUSPENDED]
+    assert sink.events[0].old_status is None
+    assert sink.events[1].old_status == AccountStatus.ACTIVE
+    assert sink.events[1].version == 1
+    assert sink.events[1].timestamp == "2025-06-11T14:30:00.000Z"
+
+
+def test_modify_without_status_change_is_ignored():
+    sink = InMemoryChangeEventSink()
+    consumer = AccountChangeConsumer(sink)
+
+    consumer.handle({"Records": [_record("1", "MODIFY", "active", old_status="active")]})
+
+    assert sink.events == []
+
+
+def test_failed_delivery_reports_first_undelivered_record():
+    sink = FailingSink(fail_after=1)
+    consumer = AccountChangeConsumer(sink)
+
+    response = consumer.handle({"Records": [
+        _record("1", "INSERT", "active"),
+        _record("2", "MODIFY", "suspended", old_status="active", version=1),
+    ]})
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+    assert len(sink.events) == 1
@@ -0,0 +1,131 @@
+from pathlib import Path
+
+from scripts.deploy_closure import ClosureHasher, changed_functions, closure_digests, find_deployable_functions, record
+from scripts.generate_lambda import plan_deploy
+
+ROUTERS = '''
+from utilities.frameworks.deployable import deployable
+from utilities.frameworks.deployment_target import DeploymentTarget
+from src.dependency_start import start_dependencies
+from src.services.account_service import AccountService
+from src.services.ledger_service import LedgerService
+
+LAMBDA_TARGET = DeploymentTarget.LAMBDA
+start_dependencies()
+
+account_service = AccountService()
+ledger_service = LedgerService()
+
+
+@deployable([LAMBDA_TARGET, "cloudfunction"], methods=["GET"], route="/accounts/{accountId}")
+def get_account(schema):
+    return account_service.get(schema)
+
+
+@deployable([LAMBDA_TARGET], methods=["POST"], route="/accounts/transactions")
+def record_transaction(schema):
+    return ledger_service.record(schema)
+'''
+
+FILES = {
+    "main.py": "from src.application import routers\n",
+    "requirements.txt": "pydantic==2.11.7\n",
+    "src/__init__.py": "",
+    "src/application/__init__.py": "",
+    "src/application/routers/__init__.py": "",
+    "src/application/routers/account_routers.py": ROUTERS,
+    "src/dependency_start.py": "def start_dependencies():\n    pass\n",
+    "src/services/__init__.py": "",
+    "src/services/account_service.py": "class AccountService:\n    pass\n",
+    "src/services/ledger_service.py": "from .ledger_math import total\n\n\nclass LedgerService:\n    pass\n",
+    "src/services/ledger_math.py": "def total(values):\n    return sum(values)\n",
+}
+
+
+def make_project(root: Path) -> Path:
+    for name, content in FILES.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def test_finds_deployable_functions_without_importing(tmp_path):
+    functions = {function.name: function for function in find_deployable_functions(make_project(tmp_path))}
+
+    assert functions["get_account"].targets == ["lambda", "cloudfunction"]
+    assert functions["get_account"].route == "/accounts/{accountId}"
+    assert functions["record_transaction"].methods == ["POST"]
+
+
+def test_finds_precompiled_deployable_functions(tmp_path):
+    root = make_project(tmp_path)
+    (root / "src/application/routers/lookup_routers.py").write_text(
+        "from src.application.compiled_routes import precompiled_deployable\n\n\n"
+        "@precompiled_deployable([\"lambda\"], methods=[\"GET\"], schema_cls=dict, source=\"path\", route=\"/lookups/{id}\")\n"
+        "def lookup(schema):\n    return schema\n"
+    )
+
+    functions = {function.name: function for function in find_deployable_functions(root)}
+
+    assert functions["lookup"].targets == ["lambda"]
+    assert functions["lookup"].route == "/lookups/{id}"
+
+
+def test_closure_follows_only_the_services_a_function_uses(tmp_path):
+    root = make_project(tmp_path)
+    hasher = ClosureHasher(root)
+    functions = {function.name: function for function in find_deployable_functions(root)}
+
+    get_account = {str(path.relative_to(root)) for path in hasher.function_files(functions["get_account"])}
+    record_transaction = {str(path.relative_to(root)) for path in hasher.function_files(functions["record_transaction"])}
+
+    assert "src/services/account_service.py" in get_account
+    assert "src/services/ledger_math.py" not in get_account
+    assert "src/services/ledger_math.py" in record_transaction
+    # Side-effect statements and shared inputs belong to every closure.
+    assert {"src/dependency_start.py", "main.py", "requirements.txt"} <= get_account & record_transaction
+
+
+def test_only_changed_closures_are_redeployed(tmp_path):
+    root = make_project(tmp_path)
+    manifest_path = tmp_path / "deploy_manifest.json"
+    manifest = record(manifest_path, "lambda", closure_digests("lambda", root))
+
+    (root / "src/services/ledger_math.py").write_text("# faster sum\ndef total(values):\n    return sum(values)\n")
+    assert changed_functions(closure_digests("lambda", root), manifest, "lambda") == []
+
+    (root / "src/services/ledger_math.py").write_text("import math\n\n\ndef total(values):\n    return math.fsum(values)\n")
+    assert changed_functions(closure_digests("lambda", root), manifest, "lambda") == ["record_transaction"]
+
+    (root / "requirements.txt").write_text("pydantic==2.11.9\n")
+    assert changed_functions(closure_digests("lambda", root), manifest, "lambda") == ["get_account", "record_transaction"]
+
+
+CONSUMER = "src/application/consumers/account_change_consumer.py"
+LAMBDA_FUNCTIONS = {
+    "get_account": {"methods": ["GET"], "route": "/accounts/{accountId}"},
+    "record_transaction": {"methods": ["POST"], "route": "/accounts/transactions"},
+}
+
+
+def test_changed_consumer_redeploys_the_stream_function(tmp_path):
+    root = make_project(tmp_path / "project")
+    (root / "src/application/consumers").mkdir()
+    (root / "src/application/consumers/__init__.py").write_text("")
+    (root / CONSUMER).write_text("def handle_account_change_stream(event, context=None):\n    return {}\n")
+    config_path, manifest_path = tmp_path / "serverless.yml", tmp_path / "deploy_manifest.json"
+    config_path.write_text("service: account\n")
+
+    first = plan_deploy(LAMBDA_FUNCTIONS, "split", manifest_path, config_path, root=root)
+    record(manifest_path, "lambda", first["digests"], first["config"])
+    (root / CONSUMER).write_text("def handle_account_change_stream(event, context=None):\n    return {\"batchItemFailures\": []}\n")
+    split = plan_deploy(LAMBDA_FUNCTIONS, "split", manifest_path, config_path, root=root)
+    unified = plan_deploy(LAMBDA_FUNCTIONS, "unified", manifest_path, config_path, root=root)
+
+    assert first["mode"] == "full"
+    assert {"account_change_stream", "internal_lookup"} <= set(first["digests"])
+    assert split["mode"] == "functions"
+    assert split["functions"] == ["account_change_stream"]
+    assert split["commands"] == ["serverless deploy function -f account_change_stream --stage $ENVIRONMENT"]
+    assert unified["commands"] == ["serverless deploy function -f account_change_stream --stage $ENVIRONMENT"]
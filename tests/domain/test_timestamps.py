@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.entity.timestamps import is_canonical, normalize_timestamp, to_epoch_millis, utc_now
+
+
+@pytest.mark.parametrize("stored", [
+    "11-06-2025 14:30:00",
+    "2025-06-11T14:30:00Z",
+    "2025-06-11T11:30:00-03:00",
+    "2025-06-11 14:30:00",
+    1_749_652_200,
+    1_749_652_200_000,
+    "1749652200000",
+    datetime(2025, 6, 11, 14, 30),
+])
+def test_every_stored_encoding_decodes_to_the_same_instant(stored):
+    assert normalize_timestamp(stored) == "2025-06-11T14:30:00.000Z"
+    assert to_epoch_millis(stored) == 1_749_652_200_000
+
+
+def test_canonical_encoding_sorts_chronologically():
+    instants = [datetime(2024, 12, 31, 23, 59, 59, 999000), datetime(2025, 1, 1), datetime(2025, 6, 11, 9, 5)]
+    legacy = [instant.strftime("%d-%m-%Y %H:%M:%S") for instant in instants]
+
+    canonical = [normalize_timestamp(value) for value in legacy]
+
+    assert sorted(legacy) != legacy
+    assert sorted(canonical) == canonical
+    assert all(is_canonical(value) for value in canonical)
+    assert not any(is_canonical(value) for value in legacy)
+
+
+def test_utc_now_is_canonical():
+    now = utc_now()
+
+    assert is_canonical(now)
+    assert abs(to_epoch_millis(now) - datetime.now(timezone.utc).timestamp() * 1000) < 5_000
+
+
+def test_empty_and_invalid_values():
+    assert normalize_timestamp(None) is None
+    assert normalize_timestamp("") is None
+    with pytest.raises(ValueError):
+        normalize_timestamp("yesterday")
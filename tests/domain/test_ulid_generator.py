@@ -0,0 +1,51 @@
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator, decode_ulid_timestamp, encode_ulid
+from src.infra.repositories.key_sharding import KeySharding
+
+FROZEN_NS = 1_749_652_200_000 * 1_000_000
+
+
+def _frozen_generator(entropy: bytes = bytes(10)) -> MonotonicUlidGenerator:
+    return MonotonicUlidGenerator(clock=lambda: FROZEN_NS, entropy=lambda size: entropy)
+
+
+def test_ids_are_strictly_increasing_within_the_same_millisecond():
+    generator = _frozen_generator()
+
+    ids = [generator.new() for _ in range(1000)] + generator.allocate(5000)
+
+    assert all(len(ulid) == 26 for ulid in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_timestamp_is_embedded():
+    generator = _frozen_generator()
+
+    assert decode_ulid_timestamp(generator.new()) == FROZEN_NS // 1_000_000
+
+
+def test_batch_crossing_a_suffix_block_matches_plain_encoding():
+    generator = _frozen_generator(entropy=(0xFFFFF - 10).to_bytes(10, "big"))
+
+    ids = generator.allocate(50)
+    first = (FROZEN_NS // 1_000_000) << 80 | (0xFFFFF - 10)
+
+    assert ids == [encode_ulid(first + offset) for offset in range(50)]
+
+
+def test_random_overflow_moves_to_next_millisecond():
+    generator = _frozen_generator(entropy=b"\xff" * 10)
+    generator.new()
+    generator._last_random = (1 << 80) - 1
+
+    ulid = generator.new()
+
+    assert decode_ulid_timestamp(ulid) == FROZEN_NS // 1_000_000 + 1
+
+
+def test_key_sharding_is_deterministic_and_disabled_with_one_shard():
+    sharding = KeySharding(shard_count=8)
+
+    assert sharding.partition_key("account", "01JXN4DSSZPX14M9CK8BVV8TS8") == sharding.partition_key("account", "01JXN4DSSZPX14M9CK8BVV8TS8")
+    assert sharding.partition_key("account", "01JXN4DSSZPX14M9CK8BVV8TS8") in sharding.partition_keys("account")
+    assert KeySharding().partition_key("account", "01JXN4DSSZPX14M9CK8BVV8TS8") == "account"
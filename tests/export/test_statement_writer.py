@@ -0,0 +1,102 @@
+import csv
+import gzip
+import io
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse
+
+from src.domain.services.transaction_service import TransactionService
+from src.infra.exports import statement_writer
+from src.infra.exports.object_store import LocalObjectStore
+from src.infra.exports.statement_writer import STATEMENT_COLUMNS, build_statement_writer, statement_format_available
+
+
+def _pages(rows: int, page_size: int):
+    for start in range(0, rows, page_size):
+        yield [
+            {
+                "id": f"01JX{index:022d}",
+                "tenant_id": "tenant_123",
+                "account_id": "acc-1",
+                "timestamp": f"2025-06-11T14:30:{index % 60:02d}.000Z",
+                "amount": Decimal("10.50"),
+                "type": "CREDIT",
+                "currency": "BRL",
+                "product": "VOUCHER",
+                "reference": f"Pedido #{index}",
+                "balance_snapshot": Decimal("10.50") * (index + 1),
+                "metadata": {"parcelas": 12} if index == 0 else None,
+            }
+            for index in range(start, min(start + page_size, rows))
+        ]
+
+
+def _export(tmp_path, export_format: str, rows: int = 2500) -> Path:
+    store = LocalObjectStore(str(tmp_path))
+    with store.open_write(f"statements/out.{export_format}") as stream:
+        writer = build_statement_writer(export_format, stream, batch_rows=1000)
+        for page in _pages(rows, 300):
+            writer.write_rows(page)
+        writer.close()
+    assert writer.rows == rows
+    return tmp_path / "statements" / f"out.{export_format}"
+
+
+def test_gzip_csv_round_trip(tmp_path):
+    path = _export(tmp_path, "csv.gz")
+
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    assert tuple(rows[0]) == STATEMENT_COLUMNS
+    assert len(rows) == 2500
+    assert rows[0]["metadata"] == '{"parcelas": 12}'
+    assert rows[-1]["reference"] == "Pedido #2499"
+
+
+def test_parquet_and_arrow_round_trip(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    parquet = pyarrow.parquet.read_table(_export(tmp_path, "parquet"))
+    arrow = pyarrow.ipc.open_stream(_export(tmp_path, "arrow").read_bytes()).read_all()
+
+    for table in (parquet, arrow):
+        assert table.num_rows == 2500
+        assert table.column_names == list(STATEMENT_COLUMNS)
+        assert table.column("balance_snapshot")[-1].as_py() == Decimal("10.50") * 2500
+    assert pyarrow.parquet.ParquetFile(tmp_path / "statements" / "out.parquet").num_row_groups == 3
+
+
+def test_columnar_formats_are_unavailable_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(statement_writer, "_load_pyarrow", lambda: None)
+
+    assert not statement_format_available("parquet")
+    assert not statement_format_available("arrow")
+    assert statement_format_available("csv.gz")
+
+
+def test_export_rejects_unavailable_formats_instead_of_switching(tmp_path, monkeypatch):
+    monkeypatch.setattr(statement_writer, "_load_pyarrow", lambda: None)
+    service = TransactionService(transaction_repository=None, object_store=LocalObjectStore(str(tmp_path)))
+
+    response = service.export_statement("2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z", account_id="acc-1")
+
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == 400
+    assert not (tmp_path / "statements").exists()
+
+
+def test_failed_export_leaves_no_object(tmp_path):
+    store = LocalObjectStore(str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        with store.open_write("statements/broken.csv.gz") as stream:
+            stream.write(b"partial")
+            raise RuntimeError("query failed")
+
+    assert list((tmp_path / "statements").iterdir()) == []
@@ -1,3 +1,6 @@
+import json
+from uuid import uuid4
+
 from utilities.frameworks.aws_event.api_gateway_v2_event import APIGatewayV2Event
 
 from main import lambda_create_account
@@ -24,7 +27,7 @@ def test_create_account():
                 "path": "/accounts/create"
             }
         },
-        "body": '{"tenant_id": "tenant123", "owner_id": "owner456"}',
+        "body": json.dumps({"tenant_id": "tenant123", "owner_id": f"owner-{uuid4()}"}),
         "isBase64Encoded": False
     }
 
@@ -0,0 +1,168 @@
+import copy
+import itertools
+import threading
+
+from google.api_core import exceptions
+
+
+class FakeSnapshot:
+    """Result of a document read: the same attributes the repository uses on a real DocumentSnapshot."""
+
+    def __init__(self, document_id: str, data: dict | None, update_time: int | None):
+        self.id = document_id
+        self.exists = data is not None
+        self.update_time = update_time
+        self._data = data
+
+    def to_dict(self) -> dict | None:
+        return copy.deepcopy(self._data)
+
+
+class FakeWriteOption:
+    def __init__(self, last_update_time):
+        self.last_update_time = last_update_time
+
+
+class FakeDocumentReference:
+    def __init__(self, collection: "FakeCollection", document_id: str):
+        self._collection = collection
+        self.id = document_id
+
+    def get(self, field_paths=None, **options) -> FakeSnapshot:
+        with self._collection.lock:
+            data, update_time = self._collection.documents.get(self.id, (None, None))
+        if data is not None and field_paths is not None:
+            data = {field: value for field, value in data.items() if field in field_paths}
+        return FakeSnapshot(self.id, copy.deepcopy(data), update_time)
+
+    def create(self, document_data: dict, **options) -> None:
+        with self._collection.lock:
+            if self.id in self._collection.documents:
+                raise exceptions.AlreadyExists(f"Document {self.id} already exists")
+            self._collection.write(self.id, document_data)
+
+    def set(self, document_data: dict, **options) -> None:
+        with self._collection.lock:
+            self._collection.write(self.id, document_data)
+
+    def update(self, field_updates: dict, option: FakeWriteOption | None = None, **options) -> None:
+        with self._collection.lock:
+            if self.id not in self._collection.documents:
+                raise exceptions.NotFound(f"Document {self.id} does not exist")
+            data, update_time = self._collection.documents[self.id]
+            if option is not None and option.last_update_time != update_time:
+                raise exceptions.FailedPrecondition(f"Document {self.id} was updated since it was read")
+            self._collection.write(self.id, {**data, **field_updates})
+
+    def delete(self, **options) -> None:
+        with self._collection.lock:
+            self._collection.documents.pop(self.id, None)
+
+
+class FakeQuery:
+    """Supports the equality filter, `__name__` ordering, cursors and limits used by the repository."""
+
+    def __init__(self, collection: "FakeCollection", filters=(), start_after=None, limit=None):
+        self._collection = collection
+        self._filters = filters
+        self._start_after = start_after
+        self._limit = limit
+
+    def _copy(self, **changes) -> "FakeQuery":
+        state = {"filters": self._filters, "start_after": self._start_after, "limit": self._limit, **changes}
+        return FakeQuery(self._collection, **state)
+
+    def where(self, filter) -> "FakeQuery":
+        assert filter.op_string == "=="
+        return self._copy(filters=self._filters + ((filter.field_path, filter.value),))
+
+    def order_by(self, field_path: str) -> "FakeQuery":
+        assert field_path == "__name__"
+        return self
+
+    def select(self, field_paths) -> "FakeQuery":
+        return self
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit=count)
+
+    def start_after(self, document_fields: dict) -> "FakeQuery":
+        return self._copy(start_after=document_fields["__name__"])
+
+    def stream(self, **options):
+        with self._collection.lock:
+            matching = sorted(
+                document_id for document_id, (data, _) in self._collection.documents.items()
+                if all(data.get(field) == value for field, value in self._filters)
+                and (self._start_after is None or document_id > self._start_after)
+            )
+        for document_id in matching[:self._limit]:
+            yield FakeSnapshot(document_id, {}, None)
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self):
+        super().__init__(self)
+        self.documents: dict[str, tuple[dict, int]] = {}
+        self.lock = threading.RLock()
+        self._clock = itertools.count(1)
+
+    def write(self, document_id: str, data: dict) -> None:
+        self.documents[document_id] = (copy.deepcopy(data), next(self._clock))
+
+    def document(self, document_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self, document_id)
+
+
+class FakeWriteBatch:
+    """All-or-nothing like a real batch: no write applies if a `create` target exists."""
+
+    def __init__(self, client: "FakeFirestoreClient"):
+        self._client = client
+        self._writes: list[tuple[str, FakeDocumentReference, dict | None]] = []
+
+    def create(self, reference: FakeDocumentReference, document_data: dict) -> None:
+        assert len(self._writes) < 500, "A Firestore batch holds at most 500 writes"
+        self._writes.append(("create", reference, document_data))
+
+    def delete(self, reference: FakeDocumentReference) -> None:
+        assert len(self._writes) < 500, "A Firestore batch holds at most 500 writes"
+        self._writes.append(("delete", reference, None))
+
+    def commit(self, **options) -> None:
+        self._client.commits += 1
+        with self._client.lock:
+            for operation, reference, _ in self._writes:
+                if operation == "create" and reference.id in reference._collection.documents:
+                    raise exceptions.AlreadyExists(f"Document {reference.id} already exists")
+            for operation, reference, document_data in self._writes:
+                if operation == "create":
+                    reference.create(document_data)
+                else:
+                    reference.delete()
+
+
+class FakeFirestoreClient:
+    """
+    In-memory stand-in for `google.cloud.firestore.Client`, covering the calls made by
+    FirestoreAccountRepository. `update_time` is a per-collection write counter.
+    """
+
+    def __init__(self):
+        self._collections: dict[str, FakeCollection] = {}
+        self.commits = 0
+        self.lock = threading.RLock()
+
+    def collection(self, name: str) -> FakeCollection:
+        return self._collections.setdefault(name, FakeCollection())
+
+    def get_all(self, references, **options):
+        for reference in references:
+            yield reference.get()
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    @staticmethod
+    def write_option(last_update_time=None) -> FakeWriteOption:
+        return FakeWriteOption(last_update_time)
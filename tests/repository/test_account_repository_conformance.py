@@ -0,0 +1,215 @@
+import os
+import threading
+import uuid
+
+import pytest
+
+from src.domain.deadlines.request_deadline import Deadline, DeadlineExceeded
+from src.domain.entity.account import Account, AccountStatus
+from src.infra.repositories.base_account_repository import BaseAccountRepository, DuplicateOwner, StatusTransitionConflict
+from src.infra.repositories.firestore_account_repository import FirestoreAccountRepository
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+from src.infra.repositories.mongo_account_repository import MongoAccountRepository
+from tests.repository.firestore_fake import FakeFirestoreClient
+
+# Every backend runs against an in-process fake; real servers join the suite when
+# their endpoint is configured (MONGODB_URI, FIRESTORE_EMULATOR_HOST, DYNAMODB_ENDPOINT_URL).
+BACKENDS = ["memory", "mongomock", "firestore-fake", "mongodb", "firestore-emulator", "dynamodb"]
+
+
+def _build(kind: str) -> BaseAccountRepository:
+    collection = f"accounts_{uuid.uuid4().hex[:8]}"
+    match kind:
+        case "memory":
+            return InMemoryAccountRepository()
+        case "mongomock":
+            mongomock = pytest.importorskip("mongomock")
+            repository = MongoAccountRepository(mongomock.MongoClient()["account"][collection])
+            repository.ensure_indexes()
+            return repository
+        case "firestore-fake":
+            return FirestoreAccountRepository(FakeFirestoreClient(), collection)
+        case "mongodb":
+            if not os.getenv("MONGODB_URI"):
+                pytest.skip("MONGODB_URI is not set")
+            repository = MongoAccountRepository.from_uri(os.environ["MONGODB_URI"], collection=collection)
+            repository.ensure_indexes()
+            return repository
+        case "firestore-emulator":
+            if not os.getenv("FIRESTORE_EMULATOR_HOST"):
+                pytest.skip("FIRESTORE_EMULATOR_HOST is not set")
+            return FirestoreAccountRepository.from_project("account-conformance", collection=collection)
+        case "dynamodb":
+            if not os.getenv("DYNAMODB_ENDPOINT_URL"):
+                pytest.skip("DYNAMODB_ENDPOINT_URL is not set")
+            from src.infra.repositories.account_repository import AccountRepository
+
+            return AccountRepository()
+
+
+@pytest.fixture(params=BACKENDS)
+def repository(request) -> BaseAccountRepository:
+    return _build(request.param)
+
+
+def _account(tenant_id: str = "tenant_a", status: AccountStatus = AccountStatus.ACTIVE) -> Account:
+    return Account(
+        id=uuid.uuid4().hex,
+        tenant_id=tenant_id,
+        owner_id=f"owner_{uuid.uuid4().hex[:6]}",
+        status=status,
+        created_at="2025-01-01T00:00:00.000Z",
+        updated_at="2025-01-01T00:00:00.000Z",
+    )
+
+
+def test_create_read_update_delete(repository):
+    account = _account()
+
+    assert repository.create(account) == account.id
+    stored = repository.get_by_id(account.id)
+    assert stored.model_dump() == account.model_dump()
+    assert repository.find_by_id(account.id).model_dump() == account.model_dump()
+    assert repository.find_by_id(account.id, consistent=True).model_dump() == account.model_dump()
+
+    changed = account.model_copy(update={"owner_id": "owner_new"})
+    repository.update(account.id, changed)
+    assert repository.find_by_id(account.id).owner_id == "owner_new"
+
+    repository.delete(account.id)
+    assert repository.find_by_id(account.id) is None
+
+
+def test_second_account_of_an_owner_is_rejected_with_the_existing_id(repository):
+    account = _account()
+    repository.create(account)
+    second = _account().model_copy(update={"owner_id": account.owner_id})
+
+    with pytest.raises(DuplicateOwner) as rejected:
+        repository.create(second)
+
+    assert rejected.value.account_id == account.id
+    assert repository.find_by_id(second.id) is None
+    assert repository.create(_account().model_copy(update={"owner_id": account.owner_id, "tenant_id": "tenant_b"}))
+
+
+def test_find_id_by_owner_follows_create_and_delete(repository):
+    account = _account()
+    assert repository.find_id_by_owner(account.tenant_id, account.owner_id) is None
+
+    repository.create(account)
+    assert repository.find_id_by_owner(account.tenant_id, account.owner_id, consistent=True) == account.id
+
+    repository.delete(account.id)
+    assert repository.find_id_by_owner(account.tenant_id, account.owner_id, consistent=True) is None
+    replacement = _account().model_copy(update={"owner_id": account.owner_id})
+    assert repository.create(replacement) == replacement.id
+
+
+def test_get_projected_returns_only_the_requested_fields(repository):
+    account = _account()
+    repository.create(account)
+
+    assert repository.get_projected(account.id, ["id", "status"]) == {"id": account.id, "status": "active"}
+    assert repository.get_projected(account.id, ["version"]) == {"version": 0}
+    assert repository.get_projected("missing", ["status"]) is None
+
+
+def test_transition_applies_allowed_moves_and_increments_version(repository):
+    account = _account()
+    repository.create(account)
+
+    suspended = repository.transition_status(account.id, AccountStatus.SUSPENDED, "fraud", "2025-01-02T00:00:00.000Z")
+
+    assert suspended.status == AccountStatus.SUSPENDED
+    assert suspended.version == 1
+    stored = repository.find_by_id(account.id)
+    assert (stored.status, stored.suspension_reason, stored.version) == (AccountStatus.SUSPENDED, "fraud", 1)
+    assert stored.updated_at == "2025-01-02T00:00:00.000Z"
+
+
+def test_transition_conflicts_leave_the_account_unchanged(repository):
+    account = _account(status=AccountStatus.CLOSED)
+    repository.create(account)
+
+    with pytest.raises(StatusTransitionConflict) as conflict:
+        repository.transition_status(account.id, AccountStatus.ACTIVE, None, "2025-01-02T00:00:00.000Z")
+    assert conflict.value.current.status == AccountStatus.CLOSED
+    assert repository.find_by_id(account.id).version == 0
+
+    with pytest.raises(StatusTransitionConflict) as missing:
+        repository.transition_status("missing", AccountStatus.SUSPENDED, None, "2025-01-02T00:00:00.000Z")
+    assert missing.value.current is None
+
+
+def test_concurrent_transitions_apply_exactly_once(repository):
+    account = _account()
+    repository.create(account)
+    outcomes = []
+
+    def close():
+        try:
+            repository.transition_status(account.id, AccountStatus.CLOSED, None, "2025-01-02T00:00:00.000Z")
+            outcomes.append("applied")
+        except StatusTransitionConflict:
+            outcomes.append("conflict")
+
+    threads = [threading.Thread(target=close) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(outcomes) == ["applied"] + ["conflict"] * 7
+    assert repository.find_by_id(account.id).version == 1
+
+
+def test_query_ids_by_tenant_pages_through_every_account(repository):
+    tenant_id = f"tenant_{uuid.uuid4().hex[:8]}"
+    accounts = [_account(tenant_id) for _ in range(7)]
+    repository.batch_create(accounts + [_account("other_tenant")])
+
+    ids, cursor = [], None
+    pages = 0
+    while True:
+        page, cursor = repository.query_ids_by_tenant(tenant_id, cursor=cursor, limit=3)
+        ids.extend(page)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert sorted(ids) == sorted(account.id for account in accounts)
+    assert pages == 3
+
+
+def test_batch_get_skips_missing_and_duplicate_ids(repository):
+    accounts = [_account() for _ in range(120)]
+    repository.batch_create(accounts)
+
+    wanted = [account.id for account in accounts] + ["missing", accounts[0].id]
+    found = repository.batch_get(wanted)
+
+    assert sorted(account.id for account in found) == sorted(account.id for account in accounts)
+    assert {account.owner_id for account in found} == {account.owner_id for account in accounts}
+
+
+def test_expired_deadline_fails_before_calling_the_backend(repository):
+    account = _account()
+    repository.create(account)
+    expired = Deadline(expires_at=0.0, clock=lambda: 1.0)
+
+    with pytest.raises(DeadlineExceeded):
+        repository.find_by_id(account.id, deadline=expired)
+    with pytest.raises(DeadlineExceeded):
+        repository.transition_status(account.id, AccountStatus.CLOSED, None, "2025-01-02T00:00:00.000Z", deadline=expired)
+    assert repository.find_by_id(account.id).status == AccountStatus.ACTIVE
+
+
+def test_firestore_batch_create_commits_in_chunks_of_500():
+    client = FakeFirestoreClient()
+    repository = FirestoreAccountRepository(client)
+
+    repository.batch_create([_account() for _ in range(1200)])
+
+    assert client.commits == 3
+    assert len(repository.batch_get([])) == 0
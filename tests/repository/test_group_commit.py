@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.infra.repositories.group_commit import GroupCommitWriter
+
+
+class FakeDynamoDB:
+    """
+    Stand-in client: `attribute_not_exists` puts and ADD updates, all or nothing per call.
+    """
+
+    def __init__(self, unprocessed_once: int = 0):
+        self.items: dict[str, dict] = {}
+        self.counters: dict[str, int] = {}
+        self.calls: list[int] = []
+        self.unprocessed_once = unprocessed_once
+        self.lock = threading.Lock()
+
+    def transact_write_items(self, TransactItems):
+        time.sleep(0.005)
+        with self.lock:
+            self.calls.append(len(TransactItems))
+            reasons = []
+            for operation in TransactItems:
+                if "Put" in operation:
+                    exists = operation["Put"]["Item"]["id"]["S"] in self.items
+                    reasons.append({"Code": "ConditionalCheckFailed" if exists else "None"})
+                else:
+                    reasons.append({"Code": "None"})
+            if any(reason["Code"] != "None" for reason in reasons):
+                raise ClientError(
+                    {"Error": {"Code": "TransactionCanceledException", "Message": "cancelled"}, "CancellationReasons": reasons},
+                    "TransactWriteItems",
+                )
+            for operation in TransactItems:
+                if "Put" in operation:
+                    self.items[operation["Put"]["Item"]["id"]["S"]] = operation["Put"]["Item"]
+                else:
+                    key = operation["Update"]["Key"]["counter_key"]["S"]
+                    self.counters[key] = self.counters.get(key, 0) + 1
+            return {}
+
+    def batch_write_item(self, RequestItems):
+        with self.lock:
+            (table_name, requests), = RequestItems.items()
+            self.calls.append(len(requests))
+            unprocessed = requests[:self.unprocessed_once]
+            self.unprocessed_once = 0
+            for request in requests[len(unprocessed):]:
+                self.items[request["PutRequest"]["Item"]["id"]["S"]] = request["PutRequest"]["Item"]
+            return {"UnprocessedItems": {table_name: unprocessed}} if unprocessed else {}
+
+
+def put(item_id):
+    return {"Put": {"TableName": "tx", "Item": {"id": {"S": item_id}}, "ConditionExpression": "attribute_not_exists(id)"}}
+
+
+def update(counter):
+    return {"Update": {"TableName": "counters", "Key": {"counter_key": {"S": counter}}, "UpdateExpression": "ADD n :one"}}
+
+
+def writer_for(client, **options):
+    writer = GroupCommitWriter(client_factory=lambda: client, **options)
+    writer.register_table("tx", ("id",))
+    return writer
+
+
+def test_concurrent_transactions_share_requests_and_resolve_individually():
+    client = FakeDynamoDB()
+    writer = writer_for(client, max_delay_ms=50, max_batch_items=100)
+
+    futures = [writer.transact([put(f"t{index}"), update(f"c{index}")]) for index in range(30)]
+    for future in futures:
+        assert future.result(timeout=5) is None
+    writer.close()
+
+    assert len(client.items) == 30
+    assert sum(client.calls) == 60
+    assert len(client.calls) < 30
+
+
+def test_failed_condition_fails_only_its_caller():
+    client = FakeDynamoDB()
+    client.items["t1"] = {"id": {"S": "t1"}}
+    writer = writer_for(client, max_delay_ms=50)
+
+    duplicate = writer.transact([put("t1"), update("c1")])
+    fresh = writer.transact([put("t2"), update("c2")])
+
+    assert fresh.result(timeout=5) is None
+    with pytest.raises(ClientError) as error:
+        duplicate.result(timeout=5)
+    writer.close()
+
+    assert error.value.response["Error"]["Code"] == "TransactionCanceledException"
+    assert [reason["Code"] for reason in error.value.response["CancellationReasons"]] == ["ConditionalCheckFailed", "None"]
+    assert client.counters == {"c2": 1}
+
+
+def test_writes_on_the_same_item_never_share_a_request():
+    client = FakeDynamoDB()
+    writer = writer_for(client, max_delay_ms=50)
+
+    futures = [writer.transact([put(f"t{index}"), update("same-rollup")]) for index in range(3)]
+    for future in futures:
+        future.result(timeout=5)
+    writer.close()
+
+    assert client.calls == [2, 2, 2]
+    assert client.counters == {"same-rollup": 3}
+
+
+def test_unprocessed_puts_are_retried():
+    client = FakeDynamoDB(unprocessed_once=2)
+    writer = writer_for(client, max_delay_ms=50)
+
+    futures = [writer.put("tx", {"id": {"S": f"a{index}"}}) for index in range(5)]
+    for future in futures:
+        assert future.result(timeout=5) is None
+    writer.close()
+
+    assert sorted(client.items) == ["a0", "a1", "a2", "a3", "a4"]
+    assert sum(client.calls) > 5
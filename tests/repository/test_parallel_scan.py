@@ -0,0 +1,72 @@
+import threading
+
+from src.infra.repositories.parallel_scan import CapacityRateLimiter, ParallelScanner, ScanCheckpoint
+
+
+class InMemoryScanClient:
+    """Serves `scan` requests from a list of items, split into segments by position."""
+
+    def __init__(self, total_items: int):
+        self.items = [{"id": {"S": f"acc-{index:05d}"}, "version": {"N": str(index)}} for index in range(total_items)]
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def scan(self, **params):
+        with self.lock:
+            self.requests += 1
+        segment_items = self.items[params["Segment"]::params["TotalSegments"]]
+        start = int(params.get("ExclusiveStartKey", {}).get("position", {}).get("N", 0))
+        page = segment_items[start:start + params["Limit"]]
+        response = {"Items": page, "ConsumedCapacity": {"CapacityUnits": len(page) * 0.5}}
+        if start + params["Limit"] < len(segment_items):
+            response["LastEvaluatedKey"] = {"position": {"N": str(start + params["Limit"])}}
+        return response
+
+
+def test_every_item_is_delivered_once_across_segments():
+    client = InMemoryScanClient(1000)
+    scanner = ParallelScanner(client, "account-table", total_segments=4, page_size=30, max_buffered_pages=2)
+
+    items = list(scanner.items())
+
+    assert sorted(item["id"] for item in items) == [f"acc-{index:05d}" for index in range(1000)]
+    assert isinstance(items[0]["version"], int)
+    assert scanner.consumed_capacity == 500.0
+
+
+def test_interrupted_scan_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "scan.json")
+    client = InMemoryScanClient(500)
+
+    first_run = ParallelScanner(client, "account-table", total_segments=3, page_size=20,
+                                checkpoint=ScanCheckpoint(path, 3))
+    seen = []
+    for page in first_run.pages():
+        seen.extend(item["id"] for item in page.items)
+        if len(seen) >= 200:
+            break
+
+    checkpoint = ScanCheckpoint(path, 3)
+    assert not checkpoint.done
+    second_run = ParallelScanner(client, "account-table", total_segments=3, page_size=20, checkpoint=checkpoint)
+    seen.extend(item["id"] for item in second_run.items())
+
+    assert set(seen) == {f"acc-{index:05d}" for index in range(500)}
+    assert len(seen) - 500 <= 3 * 20
+    assert ScanCheckpoint(path, 3).done
+
+
+def test_rate_limiter_waits_for_debt_to_be_repaid():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = CapacityRateLimiter(100, clock=lambda: now[0], sleep=sleep)
+    limiter.acquire()
+    limiter.consume(350)
+    limiter.acquire()
+
+    assert sleeps == [2.5]
@@ -0,0 +1,119 @@
+from decimal import Decimal
+
+from src.domain.entity.daily_rollup import DailyRollup
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.infra.repositories.daily_rollup_repository import DailyRollupRepository
+from src.infra.repositories.dynamodb_items import deserialize_item
+
+
+class FakeRollupClient:
+    """
+    Stand-in DynamoDB client for the rollup table: applies the `ADD` of an
+    increment, puts, deletes and `BETWEEN` queries on (account_id, rollup_key).
+    """
+
+    def __init__(self):
+        self.items: dict[tuple[str, str], dict] = {}
+
+    def apply(self, operation: dict) -> None:
+        update = operation["Update"]
+        key = (update["Key"]["account_id"]["S"], update["Key"]["rollup_key"]["S"])
+        values = deserialize_item(update["ExpressionAttributeValues"])
+        amount_field, count_field = update["UpdateExpression"].split("ADD ")[1].replace(" :amount", "").replace(" :one", "").split(", ")
+        item = self.items.setdefault(key, {"account_id": key[0], "rollup_key": key[1]})
+        item.update(tenant_id=values[":tenant_id"], day=values[":day"], product=values[":product"])
+        item[amount_field] = item.get(amount_field, Decimal(0)) + Decimal(update["ExpressionAttributeValues"][":amount"]["N"])
+        item[count_field] = item.get(count_field, 0) + values[":one"]
+
+    def put_item(self, TableName, Item):
+        item = deserialize_item(Item)
+        self.items[(item["account_id"], item["rollup_key"])] = item
+
+    def delete_item(self, TableName, Key):
+        self.items.pop((Key["account_id"]["S"], Key["rollup_key"]["S"]), None)
+
+    def transact_write_items(self, TransactItems):
+        for operation in TransactItems:
+            if "Put" in operation:
+                self.put_item(**operation["Put"])
+            else:
+                self.delete_item(**operation["Delete"])
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, **params):
+        values = deserialize_item(params["ExpressionAttributeValues"])
+        yield {"Items": [
+            {name: _attribute(value) for name, value in item.items()}
+            for (account_id, sort_key), item in sorted(self.items.items())
+            if account_id == values[":account_id"] and values[":first"] <= sort_key <= values[":last"]
+        ]}
+
+
+def _attribute(value):
+    return {"N": str(value)} if isinstance(value, (int, Decimal)) else {"S": value}
+
+
+class ShardedRollupRepository(DailyRollupRepository):
+    def __init__(self, client, shard_count):
+        super().__init__(shard_count=shard_count)
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client
+
+
+def _record(client, repository, count: int, product: str = "PIX") -> None:
+    ids = MonotonicUlidGenerator()
+    for index in range(count):
+        client.apply(repository.increment_operation(TransactionEntry(
+            id=ids.new(), account_id="hot-account", tenant_id="tenant123", timestamp="2025-06-11T10:00:00.000Z",
+            amount=0.1, type=TransactionType.CREDIT if index % 4 else TransactionType.DEBIT, product=product,
+            reference=f"ref-{index}",
+        )))
+
+
+def test_increments_spread_over_shards_and_are_summed_on_read():
+    client = FakeRollupClient()
+    repository = ShardedRollupRepository(client, shard_count=4)
+    _record(client, repository, 100)
+    _record(client, repository, 10, product="TED")
+
+    rollups = repository.query("hot-account", "2025-06-11", "2025-06-11")
+
+    assert len({sort_key for _, sort_key in client.items if sort_key.startswith("2025-06-11#PIX#")}) == 4
+    assert [(rollup.product, rollup.credit_count, rollup.debit_count) for rollup in rollups] == [
+        ("PIX", 75, 25), ("TED", 7, 3),
+    ]
+    assert rollups[0].credits == Decimal("7.5")
+    assert rollups[0].debits == Decimal("2.5")
+
+
+def test_rebuild_folds_the_shards_into_one_item():
+    client = FakeRollupClient()
+    repository = ShardedRollupRepository(client, shard_count=4)
+    _record(client, repository, 20)
+
+    repository.put(DailyRollup(
+        account_id="hot-account", tenant_id="tenant123", day="2025-06-11", product="PIX",
+        credits=Decimal("1.5"), credit_count=15, debits=Decimal("0.5"), debit_count=5,
+    ))
+    _record(client, repository, 4)
+    rollup, = repository.query("hot-account", "2025-06-11", "2025-06-11")
+
+    assert (rollup.credit_count, rollup.debit_count, rollup.credits) == (18, 6, Decimal("1.8"))
+
+    repository.delete("hot-account", "2025-06-11", "PIX")
+
+    assert client.items == {}
+
+
+def test_one_shard_keeps_the_unsuffixed_key():
+    client = FakeRollupClient()
+    repository = ShardedRollupRepository(client, shard_count=1)
+    _record(client, repository, 3)
+
+    assert list(client.items) == [("hot-account", "2025-06-11#PIX")]
@@ -0,0 +1,111 @@
+import random
+
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.infra.repositories.dynamodb_items import deserialize_item
+from src.infra.repositories.transaction_repository import ACCOUNT_SHARD_TIMESTAMP_INDEX_NAME, TransactionRepository
+
+
+class FakeIndexClient:
+    """
+    Stand-in DynamoDB client: puts from `transact_write_items` and `Query` on a GSI sorted by (timestamp, id).
+    """
+
+    def __init__(self):
+        self.items: list[dict] = []
+        self.queries: list[str] = []
+
+    def transact_write_items(self, TransactItems):
+        self.items.append(TransactItems[0]["Put"]["Item"])
+
+    def query(self, **params):
+        key_name = params["ExpressionAttributeNames"]["#key"]
+        values = params["ExpressionAttributeValues"]
+        self.queries.append(params["IndexName"])
+        rows = sorted(
+            (item for item in self.items
+             if key_name in item and item[key_name] == values[":key"]
+             and values[":start"]["S"] <= item["timestamp"]["S"] <= values[":end"]["S"]),
+            key=lambda item: (item["timestamp"]["S"], item["id"]["S"]),
+        )
+        if "ExclusiveStartKey" in params:
+            after = (params["ExclusiveStartKey"]["timestamp"]["S"], params["ExclusiveStartKey"]["id"]["S"])
+            rows = [item for item in rows if (item["timestamp"]["S"], item["id"]["S"]) > after]
+        evaluated = rows[:params["Limit"]]
+        response = {"Items": [
+            item for item in evaluated
+            if ":product" not in values or item["product"] == values[":product"]
+        ]}
+        if len(rows) > params["Limit"]:
+            last = evaluated[-1]
+            response["LastEvaluatedKey"] = {name: last[name] for name in ("id", key_name, "timestamp")}
+        return response
+
+
+class ShardedTransactionRepository(TransactionRepository):
+    def __init__(self, client, index_shards):
+        super().__init__(index_shards=index_shards)
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client
+
+
+def _store(repository, count: int) -> list[str]:
+    ids, rng = MonotonicUlidGenerator(), random.Random(7)
+    for index in range(count):
+        repository.create_once(TransactionEntry(
+            id=ids.new(), account_id="hot-account", timestamp=f"2025-06-11T10:{rng.randrange(60):02d}:00.000Z",
+            amount=1.0, type=TransactionType.CREDIT, product="PIX" if index % 3 else "TED", reference=f"ref-{index}",
+        ))
+    return sorted(
+        (deserialize_item(item) for item in repository.client.items),
+        key=lambda item: (item["timestamp"], item["id"]),
+    )
+
+
+def test_sharded_index_spreads_writes_and_reads_them_back_in_order_across_pages():
+    client = FakeIndexClient()
+    repository = ShardedTransactionRepository(client, index_shards=4)
+    stored = _store(repository, 50)
+
+    assert len({item["account_shard"] for item in stored}) == 4
+    ids, cursor = [], None
+    while True:
+        page, cursor = repository.query_range(
+            "2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z", account_id="hot-account", cursor=cursor, limit=7,
+        )
+        assert len(page) <= 7 and all("account_shard" not in item for item in page)
+        ids += [item["id"] for item in page]
+        if cursor is None:
+            break
+
+    assert ids == [item["id"] for item in stored]
+    assert set(client.queries) == {ACCOUNT_SHARD_TIMESTAMP_INDEX_NAME}
+
+
+def test_sharded_index_applies_the_product_filter():
+    client = FakeIndexClient()
+    repository = ShardedTransactionRepository(client, index_shards=3)
+    stored = _store(repository, 30)
+
+    items = [
+        item for page, _ in repository.query_range_pages(
+            "2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z", account_id="hot-account", product="TED", page_size=4,
+        )
+        for item in page
+    ]
+
+    assert [item["id"] for item in items] == [item["id"] for item in stored if item["product"] == "TED"]
+
+
+def test_one_shard_keeps_the_unsharded_index():
+    client = FakeIndexClient()
+    repository = ShardedTransactionRepository(client, index_shards=1)
+    _store(repository, 3)
+
+    repository.query_range("2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z", account_id="hot-account")
+
+    assert all("account_shard" not in item for item in client.items)
+    assert client.queries == ["account_id-timestamp-index"]
@@ -0,0 +1,169 @@
+import json
+from argparse import Namespace
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from scripts.rebuild_rollups import accumulate, clamp_to_archive, recompute
+from src.infra.archive.transaction_archive import TransactionArchive
+from src.infra.exports.object_store import LocalObjectStore
+from src.infra.repositories.tiered_transaction_repository import TieredTransactionRepository
+
+NOW = datetime(2025, 6, 30, 12, tzinfo=timezone.utc)
+
+
+def transaction(index: int, timestamp: str, account_id: str = "acc-1") -> dict:
+    return {
+        "id": f"tx-{index:04d}", "tenant_id": "tenant_123", "account_id": account_id, "timestamp": timestamp,
+        "amount": 10.0, "type": "CREDIT", "currency": "BRL", "product": "PIX", "reference": f"ref-{index}",
+    }
+
+
+class CountingObjectStore(LocalObjectStore):
+    """
+    Local store recording the most objects open for reading at once.
+    """
+
+    def __init__(self, root: str):
+        super().__init__(root)
+        self.open_reads = 0
+        self.max_open_reads = 0
+
+    @contextmanager
+    def open_read(self, key: str):
+        with super().open_read(key) as stream:
+            self.open_reads += 1
+            self.max_open_reads = max(self.max_open_reads, self.open_reads)
+            try:
+                yield stream
+            finally:
+                self.open_reads -= 1
+
+
+class HotTable:
+    """
+    Stand-in for TransactionRepository: pages of `page_size`, cursor = index of the next item.
+    """
+
+    def __init__(self, items: list[dict]):
+        self.items = sorted(items, key=lambda item: item["timestamp"])
+        self.queries = 0
+
+    def query_range_pages(self, start, end, account_id=None, tenant_id=None, product=None, page_size=1000, start_key=None):
+        self.queries += 1
+        matching = [
+            item for item in self.items
+            if (item["account_id"] == account_id if account_id else item["tenant_id"] == tenant_id)
+            and start <= item["timestamp"] <= end
+        ]
+        position = start_key["position"] if start_key else 0
+        while True:
+            page = matching[position:position + page_size]
+            position += page_size
+            next_key = {"position": position} if position < len(matching) else None
+            yield page, next_key
+            if next_key is None:
+                return
+
+
+def build(tmp_path, archived: list[dict], hot: list[dict]) -> TieredTransactionRepository:
+    archive = TransactionArchive(LocalObjectStore(str(tmp_path)))
+    if archived:
+        archive.commit(archive.write_segments(archived))
+    return TieredTransactionRepository(HotTable(hot), archive, horizon_days=90, clock=lambda: NOW)
+
+
+def test_segments_are_partitioned_by_month_and_pruned_by_min_max(tmp_path):
+    archive = TransactionArchive(LocalObjectStore(str(tmp_path)))
+    archive.commit(archive.write_segments([
+        transaction(1, "2024-01-10T10:00:00.000Z"),
+        transaction(2, "2024-01-20T10:00:00.000Z"),
+        transaction(3, "2024-02-05T10:00:00.000Z"),
+    ]))
+
+    january = archive.segments("2024-01-15T00:00:00.000Z", "2024-01-31T23:59:59.999Z", account_id="acc-1")
+    assert [(segment.min_timestamp, segment.max_timestamp, segment.rows) for segment in january] == [
+        ("2024-01-10T10:00:00.000Z", "2024-01-20T10:00:00.000Z", 2),
+    ]
+    assert len(archive.segments("2024-01-01T00:00:00.000Z", "2024-12-31T23:59:59.999Z", tenant_id="tenant_123")) == 2
+    assert [row["id"] for row in archive.read_range("2024-01-15T00:00:00.000Z", "2024-02-28T00:00:00.000Z", account_id="acc-1")] == [
+        "tx-0002", "tx-0003",
+    ]
+
+
+def test_read_range_merges_only_overlapping_segments(tmp_path):
+    store = CountingObjectStore(str(tmp_path))
+    archive = TransactionArchive(store)
+    archive.commit(archive.write_segments(
+        [transaction(index, f"2024-{month:02d}-15T10:00:00.000Z") for index, month in enumerate(range(1, 7))]
+    ))
+    # A later job archived back-dated March transactions into a second, overlapping segment.
+    archive.commit(archive.write_segments([
+        transaction(10, "2024-03-01T10:00:00.000Z"), transaction(11, "2024-03-20T10:00:00.000Z"),
+    ]))
+    store.max_open_reads = 0
+
+    ids = [row["id"] for row in archive.read_range("2024-01-01T00:00:00.000Z", "2024-12-31T23:59:59.999Z", account_id="acc-1")]
+
+    assert ids == ["tx-0000", "tx-0001", "tx-0010", "tx-0002", "tx-0011", "tx-0003", "tx-0004", "tx-0005"]
+    assert store.max_open_reads == 2
+
+
+def test_recent_ranges_read_only_the_hot_table(tmp_path):
+    repository = build(tmp_path, [transaction(1, "2024-01-10T10:00:00.000Z")], [transaction(2, "2025-06-01T10:00:00.000Z")])
+
+    items, cursor = repository.query_range("2025-05-01T00:00:00.000Z", "2025-06-30T00:00:00.000Z", account_id="acc-1")
+
+    assert [item["id"] for item in items] == ["tx-0002"]
+    assert cursor is None
+
+
+def test_ranges_crossing_the_boundary_merge_both_tiers_once(tmp_path):
+    archived = [transaction(index, f"2024-{month:02d}-15T10:00:00.000Z") for index, month in enumerate(range(1, 7))]
+    hot = [
+        transaction(10, "2025-06-01T10:00:00.000Z"),
+        transaction(11, "2024-03-20T10:00:00.000Z"),  # back-dated after the archival run
+        archived[-1],  # interrupted run: archived but not deleted yet
+    ]
+    repository = build(tmp_path, archived, hot)
+
+    pages, cursor = [], None
+    while True:
+        items, cursor = repository.query_range(
+            "2024-01-01T00:00:00.000Z", "2025-06-30T00:00:00.000Z", account_id="acc-1", cursor=cursor, limit=3
+        )
+        pages.append([item["id"] for item in items])
+        if cursor is None:
+            break
+        assert "archive_after" in json.loads(cursor)
+
+    assert pages == [
+        ["tx-0000", "tx-0001", "tx-0002"],
+        ["tx-0011", "tx-0003", "tx-0004"],
+        ["tx-0005", "tx-0010"],
+    ]
+
+
+def test_rebuild_after_archival_sees_no_drift_on_archived_days(tmp_path):
+    old = [transaction(index, f"2024-01-{10 + index % 3}T10:00:00.000Z") for index in range(9)]
+    recent = [transaction(20, "2025-06-01T10:00:00.000Z")]
+    stored = {}
+    for item in old + recent:  # the rollups written at ingest, before archival
+        accumulate(stored, item)
+    repository = build(tmp_path, archived=old, hot=recent)  # archived, then deleted from the table
+    args = Namespace(account_id="acc-1", all=False, start_day="2000-01-01", end_day="2025-06-29")
+
+    clamp_to_archive(args, repository)
+    expected = recompute(args, repository)
+
+    assert args.start_day == "2000-01-01"
+    assert sorted(expected) == sorted(stored)
+    assert all(expected[key].matches(stored[key]) for key in stored)
+
+
+def test_full_rebuild_does_not_reach_past_the_archive_horizon(tmp_path):
+    repository = build(tmp_path, archived=[transaction(1, "2024-01-10T10:00:00.000Z")], hot=[])
+    args = Namespace(account_id=None, all=True, start_day="2000-01-01", end_day="2025-06-29")
+
+    clamp_to_archive(args, repository)
+
+    assert args.start_day == "2025-04-02"  # 90 days before NOW is 2025-04-01T12:00, a partially archived day
@@ -0,0 +1,186 @@
+from types import SimpleNamespace
+
+from src.application.admission_control import TenantAdmissionControl, TenantQuota, parse_tenant_quotas
+from src.application.request_context import bind_request_context, current_request, reset_request_context, with_request_context
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.rate_limit.token_bucket import InMemoryTokenBucketStore
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _route(schema):
+    return {"statusCode": 200}
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    store = InMemoryTokenBucketStore(clock=clock)
+
+    admitted = [store.take("tenant123", rate=2, burst=3).allowed for _ in range(4)]
+    rejected = store.take("tenant123", rate=2, burst=3)
+    clock.now += 0.5
+    refilled = store.take("tenant123", rate=2, burst=3)
+
+    assert admitted == [True, True, True, False]
+    assert rejected.retry_after_seconds == 0.5
+    assert refilled.allowed
+
+
+def test_token_bucket_drops_full_buckets_when_bounded():
+    clock = FakeClock()
+    store = InMemoryTokenBucketStore(max_keys=2, clock=clock)
+    store.take("a", rate=1, burst=1)
+    store.take("b", rate=1, burst=1)
+    clock.now += 5
+
+    store.take("c", rate=1, burst=1)
+
+    assert set(store._buckets) == {"c"}
+
+
+def _call(route, schema, authorizer: dict | None = None, headers: dict | None = None):
+    token = bind_request_context(headers, authorizer=authorizer)
+    try:
+        return route(schema)
+    finally:
+        reset_request_context(token)
+
+
+def _as_tenant(tenant_id: str) -> dict:
+    return {"lambda": {"tenant_id": tenant_id}}
+
+
+def test_limit_returns_429_with_retry_after_per_tenant():
+    admission = TenantAdmissionControl(
+        InMemoryTokenBucketStore(clock=FakeClock()),
+        TenantQuota(rate=1, burst=1),
+        quotas=parse_tenant_quotas("big=100:100"),
+    )
+    route = admission.limit(cost=1)(_route)
+    schema = SimpleNamespace()
+
+    first = _call(route, schema, _as_tenant("noisy"))
+    throttled = _call(route, schema, _as_tenant("noisy"))
+    other = _call(route, schema, _as_tenant("quiet"))
+    big = [_call(route, schema, _as_tenant("big"))["statusCode"] for _ in range(50)]
+
+    assert first["statusCode"] == 200
+    assert throttled["statusCode"] == 429
+    assert throttled["headers"]["Retry-After"] == "1"
+    assert other["statusCode"] == 200
+    assert set(big) == {200}
+
+
+def test_limit_reads_the_tenant_from_jwt_claims():
+    admission = TenantAdmissionControl(
+        InMemoryTokenBucketStore(clock=FakeClock()), TenantQuota(rate=1, burst=1), tenant_claim="custom:tenant"
+    )
+    route = admission.limit()(_route)
+    authorizer = {"jwt": {"claims": {"custom:tenant": "tenant123"}}}
+
+    responses = [_call(route, SimpleNamespace(), authorizer) for _ in range(2)]
+
+    assert [response["statusCode"] for response in responses] == [200, 429]
+    assert "tenant123" in responses[1]["body"]
+
+
+def test_limit_meters_requests_without_tenant_in_the_unresolved_bucket():
+    admission = TenantAdmissionControl(InMemoryTokenBucketStore(clock=FakeClock()), TenantQuota(rate=1, burst=2))
+    route = admission.limit()(_route)
+
+    anonymous = [route(SimpleNamespace(owner_id="owner456"))["statusCode"] for _ in range(3)]
+    tenant = _call(route, SimpleNamespace(), _as_tenant("tenant123"))
+
+    assert anonymous == [200, 200, 429]
+    assert tenant["statusCode"] == 200
+
+
+def test_limit_ignores_a_spoofed_tenant_header_and_body():
+    admission = TenantAdmissionControl(InMemoryTokenBucketStore(clock=FakeClock()), TenantQuota(rate=1, burst=1))
+    route = admission.limit()(_route)
+    spoofed = {"X-Tenant-Id": "victim"}
+
+    first = _call(route, SimpleNamespace(tenant_id="victim"), _as_tenant("caller"), spoofed)
+    throttled = _call(route, SimpleNamespace(tenant_id="other"), _as_tenant("caller"), {"X-Tenant-Id": "other"})
+    victim = _call(route, SimpleNamespace(), _as_tenant("victim"))
+
+    assert first["statusCode"] == 200
+    assert throttled["statusCode"] == 429
+    assert "caller" in throttled["body"]
+    assert victim["statusCode"] == 200
+
+
+def test_limit_charges_account_routes_to_the_stored_tenant():
+    account_service = AccountService(InMemoryAccountRepository(), tenant_cache=TTLCache(ttl_seconds=60))
+    account = account_service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+    admission = TenantAdmissionControl(
+        InMemoryTokenBucketStore(clock=FakeClock()),
+        TenantQuota(rate=1, burst=1),
+        account_tenant=account_service.get_account_tenant,
+    )
+    route = admission.limit()(_route)
+
+    first = _call(route, SimpleNamespace(account_id=account.id), headers={"X-Tenant-Id": "someone-else"})
+    throttled = _call(route, SimpleNamespace(account_id=account.id), headers={"X-Tenant-Id": "another"})
+    unknown = route(SimpleNamespace(account_id="missing"))
+
+    assert first["statusCode"] == 200
+    assert throttled["statusCode"] == 429
+    assert "tenant123" in throttled["body"]
+    assert unknown["statusCode"] == 200
+    assert account_service.tenant_cache.get(account.id) == "tenant123"
+
+
+def test_internal_callers_are_metered_per_iam_principal():
+    admission = TenantAdmissionControl(
+        InMemoryTokenBucketStore(clock=FakeClock()),
+        TenantQuota(rate=1, burst=2),
+        quotas=parse_tenant_quotas("arn:aws:sts::123456789012:assumed-role/statement=10:10"),
+        unresolved_tenant="internal-callers",
+        bucket_of=lambda frame: current_request().iam_principal(),
+    )
+    route = admission.limit(cost=lambda frame: len(frame.lookups))(_route)
+
+    def caller(arn: str) -> dict:
+        return {"iam": {"userArn": arn, "callerId": "AROAEXAMPLE:session"}}
+
+    ledger = caller("arn:aws:sts::123456789012:assumed-role/ledger/container-1")
+    ledger_other_container = caller("arn:aws:sts::123456789012:assumed-role/ledger/container-2")
+    statement = caller("arn:aws:sts::123456789012:assumed-role/statement/container-1")
+
+    first = _call(route, SimpleNamespace(lookups=["balance", "balance"]), ledger)
+    throttled = _call(route, SimpleNamespace(lookups=["balance"]), ledger_other_container, {"X-Tenant-Id": "other"})
+    overridden = _call(route, SimpleNamespace(lookups=["balance"] * 8), statement)
+    anonymous = [route(SimpleNamespace(lookups=["balance"]))["statusCode"] for _ in range(3)]
+
+    assert first["statusCode"] == 200
+    assert throttled["statusCode"] == 429
+    assert "assumed-role/ledger" in throttled["body"]
+    assert overridden["statusCode"] == 200
+    assert anonymous == [200, 200, 429]
+
+
+def test_limit_is_a_no_op_when_disabled():
+    admission = TenantAdmissionControl(InMemoryTokenBucketStore(), TenantQuota(rate=0, burst=0))
+
+    assert admission.limit()(_route) is _route
+
+
+def test_lambda_handlers_bind_the_authorizer_context():
+    admission = TenantAdmissionControl(InMemoryTokenBucketStore(clock=FakeClock()), TenantQuota(rate=1, burst=1))
+    handler = with_request_context(lambda event, context=None: admission.limit()(_route)(SimpleNamespace()))
+    event = {"headers": {"X-Tenant-Id": "spoofed"}, "requestContext": {"authorizer": _as_tenant("tenant123")}}
+
+    responses = [handler(dict(event)) for _ in range(2)]
+
+    assert [response["statusCode"] for response in responses] == [200, 429]
+    assert "tenant123" in responses[1]["body"]
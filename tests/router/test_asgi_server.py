@@ -0,0 +1,63 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.application import asgi_server
+
+
+def test_worker_count_defaults_to_usable_cores(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+
+    assert asgi_server.worker_count(0) == 3
+    assert asgi_server.worker_count(5) == 5
+
+
+def test_server_options_leave_concurrency_unlimited_by_default(monkeypatch):
+    monkeypatch.setattr(asgi_server.ENVIRONMENT, "server_limit_concurrency", 0)
+    assert "limit_concurrency" not in asgi_server.server_options()
+
+    monkeypatch.setattr(asgi_server.ENVIRONMENT, "server_limit_concurrency", 500)
+    assert asgi_server.server_options()["limit_concurrency"] == 500
+
+
+def test_workers_set_up_logging_and_the_supervisor_never_builds_the_app(monkeypatch):
+    calls = []
+    monkeypatch.setattr(asgi_server, "setup_logging", lambda: calls.append("logging"))
+    monkeypatch.setattr(asgi_server, "build_app", lambda: calls.append("app") or "app")
+    monkeypatch.setitem(sys.modules, "uvicorn", SimpleNamespace(run=lambda app, **options: calls.append(("run", app, options.get("workers")))))
+    monkeypatch.setattr(asgi_server.ENVIRONMENT, "server_workers", 4)
+
+    asgi_server.serve()
+    supervisor = list(calls)
+    calls.clear()
+    worker_app = asgi_server.create_app()
+
+    assert supervisor == ["logging", ("run", asgi_server.APP_FACTORY, 4)]
+    assert calls == ["logging", "app"]
+    assert worker_app == "app"
+
+
+def test_default_json_routes_switch_to_orjson():
+    pytest.importorskip("orjson")
+    fastapi = pytest.importorskip("fastapi")
+    from fastapi.responses import ORJSONResponse, PlainTextResponse
+    from fastapi.testclient import TestClient
+
+    app = fastapi.FastAPI()
+
+    @app.get("/accounts/{account_id}")
+    def get_account(account_id: str):
+        return {"id": account_id, "status": "active"}
+
+    @app.get("/health", response_class=PlainTextResponse)
+    def health():
+        return "ok"
+
+    assert asgi_server.use_fast_json(app)
+
+    routes = {route.path: route for route in app.routes}
+    assert routes["/accounts/{account_id}"].response_class is ORJSONResponse
+    assert routes["/health"].response_class is PlainTextResponse
+    assert TestClient(app).get("/accounts/acc-1").json() == {"id": "acc-1", "status": "active"}
@@ -0,0 +1,116 @@
+import base64
+import json
+
+from pydantic import BaseModel, Field
+
+from src.application import compiled_routes
+from src.application.compiled_routes import (
+    COMPILED_ROUTES,
+    build_compiled_handler,
+    compiled_lambda_handlers,
+    precompiled,
+    precompiled_deployable,
+)
+from src.application.schemas.acchount_schema import BulkUpdateStatusSchema
+
+
+class TransferSchema(BaseModel):
+    account_id: str
+    amount: float = Field(gt=0)
+
+
+class LookupSchema(BaseModel):
+    account_id: str = Field(alias="accountId")
+
+
+@precompiled(TransferSchema, source="json")
+def transfer(schema: TransferSchema):
+    return {"statusCode": 200, "body": schema.model_dump_json()}
+
+
+@precompiled(LookupSchema, source="path")
+def lookup(schema: LookupSchema):
+    return {"statusCode": 200, "body": schema.account_id}
+
+
+@precompiled(BulkUpdateStatusSchema, source="json")
+def bulk_status(schema: BulkUpdateStatusSchema):
+    return {"statusCode": 200, "body": schema.status.value}
+
+
+def _event(**fields) -> dict:
+    return {"version": "2.0", "headers": {}, "requestContext": {}, **fields}
+
+
+def test_json_body_is_decoded_into_the_schema():
+    handler = build_compiled_handler(COMPILED_ROUTES["transfer"])
+
+    plain = handler(_event(body='{"account_id": "acc-1", "amount": 10}'))
+    encoded = handler(_event(body=base64.b64encode(b'{"account_id": "acc-2", "amount": 5}').decode(), isBase64Encoded=True))
+
+    assert json.loads(plain["body"]) == {"account_id": "acc-1", "amount": 10.0}
+    assert json.loads(encoded["body"]) == {"account_id": "acc-2", "amount": 5.0}
+
+
+def test_path_parameters_are_validated_by_alias():
+    handler = build_compiled_handler(COMPILED_ROUTES["lookup"])
+
+    response = handler(_event(pathParameters={"accountId": "acc-1"}, body="ignored"))
+
+    assert response == {"statusCode": 200, "body": "acc-1"}
+
+
+def test_invalid_requests_are_answered_with_400():
+    handler = build_compiled_handler(COMPILED_ROUTES["transfer"])
+
+    invalid = handler(_event(body='{"account_id": "acc-1", "amount": -1}'))
+    malformed = handler(_event(body="{not json"))
+    missing = handler(_event())
+
+    assert invalid["statusCode"] == 400
+    assert "amount" in invalid["body"]
+    assert malformed["statusCode"] == 400
+    assert missing["statusCode"] == 400
+
+
+def test_unknown_bulk_status_is_rejected_before_the_job_starts():
+    handler = build_compiled_handler(COMPILED_ROUTES["bulk_status"])
+
+    invalid = handler(_event(body='{"tenant_id": "tenant123", "status": "frozen"}'))
+    valid = handler(_event(body='{"tenant_id": "tenant123", "status": "suspended"}'))
+
+    assert invalid["statusCode"] == 400
+    assert "status" in invalid["body"]
+    assert (valid["statusCode"], valid["body"]) == (200, "suspended")
+
+
+def test_only_precompiled_routes_are_replaced():
+    def deployable_handler(event, context=None):
+        return {"statusCode": 200}
+
+    handlers = compiled_lambda_handlers({"transfer": deployable_handler, "legacy": deployable_handler})
+
+    assert handlers["legacy"] is deployable_handler
+    assert handlers["transfer"] is not deployable_handler
+    assert handlers["transfer"].__name__ == "transfer"
+
+
+def test_precompiled_deployable_parses_with_the_deployable_schema(monkeypatch):
+    declared = {}
+
+    def deployable(targets, **options):
+        declared.update(options, targets=targets)
+        return lambda handler: handler
+
+    monkeypatch.setattr(compiled_routes, "deployable", deployable)
+
+    @precompiled_deployable(["lambda"], methods=["GET"], schema_cls=LookupSchema, source="path", route="/lookups/{accountId}")
+    def declared_lookup(schema: LookupSchema):
+        return {"statusCode": 200, "body": schema.account_id}
+
+    response = build_compiled_handler(COMPILED_ROUTES["declared_lookup"])(_event(pathParameters={"accountId": "acc-9"}))
+
+    assert declared == {
+        "targets": ["lambda"], "methods": ["GET"], "schema_cls": LookupSchema, "source": "path", "route": "/lookups/{accountId}",
+    }
+    assert response == {"statusCode": 200, "body": "acc-9"}
@@ -0,0 +1,103 @@
+import base64
+import json
+
+import pytest
+
+from src.application.internal_routes import InternalRoute, build_internal_handler
+from src.application.request_context import bind_request_context, reset_request_context
+from src.application.schemas.transaction_schema import LookupBatchSchema
+from src.application.use_cases.transaction_use_case import TransactionUseCase
+from src.application.wire_codecs import JsonCodec, MessagePackCodec, _load_msgpack, negotiate
+from src.domain.entity.account_balance import AccountBalance
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+
+msgpack = _load_msgpack()
+
+
+class FakeTransactionService:
+    def get_balance(self, account_id):
+        return AccountBalance(account_id=account_id, balance=10.004, shards=1)
+
+    def list_transactions(self, account_id, start, end, product, cursor, limit):
+        entry = TransactionEntry(
+            id="01JXN4", account_id=account_id, timestamp=start, amount=5.0,
+            type=TransactionType.DEBIT, product="PIX", reference="ref-1",
+        )
+        return [entry], None
+
+
+def handler_for(codecs):
+    use_case = TransactionUseCase(FakeTransactionService())
+    return build_internal_handler(InternalRoute("internal_lookup", use_case.lookup, LookupBatchSchema), codecs)
+
+
+def call(handler, body: bytes, headers: dict, base64_encoded: bool = False) -> dict:
+    token = bind_request_context(headers)
+    try:
+        return handler({
+            "body": base64.b64encode(body).decode() if base64_encoded else body.decode(),
+            "isBase64Encoded": base64_encoded,
+        })
+    finally:
+        reset_request_context(token)
+
+
+FRAME = {"lookups": [
+    {"op": "balance", "account_id": "acc-1"},
+    {"op": "statement", "accountId": "acc-2", "start": "2025-06-11T00:00:00Z", "end": "2025-06-11T23:59:59Z"},
+    {"op": "statement", "account_id": "acc-3"},
+]}
+
+
+def test_negotiation_prefers_quality_then_specificity_then_server_order():
+    json_codec, msgpack_codec = JsonCodec(), MessagePackCodec.__new__(MessagePackCodec)
+    codecs = [json_codec, msgpack_codec]
+
+    assert negotiate(None, codecs) is json_codec
+    assert negotiate("*/*", codecs) is json_codec
+    assert negotiate("application/x-msgpack", codecs) is msgpack_codec
+    assert negotiate("application/*, application/msgpack", codecs) is msgpack_codec
+    assert negotiate("application/msgpack;q=0.5, application/json", codecs) is json_codec
+    assert negotiate("text/html", codecs) is None
+    assert negotiate("application/json;q=0", codecs[:1]) is None
+
+
+def test_json_frame_answers_every_lookup_without_envelope():
+    handler = handler_for([JsonCodec()])
+
+    response = call(handler, json.dumps(FRAME).encode(), {"Content-Type": "application/json"})
+
+    assert response["statusCode"] == 200
+    assert response["headers"]["Content-Type"] == "application/json"
+    results = json.loads(response["body"])["results"]
+    assert results[0] == {"status": 200, "body": {"account_id": "acc-1", "balance": 10.0, "shards": 1}}
+    assert results[1]["status"] == 200 and results[1]["body"]["items"][0]["account_id"] == "acc-2"
+    assert results[2] == {"status": 400, "error": "start and end are required"}
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+def test_msgpack_request_and_response():
+    handler = handler_for([JsonCodec(), MessagePackCodec(msgpack)])
+
+    response = call(
+        handler, msgpack.packb(FRAME),
+        {"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+        base64_encoded=True,
+    )
+
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Type"] == "application/msgpack"
+    results = msgpack.unpackb(base64.b64decode(response["body"]))["results"]
+    assert [result["status"] for result in results] == [200, 200, 400]
+    assert results[1]["body"]["items"][0]["type"] == "DEBIT"
+
+
+def test_unsupported_encodings_and_invalid_frames_are_rejected():
+    handler = handler_for([JsonCodec()])
+    body = json.dumps(FRAME).encode()
+
+    assert call(handler, body, {"Accept": "application/protobuf"})["statusCode"] == 406
+    assert call(handler, body, {"Content-Type": "application/protobuf"})["statusCode"] == 415
+    assert call(handler, b'{"lookups": []}', {})["statusCode"] == 400
+    assert call(handler, b'{"lookups": [{"op": "drop"}]}', {})["statusCode"] == 400
+    assert call(handler, b"{not json", {})["statusCode"] == 400
@@ -0,0 +1,40 @@
+from src.application.route_table import RouteTable, build_unified_handler
+
+ROUTES = {
+    "create_account": (["POST"], "/accounts/create"),
+    "get_account": (["GET"], "/accounts/{accountId}"),
+    "update_status": (["PATCH"], "/accounts/update_status"),
+}
+
+table = RouteTable.from_routes(ROUTES)
+
+
+def test_resolve_by_route_key():
+    assert table.resolve("GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8", "GET /accounts/{accountId}") == "get_account"
+
+
+def test_resolve_static_and_template_paths():
+    assert table.resolve("POST", "/accounts/create") == "create_account"
+    assert table.resolve("GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8") == "get_account"
+    assert table.resolve("PATCH", "/accounts/update_status/") == "update_status"
+
+
+def test_unknown_route_is_not_resolved():
+    assert table.resolve("DELETE", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8") is None
+    assert table.resolve("GET", "/accounts/01JXN4DSSZPX14M9CK8BVV8TS8/transactions") is None
+
+
+def test_unified_handler_dispatches_to_function_handler():
+    calls = []
+    handlers = {name: (lambda event, context, name=name: calls.append(name) or {"statusCode": 200}) for name in ROUTES}
+    handler = build_unified_handler(table, handlers)
+
+    event = {
+        "routeKey": "$default",
+        "rawPath": "/accounts/create",
+        "requestContext": {"http": {"method": "POST", "path": "/accounts/create"}},
+    }
+
+    assert handler(event, object())["statusCode"] == 200
+    assert calls == ["create_account"]
+    assert handler({**event, "rawPath": "/unknown"}, object())["statusCode"] == 404
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse, ErrorMessage
 from utilities.depency_injections.injection_manager import InjectionManager
 
@@ -9,7 +11,7 @@ service = InjectionManager.get_dependency(AccountService)
 def _create_account_service():
     account = Account(
         tenant_id="Test Account",
-        owner_id="email@email.com",
+        owner_id=f"owner-{uuid4()}",
         status=AccountStatus.ACTIVE,
     )
 
@@ -21,7 +23,7 @@ def _create_account_service():
 def test_create_account():
     account = Account(
         tenant_id="Test Account",
-        owner_id="email@email.com",
+        owner_id=f"owner-{uuid4()}",
         status=AccountStatus.ACTIVE,
     )
 
@@ -30,6 +32,19 @@ def test_create_account():
     assert created_account.id == account.id
 
 
+def test_create_second_account_for_owner_conflicts():
+    account = _create_account_service()
+
+    response = service.create_account(
+        Account(tenant_id=account.tenant_id, owner_id=account.owner_id, status=AccountStatus.ACTIVE)
+    )
+
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == 409
+    assert response.message == "Conflict"
+    assert account.id in response.body.error
+
+
 def test_get_account():
     account = _create_account_service()
     account_data: Account = service.get_account(account.id)
@@ -38,7 +53,7 @@ def test_get_account():
     assert account_data.id is not None
     assert account_data.created_at is not None
     assert account_data.tenant_id == "Test Account"
-    assert account_data.owner_id == "email@email.com"
+    assert account_data.owner_id == account.owner_id
 
 def test_update_status_active_to_suspend():
     account = _create_account_service()
@@ -78,3 +93,37 @@ def test_update_status_active_to_active_error():
         assert response.message == "Bad Request"
         assert response.status_code == 409
         assert response.body == ErrorMessage(error=f"Account is already in {account.status} status")
+
+
+def test_transition_status_active_to_suspend():
+    account = _create_account_service()
+
+    response_updated: Account = service.transition_status(account.id, AccountStatus.SUSPENDED, "Testing suspension")
+
+    assert isinstance(response_updated, Account)
+    assert response_updated.status == AccountStatus.SUSPENDED
+    assert response_updated.suspension_reason == "Testing suspension"
+
+
+def test_transition_status_closed_to_active_error():
+    account = _create_account_service()
+    service.transition_status(account.id, AccountStatus.CLOSED)
+
+    response: ErrorResponse = service.transition_status(account.id, AccountStatus.ACTIVE)
+
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == 400
+    assert response.body == ErrorMessage(error="Cannot change status of a closed account")
+
+
+def test_bulk_update_status_reports_each_account():
+    accounts = [_create_account_service() for _ in range(3)]
+    service.transition_status(accounts[0].id, AccountStatus.SUSPENDED)
+
+    outcomes = dict(service.bulk_update_status([account.id for account in accounts], AccountStatus.SUSPENDED, "Tenant delinquent", max_workers=2))
+
+    assert set(outcomes) == {account.id for account in accounts}
+    assert isinstance(outcomes[accounts[0].id], ErrorResponse)
+    assert outcomes[accounts[0].id].status_code == 409
+    assert outcomes[accounts[1].id].status == AccountStatus.SUSPENDED
+    assert outcomes[accounts[2].id].status == AccountStatus.SUSPENDED
@@ -0,0 +1,77 @@
+from src.application.schemas.acchount_schema import GetAccountSchema
+from src.application.use_cases.account_use_case import AccountUseCase
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.session_token import SessionToken
+from src.domain.services.account_service import AccountService
+from src.infra.cache.ttl_cache import TTLCache
+
+
+class RecordingAccountRepository:
+    """
+    Stand-in repository recording the consistency of every read.
+    """
+
+    def __init__(self, account: Account):
+        self.account = account
+        self.reads: list[bool] = []
+
+    def find_by_id(self, account_id, deadline, consistent=False):
+        self.reads.append(consistent)
+        return self.account if account_id == self.account.id else None
+
+
+def _service(version: int = 1, consistent_reads: bool = False):
+    account = Account(id="acc", tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE, version=version)
+    repository = RecordingAccountRepository(account)
+    service = AccountService(repository, account_cache=TTLCache(ttl_seconds=60), consistent_reads=consistent_reads)
+    return service, repository
+
+
+def test_reads_are_eventually_consistent_by_default():
+    service, repository = _service()
+
+    service.get_account("acc")
+
+    assert repository.reads == [False]
+
+
+def test_consistent_reads_setting_reads_strongly():
+    service, repository = _service(consistent_reads=True)
+
+    service.get_account("acc")
+
+    assert repository.reads == [True]
+
+
+def test_token_newer_than_the_cache_forces_a_strong_read():
+    service, repository = _service(version=1)
+    service.get_account("acc")
+    repository.account = repository.account.model_copy(update={"version": 2})
+
+    account = service.get_account("acc", min_version=2)
+
+    assert account.version == 2
+    assert repository.reads == [False, True]
+
+
+def test_token_satisfied_by_the_cache_is_served_without_a_read():
+    service, repository = _service(version=3)
+    service.get_account("acc")
+
+    account = service.get_account("acc", min_version=3)
+
+    assert account.version == 3
+    assert repository.reads == [False]
+
+
+def test_use_case_applies_only_tokens_of_the_requested_account():
+    service, repository = _service(version=2)
+    use_case = AccountUseCase(service)
+
+    use_case.get_account_conditional(GetAccountSchema(account_id="acc"), session_token="other.9")
+    service.account_cache = TTLCache(ttl_seconds=60)
+    use_case.get_account_conditional(GetAccountSchema(account_id="acc"), session_token=SessionToken("acc", 2).encode())
+
+    assert repository.reads == [False, True]
+    assert SessionToken.parse("acc.2") == SessionToken("acc", 2)
+    assert SessionToken.parse("not-a-token") is None
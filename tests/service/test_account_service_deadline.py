@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.deadline_guard import respect_deadline
+from src.application.request_context import bind_request_context, reset_request_context
+from src.domain.deadlines.request_deadline import Deadline, DeadlineExceeded
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.infra.cache.ttl_cache import TTLCache
+from src.infra.clients.dynamodb_client import deadline_client_settings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowAccountRepository:
+    """
+    Stand-in repository whose calls take `latency` seconds on the fake clock.
+
+    Like the deadline-capped DynamoDB client, a call that would outlive the
+    deadline times out when it expires and raises DeadlineExceeded.
+    """
+
+    def __init__(self, clock: FakeClock, latency: float):
+        self.clock = clock
+        self.latency = latency
+        self.accounts: dict[str, Account] = {}
+        self.calls: list[str] = []
+
+    def _call(self, operation: str, deadline: Deadline):
+        self.calls.append(operation)
+        remaining = deadline.remaining()
+        if self.latency > remaining:
+            self.clock.now += remaining
+            raise DeadlineExceeded(operation, 0.0)
+        self.clock.now += self.latency
+
+    def find_by_id(self, account_id, deadline, consistent=False):
+        self._call("get_item", deadline)
+        return self.accounts.get(account_id)
+
+    def create(self, account):
+        self.calls.append("put_item")
+        self.accounts[account.id] = account
+        return account.id
+
+
+def _service(latency: float):
+    clock = FakeClock()
+    repository = SlowAccountRepository(clock, latency)
+    repository.accounts["acc"] = Account(id="acc", tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE)
+    service = AccountService(repository, account_cache=TTLCache(ttl_seconds=60, clock=clock))
+    return service, repository, clock
+
+
+def test_get_account_within_deadline_fills_cache():
+    service, repository, clock = _service(latency=0.05)
+
+    account = service.get_account("acc", deadline=Deadline.after(3.0, clock=clock))
+
+    assert account.id == "acc"
+    assert service.account_cache.get("acc") is not None
+
+
+def test_get_account_skips_cache_fill_when_deadline_is_short():
+    service, repository, clock = _service(latency=0.05)
+
+    account = service.get_account("acc", deadline=Deadline.after(0.3, short_seconds=0.5, clock=clock))
+
+    assert account.id == "acc"
+    assert service.account_cache.get("acc") is None
+
+
+def test_slow_repository_call_is_cut_at_the_deadline():
+    service, repository, clock = _service(latency=5.0)
+
+    with pytest.raises(DeadlineExceeded):
+        service.get_account("acc", deadline=Deadline.after(1.0, clock=clock))
+
+    assert clock.now == 1.0
+
+
+def test_write_is_not_started_after_the_deadline():
+    service, repository, clock = _service(latency=0.0)
+    deadline = Deadline.after(1.0, clock=clock)
+    clock.now += 2.0
+
+    with pytest.raises(DeadlineExceeded):
+        service.create_account(
+            Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE), deadline=deadline
+        )
+
+    assert repository.calls == []
+
+
+def test_respect_deadline_answers_503_with_retry_after():
+    @respect_deadline
+    def route(schema):
+        raise DeadlineExceeded("get_item", 0.0)
+
+    response = route(SimpleNamespace())
+
+    assert response["statusCode"] == 503
+    assert response["headers"]["Retry-After"] == "1"
+
+
+def test_respect_deadline_rejects_expired_requests_upfront():
+    calls = []
+
+    @respect_deadline
+    def route(schema):
+        calls.append(schema)
+
+    lambda_context = SimpleNamespace(get_remaining_time_in_millis=lambda: 100)
+    token = bind_request_context(lambda_context=lambda_context)
+    try:
+        response = route(SimpleNamespace())
+    finally:
+        reset_request_context(token)
+
+    assert response["statusCode"] == 503
+    assert calls == []
+
+
+def test_deadline_client_settings_cap_timeouts_and_attempts():
+    assert deadline_client_settings(60.0) is None
+    assert deadline_client_settings(1.2) == (1.0, 1)
+    assert deadline_client_settings(0.6) == (0.5, 1)
+    assert deadline_client_settings(0.25) == (0.25, 1)
+    with pytest.raises(DeadlineExceeded):
+        deadline_client_settings(0.05)
@@ -0,0 +1,61 @@
+from src.application.schemas.acchount_schema import GetAccountByOwnerSchema
+from src.application.use_cases.account_use_case import AccountUseCase
+from src.domain.deadlines.request_deadline import NO_DEADLINE
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+
+class RecordingAccountRepository(InMemoryAccountRepository):
+    def __init__(self):
+        super().__init__()
+        self.owner_reads = []
+
+    def find_id_by_owner(self, tenant_id, owner_id, deadline=NO_DEADLINE, consistent=False):
+        self.owner_reads.append(consistent)
+        return super().find_id_by_owner(tenant_id, owner_id, deadline, consistent)
+
+
+def _service() -> AccountService:
+    return AccountService(InMemoryAccountRepository())
+
+
+def test_second_account_of_an_owner_is_answered_with_409():
+    service = _service()
+    first = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+
+    response = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+
+    assert response.status_code == 409
+    assert response.message == "Conflict"
+    assert first.id in response.body.error
+
+
+def test_get_account_by_owner_reads_the_owner_account():
+    service = _service()
+    created = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+
+    assert service.get_account_by_owner("tenant123", "owner456").id == created.id
+    assert service.get_account_by_owner("tenant123", "owner789").status_code == 404
+    assert service.get_account_by_owner("tenant999", "owner456").status_code == 404
+
+
+def test_get_account_by_owner_reads_the_guard_strongly_consistent():
+    repository = RecordingAccountRepository()
+    service = AccountService(repository)
+    service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+
+    service.get_account_by_owner("tenant123", "owner456")
+
+    assert repository.owner_reads == [True]
+
+
+def test_use_case_validates_path_parameters_by_alias():
+    service = _service()
+    created = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+    schema = GetAccountByOwnerSchema.model_validate({"tenantId": "tenant123", "ownerId": "owner456"})
+
+    response = AccountUseCase(service).get_account_by_owner(schema)
+
+    assert response.status_code == 200
+    assert response.body.id == created.id
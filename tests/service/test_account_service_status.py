@@ -0,0 +1,51 @@
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse
+
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+
+class StaleReadRepository(InMemoryAccountRepository):
+    """
+    Repository whose reads always return the account as first created, like a
+    concurrent request that read it before another update landed. Replacing the
+    account is not allowed: status updates must be conditional.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.created: dict[str, Account] = {}
+
+    def create(self, entity):
+        self.created[entity.id] = entity.model_copy(deep=True)
+        return super().create(entity)
+
+    def find_by_id(self, account_id, deadline=None, consistent=False):
+        return self.created[account_id].model_copy(deep=True)
+
+    def update(self, entity_id, entity):
+        raise AssertionError("status updates must not replace the account")
+
+
+def test_racing_close_and_reactivate_cannot_reopen_a_closed_account():
+    repository = StaleReadRepository()
+    service = AccountService(repository)
+    account = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.SUSPENDED))
+
+    closed = service.update_status(account.id, AccountStatus.CLOSED, "fraud")
+    reopened = service.update_status(account.id, AccountStatus.ACTIVE)
+
+    assert closed.status == AccountStatus.CLOSED
+    assert isinstance(reopened, ErrorResponse)
+    assert reopened.status_code == 400
+    assert repository.get_by_id(account.id).status == AccountStatus.CLOSED
+
+
+def test_every_status_update_gets_its_own_version():
+    service = AccountService(StaleReadRepository())
+    account = service.create_account(Account(tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE))
+
+    suspended = service.update_status(account.id, AccountStatus.SUSPENDED)
+    reactivated = service.update_status(account.id, AccountStatus.ACTIVE)
+
+    assert reactivated.version == suspended.version + 1
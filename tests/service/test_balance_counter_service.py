@@ -0,0 +1,113 @@
+from decimal import Decimal
+
+from src.domain.entity.account_balance import UNSHARDED, BalanceLayout
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.ids.ulid_generator import MonotonicUlidGenerator
+from src.domain.services.balance_counter_service import BalanceCounterService
+from src.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class InMemoryCounters:
+    """
+    Stand-in for BalanceCounterRepository: operations are (account_id, shard, delta) tuples.
+    """
+
+    def __init__(self):
+        self.counters: dict[tuple[str, int], Decimal] = {}
+        self.layouts: dict[str, BalanceLayout] = {}
+
+    def increment_operation(self, account_id, shard, delta):
+        return account_id, shard, delta
+
+    def apply(self, operation):
+        account_id, shard, delta = operation
+        self.counters[(account_id, shard)] = self.counters.get((account_id, shard), Decimal(0)) + delta
+
+    def get_layout(self, account_id):
+        return self.layouts.get(account_id, UNSHARDED)
+
+    def get_counters(self, account_id, shard_count):
+        counters = {shard: value for (account, shard), value in self.counters.items() if account == account_id and shard < shard_count}
+        return self.get_layout(account_id), counters
+
+    def set_write_shards(self, account_id, write_shards):
+        current = self.get_layout(account_id)
+        self.layouts[account_id] = BalanceLayout(write_shards, max(write_shards, current.read_shards))
+        return self.layouts[account_id]
+
+
+def _service():
+    clock = FakeClock()
+    repository = InMemoryCounters()
+    service = BalanceCounterService(
+        repository,
+        hot_shard_count=4,
+        promote_writes_per_second=100,
+        demote_writes_per_second=10,
+        window_seconds=1,
+        layout_cache=TTLCache(ttl_seconds=0),
+        balance_cache=TTLCache(ttl_seconds=60, clock=clock),
+        clock=clock,
+    )
+    return service, repository, clock
+
+
+IDS = MonotonicUlidGenerator()
+
+
+def _write(service, repository, amount, transaction_type=TransactionType.CREDIT, account_id="merchant"):
+    entry = TransactionEntry(
+        id=IDS.new(), account_id=account_id, timestamp="2025-06-11T10:00:00.000Z",
+        amount=amount, type=transaction_type, product="PIX", reference="ref",
+    )
+    repository.apply(service.increment_operation(entry))
+    service.observe_write(account_id)
+
+
+def test_hot_account_is_promoted_and_reads_sum_every_shard():
+    service, repository, clock = _service()
+
+    for index in range(300):
+        clock.now = index / 200
+        _write(service, repository, 10.0)
+    _write(service, repository, 500.0, TransactionType.DEBIT)
+
+    assert repository.layouts["merchant"] == BalanceLayout(write_shards=4, read_shards=4)
+    assert {shard for _, shard in repository.counters} == {0, 1, 2, 3}
+    balance = service.get_balance("merchant")
+    assert balance.balance == 2500.0
+    assert balance.shards == 4
+
+
+def test_cold_account_is_demoted_but_keeps_reading_old_shards():
+    service, repository, clock = _service()
+    for index in range(300):
+        clock.now = index / 200
+        _write(service, repository, 1.0)
+
+    for index in range(3):
+        clock.now = 10 + index * 2
+        _write(service, repository, 1.0)
+
+    assert repository.layouts["merchant"] == BalanceLayout(write_shards=1, read_shards=4)
+    assert service.get_balance("merchant").balance == 303.0
+
+
+def test_quiet_accounts_stay_unsharded_and_balance_is_cached():
+    service, repository, clock = _service()
+    for index in range(20):
+        clock.now = index * 0.5
+        _write(service, repository, 5.0)
+
+    assert "merchant" not in repository.layouts
+    assert service.get_balance("merchant").balance == 100.0
+    repository.apply(("merchant", 0, Decimal("50.00")))
+    assert service.get_balance("merchant").balance == 100.0
@@ -0,0 +1,102 @@
+import time
+import uuid
+
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.services.account_service import AccountService
+from src.domain.services.bulk_status_service import BulkStatusService
+from src.infra.repositories.in_memory_account_repository import InMemoryAccountRepository
+
+
+class CrashingJobRepository:
+    """
+    Stand-in job repository whose checkpoint writes can be made to fail, like a Lambda killed mid-page.
+    """
+
+    def __init__(self):
+        self.jobs = {}
+        self.fail_checkpoint = False
+
+    def create(self, job):
+        self.jobs[job.id] = job.model_copy(deep=True)
+
+    def get_by_id(self, job_id):
+        job = self.jobs.get(job_id)
+        return job.model_copy(deep=True) if job else None
+
+    def update(self, entity_id, entity):
+        if self.fail_checkpoint and not entity.page_in_progress:
+            raise TimeoutError("invocation killed before the checkpoint")
+        self.jobs[entity_id] = entity.model_copy(deep=True)
+
+
+def _accounts(repository, count):
+    ids = []
+    for _ in range(count):
+        account = Account(
+            id=uuid.uuid4().hex, tenant_id="tenant123", owner_id=f"owner-{uuid.uuid4()}", status=AccountStatus.ACTIVE
+        )
+        repository.create(account)
+        ids.append(account.id)
+    return ids
+
+
+def test_page_replayed_after_a_crash_is_not_counted_twice():
+    accounts = InMemoryAccountRepository()
+    account_ids = _accounts(accounts, 5)
+    jobs = CrashingJobRepository()
+    service = BulkStatusService(AccountService(accounts), jobs, page_size=3, max_workers=2)
+    job = service.start_job(AccountStatus.SUSPENDED, reason="overdue", account_ids=account_ids)
+
+    jobs.fail_checkpoint = True
+    try:
+        list(service.run(service.get_job(job.id), time_budget_seconds=60))
+    except TimeoutError:
+        pass
+    jobs.fail_checkpoint = False
+
+    resumed = service.get_job(job.id)
+    assert resumed.page_in_progress and resumed.processed == 0
+    list(service.run(resumed, time_budget_seconds=60))
+
+    assert resumed.state == "completed"
+    assert (resumed.processed, resumed.updated, resumed.replayed, resumed.skipped) == (5, 2, 3, 0)
+
+
+class SlowAccountService(AccountService):
+    """
+    AccountService whose transitions take a fixed time, so a budget runs out mid-page.
+    """
+
+    def transition_status(self, account_id, update_status, reason=None, **kwargs):
+        time.sleep(0.05)
+        return super().transition_status(account_id, update_status, reason, **kwargs)
+
+
+def test_negative_budget_schedules_nothing():
+    accounts = InMemoryAccountRepository()
+    account_ids = _accounts(accounts, 3)
+    service = BulkStatusService(AccountService(accounts), CrashingJobRepository(), page_size=3)
+    job = service.start_job(AccountStatus.SUSPENDED, account_ids=account_ids)
+
+    assert list(service.run(job, time_budget_seconds=-5)) == []
+    assert job.state == "running" and job.processed == 0
+    assert all(accounts.get_by_id(account_id).status == AccountStatus.ACTIVE for account_id in account_ids)
+
+
+def test_exhausted_budget_stops_mid_page_and_replays_it():
+    accounts = InMemoryAccountRepository()
+    account_ids = _accounts(accounts, 10)
+    jobs = CrashingJobRepository()
+    service = BulkStatusService(SlowAccountService(accounts), jobs, page_size=10, max_workers=1)
+    job = service.start_job(AccountStatus.SUSPENDED, account_ids=account_ids)
+
+    outcomes = list(service.run(service.get_job(job.id), time_budget_seconds=0.12))
+
+    assert 0 < len(outcomes) < 10
+    interrupted = service.get_job(job.id)
+    assert interrupted.page_in_progress and (interrupted.offset, interrupted.processed) == (0, 0)
+
+    list(service.run(interrupted, time_budget_seconds=60))
+
+    assert interrupted.state == "completed"
+    assert (interrupted.processed, interrupted.updated, interrupted.replayed) == (10, 10 - len(outcomes), len(outcomes))
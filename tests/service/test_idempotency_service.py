@@ -0,0 +1,73 @@
+from src.domain.entity.idempotency_record import IdempotencyState
+from src.domain.services.idempotency_service import IdempotencyService
+from src.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_750_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class LeasedIdempotencyRepository:
+    """
+    Stand-in for IdempotencyRepository applying the same claim condition in memory.
+    """
+
+    def __init__(self):
+        self.records = {}
+
+    def claim(self, record, now=None):
+        stored = self.records.get(record.idempotency_key)
+        free = (
+            stored is None
+            or stored.expires_at < now
+            or (stored.state == IdempotencyState.IN_PROGRESS and stored.lease_expires_at < now
+                and stored.request_hash == record.request_hash)
+        )
+        if not free:
+            return stored
+        self.records[record.idempotency_key] = record
+        return None
+
+    def complete(self, idempotency_key, status_code, message, body, expires_at):
+        self.records[idempotency_key] = self.records[idempotency_key].model_copy(update={
+            "state": IdempotencyState.COMPLETED, "status_code": status_code, "message": message,
+            "body": body, "expires_at": expires_at, "lease_expires_at": None,
+        })
+
+    def release(self, idempotency_key):
+        self.records.pop(idempotency_key, None)
+
+
+def _service(clock):
+    return IdempotencyService(
+        LeasedIdempotencyRepository(), ttl_seconds=86_400, cache=TTLCache(ttl_seconds=0), lease_seconds=30, clock=clock,
+    )
+
+
+def test_retry_after_a_crashed_claim_takes_the_key_over_once_the_lease_passes():
+    clock = FakeClock()
+    service = _service(clock)
+    assert service.begin("create_account#t#k", "hash") is None
+    # The invocation dies here: neither complete nor abandon runs.
+
+    clock.now += 10
+    assert service.begin("create_account#t#k", "hash").state == IdempotencyState.IN_PROGRESS
+
+    clock.now += 25
+    assert service.begin("create_account#t#k", "hash") is None
+    service.complete("create_account#t#k", "hash", 200, "Account created successfully", "{}")
+    assert service.begin("create_account#t#k", "hash").state == IdempotencyState.COMPLETED
+
+
+def test_expired_lease_is_not_taken_over_with_another_payload():
+    clock = FakeClock()
+    service = _service(clock)
+    service.begin("create_account#t#k", "hash")
+
+    clock.now += 60
+
+    assert service.begin("create_account#t#k", "other-hash").request_hash == "hash"
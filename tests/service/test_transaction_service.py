@@ -0,0 +1,155 @@
+from utilities.cross_cutting.application.schemas.responses_schema import ErrorResponse
+
+from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.daily_rollup import DailyRollup, day_of
+from src.domain.entity.transaction_entry import TransactionEntry, TransactionType
+from src.domain.services.transaction_service import TransactionService
+
+
+class InMemoryTransactions:
+    """
+    Stand-in for TransactionRepository: `create_once` applies the rollup
+    increments only when the transaction is new, like the DynamoDB transaction.
+    """
+
+    def __init__(self, rollups: "InMemoryRollups"):
+        self.rollups = rollups
+        self.items: dict[str, dict] = {}
+        self.raw_reads = 0
+
+    def create_once(self, entry, operations=None):
+        if entry.id in self.items:
+            return False
+        self.items[entry.id] = entry.model_dump(mode="json")
+        for operation in operations or []:
+            self.rollups.apply(operation)
+        return True
+
+    def query_range_pages(self, start, end, account_id=None, tenant_id=None, product=None, page_size=1000, start_key=None):
+        items = sorted(
+            (
+                item for item in self.items.values()
+                if item["account_id"] == account_id and start <= item["timestamp"] <= end
+                and (product is None or item["product"] == product)
+            ),
+            key=lambda item: item["timestamp"],
+        )
+        self.raw_reads += len(items)
+        yield items, None
+
+
+class InMemoryRollups:
+    """
+    Stand-in for DailyRollupRepository: operations are the entries themselves.
+    """
+
+    def __init__(self):
+        self.rollups: dict[tuple[str, str, str], DailyRollup] = {}
+
+    def increment_operation(self, entry):
+        return entry
+
+    def apply(self, entry):
+        key = (entry.account_id, day_of(entry.timestamp), entry.product)
+        if key not in self.rollups:
+            self.rollups[key] = DailyRollup(account_id=key[0], tenant_id=entry.tenant_id, day=key[1], product=key[2])
+        self.rollups[key].add(entry.type, entry.amount)
+
+    def query(self, account_id, first_day, last_day, product=None):
+        return [
+            rollup for (account, day, rollup_product), rollup in sorted(self.rollups.items())
+            if account == account_id and first_day <= day <= last_day and (product is None or rollup_product == product)
+        ]
+
+
+class StubAccountService:
+    def __init__(self, *accounts: Account):
+        self.accounts = {account.id: account for account in accounts}
+
+    def get_account(self, account_id):
+        return self.accounts.get(account_id) or ErrorResponse(status_code=404, message="Not Found")
+
+
+ACTIVE = Account(id="acc-active", tenant_id="tenant123", owner_id="owner456", status=AccountStatus.ACTIVE)
+SUSPENDED = Account(id="acc-suspended", tenant_id="tenant123", owner_id="owner789", status=AccountStatus.SUSPENDED)
+
+
+def _service():
+    rollups = InMemoryRollups()
+    transactions = InMemoryTransactions(rollups)
+    service = TransactionService(
+        transaction_repository=transactions,
+        rollup_repository=rollups,
+        account_service=StubAccountService(ACTIVE, SUSPENDED),
+    )
+    return service, transactions, rollups
+
+
+def _entry(entry_id, timestamp, amount, transaction_type=TransactionType.CREDIT, product="VOUCHER", account_id=ACTIVE.id):
+    return TransactionEntry(
+        id=entry_id, account_id=account_id, timestamp=timestamp, amount=amount,
+        type=transaction_type, product=product, reference=f"ref-{entry_id}",
+    )
+
+
+def test_record_transaction_updates_rollup_once():
+    service, transactions, rollups = _service()
+
+    recorded = service.record_transaction(_entry("t1", "2025-06-11T10:00:00.000Z", 100.0))
+    duplicate = service.record_transaction(_entry("t1", "2025-06-11T10:00:00.000Z", 100.0))
+
+    assert recorded.tenant_id == "tenant123"
+    assert isinstance(duplicate, ErrorResponse)
+    assert duplicate.status_code == 409
+    rollup = rollups.rollups[(ACTIVE.id, "2025-06-11", "VOUCHER")]
+    assert rollup.credits == 100.0
+    assert rollup.credit_count == 1
+
+
+def test_record_transaction_rejects_inactive_or_missing_account():
+    service, transactions, rollups = _service()
+
+    inactive = service.record_transaction(_entry("t1", "2025-06-11T10:00:00.000Z", 10.0, account_id=SUSPENDED.id))
+    missing = service.record_transaction(_entry("t2", "2025-06-11T10:00:00.000Z", 10.0, account_id="unknown"))
+
+    assert inactive.status_code == 400
+    assert missing.status_code == 404
+    assert transactions.items == {}
+    assert rollups.rollups == {}
+
+
+def test_summarize_reads_raw_transactions_only_for_partial_days():
+    service, transactions, _ = _service()
+    entries = [
+        _entry("t1", "2025-06-10T08:00:00.000Z", 50.0),
+        _entry("t2", "2025-06-10T20:00:00.000Z", 5.0),
+        _entry("t3", "2025-06-11T09:00:00.000Z", 30.0, TransactionType.DEBIT),
+        _entry("t4", "2025-06-11T12:00:00.000Z", 7.5, product="CASHBACK"),
+        _entry("t5", "2025-06-12T10:00:00.000Z", 20.0),
+        _entry("t6", "2025-06-12T18:00:00.000Z", 1.0),
+    ]
+    for entry in entries:
+        service.record_transaction(entry)
+
+    summary = service.summarize(ACTIVE.id, "2025-06-10T12:00:00.000Z", "2025-06-12T12:00:00.000Z")
+
+    totals = {(rollup.day, rollup.product): (rollup.credits, rollup.debits) for rollup in summary.rollups}
+    assert totals == {
+        ("2025-06-10", "VOUCHER"): (5.0, 0.0),
+        ("2025-06-11", "CASHBACK"): (7.5, 0.0),
+        ("2025-06-11", "VOUCHER"): (0.0, 30.0),
+        ("2025-06-12", "VOUCHER"): (20.0, 0.0),
+    }
+    assert summary.raw_transactions == 2
+    assert transactions.raw_reads == 2
+
+
+def test_summarize_filters_by_product():
+    service, _, _ = _service()
+    service.record_transaction(_entry("t1", "2025-06-11T09:00:00.000Z", 30.0))
+    service.record_transaction(_entry("t2", "2025-06-11T12:00:00.000Z", 7.5, product="CASHBACK"))
+
+    summary = service.summarize(ACTIVE.id, "2025-06-11T00:00:00.000Z", "2025-06-11T23:59:59.999Z", product="CASHBACK")
+
+    assert [(rollup.product, rollup.credits) for rollup in summary.rollups] == [("CASHBACK", 7.5)]
+    assert summary.raw_transactions == 0
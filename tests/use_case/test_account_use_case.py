@@ -1,8 +1,13 @@
+from uuid import uuid4
+
 from utilities.cross_cutting.application.schemas.responses_schema import SuccessResponse, ErrorResponse
 from utilities.depency_injections.injection_manager import InjectionManager
 
-from src.application.schemas.acchount_schema import AccountSchema, UpdateStatusAccountSchema
+from src.application.schemas.acchount_schema import AccountSchema, GetAccountSchema, UpdateStatusAccountSchema
 from src.domain.entity.account import Account, AccountStatus
+from src.domain.entity.idempotency_record import IdempotencyState
+from src.domain.services.idempotency_service import IdempotencyService
+from src.infra.cache.ttl_cache import TTLCache
 
 from src.application.use_cases.account_use_case import AccountUseCase
 
@@ -12,7 +17,7 @@ account_use_case = InjectionManager.get_dependency(AccountUseCase)
 def _create_account():
     model = AccountSchema(
         tenant_id="tenant123",
-        owner_id="owner456"
+        owner_id=f"owner-{uuid4()}"
     )
     account = account_use_case.create_account(model)
     return account.body
@@ -21,7 +26,7 @@ def _create_account():
 def test_create_account():
     model = AccountSchema(
         tenant_id="tenant123",
-        owner_id="owner456"
+        owner_id=f"owner-{uuid4()}"
     )
     response = account_use_case.create_account(model)
 
@@ -32,6 +37,16 @@ def test_create_account():
     assert response.body is not None
 
 
+def test_create_account_for_owner_with_account_conflicts():
+    account = _create_account()
+
+    response = account_use_case.create_account(AccountSchema(tenant_id=account.tenant_id, owner_id=account.owner_id))
+
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == 409
+    assert response.message == "Conflict"
+
+
 def test_get_account():
     account = _create_account()  # Replace with a valid account ID for testing
     response: Account = account_use_case.get_account(account.id)
@@ -85,3 +100,71 @@ def test_update_status_active_to_active_error():
     assert response.status_code == 409
     assert response.message == "Bad Request"
     assert response.body.error == f"Account is already in {account.status} status"
+
+
+class InMemoryIdempotencyRepository:
+    def __init__(self):
+        self.records = {}
+
+    def claim(self, record, now=None):
+        if record.idempotency_key in self.records:
+            return self.records[record.idempotency_key]
+        self.records[record.idempotency_key] = record
+        return None
+
+    def complete(self, idempotency_key, status_code, message, body, expires_at):
+        self.records[idempotency_key] = self.records[idempotency_key].model_copy(update={
+            "state": IdempotencyState.COMPLETED, "status_code": status_code, "message": message, "body": body,
+        })
+
+    def release(self, idempotency_key):
+        self.records.pop(idempotency_key, None)
+
+
+def _idempotent_use_case():
+    return AccountUseCase(
+        account_service=account_use_case.account_service,
+        idempotency_service=IdempotencyService(InMemoryIdempotencyRepository(), cache=TTLCache(ttl_seconds=0)),
+    )
+
+
+def test_create_account_with_same_idempotency_key_is_replayed():
+    use_case = _idempotent_use_case()
+    model = AccountSchema(tenant_id="tenant123", owner_id=f"owner-{uuid4()}")
+
+    first = use_case.create_account(model, _idempotent_use_case, idempotency_key="retry-1")
+    second = use_case.create_account(model, _idempotent_use_case, idempotency_key="retry-1")
+
+    assert isinstance(second, SuccessResponse)
+    assert second.status_code == first.status_code
+    assert second.body.id == first.body.id
+
+
+def test_create_account_with_reused_idempotency_key_and_other_payload_fails():
+    use_case = _idempotent_use_case()
+    use_case.create_account(AccountSchema(tenant_id="tenant123", owner_id=f"owner-{uuid4()}"), _idempotent_use_case, idempotency_key="retry-2")
+
+    response = use_case.create_account(AccountSchema(tenant_id="tenant123", owner_id=f"owner-{uuid4()}"), _idempotent_use_case, idempotency_key="retry-2")
+
+    assert isinstance(response, ErrorResponse)
+    assert response.status_code == 422
+
+
+def test_get_account_with_fields_returns_only_projection():
+    account = _create_account()
+
+    response, etag = account_use_case.get_account_conditional(GetAccountSchema(account_id=account.id, fields="status"))
+
+    assert response.status_code == 200
+    assert response.body == {"status": AccountStatus.ACTIVE.value}
+    assert etag is not None
+
+
+def test_get_account_with_matching_etag_is_not_modified():
+    account = _create_account()
+    _, etag = account_use_case.get_account_conditional(GetAccountSchema(account_id=account.id))
+
+    response, same_etag = account_use_case.get_account_conditional(GetAccountSchema(account_id=account.id), if_none_match=etag)
+
+    assert response.status_code == 304
+    assert same_etag == etag